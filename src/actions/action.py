@@ -9,6 +9,7 @@ from actions.activity_tracker import ActivityTracker, ActionState
 from actions.behavior_action_status_builder import BehaviorActionStatusBuilder
 from instructions.context_data_injector import ContextDataInjector
 from instructions.instructions import Instructions
+from instructions.instruction_template import render_lines
 from actions.action_context import ActionContext
 from scope.scope import Scope
 from instructions.reminders import inject_reminder_to_instructions
@@ -188,14 +189,7 @@ class Action:
             '{bot}': str(self.behavior.bot_paths.bot_directory),
             '{behavior}': self.behavior.name
         }
-        
-        result = []
-        for instruction in instructions_list:
-            replaced = instruction
-            for placeholder, value in replacements.items():
-                replaced = replaced.replace(placeholder, value)
-            result.append(replaced)
-        return result
+        return render_lines(instructions_list, replacements)
     
     def _load_scope_from_state(self) -> Optional[Scope]:
         if hasattr(self.behavior, 'bot') and self.behavior.bot:
@@ -1,6 +1,6 @@
 ﻿
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from pathlib import Path
 from enum import Enum
 
@@ -59,6 +59,10 @@ class ValidateActionContext(ScopeActionContext):
     all_files: bool = False
     force_full: bool = False
     max_cross_file_comparisons: int = 20
+    scanner_budget_seconds: Optional[float] = None
+    file_budget_seconds: Optional[float] = None
+    trace_memory: bool = False
+    cancel_check: Optional[Callable[[], bool]] = None
     
     def __post_init__(self):
         if self.force_full:
@@ -66,6 +70,10 @@ class ValidateActionContext(ScopeActionContext):
         elif self.all_files:
             object.__setattr__(self, 'force_full', True)
 
+@dataclass
+class RenderActionContext(ScopeActionContext):
+    force_render: bool = False
+
 @dataclass
 class RulesActionContext(ActionContext):
     message: Optional[str] = None
@@ -1,71 +1,90 @@
-﻿import json
-import logging
+﻿import logging
 from pathlib import Path
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 from datetime import datetime
+from diagnostics import get_trace_logger
+from workspace_state_store import WorkspaceStateStore
+
+trace = get_trace_logger(__name__)
 
 class ActionStateManager:
 
     def __init__(self, behavior):
         self.behavior = behavior
+        self._store = WorkspaceStateStore.shared()
 
     def get_state_file_path(self) -> Path:
         workspace_dir = self.behavior.bot_paths.workspace_directory
         return workspace_dir / 'behavior_action_state.json'
 
+    def read_state_file(self, state_file: Path) -> Optional[dict]:
+        return self._store.read(state_file)
+
+    def peek_state_file(self, state_file: Path) -> Optional[dict]:
+        return self._store.peek(state_file)
+
     def load_or_create_state(self, state_file: Path) -> dict:
-        expected_behavior = f'{self.behavior.bot_name}.{self.behavior.name}'
-        if state_file.exists():
-            state_data = json.loads(state_file.read_text(encoding='utf-8'))
-        else:
-            state_data = {'current_behavior': expected_behavior, 'current_action': '', 'completed_actions': [], 'timestamp': datetime.now().isoformat()}
+        state_data = self.read_state_file(state_file)
+        if state_data is None:
+            state_data = self._new_state()
         if 'completed_actions' not in state_data:
             state_data['completed_actions'] = []
         return state_data
 
+    def _new_state(self) -> dict:
+        expected_behavior = f'{self.behavior.bot_name}.{self.behavior.name}'
+        return {'current_behavior': expected_behavior, 'current_action': '', 'completed_actions': [], 'timestamp': datetime.now().isoformat()}
+
+    @contextmanager
+    def transaction(self, state_file: Path) -> Iterator[dict]:
+        with self._store.transaction(state_file, default=self._new_state) as state_data:
+            state_data.setdefault('completed_actions', [])
+            yield state_data
+
     def save_state(self, current_action_obj, state_file: Path):
-        state_data = self.load_or_create_state(state_file)
-        state_data['current_behavior'] = f'{self.behavior.bot_name}.{self.behavior.name}'
-        if current_action_obj:
-            state_data['current_action'] = f'{self.behavior.bot_name}.{self.behavior.name}.{current_action_obj.action_name}'
-            state_data['timestamp'] = datetime.now().isoformat()
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-        state_file.write_text(json.dumps(state_data, indent=2), encoding='utf-8')
+        with self.transaction(state_file) as state_data:
+            state_data['current_behavior'] = f'{self.behavior.bot_name}.{self.behavior.name}'
+            if current_action_obj:
+                state_data['current_action'] = f'{self.behavior.bot_name}.{self.behavior.name}.{current_action_obj.action_name}'
+                state_data['timestamp'] = datetime.now().isoformat()
 
     def load_state(self, actions_list: List, current_index_ref: list) -> None:
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_path.parent.mkdir(parents=True, exist_ok=True); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:35','message':'load_state entry','data':{'behavior_bot_name':self.behavior.bot_name,'behavior_name':self.behavior.name,'actions_count':len(actions_list),'action_names':[a.action_name for a in actions_list] if actions_list else []},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H3'})+'\n'); log_file.close()
+        if trace.isEnabledFor(logging.DEBUG):
+            trace.debug('load_state entry', extra={'data': {'behavior_bot_name':self.behavior.bot_name,'behavior_name':self.behavior.name,'actions_count':len(actions_list),'action_names':[a.action_name for a in actions_list] if actions_list else []}})
         state_data = self._load_state_data()
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:37','message':'after _load_state_data','data':{'state_data_exists':state_data is not None,'current_behavior':state_data.get('current_behavior') if state_data else None,'current_action':state_data.get('current_action') if state_data else None},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1,H4'})+'\n'); log_file.close()
+        trace.debug('after _load_state_data', extra={'data': {'state_data_exists':state_data is not None,'current_behavior':state_data.get('current_behavior') if state_data else None,'current_action':state_data.get('current_action') if state_data else None}})
         if state_data is None:
-            import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:38','message':'state_data is None, setting default','data':{},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1,H4'})+'\n'); log_file.close()
+            trace.debug('state_data is None, setting default')
             self._set_default_index(actions_list, current_index_ref)
             return
         is_current = self._is_current_behavior(state_data)
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:40','message':'checking current behavior','data':{'is_current_behavior':is_current,'expected':f'{self.behavior.bot_name}.{self.behavior.name}','actual':state_data.get('current_behavior')},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H2'})+'\n'); log_file.close()
+        trace.debug('checking current behavior', extra={'data': {'is_current_behavior':is_current,'expected':f'{self.behavior.bot_name}.{self.behavior.name}','actual':state_data.get('current_behavior')}})
         if not is_current:
-            import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:41','message':'not current behavior, setting default','data':{},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H2'})+'\n'); log_file.close()
+            trace.debug('not current behavior, setting default')
             self._set_default_index(actions_list, current_index_ref)
             return
         if self._try_set_from_current_action(state_data, actions_list, current_index_ref):
-            import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:43','message':'set from current_action','data':{'final_index':current_index_ref[0]},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H5'})+'\n'); log_file.close()
+            trace.debug('set from current_action', extra={'data': {'final_index':current_index_ref[0]}})
             return
         if self._try_set_from_completed_actions(state_data, actions_list, current_index_ref):
-            import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:45','message':'set from completed_actions','data':{'final_index':current_index_ref[0]},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H5'})+'\n'); log_file.close()
+            trace.debug('set from completed_actions', extra={'data': {'final_index':current_index_ref[0]}})
             return
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:47','message':'fallback to default index','data':{},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H5'})+'\n'); log_file.close()
+        trace.debug('fallback to default index')
         self._set_default_index(actions_list, current_index_ref)
 
     def _load_state_data(self) -> Optional[dict]:
         state_file = self.behavior.bot_paths.workspace_directory / 'behavior_action_state.json'
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_path.parent.mkdir(parents=True, exist_ok=True); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:49','message':'_load_state_data entry','data':{'state_file_path':str(state_file),'file_exists':state_file.exists(),'workspace_dir':str(self.behavior.bot_paths.workspace_directory)},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
-        if not state_file.exists():
-            return None
+        if trace.isEnabledFor(logging.DEBUG):
+            trace.debug('_load_state_data entry', extra={'data': {'state_file_path':str(state_file),'file_exists':state_file.exists(),'workspace_dir':str(self.behavior.bot_paths.workspace_directory)}})
         try:
-            data = json.loads(state_file.read_text(encoding='utf-8'))
-            import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:54','message':'state file read successfully','data':{'current_behavior':data.get('current_behavior'),'current_action':data.get('current_action')},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
+            data = self._store.peek(state_file)
+            if data is None:
+                return None
+            trace.debug('state file read successfully', extra={'data': {'current_behavior':data.get('current_behavior'),'current_action':data.get('current_action')}})
             return data
         except Exception as e:
-            import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:56','message':'error reading state file','data':{'error':str(e)},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
+            trace.debug('error reading state file', extra={'data': {'error':str(e)}})
             return None
 
     def _is_current_behavior(self, state_data: dict) -> bool:
@@ -78,21 +97,23 @@ class ActionStateManager:
 
     def _try_set_from_current_action(self, state_data: dict, actions_list: List, current_index_ref: list) -> bool:
         current_action_full = state_data.get('current_action', '')
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_path.parent.mkdir(parents=True, exist_ok=True); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:66','message':'_try_set_from_current_action entry','data':{'current_action_full':current_action_full,'actions_count':len(actions_list),'action_names':[a.action_name for a in actions_list] if actions_list else []},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H3,H5'})+'\n'); log_file.close()
+        if trace.isEnabledFor(logging.DEBUG):
+            trace.debug('_try_set_from_current_action entry', extra={'data': {'current_action_full':current_action_full,'actions_count':len(actions_list),'action_names':[a.action_name for a in actions_list] if actions_list else []}})
         if not current_action_full:
             return False
         parts = current_action_full.split('.')
         if len(parts) < 3:
-            import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:71','message':'invalid current_action format','data':{'parts':parts},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H5'})+'\n'); log_file.close()
+            trace.debug('invalid current_action format', extra={'data': {'parts':parts}})
             return False
         action_name = parts[-1]
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:73','message':'extracted action name','data':{'action_name':action_name,'parts':parts},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H5'})+'\n'); log_file.close()
+        trace.debug('extracted action name', extra={'data': {'action_name':action_name,'parts':parts}})
         for i, action in enumerate(actions_list):
             if action.action_name == action_name:
                 current_index_ref[0] = i
-                import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:76','message':'matched action, set index','data':{'action_name':action_name,'index':i},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H5'})+'\n'); log_file.close()
+                trace.debug('matched action, set index', extra={'data': {'action_name':action_name,'index':i}})
                 return True
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'action_state_manager.py:78','message':'action name not found in list','data':{'action_name':action_name,'available_names':[a.action_name for a in actions_list]},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H3,H5'})+'\n'); log_file.close()
+        if trace.isEnabledFor(logging.DEBUG):
+            trace.debug('action name not found in list', extra={'data': {'action_name':action_name,'available_names':[a.action_name for a in actions_list]}})
         return False
 
     def _try_set_from_completed_actions(self, state_data: dict, actions_list: List, current_index_ref: list) -> bool:
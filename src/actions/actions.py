@@ -1,5 +1,4 @@
 ﻿from __future__ import annotations
-import json
 import logging
 from pathlib import Path
 from typing import List, Optional, Iterator, Dict, Any, TYPE_CHECKING
@@ -135,12 +134,11 @@ class Actions:
             return
         
         state_file = self._state_manager.get_state_file_path()
-        state_data = self._state_manager.load_or_create_state(state_file)
-        self._ensure_current_behavior_in_state(state_data)
-        self._mark_action_completed(state_data)
-        self._advance_to_next_action()
-        self._update_current_action_in_state(state_data)
-        self._save_state_file(state_file, state_data)
+        with self._state_manager.transaction(state_file) as state_data:
+            self._ensure_current_behavior_in_state(state_data)
+            self._mark_action_completed(state_data)
+            self._advance_to_next_action()
+            self._update_current_action_in_state(state_data)
 
     def _ensure_current_behavior_in_state(self, state_data):
         if 'current_behavior' not in state_data:
@@ -171,10 +169,6 @@ class Actions:
             state_data['current_action'] = f'{self.behavior.bot_name}.{self.behavior.name}.{current_action_obj.action_name}'
         state_data['timestamp'] = datetime.now().isoformat()
 
-    def _save_state_file(self, state_file, state_data):
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-        state_file.write_text(json.dumps(state_data, indent=2), encoding='utf-8')
-
     def forward_to_current(self) -> Optional['Action']:
         self.load_state()
         return self.current
@@ -187,8 +181,8 @@ class Actions:
             if self.current is not None:
                 return self.current.action_name == action_names[-1]
             state_file = self._state_manager.get_state_file_path()
-            if state_file.exists():
-                state_data = json.loads(state_file.read_text(encoding='utf-8'))
+            state_data = self._state_manager.peek_state_file(state_file)
+            if state_data is not None:
                 completed = state_data.get('completed_actions', [])
                 last_action_state = f'{self.behavior.bot_name}.{self.behavior.name}.{action_names[-1]}'
                 return any(a.get('action_state') == last_action_state for a in completed if isinstance(a, dict))
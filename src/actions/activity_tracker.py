@@ -1,21 +1,18 @@
+import os
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from bot_path import BotPath
+from workspace_state_store import WorkspaceStateStore
 
-# DISABLED: TinyDB activity tracking was causing file corruption issues
-# The activity_log.json file got corrupted with null bytes, breaking the panel
-# To re-enable, set TINYDB_AVAILABLE = True and uncomment the import
-TINYDB_AVAILABLE = False
-TinyDB = None
+# Activity used to be kept in a TinyDB file that was rewritten on every event and got corrupted (null bytes) often
+# enough to break the panel. It is now an append-only JSON lines journal and stays off unless ACTIVITY_LOG_ENV is set.
+ACTIVITY_LOG_ENV = 'AGILE_BOTS_ACTIVITY_LOG'
+ACTIVITY_LOG_FILE = 'activity_log.jsonl'
 
-# try:
-#     from tinydb import TinyDB
-#     TINYDB_AVAILABLE = True
-# except ImportError:
-#     TINYDB_AVAILABLE = False
-#     TinyDB = None
+def activity_tracking_enabled() -> bool:
+    return os.environ.get(ACTIVITY_LOG_ENV, '').strip().lower() in ('1', 'true', 'on', 'yes')
 
 def make_json_serializable(obj: Any) -> Any:
     from instructions.instructions import Instructions
@@ -53,23 +50,22 @@ class ActivityTracker:
 
     @property
     def file(self) -> Path:
-        return self._bot_paths.workspace_directory / 'activity_log.json'
+        return self._bot_paths.workspace_directory / ACTIVITY_LOG_FILE
 
     def track_start(self, state: ActionState):
-        if not TINYDB_AVAILABLE:
+        if not activity_tracking_enabled():
             return
-        self.file.parent.mkdir(parents=True, exist_ok=True)
-        with TinyDB(self.file) as db:
-            db.insert({'action_state': state.state_key, 'status': 'started', 'timestamp': datetime.now().isoformat()})
+        WorkspaceStateStore.shared().append_journal(self.file, {'action_state': state.state_key, 'status': 'started', 'timestamp': datetime.now().isoformat()})
 
     def track_completion(self, state: ActionState):
-        if not TINYDB_AVAILABLE:
+        if not activity_tracking_enabled():
             return
-        self.file.parent.mkdir(parents=True, exist_ok=True)
-        with TinyDB(self.file) as db:
-            entry = {'action_state': state.state_key, 'status': 'completed', 'timestamp': datetime.now().isoformat()}
-            if state.outputs:
-                entry['outputs'] = make_json_serializable(state.outputs)
-            if state.duration:
-                entry['duration'] = state.duration
-            db.insert(entry)
\ No newline at end of file
+        entry = {'action_state': state.state_key, 'status': 'completed', 'timestamp': datetime.now().isoformat()}
+        if state.outputs:
+            entry['outputs'] = make_json_serializable(state.outputs)
+        if state.duration:
+            entry['duration'] = state.duration
+        WorkspaceStateStore.shared().append_journal(self.file, entry)
+
+    def entries(self) -> list:
+        return WorkspaceStateStore.shared().read_journal(self.file)
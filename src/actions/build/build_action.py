@@ -7,6 +7,7 @@ from actions.build.story_graph_data import StoryGraphData
 from actions.build.story_graph_spec import StoryGraphSpec
 from actions.build.story_graph_template import StoryGraphTemplate
 from scope.action_scope import ActionScope
+from instructions.instruction_template import render_template
 from actions.validate.validate_action import ValidateRulesAction
 logger = logging.getLogger(__name__)
 
@@ -178,15 +179,16 @@ class BuildStoryGraphAction(Action):
         rules_section = []
         
         schema_path = self.behavior.bot_paths.workspace_directory / 'docs' / 'stories' / 'story-graph.json'
+        placeholders = {
+            '{{schema}}': f'**Schema:** Story graph template at `{schema_path}`',
+            '{{description}}': f'**Task:** Build {self.behavior.name} story graph from clarification and strategy data'
+        }
         
         for line in existing_instructions:
             if isinstance(line, str):
                 if '{{rules}}' in line:
                     continue
-                if '{{schema}}' in line:
-                    line = line.replace('{{schema}}', f'**Schema:** Story graph template at `{schema_path}`')
-                if '{{description}}' in line:
-                    line = line.replace('{{description}}', f'**Task:** Build {self.behavior.name} story graph from clarification and strategy data')
+                line = render_template(line, placeholders)
             new_instructions.append(line)
         
         if rules_text != 'No validation rules found.':
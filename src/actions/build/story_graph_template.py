@@ -1,6 +1,6 @@
 ﻿from pathlib import Path
 from typing import Dict, Any, Optional
-from utils import read_json_file
+from workspace_state_store import WorkspaceStateStore
 
 class StoryGraphTemplate:
 
@@ -17,7 +17,8 @@ class StoryGraphTemplate:
         template_path = self._sg_dir / self._template_filename
         if not template_path.exists():
             return
-        self._template_content = read_json_file(template_path)
+        # The shared store re-reads the file only when it changes; read parses the cached text again, so each template gets its own copy
+        self._template_content = WorkspaceStateStore.shared().read(template_path)
         self._template_path = template_path
 
     @property
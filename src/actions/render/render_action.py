@@ -5,20 +5,23 @@ import importlib
 import logging
 from utils import read_json_file
 from actions.action import Action
-from actions.action_context import ActionContext, ScopeActionContext
+from actions.action_context import ActionContext, RenderActionContext
 from actions.render.render_spec import RenderSpec
+from actions.render.render_manifest import RenderManifest, force_render_requested
+from actions.render.render_scheduler import RenderScheduler
 from actions.render.render_config_loader import RenderConfigLoader
 from actions.render.render_instruction_builder import RenderInstructionBuilder
 logger = logging.getLogger(__name__)
 
 class RenderOutputAction(Action):
-    context_class: Type[ActionContext] = ScopeActionContext
+    context_class: Type[ActionContext] = RenderActionContext
 
     def __init__(self, behavior=None, action_config=None):
         super().__init__(behavior=behavior, action_config=action_config)
         self._config_loader = RenderConfigLoader(self.behavior)
         self._instruction_formatter = RenderInstructionBuilder()
         self._render_specs: List[RenderSpec] = self._config_loader.load_render_specs()
+        self._specs_rendered_for_call = False
 
     @property
     def action_name(self) -> str:
@@ -28,22 +31,29 @@ class RenderOutputAction(Action):
     def action_name(self, value: str):
         raise AttributeError('action_name is read-only for RenderOutputAction')
 
-    def _execute_synchronizers(self, render_specs: List['RenderSpec']) -> None:
+    def _execute_synchronizers(self, render_specs: List['RenderSpec'], force: bool = False) -> None:
+        manifest = RenderManifest(self.behavior.bot_paths.workspace_directory)
+        RenderScheduler(render_specs).run(manifest, force=force or force_render_requested())
         for spec in render_specs:
-            if spec.synchronizer:
-                try:
-                    result = spec.execute_synchronizer()
-                    spec.mark_executed(result)
-                    logger.info(f"Executed synchronizer for {spec.name}: {result.get('output_path', 'N/A')}")
-                except Exception as e:
-                    logger.error(f'Failed to execute synchronizer for {spec.name}: {e}')
-                    spec.mark_failed(str(e))
+            if not spec.synchronizer:
+                continue
+            if spec.execution_status == 'failed':
+                logger.error(f"Failed to execute synchronizer for {spec.name}: {spec.execution_result.get('error')}")
+            elif spec.was_skipped:
+                logger.info(f"Skipped synchronizer for {spec.name}: inputs and outputs unchanged since last render")
+            else:
+                logger.info(f"Executed synchronizer for {spec.name} ({spec.rebuild_reason}): {spec.execution_result.get('output_path', 'N/A')}")
+    
+    def _force_render(self, context: ActionContext) -> bool:
+        return bool(getattr(context, 'force_render', False))
     
-    def _prepare_instructions(self, instructions, context: ScopeActionContext):
+    def _prepare_instructions(self, instructions, context: RenderActionContext):
         render_instructions = self._config_loader.load_render_instructions()
         render_specs = self._render_specs
         
-        self._execute_synchronizers(render_specs)
+        # Under do_execute the specs have just been rendered; only standalone instruction requests render here
+        if not self._specs_rendered_for_call:
+            self._execute_synchronizers(render_specs, force=self._force_render(context))
         
         merged_data = {
             'base_instructions': instructions.get('base_instructions', []),
@@ -94,12 +104,16 @@ class RenderOutputAction(Action):
         if render_output_paths:
             instructions._data['render_output_paths'] = render_output_paths
     
-    def do_execute(self, context: ScopeActionContext = None):
+    def do_execute(self, context: RenderActionContext = None):
         render_instructions = self._config_loader.load_render_instructions()
         render_specs = self._render_specs
-        self._execute_synchronizers(render_specs)
+        self._execute_synchronizers(render_specs, force=self._force_render(context))
         
-        instructions = self.get_instructions(context)
+        self._specs_rendered_for_call = True
+        try:
+            instructions = self.get_instructions(context)
+        finally:
+            self._specs_rendered_for_call = False
         
         merged_data = {
             'base_instructions': instructions.get('base_instructions', []),
@@ -1,5 +1,6 @@
 ﻿from pathlib import Path
 from typing import Dict, Any, List, TYPE_CHECKING
+from instructions.instruction_template import render_template
 if TYPE_CHECKING:
     from actions.render.render_spec import RenderSpec
 
@@ -110,6 +111,10 @@ class RenderInstructionBuilder:
             parts.append(f'   - Output generated at: {output_path}')
             if spec.synchronizer:
                 parts.append(f'   - Synchronizer: {spec.synchronizer.synchronizer_class_path}')
+            if spec.was_skipped:
+                parts.append('   - Skipped: inputs and outputs unchanged since last render')
+            elif spec.rebuild_reason:
+                parts.append(f'   - Rebuilt: {spec.rebuild_reason}')
         else:
             error = spec.execution_result.get('error', 'Unknown error') if spec.execution_result else 'Unknown error'
             parts.append(f'{index}. **{spec.name}** - FAILED')
@@ -163,21 +168,18 @@ class RenderInstructionBuilder:
             '{render_config.path}': spec.config_data.get('path', 'N/A')
         }
         
+        first_line, *more_lines = str(instructions).split('\n')
+        if more_lines:
+            # With multi-line instructions only the name and the first instruction line are filled in;
+            # a line holding just the instructions placeholder is followed by the remaining lines
+            values = {'{render_config.name}': str(spec.name), '{render_config.instructions}': first_line}
+        else:
+            values = {placeholder: str(value) for placeholder, value in replacements.items()}
+        
         expanded_lines = []
         for line in template_lines:
-            expanded_line = line
-            for placeholder, value in replacements.items():
-                if placeholder == '{render_config.instructions}' and '\n' in value:
-                    lines = value.split('\n')
-                    expanded_line = expanded_line.replace(placeholder, lines[0])
-                    expanded_lines.append(expanded_line)
-                    if line.strip() == placeholder:
-                        for additional_line in lines[1:]:
-                            expanded_lines.append(additional_line)
-                    break
-                else:
-                    expanded_line = expanded_line.replace(placeholder, str(value))
-            else:
-                expanded_lines.append(expanded_line)
+            expanded_lines.append(render_template(line, values))
+            if more_lines and line.strip() == '{render_config.instructions}':
+                expanded_lines.extend(more_lines)
         
         return expanded_lines
\ No newline at end of file
@@ -0,0 +1,129 @@
+"""Skip cache for synchronizer render specs.
+
+The manifest under the workspace records, per render spec, the hashes of what went into its last render (story graph,
+template, render config, synchronizer code and any extra inputs the synchronizer declares in `render_inputs`) and the
+hashes of the outputs it wrote. A spec whose inputs all hash the same and whose outputs are untouched on disk is not
+rendered again; its recorded result is reused instead. An output the last render did not leave on disk is recorded
+without a hash and always forces a rebuild. Every rebuild carries a short reason saying what changed.
+"""
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+RENDER_MANIFEST = Path('.agile_bots') / 'cache' / 'render_manifest.json'
+FORCE_RENDER_ENV = 'AGILE_BOTS_FORCE_RENDER'
+
+
+def force_render_requested() -> bool:
+    return os.environ.get(FORCE_RENDER_ENV, '').strip().lower() in ('1', 'true', 'on', 'yes')
+
+
+def hash_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: Path) -> Optional[str]:
+    """Content hash of a file, or None when it does not exist or cannot be read."""
+    try:
+        return hash_bytes(Path(path).read_bytes())
+    except OSError:
+        return None
+
+
+def hash_output(path: Path) -> Optional[str]:
+    """Content hash of an output file, or of every file under an output directory with its relative path."""
+    path = Path(path)
+    if not path.is_dir():
+        return hash_file(path)
+    digest = hashlib.sha256()
+    for file_path in sorted(p for p in path.rglob('*') if p.is_file()):
+        digest.update(file_path.relative_to(path).as_posix().encode('utf-8'))
+        digest.update(b'\0')
+        digest.update((hash_file(file_path) or '').encode('ascii'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def hash_source_tree(module_file: Optional[str]) -> Optional[str]:
+    """Stat signature of the Python sources next to a module, so editing a synchronizer's package re-renders its specs."""
+    if not module_file:
+        return None
+    digest = hashlib.sha256()
+    root = Path(module_file).parent
+    for source in sorted(root.rglob('*.py')):
+        try:
+            stat = source.stat()
+        except OSError:
+            continue
+        digest.update(f'{source.relative_to(root).as_posix()}:{stat.st_mtime_ns}:{stat.st_size}\n'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _json_safe(value: Any) -> Any:
+    return json.loads(json.dumps(value, default=str))
+
+
+class RenderManifest:
+    """Render manifest of one workspace, read and written through the shared WorkspaceStateStore."""
+
+    def __init__(self, workspace_directory: Path):
+        self.path = Path(workspace_directory) / RENDER_MANIFEST
+
+    @property
+    def _store(self):
+        from workspace_state_store import WorkspaceStateStore
+        return WorkspaceStateStore.shared()
+
+    def entry(self, spec_key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return self._store.peek(self.path, {}).get(spec_key)
+        except ValueError as e:
+            logger.debug(f'Ignoring unreadable render manifest {self.path}: {e}')
+            return None
+
+    def rebuild_reason(self, spec_key: str, inputs: Dict[str, Optional[str]]) -> Optional[str]:
+        """Why the spec has to be rendered again, or None when its recorded result is still current."""
+        entry = self.entry(spec_key)
+        if entry is None:
+            return 'no previous render recorded'
+        recorded_inputs = entry.get('inputs', {})
+        changed = [name for name in sorted(set(inputs) | set(recorded_inputs)) if inputs.get(name) != recorded_inputs.get(name)]
+        if changed:
+            return f"inputs changed: {', '.join(changed)}"
+        for output_path, output_hash in entry.get('outputs', {}).items():
+            if output_hash is None:
+                return f'output not written by last render: {output_path}'
+            current = hash_output(Path(output_path))
+            if current is None:
+                return f'output missing: {output_path}'
+            if current != output_hash:
+                return f'output modified since last render: {output_path}'
+        return None
+
+    def recorded_result(self, spec_key: str) -> Dict[str, Any]:
+        entry = self.entry(spec_key) or {}
+        return dict(entry.get('result', {}))
+
+    def record(self, spec_key: str, inputs: Dict[str, Optional[str]], output_paths: Iterable[Path], result: Dict[str, Any]) -> None:
+        outputs = {str(path): hash_output(Path(path)) for path in output_paths}
+        try:
+            with self._store.transaction(self.path) as manifest:
+                manifest[spec_key] = {
+                    'inputs': inputs,
+                    'outputs': outputs,
+                    'result': _json_safe(result)
+                }
+        except (OSError, ValueError) as e:
+            logger.debug(f'Could not record render of {spec_key} in {self.path}: {e}')
+
+    def forget(self, spec_key: str) -> None:
+        try:
+            with self._store.transaction(self.path) as manifest:
+                manifest.pop(spec_key, None)
+        except (OSError, ValueError) as e:
+            logger.debug(f'Could not drop {spec_key} from {self.path}: {e}')
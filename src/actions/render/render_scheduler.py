@@ -0,0 +1,173 @@
+"""Runs a render action's synchronizer specs in dependency order, independent renders side by side.
+
+Specs are ordered by the files they read and write: a spec whose input is another spec's output (or lies inside an
+output directory) waits for it, and specs writing the same output keep their config order. Each wave of specs whose
+dependencies are done is checked against the render manifest in this process; the renders it still needs run in
+spawned worker processes when there are several of them and the story graph is big enough to repay a worker's start-up,
+and in this process otherwise. Workers read the story graph from disk themselves, since synchronizers take paths.
+Workspace state a synchronizer records in a worker (such as its own output manifest) is handed back and written here,
+so workers sharing a state file cannot overwrite each other's entries. Results and failures are recorded on the specs
+in spec order whatever order the workers finish in.
+"""
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from actions.render.render_manifest import RenderManifest
+from actions.render.render_spec import RenderJob, RenderSpec
+
+logger = logging.getLogger(__name__)
+
+RENDER_WORKERS_ENV = 'AGILE_BOTS_RENDER_WORKERS'
+# Below this story graph size a spawned worker's imports cost more than the render it takes over
+PARALLEL_RENDER_MIN_INPUT_BYTES = 512 * 1024
+
+
+def _feeds(output_path: Path, input_path: Path) -> bool:
+    return input_path == output_path or output_path in input_path.parents
+
+
+def _available_cpus() -> int:
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _run_job(job: RenderJob) -> Tuple[Dict, Dict[str, Dict]]:
+    from workspace_state_store import WorkspaceStateStore
+    with WorkspaceStateStore.shared().deferred_writes() as state_updates:
+        result = job.run()
+    return result, state_updates
+
+
+def configured_render_workers() -> Optional[int]:
+    setting = os.environ.get(RENDER_WORKERS_ENV, '').strip()
+    try:
+        return max(1, int(setting)) if setting else None
+    except ValueError:
+        logger.warning(f'Ignoring {RENDER_WORKERS_ENV}={setting!r}: not a number')
+        return None
+
+
+def run_render_jobs(jobs: List[RenderJob], workers: int) -> List[Tuple[Optional[Dict], Optional[Exception]]]:
+    """(result, error) for each job, in job order, using up to workers processes."""
+    if workers <= 1 or len(jobs) <= 1:
+        return [_run_in_process(job) for job in jobs]
+    try:
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(jobs)), mp_context=multiprocessing.get_context('spawn'))
+    except (OSError, ValueError) as e:
+        logger.debug(f'Rendering in process, worker pool unavailable: {e}')
+        return [_run_in_process(job) for job in jobs]
+    from workspace_state_store import WorkspaceStateStore
+    store = WorkspaceStateStore.shared()
+    outcomes = []
+    with pool:
+        futures = [pool.submit(_run_job, job) for job in jobs]
+        for job, future in zip(jobs, futures):
+            try:
+                result, state_updates = future.result()
+                outcomes.append((result, None))
+            except BrokenProcessPool:
+                # The worker died without an answer; the render itself may be fine
+                outcomes.append(_run_in_process(job))
+                continue
+            except Exception as e:
+                outcomes.append((None, e))
+                continue
+            try:
+                store.apply_updates(state_updates)
+            except (OSError, ValueError) as e:
+                logger.debug(f'Could not record workspace state from rendering {job.output_path}: {e}')
+    return outcomes
+
+
+def _run_in_process(job: RenderJob) -> Tuple[Optional[Dict], Optional[Exception]]:
+    try:
+        return job.run(), None
+    except Exception as e:
+        return None, e
+
+
+class RenderScheduler:
+
+    def __init__(self, specs: List[RenderSpec], workers: Optional[int] = None):
+        self._specs = [spec for spec in specs if spec.synchronizer]
+        self._workers = workers if workers is not None else configured_render_workers()
+
+    def dependencies(self) -> Dict[int, Set[int]]:
+        """For each spec (by position), the specs that must render before it."""
+        paths = {}
+        for index, spec in enumerate(self._specs):
+            try:
+                paths[index] = spec.render_paths()
+            except Exception as e:
+                logger.debug(f'Could not resolve paths of render spec {spec.name}: {e}')
+        depends_on: Dict[int, Set[int]] = {index: set() for index in range(len(self._specs))}
+        for index, (input_path, output_path) in paths.items():
+            for other, (other_input, other_output) in paths.items():
+                if other == index:
+                    continue
+                if _feeds(other_output, input_path) or (other < index and other_output == output_path):
+                    depends_on[index].add(other)
+        return depends_on
+
+    def waves(self) -> List[List[int]]:
+        """Spec positions grouped into waves whose dependencies all sit in earlier waves, each in spec order."""
+        depends_on = self.dependencies()
+        done: Set[int] = set()
+        waves = []
+        while len(done) < len(self._specs):
+            wave = [index for index in range(len(self._specs)) if index not in done and depends_on[index] <= done]
+            if not wave:
+                # Specs that feed each other: fall back to config order for the rest
+                wave = [min(index for index in range(len(self._specs)) if index not in done)]
+            waves.append(wave)
+            done.update(wave)
+        return waves
+
+    def run(self, manifest: Optional[RenderManifest] = None, force: bool = False) -> None:
+        for wave in self.waves():
+            self._run_wave([self._specs[index] for index in wave], manifest, force)
+
+    def _run_wave(self, specs: List[RenderSpec], manifest: Optional[RenderManifest], force: bool) -> None:
+        pending: List[Tuple[RenderSpec, RenderJob]] = []
+        for spec in specs:
+            try:
+                job = spec.prepare_synchronizer(manifest, force)
+            except Exception as e:
+                spec.mark_failed(str(e))
+                continue
+            if job is None:
+                spec.mark_executed(spec.skipped_result(manifest))
+            else:
+                pending.append((spec, job))
+        jobs = [job for _, job in pending]
+        for (spec, job), (result, error) in zip(pending, run_render_jobs(jobs, self._worker_count(jobs))):
+            if error is not None:
+                spec.mark_failed(str(error))
+                continue
+            try:
+                spec.mark_executed(spec.complete_synchronizer(job, result, manifest))
+            except Exception as e:
+                spec.mark_failed(str(e))
+
+    def _worker_count(self, jobs: List[RenderJob]) -> int:
+        if self._workers is not None:
+            return self._workers
+        if len(jobs) < 2:
+            return 1
+        largest_input = max((self._input_size(job) for job in jobs), default=0)
+        if largest_input < PARALLEL_RENDER_MIN_INPUT_BYTES:
+            return 1
+        return min(len(jobs), _available_cpus())
+
+    @staticmethod
+    def _input_size(job: RenderJob) -> int:
+        try:
+            return os.path.getsize(job.input_path)
+        except OSError:
+            return 0
@@ -1,10 +1,60 @@
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 import importlib
+import json
+import sys
 from actions.render.template import Template
 from actions.render.synchronizer import Synchronizer
 from bot_path import BotPath
 from utils import read_json_file
+from actions.render.render_manifest import RenderManifest, hash_bytes, hash_file, hash_source_tree
+
+WRITTEN_FILE_KEYS = ('created_files', 'updated_files', 'unchanged_files')
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One synchronizer render with everything resolved, so it can run in this process or a worker."""
+    synchronizer_class_path: str
+    bot_directory_name: str
+    input_path: str
+    output_path: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def run(self) -> Dict[str, Any]:
+        synchronizer_class = import_synchronizer_class(self.synchronizer_class_path, self.bot_directory_name)
+        return synchronizer_class().render(self.input_path, self.output_path, **self.kwargs)
+
+
+def import_synchronizer_class(synchronizer_class_path: str, bot_directory_name: str):
+    module_path, class_name = synchronizer_class_path.rsplit('.', 1)
+    # Try multiple import paths to handle different Python path configurations
+    # Try src.* paths first since they work most reliably
+    possible_paths = [
+        f'src.{module_path}',  # Import from src package (works when cwd is workspace root)
+        module_path,  # Direct import (works when src is in PYTHONPATH)
+        f'agile_bots.bots.{bot_directory_name}.src.{module_path}',
+        f'agile_bots.bots.{bot_directory_name}.src.synchronizers.{module_path}'
+    ]
+    module = None
+    last_error = None
+    for path in possible_paths:
+        try:
+            module = importlib.import_module(path)
+            if hasattr(module, class_name):
+                break
+            module = None
+        except ImportError as e:
+            last_error = e
+            continue
+    if module is None:
+        raise ImportError(f'Could not import synchronizer module: {synchronizer_class_path}. Last error: {last_error}')
+    synchronizer_class = getattr(module, class_name)
+    if not hasattr(synchronizer_class, 'render'):
+        raise ValueError(f'Synchronizer class {synchronizer_class_path} does not have render method')
+    return synchronizer_class
+
 
 class RenderSpec:
 
@@ -22,6 +72,8 @@ class RenderSpec:
         self._template, self._synchronizer = self._init_template_or_synchronizer()
         self._execution_result: Optional[Dict[str, Any]] = None
         self._execution_status: str = 'pending'
+        self._rebuild_reason: Optional[str] = None
+        self._pending_inputs: Optional[Dict[str, Optional[str]]] = None
 
     def _init_template_or_synchronizer(self):
         config_data = self._config_data
@@ -79,6 +131,18 @@ class RenderSpec:
     def execution_result(self) -> Optional[Dict[str, Any]]:
         return self._execution_result
 
+    @property
+    def was_skipped(self) -> bool:
+        return bool(self._execution_result and self._execution_result.get('skipped')) and self._rebuild_reason is None
+
+    @property
+    def rebuild_reason(self) -> Optional[str]:
+        return self._rebuild_reason
+
+    @property
+    def manifest_key(self) -> str:
+        return f"{self._config_data.get('file', 'unknown')}::{self.name}"
+
     def mark_executed(self, result: Dict[str, Any]):
         self._execution_result = result
         self._execution_status = 'executed'
@@ -87,14 +151,72 @@ class RenderSpec:
         self._execution_result = {'error': error}
         self._execution_status = 'failed'
 
-    def execute_synchronizer(self) -> Dict[str, Any]:
+    def execute_synchronizer(self, manifest: Optional[RenderManifest] = None, force: bool = False) -> Dict[str, Any]:
+        job = self.prepare_synchronizer(manifest, force)
+        if job is None:
+            return self.skipped_result(manifest)
+        return self.complete_synchronizer(job, job.run(), manifest)
+
+    def prepare_synchronizer(self, manifest: Optional[RenderManifest] = None, force: bool = False) -> Optional[RenderJob]:
+        """The render this spec needs, or None when the manifest's recorded result for it is still current."""
         if not self.synchronizer:
             raise ValueError(f"No synchronizer specified in render spec '{self.name}'")
-        synchronizer_instance = self._import_synchronizer_class(self.synchronizer.synchronizer_class_path)()
+        self._rebuild_reason = None
+        self._pending_inputs = None
+        synchronizer_class = self._import_synchronizer_class(self.synchronizer.synchronizer_class_path)
         input_path = self._resolve_input_path()
         output_path = self._resolve_output_path(input_path)
-        kwargs = self._build_synchronizer_kwargs()
-        return synchronizer_instance.render(str(input_path), str(output_path), **kwargs)
+        job = RenderJob(self.synchronizer.synchronizer_class_path, self._bot_paths.bot_directory.name,
+                        str(input_path), str(output_path), self._build_synchronizer_kwargs())
+        if manifest is not None:
+            self._pending_inputs = self._render_inputs(synchronizer_class, input_path)
+            self._rebuild_reason = 'forced' if force else manifest.rebuild_reason(self.manifest_key, self._pending_inputs)
+            if self._rebuild_reason is None:
+                return None
+        return job
+
+    def skipped_result(self, manifest: RenderManifest) -> Dict[str, Any]:
+        return {**manifest.recorded_result(self.manifest_key), 'skipped': True}
+
+    def complete_synchronizer(self, job: RenderJob, result: Dict[str, Any], manifest: Optional[RenderManifest] = None) -> Dict[str, Any]:
+        if manifest is not None and self._pending_inputs is not None:
+            manifest.record(self.manifest_key, self._pending_inputs, self._written_outputs(result, Path(job.output_path)),
+                            {key: value for key, value in result.items() if key != 'skipped'})
+        self._pending_inputs = None
+        return result
+
+    def render_paths(self) -> Optional[tuple]:
+        """(input_path, output_path) a synchronizer spec reads and writes, for ordering specs that feed each other."""
+        if not self.synchronizer:
+            return None
+        input_path = self._resolve_input_path()
+        return input_path, self._resolve_output_path(input_path)
+
+    def _render_inputs(self, synchronizer_class: type, input_path: Path) -> Dict[str, Optional[str]]:
+        module_file = getattr(sys.modules.get(synchronizer_class.__module__), '__file__', None)
+        synchronizer_version = f"{self.synchronizer.synchronizer_class_path}:{getattr(synchronizer_class, 'RENDER_VERSION', None)}:{hash_source_tree(module_file)}"
+        inputs = {
+            'graph': hash_file(input_path),
+            'render_config': hash_bytes(json.dumps(self._config_data, sort_keys=True, default=str).encode('utf-8')),
+            'synchronizer': hash_bytes(synchronizer_version.encode('utf-8'))
+        }
+        if self._template is not None:
+            inputs['template'] = hash_file(self._template.template_path)
+        workspace_dir = self._bot_paths.workspace_directory
+        for relative_path in getattr(synchronizer_class, 'render_inputs', ()):
+            inputs[f'input:{relative_path}'] = hash_file(workspace_dir / relative_path)
+        return inputs
+
+    def _written_outputs(self, result: Dict[str, Any], output_path: Path) -> List[Path]:
+        output_path = Path(result.get('output_path') or output_path)
+        # Multi-file synchronizers list each file they own, absolute or relative to their output directory;
+        # those come first so a rebuild names the file rather than the directory holding it
+        outputs = []
+        for key in WRITTEN_FILE_KEYS:
+            for file_path in result.get(key) or ():
+                if output_path / file_path not in outputs:
+                    outputs.append(output_path / file_path)
+        return outputs + [output_path]
 
     def _resolve_input_path(self) -> Path:
         workspace_dir = self._bot_paths.workspace_directory
@@ -131,29 +253,4 @@ class RenderSpec:
         return kwargs
 
     def _import_synchronizer_class(self, synchronizer_class_path: str):
-        module_path, class_name = synchronizer_class_path.rsplit('.', 1)
-        # Try multiple import paths to handle different Python path configurations
-        # Try src.* paths first since they work most reliably
-        possible_paths = [
-            f'src.{module_path}',  # Import from src package (works when cwd is workspace root)
-            module_path,  # Direct import (works when src is in PYTHONPATH)
-            f'agile_bots.bots.{self._bot_paths.bot_directory.name}.src.{module_path}',
-            f'agile_bots.bots.{self._bot_paths.bot_directory.name}.src.synchronizers.{module_path}'
-        ]
-        module = None
-        last_error = None
-        for path in possible_paths:
-            try:
-                module = importlib.import_module(path)
-                if hasattr(module, class_name):
-                    break
-                module = None
-            except ImportError as e:
-                last_error = e
-                continue
-        if module is None:
-            raise ImportError(f'Could not import synchronizer module: {synchronizer_class_path}. Last error: {last_error}')
-        synchronizer_class = getattr(module, class_name)
-        if not hasattr(synchronizer_class, 'render'):
-            raise ValueError(f'Synchronizer class {synchronizer_class_path} does not have render method')
-        return synchronizer_class
\ No newline at end of file
+        return import_synchronizer_class(synchronizer_class_path, self._bot_paths.bot_directory.name)
@@ -1,5 +1,6 @@
 ﻿from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
+from instructions.instruction_template import CompiledTemplate, compile_template, read_template_text
 
 class Template:
 
@@ -11,12 +12,19 @@ class Template:
     def _load_template(self):
         if not self._template_path.exists():
             raise FileNotFoundError(f'Template file not found: {self._template_path}')
-        self._content = self._template_path.read_text(encoding='utf-8')
+        self._content = read_template_text(self._template_path)
 
     @property
     def content(self) -> str:
         return self._content
 
+    @property
+    def compiled(self) -> CompiledTemplate:
+        return compile_template(self._content)
+
+    def render(self, values: Mapping[str, str]) -> str:
+        return self.compiled.render(values)
+
     @property
     def template_path(self) -> Path:
         return self._template_path
\ No newline at end of file
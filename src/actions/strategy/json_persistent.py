@@ -1,8 +1,8 @@
 ﻿from pathlib import Path
 from typing import Dict, Any, Optional
-import json
 import logging
 from bot_path import BotPath
+from workspace_state_store import WorkspaceStateStore
 logger = logging.getLogger(__name__)
 
 class JsonPersistent:
@@ -19,10 +19,7 @@ class JsonPersistent:
         return docs_dir / self.filename
 
     def load(self) -> Dict[str, Any]:
-        file_path = self.file_path
-        if not file_path.exists():
-            return {}
-        return json.loads(file_path.read_text(encoding='utf-8-sig'))
+        return WorkspaceStateStore.shared().read(self.file_path, {})
 
     def merge(self, existing_data: Dict[str, Any], new_data: Dict[str, Any], key: str) -> Dict[str, Any]:
         merged = existing_data.copy()
@@ -31,9 +28,7 @@ class JsonPersistent:
 
     def save(self, data: Dict[str, Any]):
         try:
-            file_path = self.file_path
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
+            WorkspaceStateStore.shared().write(self.file_path, data)
         except Exception as e:
             logger.exception(f'Failed to save {self.filename}')
             raise RuntimeError(f'Failed to save {self.filename}: {e}') from e
\ No newline at end of file
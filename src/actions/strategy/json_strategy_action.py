@@ -1,7 +1,11 @@
 ﻿
 import json
+import logging
 from cli.adapters import JSONAdapter
 from actions.strategy.strategy_action import StrategyAction
+from diagnostics import get_trace_logger
+
+trace = get_trace_logger(__name__)
 
 class JSONStrategyAction(JSONAdapter):
     
@@ -55,9 +59,8 @@ class JSONStrategyAction(JSONAdapter):
         return self.action.typical_assumptions
     
     def to_dict(self) -> dict:
-        import time
-        with open(r'c:\dev\augmented-teams\.cursor\debug.log', 'a', encoding='utf-8') as f:
-            f.write(json.dumps({'sessionId':'debug-session','runId':'initial','hypothesisId':'H1','location':'json_strategy_action.py:67','message':'to_dict called','data':{'behavior_name':self.action.behavior.name if self.action.behavior else None,'has_strategy':bool(self.action.strategy)},'timestamp':int(time.time()*1000)})+'\n')
+        if trace.isEnabledFor(logging.DEBUG):
+            trace.debug('to_dict called', extra={'data': {'behavior_name':self.action.behavior.name if self.action.behavior else None,'has_strategy':bool(self.action.strategy)}})
         
         result = {
             'action_name': self.action.action_name,
@@ -74,20 +77,20 @@ class JSONStrategyAction(JSONAdapter):
             from actions.strategy.strategy_decision import StrategyDecision
             saved_data = StrategyDecision.load_all(self.action.behavior.bot_paths)
             
-            with open(r'c:\dev\augmented-teams\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'sessionId':'debug-session','runId':'initial','hypothesisId':'H3,H4','location':'json_strategy_action.py:83','message':'loaded saved_data','data':{'saved_data_keys':list(saved_data.keys()) if saved_data else None,'saved_data':saved_data,'behavior_name':self.action.behavior.name},'timestamp':int(time.time()*1000)})+'\n')
+            if trace.isEnabledFor(logging.DEBUG):
+                trace.debug('loaded saved_data', extra={'data': {'saved_data_keys':list(saved_data.keys()) if saved_data else None,'saved_data':saved_data,'behavior_name':self.action.behavior.name}})
             
             behavior_data = saved_data.get(self.action.behavior.name, {}) if saved_data else {}
             saved_decisions = behavior_data.get('decisions', {})
             saved_assumptions = behavior_data.get('assumptions', [])
             
-            with open(r'c:\dev\augmented-teams\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'sessionId':'debug-session','runId':'initial','hypothesisId':'H3,H4','location':'json_strategy_action.py:93','message':'extracted behavior data','data':{'behavior_data':behavior_data,'saved_decisions':saved_decisions,'saved_assumptions':saved_assumptions},'timestamp':int(time.time()*1000)})+'\n')
+            if trace.isEnabledFor(logging.DEBUG):
+                trace.debug('extracted behavior data', extra={'data': {'behavior_data':behavior_data,'saved_decisions':saved_decisions,'saved_assumptions':saved_assumptions}})
             
             serialized_criteria = {}
             
-            with open(r'c:\dev\augmented-teams\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'sessionId':'debug-session','runId':'initial','hypothesisId':'H2,H6','location':'json_strategy_action.py:102','message':'before serializing criteria','data':{'has_strategy_criteria':bool(self.action.strategy_criteria),'criteria_type':str(type(self.action.strategy_criteria)),'criteria_len':len(self.action.strategy_criteria) if self.action.strategy_criteria else 0},'timestamp':int(time.time()*1000)})+'\n')
+            if trace.isEnabledFor(logging.DEBUG):
+                trace.debug('before serializing criteria', extra={'data': {'has_strategy_criteria':bool(self.action.strategy_criteria),'criteria_type':str(type(self.action.strategy_criteria)),'criteria_len':len(self.action.strategy_criteria) if self.action.strategy_criteria else 0}})
             
             if self.action.strategy_criteria:
                 for key, criteria in self.action.strategy_criteria.items():
@@ -100,8 +103,8 @@ class JSONStrategyAction(JSONAdapter):
                             'outcome': criteria.outcome if hasattr(criteria, 'outcome') else None
                         }
             
-            with open(r'c:\dev\augmented-teams\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'sessionId':'debug-session','runId':'initial','hypothesisId':'H2,H6','location':'json_strategy_action.py:120','message':'after serializing criteria','data':{'serialized_count':len(serialized_criteria),'serialized_keys':list(serialized_criteria.keys())},'timestamp':int(time.time()*1000)})+'\n')
+            if trace.isEnabledFor(logging.DEBUG):
+                trace.debug('after serializing criteria', extra={'data': {'serialized_count':len(serialized_criteria),'serialized_keys':list(serialized_criteria.keys())}})
             
             result['strategy'] = {
                 'criteria_count': len(self.action.strategy_criteria) if self.action.strategy_criteria else 0,
@@ -115,8 +118,8 @@ class JSONStrategyAction(JSONAdapter):
                 }
             }
             
-            with open(r'c:\dev\augmented-teams\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'sessionId':'debug-session','runId':'initial','hypothesisId':'H5','location':'json_strategy_action.py:135','message':'final strategy structure','data':{'has_strategy_key':('strategy' in result),'strategy_criteria_criteria_keys':list(result['strategy']['strategy_criteria']['criteria'].keys()),'decisions_made_keys':list(result['strategy']['strategy_criteria']['decisions_made'].keys()),'assumptions_made_count':len(result['strategy']['assumptions']['assumptions_made'])},'timestamp':int(time.time()*1000)})+'\n')
+            if trace.isEnabledFor(logging.DEBUG):
+                trace.debug('final strategy structure', extra={'data': {'has_strategy_key':('strategy' in result),'strategy_criteria_criteria_keys':list(result['strategy']['strategy_criteria']['criteria'].keys()),'decisions_made_keys':list(result['strategy']['strategy_criteria']['decisions_made'].keys()),'assumptions_made_count':len(result['strategy']['assumptions']['assumptions_made'])}})
             
             if self.action.strategy_criteria:
                 criteria_dict = self.action.strategy_criteria
@@ -135,8 +138,8 @@ class JSONStrategyAction(JSONAdapter):
             if self.action.typical_assumptions:
                 result['typical_assumptions'] = self.action.typical_assumptions
         
-        with open(r'c:\dev\augmented-teams\.cursor\debug.log', 'a', encoding='utf-8') as f:
-            f.write(json.dumps({'sessionId':'debug-session','runId':'initial','hypothesisId':'H1','location':'json_strategy_action.py:152','message':'to_dict returning','data':{'result_keys':list(result.keys()),'has_strategy':('strategy' in result),'result_json_length':len(json.dumps(result))},'timestamp':int(time.time()*1000)})+'\n')
+        if trace.isEnabledFor(logging.DEBUG):
+            trace.debug('to_dict returning', extra={'data': {'result_keys':list(result.keys()),'has_strategy':('strategy' in result),'result_json_length':len(json.dumps(result))}})
         
         return result
     
@@ -5,24 +5,28 @@ from pathlib import Path
 from typing import Dict, Any, TYPE_CHECKING
 from datetime import datetime
 from actions.validate.validation_scope import ValidationScope
+from actions.validate.validation_job_manager import ValidationJobManager, ValidationJob, JOB_CANCELLED
 
 if TYPE_CHECKING:
     from action_context import ValidateActionContext
 
 class BackgroundValidationHandler:
 
-    def __init__(self, behavior, validation_executor):
+    def __init__(self, behavior, validation_executor, job_manager: ValidationJobManager = None):
         self.behavior = behavior
         self.validation_executor = validation_executor
+        self.job_manager = job_manager or ValidationJobManager(behavior.bot_paths)
 
     def execute_background(self, context: 'ValidateActionContext', track_completion_fn) -> Dict[str, Any]:
         total_files = self._get_file_count(context)
         timestamp = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
         status_path = self._get_status_path(timestamp)
-        context.timestamp = timestamp
-        self._start_validation_thread(context, track_completion_fn, status_path)
         status_path_relative = status_path.relative_to(self.behavior.bot_paths.workspace_directory)
-        return self._build_background_response(status_path_relative, total_files)
+        job = self.job_manager.create_job(self.behavior.name, status_path_relative)
+        context.timestamp = timestamp
+        context.cancel_check = lambda: self.job_manager.is_cancel_requested(job.job_id)
+        self._start_validation_thread(context, track_completion_fn, status_path, job)
+        return self._build_background_response(status_path_relative, total_files, job)
 
     def _get_file_count(self, context: 'ValidateActionContext') -> int:
         try:
@@ -38,34 +42,41 @@ class BackgroundValidationHandler:
         reports_dir.mkdir(parents=True, exist_ok=True)
         return reports_dir / f'{self.behavior.name}-validation-status-{timestamp}.md'
 
-    def _start_validation_thread(self, context: 'ValidateActionContext', track_completion_fn, status_path: Path) -> None:
+    def _start_validation_thread(self, context: 'ValidateActionContext', track_completion_fn, status_path: Path, job: ValidationJob) -> None:
 
         def run_validation():
-            self._run_validation_task(context, track_completion_fn, status_path)
-        threading.Thread(target=run_validation, daemon=False, name='ValidationThread').start()
+            self._run_validation_task(context, track_completion_fn, status_path, job)
+        threading.Thread(target=run_validation, daemon=False, name=f'ValidationThread-{job.job_id}').start()
 
-    def _run_validation_task(self, context: 'ValidateActionContext', track_completion_fn, status_path: Path) -> None:
+    def _run_validation_task(self, context: 'ValidateActionContext', track_completion_fn, status_path: Path, job: ValidationJob) -> None:
         logger = logging.getLogger(__name__)
         try:
             result = self.validation_executor.execute_synchronous(context)
             track_completion_fn(outputs=result)
-            logger.info('Background validation completed successfully')
+            job = self.job_manager.finish(job)
+            if job.status == JOB_CANCELLED:
+                self._append_to_status_file(status_path, '\n\n## CANCELLED\n\nValidation was cancelled; results above are partial.\n', logger)
+            logger.info(f'Background validation {job.job_id} finished: {job.status}')
         except Exception as e:
+            self.job_manager.finish(job, error=str(e))
             self._handle_validation_error(e, track_completion_fn, status_path, logger)
 
     def _handle_validation_error(self, e: Exception, track_completion_fn, status_path: Path, logger) -> None:
         track_completion_fn(outputs={'error': str(e)})
         logger.error(f'Background validation failed: {e}')
         traceback.print_exc()
+        self._append_to_status_file(status_path, f'\n\n## ERROR\n\nValidation failed with error: {e}\n', logger)
+
+    def _append_to_status_file(self, status_path: Path, text: str, logger) -> None:
         try:
             status_path.parent.mkdir(parents=True, exist_ok=True)
             with open(status_path, 'a', encoding='utf-8') as f:
-                f.write(f'\n\n## ERROR\n\nValidation failed with error: {e}\n')
+                f.write(text)
         except Exception as status_err:
-            logger.error(f'Could not write error to status file: {status_err}')
+            logger.error(f'Could not write to status file: {status_err}')
 
-    def _build_background_response(self, status_path_relative: Path, total_files: int) -> Dict[str, Any]:
-        return {'instructions': {'base_instructions': self._get_background_instructions(status_path_relative, total_files)}, '_background_execution': True, 'background': True, 'status_file': str(status_path_relative), 'total_files': total_files}
+    def _build_background_response(self, status_path_relative: Path, total_files: int, job: ValidationJob) -> Dict[str, Any]:
+        return {'instructions': {'base_instructions': self._get_background_instructions(status_path_relative, total_files, job)}, '_background_execution': True, 'background': True, 'job_id': job.job_id, 'status_file': str(status_path_relative), 'total_files': total_files}
 
-    def _get_background_instructions(self, status_path_relative: Path, total_files: int) -> list:
-        return ['', '=' * 70, '**VALIDATION RUNNING IN BACKGROUND**', '=' * 70, '', '**CRITICAL: YOU MUST POLL THE STATUS FILE EVERY 10 SECONDS UNTIL VALIDATION COMPLETES**', '', f'Validation has been started in the background. It will scan {total_files} file(s).', '', '**Status File:**', f'  {status_path_relative}', '', '**AI ASSISTANT DIRECTIVES:**', '1. YOU MUST read the status file every 10 seconds to check progress', '2. YOU MUST report the current status summary to the user each time you check', '3. Continue polling every 10 seconds until validation is complete', '4. When complete, YOU MUST read and report the final summary from the status file', '5. Also check the full report at: docs/stories/code-validation-report.md', '', 'The validation is running asynchronously and will update the status file in real-time.', 'The status file shows progress as scanners complete their work.', '', '**Status File Location:**', f'  {status_path_relative}', '', '**Report File Location (when complete):**', '  docs/stories/code-validation-report.md', '', '=' * 70, '']
\ No newline at end of file
+    def _get_background_instructions(self, status_path_relative: Path, total_files: int, job: ValidationJob) -> list:
+        return ['', '=' * 70, '**VALIDATION RUNNING IN BACKGROUND**', '=' * 70, '', '**CRITICAL: YOU MUST POLL THE STATUS FILE EVERY 10 SECONDS UNTIL VALIDATION COMPLETES**', '', f'Validation has been started in the background. It will scan {total_files} file(s).', '', f'**Job ID:** {job.job_id}', f'  Check progress: validation_status {job.job_id}', f'  Stop the run:   validation_cancel {job.job_id}', '', '**Status File:**', f'  {status_path_relative}', '', '**AI ASSISTANT DIRECTIVES:**', '1. YOU MUST read the status file every 10 seconds to check progress', '2. YOU MUST report the current status summary to the user each time you check', '3. Continue polling every 10 seconds until validation is complete', '4. When complete, YOU MUST read and report the final summary from the status file', '5. Also check the full report at: docs/stories/code-validation-report.md', '', 'The validation is running asynchronously and will update the status file in real-time.', 'The status file shows progress as scanners complete their work.', '', '**Status File Location:**', f'  {status_path_relative}', '', '**Report File Location (when complete):**', '  docs/stories/code-validation-report.md', '', '=' * 70, '']
\ No newline at end of file
@@ -1,15 +1,172 @@
-﻿import logging
+﻿import fnmatch
+import logging
+import os
+import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from bot_path import BotPath
 
+logger = logging.getLogger(__name__)
+
+GLOB_CHARS = ('*', '?', '[')
+
+
+@dataclass
+class DiscoveredFile:
+    """A file found by the discovery walk; its stat is taken from the directory entry on first use and then kept."""
+    path: Path
+    relative_path: str
+    _entry: Optional[os.DirEntry] = field(default=None, repr=False, compare=False)
+    _stat: Optional[os.stat_result] = field(default=None, repr=False, compare=False)
+
+    @property
+    def stat(self) -> os.stat_result:
+        if self._stat is None:
+            self._stat = self._entry.stat() if self._entry is not None else self.path.stat()
+        return self._stat
+
+    @property
+    def mtime(self) -> float:
+        return self.stat.st_mtime
+
+    @property
+    def size(self) -> int:
+        return self.stat.st_size
+
+
+def _gitignore_pattern_to_regex(pattern: str) -> str:
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == len(pattern):
+            parts.append('/.*')
+            i += 3
+        elif pattern[i] == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            parts.append('[^/]')
+            i += 1
+        elif pattern[i] == '[' and ']' in pattern[i + 1:]:
+            end = pattern.index(']', i + 1)
+            parts.append('[' + pattern[i + 1:end].replace('!', '^', 1) + ']')
+            i = end + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+    return ''.join(parts)
+
+
+@dataclass(frozen=True)
+class GitignoreRule:
+    base: str
+    regex: 're.Pattern'
+    negated: bool
+    directory_only: bool
+
+    @classmethod
+    def parse(cls, line: str, base: str) -> Optional['GitignoreRule']:
+        line = line.rstrip('\n').rstrip('\r')
+        if not line.strip() or line.startswith('#'):
+            return None
+        line = line.rstrip(' ')
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        directory_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return None
+        anchored = '/' in line
+        line = line.lstrip('/')
+        prefix = '' if anchored else '(?:.*/)?'
+        return cls(base=base, regex=re.compile(prefix + _gitignore_pattern_to_regex(line) + '$'), negated=negated, directory_only=directory_only)
+
+    def matches(self, path_str: str, is_dir: bool) -> bool:
+        if self.directory_only and not is_dir:
+            return False
+        if not path_str.startswith(self.base + '/'):
+            return False
+        return self.regex.match(path_str[len(self.base) + 1:]) is not None
+
+
+def load_gitignore_rules(directory: str) -> Tuple[GitignoreRule, ...]:
+    try:
+        with open(os.path.join(directory, '.gitignore'), encoding='utf-8') as gitignore:
+            lines = gitignore.readlines()
+    except (OSError, UnicodeDecodeError):
+        return ()
+    base = directory.replace('\\', '/').rstrip('/')
+    return tuple(rule for rule in (GitignoreRule.parse(line, base) for line in lines) if rule)
+
+
+def is_gitignored(rules: Tuple[GitignoreRule, ...], path_str: str, is_dir: bool) -> bool:
+    ignored = False
+    for rule in rules:
+        if rule.negated == ignored and rule.matches(path_str, is_dir):
+            ignored = not rule.negated
+    return ignored
+
+
+class ExcludeMatcher:
+    """Exclude patterns compiled once: substrings of the path, globs and existing folders (resolved a single time)."""
+
+    def __init__(self, patterns: List[str], workspace_directory: Optional[Path] = None):
+        self.substrings = [pattern.replace('\\', '/') for pattern in patterns]
+        self.globs = [pattern for pattern in self.substrings if any(char in pattern for char in GLOB_CHARS)]
+        self.folders: List[Tuple[str, bool]] = []
+        for pattern in patterns:
+            pattern_path = Path(pattern)
+            if pattern_path.is_dir():
+                self._add_folder(pattern_path)
+            if not pattern_path.is_absolute() and workspace_directory:
+                resolved = workspace_directory / pattern_path
+                if resolved.is_dir():
+                    self._add_folder(resolved)
+
+    def _add_folder(self, folder: Path) -> None:
+        self.folders.append((str(folder).replace('\\', '/').rstrip('/'), folder.is_absolute()))
+
+    def __bool__(self) -> bool:
+        return bool(self.substrings)
+
+    def matches(self, path: Path, path_str: str, relative_str: Optional[str]) -> bool:
+        for pattern in self.substrings:
+            if pattern in path_str or (relative_str and pattern in relative_str):
+                return True
+        for pattern in self.globs:
+            if fnmatch.fnmatchcase(relative_str or path_str, pattern) or fnmatch.fnmatchcase(path.name, pattern):
+                return True
+        for folder_str, folder_is_absolute in self.folders:
+            if (folder_is_absolute or path.is_absolute()) and (path_str == folder_str or path_str.startswith(folder_str + '/')):
+                return True
+        return False
+
+
 class FileDiscovery:
     EXCLUDED_FILES = {'__init__.py'}
 
-    def __init__(self, bot_paths: Optional[BotPath]=None, behavior_name: Optional[str]=None, exclude_patterns: List[str]=None):
+    def __init__(self, bot_paths: Optional[BotPath]=None, behavior_name: Optional[str]=None, exclude_patterns: List[str]=None, respect_gitignore: bool = False):
         self.bot_paths = bot_paths
         self.behavior_name = behavior_name
         self.exclude_patterns = exclude_patterns or []
+        self.respect_gitignore = respect_gitignore
+        self.discovered: Dict[Path, DiscoveredFile] = {}
+        self._exclude_matcher: Optional[ExcludeMatcher] = None
+
+    @property
+    def exclude_matcher(self) -> ExcludeMatcher:
+        if self._exclude_matcher is None:
+            self._exclude_matcher = ExcludeMatcher(self.exclude_patterns, self._workspace_directory)
+        return self._exclude_matcher
+
+    @property
+    def _workspace_directory(self) -> Optional[Path]:
+        return self.bot_paths.workspace_directory if self.bot_paths else None
 
     def should_include_file(self, file_path: Path) -> bool:
         if file_path.name in self.EXCLUDED_FILES:
@@ -20,11 +177,7 @@ class FileDiscovery:
 
     def _matches_any_exclude_pattern(self, file_path: Path) -> bool:
         file_path_str = str(file_path).replace('\\', '/')
-        file_relative_str = self._get_relative_path_str(file_path)
-        for pattern in self.exclude_patterns:
-            if self._matches_exclude_pattern(file_path, file_path_str, file_relative_str, pattern):
-                return True
-        return False
+        return self.exclude_matcher.matches(file_path, file_path_str, self._get_relative_path_str(file_path))
 
     def _get_relative_path_str(self, file_path: Path) -> Optional[str]:
         if not (file_path.is_absolute() and self.bot_paths and self.bot_paths.workspace_directory):
@@ -32,57 +185,100 @@ class FileDiscovery:
         try:
             return str(file_path.relative_to(self.bot_paths.workspace_directory)).replace('\\', '/')
         except ValueError as e:
-            logging.getLogger(__name__).debug(f'File not relative to workspace: {e}')
+            logger.debug(f'File not relative to workspace: {e}')
             raise
 
-    def _matches_exclude_pattern(self, file_path: Path, file_path_str: str, file_relative_str: Optional[str], pattern: str) -> bool:
-        pattern_normalized = pattern.replace('\\', '/')
-        if pattern_normalized in file_path_str:
-            return True
-        if file_relative_str and pattern_normalized in file_relative_str:
-            return True
-        if self._matches_folder_pattern(file_path, pattern):
-            return True
-        return False
+    def discover(self, root: Path, suffix: str = '.py') -> List[DiscoveredFile]:
+        """Walk root once with os.scandir, pruning excluded and gitignored directories.
 
-    def _matches_folder_pattern(self, file_path: Path, pattern: str) -> bool:
-        pattern_path = Path(pattern)
-        if pattern_path.exists() and pattern_path.is_dir():
-            if self._is_file_in_folder(file_path, str(pattern_path)):
-                return True
-        if not pattern_path.is_absolute() and self.bot_paths and self.bot_paths.workspace_directory:
-            resolved = self.bot_paths.workspace_directory / pattern_path
-            if resolved.exists() and resolved.is_dir() and self._is_file_in_folder(file_path, str(resolved)):
-                return True
-        return False
+        Files come back in the same order as root.rglob('*' + suffix). Symlinked directories are not followed and
+        symlinked files are kept only when they point back inside root. A relative root is taken as relative to the
+        workspace, so the workspace's .gitignore applies to it.
+        """
+        root = self._resolve_root(root)
+        root_real = os.path.realpath(root)
+        if not os.path.isdir(root_real):
+            return []
+        matcher = self.exclude_matcher
+        workspace_prefix = self._workspace_prefix(root) if matcher else None
+        gitignore_rules = self._ancestor_gitignore_rules(root) if self.respect_gitignore else ()
+        files_by_directory: Dict[str, List[DiscoveredFile]] = {}
+        directory_order = [str(root)]
+        stack = [(root, str(root).replace('\\', '/'), '', gitignore_rules)]
+        while stack:
+            dir_path, dir_str, dir_relative, rules = stack.pop()
+            if self.respect_gitignore and dir_path is not root:
+                rules = rules + load_gitignore_rules(str(dir_path))
+            try:
+                with os.scandir(dir_path) as scanned:
+                    entries = list(scanned)
+            except OSError as e:
+                logger.debug(f'Skipping unreadable directory {dir_path}: {e}')
+                continue
+            subdirectories = []
+            directory_files = files_by_directory.setdefault(str(dir_path), [])
+            for entry in entries:
+                entry_str = f'{dir_str}/{entry.name}'
+                entry_relative = f'{dir_relative}/{entry.name}' if dir_relative else entry.name
+                workspace_relative = workspace_prefix + entry_relative if workspace_prefix is not None else None
+                try:
+                    is_dir = entry.is_dir()
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    continue
+                if is_dir and not is_symlink:
+                    if self.respect_gitignore and (entry.name == '.git' or is_gitignored(rules, entry_str, True)):
+                        continue
+                    entry_path = dir_path / entry.name
+                    if matcher and matcher.matches(entry_path, entry_str, workspace_relative):
+                        continue
+                    subdirectories.append((entry_path, entry_str, entry_relative, rules))
+                    continue
+                if not entry.name.endswith(suffix) or entry.name in self.EXCLUDED_FILES:
+                    continue
+                if self.respect_gitignore and is_gitignored(rules, entry_str, False):
+                    continue
+                if is_symlink and not self._is_inside(entry.path, root_real):
+                    continue
+                entry_path = dir_path / entry.name
+                if matcher and matcher.matches(entry_path, entry_str, workspace_relative):
+                    continue
+                discovered_file = DiscoveredFile(path=entry_path, relative_path=entry_relative, _entry=entry)
+                self.discovered[entry_path] = discovered_file
+                directory_files.append(discovered_file)
+            # rglob lists a directory's subdirectories when the walk reaches that directory
+            directory_order.extend(str(subdirectory[0]) for subdirectory in subdirectories)
+            stack.extend(reversed(subdirectories))
+        return [discovered for directory in directory_order for discovered in files_by_directory.get(directory, ())]
 
-    def _is_file_in_folder(self, file_path: Path, folder_pattern: str) -> bool:
-        try:
-            folder_path = Path(folder_pattern)
-            if not (folder_path.is_absolute() or file_path.is_absolute()):
-                return False
-            return self._check_path_relative(file_path, folder_path)
-        except Exception:
-            return False
+    def _resolve_root(self, root: Path) -> Path:
+        workspace = self._workspace_directory
+        if root.is_absolute() or not workspace:
+            return root
+        return Path(workspace) / root
 
-    def _check_path_relative(self, file_path: Path, folder_path: Path) -> bool:
-        try:
-            return file_path.is_relative_to(folder_path)
-        except ValueError as e:
-            logging.getLogger(__name__).debug(f'Path comparison failed (ValueError): {e}')
-            raise
+    def _workspace_prefix(self, root: Path) -> Optional[str]:
+        root_relative = self._get_relative_path_str(root)
+        if root_relative is None:
+            return None
+        return '' if root_relative == '.' else root_relative + '/'
+
+    @staticmethod
+    def _is_inside(path: str, root_real: str) -> bool:
+        real = os.path.realpath(path)
+        return real == root_real or real.startswith(root_real + os.sep)
+
+    def _ancestor_gitignore_rules(self, root: Path) -> Tuple[GitignoreRule, ...]:
+        workspace = self._workspace_directory
+        base = workspace if workspace and root.is_relative_to(workspace) else root
+        rules = load_gitignore_rules(str(base))
+        for part in root.relative_to(base).parts:
+            base = base / part
+            rules = rules + load_gitignore_rules(str(base))
+        return rules
 
     def expand_directory_to_files(self, dir_path: Path) -> List[Path]:
-        abs_dir_path = dir_path.resolve()
-        abs_dir_str = str(abs_dir_path).replace('\\', '/')
-        result = []
-        for f in dir_path.rglob('*.py'):
-            if not self.should_include_file(f):
-                continue
-            f_abs_str = str(f.resolve()).replace('\\', '/')
-            if f_abs_str.startswith(abs_dir_str + '/') or f_abs_str == abs_dir_str:
-                result.append(f)
-        return result
+        return [discovered.path for discovered in self.discover(dir_path)]
 
     def discover_files_from_directory(self, dir_name: str) -> List[Path]:
         if not self.bot_paths:
@@ -91,26 +287,18 @@ class FileDiscovery:
         return self._collect_py_files_in_dir(search_dir)
 
     def _collect_py_files_in_dir(self, search_dir: Path) -> List[Path]:
-        abs_dir_str = str(search_dir.resolve()).replace('\\', '/')
-        discovered = []
-        for f in search_dir.rglob('*.py'):
-            if not self.should_include_file(f):
-                continue
-            f_abs_str = str(f.resolve()).replace('\\', '/')
-            if f_abs_str.startswith(abs_dir_str + '/') or f_abs_str == abs_dir_str:
-                discovered.append(f)
-        return discovered
+        return [discovered.path for discovered in self.discover(search_dir)]
 
     def auto_discover_files(self, key: str) -> List[str]:
         if not self.bot_paths:
             return []
         dir_name = self._behavior_to_directory() if self.behavior_name else key
         search_dir = self.bot_paths.workspace_directory / dir_name
-        return [str(f) for f in search_dir.rglob('*.py') if self.should_include_file(f)]
+        return [str(discovered.path) for discovered in self.discover(search_dir)]
 
     def _behavior_to_directory(self) -> Optional[str]:
         if not self.behavior_name:
             return None
         if self.behavior_name == 'code':
             return 'src'
-        return self.behavior_name
\ No newline at end of file
+        return self.behavior_name
@@ -0,0 +1,483 @@
+"""Changed-file detection for the 'changed' validation scope.
+
+Reads .git/index, refs and the object store (loose objects and packs) directly so no git subprocess is needed.
+"""
+import bisect
+import hashlib
+import logging
+import mmap
+import os
+import re
+import struct
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+WORKING_TREE = 'working-tree'
+DEFAULT_REVISION = 'HEAD'
+SOURCE_SUFFIXES = ('.py', '.js')
+
+OBJECT_TYPES = {1: 'commit', 2: 'tree', 3: 'blob', 4: 'tag'}
+OFS_DELTA = 6
+REF_DELTA = 7
+
+REVISION_SUFFIX = re.compile(r'(\^\d*|~\d*)$')
+ABBREVIATED_SHA = re.compile(r'[0-9a-f]{4,39}')
+IMPORT_PATTERN = re.compile(r'^[ \t]*(?:from[ \t]+(\.*[\w.]*)[ \t]+import[ \t]+\(?([\w*, \t]+)|import[ \t]+([\w., \t]+))', re.MULTILINE)
+
+
+class GitError(Exception):
+    pass
+
+
+class RevisionError(GitError):
+    """The requested revision does not name exactly one commit."""
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    path: str
+    sha: str
+    mtime_ns: int
+    size: int
+
+
+def find_git_directory(start: Path) -> Optional[Path]:
+    for directory in (start, *start.parents):
+        git_path = directory / '.git'
+        if git_path.is_dir():
+            return git_path
+        if git_path.is_file():
+            # Worktrees and submodules point at their real git directory
+            content = git_path.read_text(encoding='utf-8').strip()
+            if content.startswith('gitdir:'):
+                return (directory / content[len('gitdir:'):].strip()).resolve()
+    return None
+
+
+def read_index(git_dir: Path) -> Dict[str, IndexEntry]:
+    index_path = git_dir / 'index'
+    if not index_path.exists():
+        return {}
+    data = index_path.read_bytes()
+    signature, version, count = struct.unpack('>4sLL', data[:12])
+    if signature != b'DIRC' or version not in (2, 3, 4):
+        raise GitError(f'Unsupported git index: {signature!r} version {version}')
+    entries = {}
+    offset = 12
+    previous_path = b''
+    for _ in range(count):
+        fields = struct.unpack('>10L20sH', data[offset:offset + 62])
+        mtime_ns = fields[2] * 1_000_000_000 + fields[3]
+        size = fields[9]
+        sha = fields[10].hex()
+        flags = fields[11]
+        entry_start = offset
+        offset += 62
+        if version >= 3 and flags & 0x4000:
+            offset += 2
+        if version == 4:
+            strip, offset = _read_varint(data, offset)
+            path_end = data.index(b'\0', offset)
+            path = previous_path[:len(previous_path) - strip] + data[offset:path_end]
+            offset = path_end + 1
+        else:
+            path_end = data.index(b'\0', offset)
+            path = data[offset:path_end]
+            # Entries are NUL padded to a multiple of eight bytes
+            offset = entry_start + ((path_end - entry_start + 8) & ~7)
+        previous_path = path
+        decoded = path.decode('utf-8', errors='surrogateescape')
+        entries[decoded] = IndexEntry(path=decoded, sha=sha, mtime_ns=mtime_ns, size=size)
+    return entries
+
+
+def _read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    # Index v4 offset encoding: each continuation adds one before shifting
+    byte = data[offset]
+    offset += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[offset]
+        offset += 1
+        value = ((value + 1) << 7) | (byte & 0x7F)
+    return value, offset
+
+
+def blob_sha(content: bytes) -> str:
+    return hashlib.sha1(b'blob %d\0' % len(content) + content).hexdigest()
+
+
+class PackFile:
+    def __init__(self, idx_path: Path):
+        self.pack_path = idx_path.with_suffix('.pack')
+        data = idx_path.read_bytes()
+        if data[:4] != b'\377tOc' or struct.unpack('>L', data[4:8])[0] != 2:
+            raise GitError(f'Unsupported pack index: {idx_path}')
+        self._fanout = struct.unpack('>256L', data[8:8 + 1024])
+        count = self._fanout[-1]
+        shas_start = 8 + 1024
+        self._shas = [data[shas_start + i * 20:shas_start + (i + 1) * 20] for i in range(count)]
+        offsets_start = shas_start + count * 24
+        self._offsets = struct.unpack(f'>{count}L', data[offsets_start:offsets_start + count * 4])
+        self._large_offsets_start = offsets_start + count * 4
+        self._index_data = data
+        self._pack = None
+
+    def offset_of(self, sha: bytes) -> Optional[int]:
+        low = self._fanout[sha[0] - 1] if sha[0] else 0
+        high = self._fanout[sha[0]]
+        position = bisect.bisect_left(self._shas, sha, low, high)
+        if position >= high or self._shas[position] != sha:
+            return None
+        offset = self._offsets[position]
+        if offset & 0x80000000:
+            large_index = offset & 0x7FFFFFFF
+            start = self._large_offsets_start + large_index * 8
+            offset = struct.unpack('>Q', self._index_data[start:start + 8])[0]
+        return offset
+
+    def shas_with_prefix(self, prefix: str) -> List[str]:
+        position = bisect.bisect_left(self._shas, bytes.fromhex(prefix.ljust(40, '0')))
+        matches = []
+        while position < len(self._shas) and self._shas[position].hex().startswith(prefix):
+            matches.append(self._shas[position].hex())
+            position += 1
+        return matches
+
+    def read_at(self, offset: int, store: 'GitObjectStore') -> Tuple[str, bytes]:
+        pack = self._open()
+        byte = pack[offset]
+        object_type = (byte >> 4) & 7
+        position = offset + 1
+        shift = 4
+        while byte & 0x80:
+            byte = pack[position]
+            position += 1
+            shift += 7
+        if object_type == OFS_DELTA:
+            byte = pack[position]
+            position += 1
+            base_distance = byte & 0x7F
+            while byte & 0x80:
+                byte = pack[position]
+                position += 1
+                base_distance = ((base_distance + 1) << 7) | (byte & 0x7F)
+            base_type, base = self.read_at(offset - base_distance, store)
+            return base_type, _apply_delta(base, self._inflate(position))
+        if object_type == REF_DELTA:
+            base_type, base = store.read(pack[position:position + 20].hex())
+            return base_type, _apply_delta(base, self._inflate(position + 20))
+        return OBJECT_TYPES[object_type], self._inflate(position)
+
+    def _inflate(self, position: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        chunks = []
+        pack = self._open()
+        while not decompressor.eof and position < len(pack):
+            chunks.append(decompressor.decompress(pack[position:position + 65536]))
+            position += 65536
+        return b''.join(chunks)
+
+    def _open(self):
+        if self._pack is None:
+            with open(self.pack_path, 'rb') as pack_file:
+                self._pack = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._pack
+
+
+def _apply_delta(base: bytes, delta: bytes) -> bytes:
+    position = 0
+    for _ in range(2):
+        # Source and target sizes; the ops below are enough to rebuild the target
+        while delta[position] & 0x80:
+            position += 1
+        position += 1
+    result = bytearray()
+    while position < len(delta):
+        opcode = delta[position]
+        position += 1
+        if opcode & 0x80:
+            copy_offset = copy_size = 0
+            for bit in range(4):
+                if opcode & (1 << bit):
+                    copy_offset |= delta[position] << (8 * bit)
+                    position += 1
+            for bit in range(3):
+                if opcode & (1 << (4 + bit)):
+                    copy_size |= delta[position] << (8 * bit)
+                    position += 1
+            result += base[copy_offset:copy_offset + (copy_size or 0x10000)]
+        elif opcode:
+            result += delta[position:position + opcode]
+            position += opcode
+        else:
+            raise GitError('Invalid delta opcode 0')
+    return bytes(result)
+
+
+class GitObjectStore:
+    def __init__(self, git_dir: Path):
+        self.git_dir = git_dir
+        self.objects_dir = self._common_dir() / 'objects'
+        self._packs: Optional[List[PackFile]] = None
+
+    def _common_dir(self) -> Path:
+        commondir = self.git_dir / 'commondir'
+        if commondir.exists():
+            return (self.git_dir / commondir.read_text(encoding='utf-8').strip()).resolve()
+        return self.git_dir
+
+    def read(self, sha: str) -> Tuple[str, bytes]:
+        loose_path = self.objects_dir / sha[:2] / sha[2:]
+        if loose_path.exists():
+            raw = zlib.decompress(loose_path.read_bytes())
+            header_end = raw.index(b'\0')
+            object_type = raw[:header_end].split(b' ', 1)[0].decode('ascii')
+            return object_type, raw[header_end + 1:]
+        binary_sha = bytes.fromhex(sha)
+        for pack in self.packs:
+            offset = pack.offset_of(binary_sha)
+            if offset is not None:
+                return pack.read_at(offset, self)
+        raise GitError(f'Object not found: {sha}')
+
+    @property
+    def packs(self) -> List[PackFile]:
+        if self._packs is None:
+            pack_dir = self.objects_dir / 'pack'
+            self._packs = [PackFile(idx_path) for idx_path in sorted(pack_dir.glob('*.idx'))] if pack_dir.is_dir() else []
+        return self._packs
+
+    def resolve(self, revision: str) -> str:
+        suffix = REVISION_SUFFIX.search(revision)
+        if suffix:
+            sha = self.resolve(revision[:suffix.start()])
+            operator, count = suffix.group(1)[0], suffix.group(1)[1:]
+            steps = int(count) if count else 1
+            if operator == '^':
+                if not steps:
+                    return sha
+                parents = self._parents(sha)
+                if steps > len(parents):
+                    raise RevisionError(f'Commit {sha} has no parent {steps}')
+                return parents[steps - 1]
+            for _ in range(steps):
+                sha = self._parents(sha)[0]
+            return sha
+        if re.fullmatch(r'[0-9a-f]{40}', revision):
+            return revision
+        sha = self._resolve_ref(revision)
+        if sha is not None:
+            return sha
+        # Like git, a ref wins over an object id it happens to abbreviate
+        if ABBREVIATED_SHA.fullmatch(revision):
+            return self._expand_abbreviated(revision)
+        raise RevisionError(f'Unknown revision: {revision}')
+
+    def _expand_abbreviated(self, prefix: str) -> str:
+        matches = set()
+        loose_dir = self.objects_dir / prefix[:2]
+        if loose_dir.is_dir():
+            matches.update(prefix[:2] + entry.name for entry in loose_dir.iterdir() if entry.name.startswith(prefix[2:]))
+        for pack in self.packs:
+            matches.update(pack.shas_with_prefix(prefix))
+        if not matches:
+            raise RevisionError(f'Unknown revision: {prefix}')
+        if len(matches) > 1:
+            raise RevisionError(f'Ambiguous revision: {prefix} matches {len(matches)} objects, use more characters')
+        return matches.pop()
+
+    def _resolve_ref(self, name: str) -> Optional[str]:
+        common_dir = self._common_dir()
+        candidates = [name] if name.startswith('refs/') or name == 'HEAD' else [f'refs/heads/{name}', f'refs/tags/{name}', f'refs/remotes/{name}']
+        for candidate in candidates:
+            for base in (self.git_dir, common_dir):
+                ref_path = base / candidate
+                if ref_path.is_file():
+                    content = ref_path.read_text(encoding='utf-8').strip()
+                    if content.startswith('ref:'):
+                        return self._resolve_ref(content[4:].strip())
+                    return content
+            packed = self._packed_refs().get(candidate)
+            if packed:
+                return packed
+        return None
+
+    def _packed_refs(self) -> Dict[str, str]:
+        packed_path = self._common_dir() / 'packed-refs'
+        if not packed_path.exists():
+            return {}
+        refs = {}
+        for line in packed_path.read_text(encoding='utf-8').splitlines():
+            if line and line[0] not in '#^':
+                sha, ref_name = line.split(' ', 1)
+                refs[ref_name] = sha
+        return refs
+
+    def _commit_headers(self, sha: str) -> List[Tuple[str, str]]:
+        object_type, data = self.read(sha)
+        while object_type == 'tag':
+            sha = data.split(b'\n', 1)[0].split(b' ', 1)[1].decode('ascii')
+            object_type, data = self.read(sha)
+        if object_type != 'commit':
+            raise GitError(f'{sha} is a {object_type}, not a commit')
+        header = data.split(b'\n\n', 1)[0].decode('utf-8', errors='replace')
+        return [tuple(line.split(' ', 1)) for line in header.splitlines() if ' ' in line and not line.startswith(' ')]
+
+    def _parents(self, sha: str) -> List[str]:
+        parents = [value for key, value in self._commit_headers(sha) if key == 'parent']
+        if not parents:
+            raise RevisionError(f'Commit {sha} has no parent')
+        return parents
+
+    def tree_of(self, commit_sha: str) -> str:
+        return next(value for key, value in self._commit_headers(commit_sha) if key == 'tree')
+
+    def tree_blobs(self, tree_sha: str, prefix: str = '') -> Dict[str, str]:
+        blobs = {}
+        _, data = self.read(tree_sha)
+        position = 0
+        while position < len(data):
+            space = data.index(b' ', position)
+            name_end = data.index(b'\0', space)
+            mode = data[position:space]
+            name = data[space + 1:name_end].decode('utf-8', errors='surrogateescape')
+            sha = data[name_end + 1:name_end + 21].hex()
+            position = name_end + 21
+            path = f'{prefix}{name}'
+            if mode == b'40000':
+                blobs.update(self.tree_blobs(sha, path + '/'))
+            elif mode != b'160000':
+                blobs[path] = sha
+        return blobs
+
+
+class GitChangeDetector:
+    """Finds the source files that differ from a revision.
+
+    'working-tree' compares HEAD with the files on disk, so staged and unstaged edits both count (like
+    `git diff HEAD`); before the first commit every source file counts as changed.
+    """
+
+    def __init__(self, workspace_directory: Path):
+        self.workspace_directory = Path(workspace_directory)
+        self.git_dir = find_git_directory(self.workspace_directory.resolve())
+        if self.git_dir is None:
+            raise GitError(f'Not a git repository: {self.workspace_directory}')
+        self.repository_root = self._repository_root()
+        self.objects = GitObjectStore(self.git_dir)
+
+    def _repository_root(self) -> Path:
+        for directory in (self.workspace_directory.resolve(), *self.workspace_directory.resolve().parents):
+            if (directory / '.git').exists():
+                return directory
+        return self.workspace_directory.resolve()
+
+    def changed_files(self, revision: str, candidates: Iterable[Path]) -> Set[Path]:
+        index = read_index(self.git_dir)
+        if revision == WORKING_TREE:
+            baseline = self._head_blobs()
+        else:
+            baseline = self.objects.tree_blobs(self.objects.tree_of(self.objects.resolve(revision or DEFAULT_REVISION)))
+        changed = set()
+        for file_path in candidates:
+            if not file_path.name.endswith(SOURCE_SUFFIXES):
+                continue
+            relative = self._relative_to_repository(file_path)
+            if relative is None:
+                continue
+            current = self._current_sha(file_path, index.get(relative))
+            if current is not None and baseline.get(relative) != current:
+                changed.add(file_path)
+        return changed
+
+    def _head_blobs(self) -> Dict[str, str]:
+        try:
+            head = self.objects.resolve(DEFAULT_REVISION)
+        except RevisionError:
+            # Unborn branch: nothing is committed yet
+            return {}
+        return self.objects.tree_blobs(self.objects.tree_of(head))
+
+    def _relative_to_repository(self, file_path: Path) -> Optional[str]:
+        try:
+            return Path(os.path.realpath(file_path)).relative_to(self.repository_root).as_posix()
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _current_sha(file_path: Path, entry: Optional[IndexEntry]) -> Optional[str]:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        if entry is not None and entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            # Unchanged since it was staged, so the index already holds its blob id
+            return entry.sha
+        try:
+            return blob_sha(file_path.read_bytes())
+        except OSError:
+            return None
+
+
+def _module_names(file_path: Path, source_roots: List[Path]) -> Set[str]:
+    names = set()
+    for root in source_roots:
+        try:
+            parts = list(file_path.relative_to(root).with_suffix('').parts)
+        except ValueError:
+            continue
+        if parts and parts[-1] == '__init__':
+            parts.pop()
+        if parts:
+            names.add('.'.join(parts))
+    return names
+
+
+def _imported_modules(content: str, package: str) -> Set[str]:
+    imported = set()
+    for from_module, from_names, plain_names in IMPORT_PATTERN.findall(content):
+        if plain_names:
+            imported.update(name.split()[0] for name in plain_names.split(',') if name.strip())
+            continue
+        module = from_module
+        if module.startswith('.'):
+            level = len(module) - len(module.lstrip('.'))
+            package_parts = package.split('.') if package else []
+            base_parts = package_parts[:len(package_parts) - level + 1] if level > 1 else package_parts
+            module = '.'.join(base_parts + ([module.lstrip('.')] if module.lstrip('.') else []))
+        if module:
+            imported.add(module)
+        for name in from_names.split(','):
+            name = name.strip().split(' ')[0]
+            if name and name != '*':
+                imported.add(f'{module}.{name}' if module else name)
+    return imported
+
+
+def reverse_dependencies(changed: Set[Path], candidates: Iterable[Path], source_roots: List[Path]) -> Set[Path]:
+    """Python files among candidates that import one of the changed modules directly."""
+    changed_modules = set()
+    for file_path in changed:
+        if file_path.suffix == '.py':
+            changed_modules |= _module_names(file_path, source_roots)
+    if not changed_modules:
+        return set()
+    importers = set()
+    for file_path in candidates:
+        if file_path in changed or file_path.suffix != '.py':
+            continue
+        module_names = _module_names(file_path, source_roots)
+        module_name = max(module_names, key=len) if module_names else ''
+        package = module_name if file_path.name == '__init__.py' else module_name.rpartition('.')[0]
+        try:
+            content = file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        if _imported_modules(content, package) & changed_modules:
+            importers.add(file_path)
+    return importers
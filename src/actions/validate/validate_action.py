@@ -1,11 +1,15 @@
-﻿from typing import Dict, Any, List, Type
+﻿from typing import Dict, Any, List, Optional, Type, TYPE_CHECKING
 import logging
+from pathlib import Path
 from actions.action import Action
 from actions.action_context import ActionContext, ValidateActionContext
 from rules.rules import Rules
-from actions.validate.validation_executor import ValidationExecutor
+from rules.rule_catalog import RuleCatalog
 from utils import read_json_file
-from scanners.scanner_execution_error import ScannerExecutionError
+from instructions.instruction_template import render_lines
+if TYPE_CHECKING:
+    from actions.validate.validation_executor import ValidationExecutor
+    from actions.validate.background_validation_handler import BackgroundValidationHandler
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +19,8 @@ class ValidateRulesAction(Action):
     def __init__(self, behavior=None, action_config=None):
         super().__init__(behavior=behavior, action_config=action_config)
         self._rules = Rules(behavior=self.behavior, bot_paths=self.behavior.bot_paths)
-        self._executor = ValidationExecutor(self.behavior, self._rules)
+        self._validation_executor: Optional['ValidationExecutor'] = None
+        self._validation_background_handler: Optional['BackgroundValidationHandler'] = None
 
     @property
     def action_name(self) -> str:
@@ -29,6 +34,22 @@ class ValidateRulesAction(Action):
     def rules(self) -> Rules:
         return self._rules
 
+    # The executor pulls in the report writers and scanner packages, so it is built when validation first runs rather
+    # than whenever a behavior's actions are listed
+    @property
+    def _executor(self) -> 'ValidationExecutor':
+        if self._validation_executor is None:
+            from actions.validate.validation_executor import ValidationExecutor
+            self._validation_executor = ValidationExecutor(self.behavior, self._rules)
+        return self._validation_executor
+
+    @property
+    def _background_handler(self) -> 'BackgroundValidationHandler':
+        if self._validation_background_handler is None:
+            from actions.validate.background_validation_handler import BackgroundValidationHandler
+            self._validation_background_handler = BackgroundValidationHandler(self.behavior, self._executor)
+        return self._validation_background_handler
+
     def _prepare_instructions(self, instructions, context: ValidateActionContext):
         rules_text = self._format_rules_with_file_paths()
         
@@ -46,21 +67,12 @@ class ValidateRulesAction(Action):
             'scope': scope_text
         }
         
-        base_instructions = instructions.get('base_instructions', [])
-        new_instructions = []
-        for line in base_instructions:
-            if isinstance(line, str):
-                for key, value in replacements.items():
-                    placeholder = '{{' + key + '}}'
-                    if placeholder in line:
-                        line = line.replace(placeholder, value)
-                for key, value in replacements.items():
-                    placeholder = '{' + key + '}'
-                    if placeholder in line:
-                        line = line.replace(placeholder, value)
-            new_instructions.append(line)
-        
-        instructions._data['base_instructions'] = new_instructions
+        placeholders = {}
+        for key, value in replacements.items():
+            placeholders['{{' + key + '}}'] = value
+            placeholders['{' + key + '}'] = value
+        
+        instructions._data['base_instructions'] = render_lines(instructions.get('base_instructions', []), placeholders)
         
         kg_dir = self.behavior.bot_paths.bot_directory / 'behaviors' / self.behavior.name / 'content' / 'story_graph'
         
@@ -74,17 +86,10 @@ class ValidateRulesAction(Action):
         if template_file:
             instructions._data['template_path'] = str(template_file.resolve())
         
-        rules_data = self.inject_behavior_specific_rules()
-        all_rules = rules_data.get('validation_rules', [])
-        if all_rules:
-            rule_files = []
+        behavior_rule_files = self._behavior_rule_files()
+        if behavior_rule_files:
             bots_dir = self.behavior.bot_paths.python_workspace_root / 'bots'
-            for rule in all_rules:
-                rule_file = rule.get('rule_file', '')
-                if rule_file:
-                    rule_path = str(bots_dir / rule_file)
-                    rule_files.append(rule_path)
-            instructions._data['rules'] = rule_files
+            instructions._data['rules'] = [str(bots_dir / self._relative_rule_file(rule_file)) for rule_file in behavior_rule_files]
 
     def _run_scanners_and_format_results(self, context: ValidateActionContext) -> str:
         logger.info('Running scanners for instructions display...')
@@ -100,7 +105,6 @@ class ValidateRulesAction(Action):
                 match = re.search(r'\[.*?\]\((.*?)\)', report_link)
                 if match:
                     report_path = match.group(1)
-                    from pathlib import Path
                     report_file = Path(report_path)
                     if not report_file.is_absolute():
                         report_file = self.behavior.bot_paths.workspace_directory / report_path
@@ -132,45 +136,44 @@ class ValidateRulesAction(Action):
                 return f"story/stories: {', '.join(scope_value)}"
             elif scope_type == 'files':
                 return f"file(s): {', '.join(scope_value)}"
+            elif scope_type == 'changed':
+                return f"files changed since {scope_value[0] if scope_value else 'HEAD'} and their importers"
             else:
                 return "all epics, sub-epics, stories, and domain concepts in the story graph"
         else:
             return "all epics, sub-epics, stories, and domain concepts in the story graph"
 
     def _format_rules_with_file_paths(self) -> str:
-        rules_data = self.inject_behavior_specific_rules()
-        all_rules = rules_data.get('validation_rules', [])
+        behavior_rule_files = self._behavior_rule_files()
         
-        if not all_rules:
+        if not behavior_rule_files:
             return 'No validation rules found.'
         
-        all_rules = sorted(all_rules, key=lambda r: r.get('rule_content', {}).get('priority', 99))
+        # Summaries come from the rule catalog, so listing the rules does not parse every rule file
+        entries = RuleCatalog.for_bot(self.behavior.bot_paths).entries(behavior_rule_files)
+        all_rules = sorted(zip(behavior_rule_files, entries), key=lambda pair: 99 if pair[1].priority is None else pair[1].priority)
         
         lines = []
         lines.append("**Rules to validate against (read each file for full DO/DON'T examples):**")
         lines.append("")
         
-        for rule in all_rules:
-            rule_file = rule.get('rule_file', 'unknown')
-            rule_content = rule.get('rule_content', {})
+        for rule_path, entry in all_rules:
+            rule_file = self._relative_rule_file(rule_path)
             
-            name = rule_content.get('name', rule_file.split('/')[-1].replace('.json', '').replace('_', ' ').title())
-            description = rule_content.get('description', 'No description')
-            priority = rule_content.get('priority', 99)
-            has_scanner = 'scanner' in rule_content or 'scanners' in rule_content
+            name = entry.declared_name if entry.declared_name is not None else rule_path.name.replace('.json', '').replace('_', ' ').title()
+            description = entry.description if entry.description is not None else 'No description'
+            priority = 99 if entry.priority is None else entry.priority
             
-            scanner_status = '[Scanner]' if has_scanner else '[Manual Check]'
+            scanner_status = '[Scanner]' if entry.has_scanner_config else '[Manual Check]'
             lines.append(f"### Rule: {name} (Priority {priority}) {scanner_status}")
             lines.append(f"**File:** `{rule_file}`")
             lines.append(f"**Description:** {description}")
             
-            do_section = rule_content.get('do', {})
-            do_desc = do_section.get('description', '')
+            do_desc = entry.do_description
             if do_desc:
                 lines.append(f"**DO:** {do_desc}")
             
-            dont_section = rule_content.get('dont', {})
-            dont_desc = dont_section.get('description', '')
+            dont_desc = entry.dont_description
             if dont_desc:
                 lines.append(f"**DON'T:** {dont_desc}")
             
@@ -179,8 +182,16 @@ class ValidateRulesAction(Action):
         return '\n'.join(lines)
     
     def do_execute(self, context: ValidateActionContext = None):
+        if context is not None and context.background:
+            return self._background_handler.execute_background(context, self.track_activity_on_completion)
         return self.get_instructions(context)
 
+    def _behavior_rule_files(self) -> List[Path]:
+        return list((self.behavior.bot_paths.bot_directory / 'behaviors' / self.behavior.name / 'rules').glob('*.json'))
+
+    def _relative_rule_file(self, rule_file: Path) -> str:
+        return f'{self.behavior.bot_paths.bot_directory.name}/behaviors/{self.behavior.name}/rules/{rule_file.name}'
+
     def inject_behavior_specific_rules(self) -> Dict[str, Any]:
         all_rules = []
         bot_dir = self.behavior.bot_paths.bot_directory
@@ -43,6 +43,7 @@ class ValidationExecutor:
         streaming_writer.finish(instructions, validation_rules)
         writer = ValidationReportWriter(self.behavior.name, self.behavior.bot_paths, streaming_writer.timestamp)
         writer.write(instructions, validation_rules, validation_context.files)
+        writer.write_metrics(validation_rules)
 
     def _log_error(self, e: Exception, context: 'ValidateActionContext', logger) -> None:
         logger.error(f'Error in synchronous validation: {e}')
@@ -0,0 +1,114 @@
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+from bot_path import BotPath
+
+logger = logging.getLogger(__name__)
+
+JOB_RUNNING = 'running'
+JOB_COMPLETED = 'completed'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+
+@dataclass
+class ValidationJob:
+    job_id: str
+    behavior: str
+    status: str
+    status_file: str
+    started_at: str
+    finished_at: Optional[str] = None
+    cancel_requested: bool = False
+    error: Optional[str] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == JOB_RUNNING
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class ValidationJobManager:
+    """Persists background validation jobs under the reports folder so any CLI session can poll or cancel them."""
+
+    _lock = threading.Lock()
+
+    def __init__(self, bot_paths: BotPath):
+        self.bot_paths = bot_paths
+
+    @property
+    def jobs_directory(self) -> Path:
+        return self.bot_paths.workspace_directory / self.bot_paths.documentation_path / 'reports' / 'jobs'
+
+    def create_job(self, behavior_name: str, status_file: Path) -> ValidationJob:
+        job = ValidationJob(
+            job_id=uuid.uuid4().hex[:8],
+            behavior=behavior_name,
+            status=JOB_RUNNING,
+            status_file=str(status_file),
+            started_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        )
+        self._save(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[ValidationJob]:
+        if not job_id or not job_id.isalnum():
+            return None
+        job_path = self._job_path(job_id)
+        if not job_path.exists():
+            return None
+        return ValidationJob(**json.loads(job_path.read_text(encoding='utf-8')))
+
+    def list_jobs(self) -> List[ValidationJob]:
+        if not self.jobs_directory.exists():
+            return []
+        jobs = [self.get(path.stem) for path in self.jobs_directory.glob('*.json')]
+        return sorted((job for job in jobs if job), key=lambda job: job.started_at, reverse=True)
+
+    def latest(self) -> Optional[ValidationJob]:
+        jobs = self.list_jobs()
+        return jobs[0] if jobs else None
+
+    def request_cancel(self, job_id: str) -> Optional[ValidationJob]:
+        job = self.get(job_id)
+        if job is None or not job.is_running:
+            return job
+        self._cancel_marker(job_id).touch()
+        job.cancel_requested = True
+        self._save(job)
+        return job
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        return self._cancel_marker(job_id).exists()
+
+    def finish(self, job: ValidationJob, error: Optional[str] = None) -> ValidationJob:
+        if error:
+            job.status = JOB_FAILED
+            job.error = error
+        elif self.is_cancel_requested(job.job_id):
+            job.status = JOB_CANCELLED
+            job.cancel_requested = True
+        else:
+            job.status = JOB_COMPLETED
+        job.finished_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._save(job)
+        self._cancel_marker(job.job_id).unlink(missing_ok=True)
+        return job
+
+    def _save(self, job: ValidationJob) -> None:
+        with self._lock:
+            self.jobs_directory.mkdir(parents=True, exist_ok=True)
+            self._job_path(job.job_id).write_text(json.dumps(job.to_dict(), indent=2), encoding='utf-8')
+
+    def _job_path(self, job_id: str) -> Path:
+        return self.jobs_directory / f'{job_id}.json'
+
+    def _cancel_marker(self, job_id: str) -> Path:
+        return self.jobs_directory / f'{job_id}.cancel'
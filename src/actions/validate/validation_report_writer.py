@@ -1,4 +1,5 @@
-﻿import logging
+﻿import json
+import logging
 import re
 import sys
 import traceback
@@ -103,6 +104,7 @@ class StreamingValidationReportWriter:
         self._scanner_results.append(rule_result)
         scanner_status = rule_result.get('scanner_status', {})
         status = scanner_status.get('status', 'UNKNOWN')
+        self._write_scanner_metrics(rule_result)
         if status == 'EXECUTED':
             self._handle_executed_status(scanner_status, rule_result)
         elif status == 'LOAD_FAILED':
@@ -120,6 +122,16 @@ class StreamingValidationReportWriter:
         else:
             print(f' [OK]', file=sys.stderr, flush=True)
 
+    def _write_scanner_metrics(self, rule_result: Dict[str, Any]) -> None:
+        metrics = rule_result.get('scanner_metrics')
+        if not metrics:
+            return
+        rule_name = Path(rule_result.get('rule_file', '')).stem or self._current_rule_name
+        budget_flag = ' [OVER BUDGET]' if metrics.get('over_budget') else ''
+        self._write_line(f"[metrics] {rule_name}: {metrics['wall_seconds']:.2f}s wall, {metrics['cpu_seconds']:.2f}s cpu, {metrics['files_scanned']} file(s){budget_flag}")
+        self._flush()
+        print(f" ({metrics['wall_seconds']:.2f}s{budget_flag})", file=sys.stderr, end='', flush=True)
+
     def _check_for_errors(self, rule_result):
         scanner_results = rule_result.get('scanner_results', {})
         file_by_file_violations = scanner_results.get('file_by_file', {}).get('violations', [])
@@ -135,11 +147,24 @@ class StreamingValidationReportWriter:
         self._write_line(f"Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         self._write_line(f'Total violations: {self._total_violations}')
         self._write_line(f'Scanners executed: {self._executed_count}')
+        self._write_slowest_scanners()
         self._status_file.close()
         self._status_file = None
         print(f'\n[COMPLETE] {self._total_violations} violations, {self._executed_count} scanners', file=sys.stderr)
         sys.stderr.flush()
 
+    def _write_slowest_scanners(self, limit: int = 5) -> None:
+        timed = [r for r in self._scanner_results if r.get('scanner_metrics')]
+        if not timed:
+            return
+        timed.sort(key=lambda r: -r['scanner_metrics']['wall_seconds'])
+        total_seconds = sum(r['scanner_metrics']['wall_seconds'] for r in timed)
+        self._write_line(f'Scanner time: {total_seconds:.2f}s')
+        self._write_line('Slowest scanners:')
+        for rule_result in timed[:limit]:
+            rule_name = Path(rule_result.get('rule_file', '')).stem
+            self._write_line(f"- {rule_name}: {rule_result['scanner_metrics']['wall_seconds']:.2f}s")
+
     def _write_line(self, line: str) -> None:
         if self._status_file:
             self._status_file.write(line + '\n')
@@ -227,11 +252,36 @@ class ValidationReportWriter:
             self._write_section(f, self.builder.build_summary(validation_rules, files))
             self._write_section(f, self.builder.build_content_validated(files, self.file_link_builder.get_relative_path, self._build_scanned_files_section))
             self._write_section(f, self.scanner_status_formatter.build_scanner_status(validation_rules))
+            self._write_section(f, self.scanner_status_formatter.build_scanner_metrics(validation_rules))
             self._write_section(f, self.scanner_status_builder.build_validation_rules(validation_rules))
             self._write_section(f, self.violation_formatter.build_violations(validation_rules))
             self._write_section(f, self.builder.build_instructions(instructions))
             self._write_section(f, self.builder.build_report_location(report_path))
     
+    def write_metrics(self, validation_rules: List[Dict[str, Any]]) -> Path:
+        metrics_path = self.get_metrics_path()
+        scanners = []
+        for rule_dict in validation_rules:
+            metrics = rule_dict.get('scanner_metrics')
+            if not metrics:
+                continue
+            scanner_status = rule_dict.get('scanner_status', {})
+            scanners.append({'rule_file': rule_dict.get('rule_file', 'unknown'), 'scanner_path': scanner_status.get('scanner_path'), 'status': scanner_status.get('status', 'UNKNOWN'), **metrics})
+        payload = {
+            'behavior': self.behavior_name,
+            'timestamp': self._timestamp,
+            'total_wall_seconds': round(sum(s['wall_seconds'] for s in scanners), 4),
+            'total_cpu_seconds': round(sum(s['cpu_seconds'] for s in scanners), 4),
+            'scanners': scanners
+        }
+        metrics_path.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+        logger.info(f'Validation metrics written to: {metrics_path}')
+        return metrics_path
+
+    def get_metrics_path(self) -> Path:
+        docs_dir = ensure_reports_directory(self.bot_paths, self.workspace_directory)
+        return docs_dir / f'{self.behavior_name}-validation-metrics-{self._timestamp}.json'
+
     def _write_section(self, file_handle, lines: List[str]) -> None:
         file_handle.write('\n'.join(lines) + '\n')
         file_handle.flush()
@@ -20,7 +20,7 @@ class ValidationScope(ActionScope):
             exclude_patterns = parameters['scope'].get('exclude', [])
         if isinstance(exclude_patterns, str):
             exclude_patterns = [exclude_patterns]
-        self._file_discovery = FileDiscovery(bot_paths, behavior_name, exclude_patterns)
+        self._file_discovery = FileDiscovery(bot_paths, behavior_name, exclude_patterns, respect_gitignore=True)
         self._path_resolver = PathResolver(bot_paths)
         super().__init__(parameters, bot_paths)
         self._extract_skiprule_from_scope()
@@ -76,7 +76,7 @@ class ValidationScope(ActionScope):
         if exclude_patterns:
             if isinstance(exclude_patterns, str):
                 exclude_patterns = [exclude_patterns]
-            self._file_discovery = FileDiscovery(self._bot_paths, self._behavior_name, exclude_patterns)
+            self._file_discovery = FileDiscovery(self._bot_paths, self._behavior_name, exclude_patterns, respect_gitignore=True)
         
         if skiprule:
             if isinstance(skiprule, str):
@@ -1,8 +1,8 @@
-﻿import json
-import logging
+﻿import logging
 from pathlib import Path
 from typing import Dict, Any, List, TYPE_CHECKING, NamedTuple
 from utils import read_json_file
+from workspace_state_store import WorkspaceStateStore
 if TYPE_CHECKING:
     from bot.behavior import Behavior
     from bot.behaviors import Behaviors
@@ -40,9 +40,9 @@ class BehaviorActionStatusBuilder:
             return self._get_default_breadcrumbs()
 
     def _load_state_file(self, state_file: Path) -> tuple:
-        if not state_file.exists():
+        state_data = WorkspaceStateStore.shared().peek(state_file)
+        if state_data is None:
             return ([], None)
-        state_data = json.loads(state_file.read_text(encoding='utf-8'))
         completed_actions = state_data.get('completed_actions', [])
         current_action_path = state_data.get('current_action', '')
         current_action_from_state = None
@@ -1,5 +1,4 @@
 ﻿from __future__ import annotations
-import json
 import logging
 import traceback
 from pathlib import Path
@@ -9,25 +8,28 @@ from bot_path import BotPath
 from utils import read_json_file
 from instructions.reminders import inject_reminder_to_instructions
 from behaviors.behavior import Behavior
+from diagnostics import get_trace_logger
+from workspace_state_store import WorkspaceStateStore
 if TYPE_CHECKING:
     from bot import BotResult
 logger = logging.getLogger(__name__)
+trace = get_trace_logger(__name__)
 
 class Behaviors:
 
     def __init__(self, bot_name: str, bot_paths: BotPath, allowed_behaviors: Optional[List[str]] = None):
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_path.parent.mkdir(parents=True, exist_ok=True); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'behaviors.py:18','message':'Behaviors.__init__ entry','data':{'bot_name':bot_name},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
+        trace.debug('Behaviors.__init__ entry', extra={'data': {'bot_name':bot_name}})
         self.bot_name = bot_name
         self.bot_paths = bot_paths
         self._allowed_behaviors = allowed_behaviors
         self._behaviors: List['Behavior'] = []
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'behaviors.py:22','message':'Before _discover_behaviors','data':{},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
+        trace.debug('Before _discover_behaviors')
         self._discover_behaviors()
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'behaviors.py:22','message':'After _discover_behaviors','data':{'behavior_count':len(self._behaviors)},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
+        trace.debug('After _discover_behaviors', extra={'data': {'behavior_count':len(self._behaviors)}})
         self._current_index: Optional[int] = None
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'behaviors.py:24','message':'Before load_state','data':{},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
+        trace.debug('Before load_state')
         self.load_state()
-        import json; from pathlib import Path as P; log_path = P(r'c:\dev\augmented-teams\.cursor\debug.log'); log_file = open(log_path, 'a', encoding='utf-8'); log_file.write(json.dumps({'location':'behaviors.py:24','message':'After load_state - Behaviors.__init__ exit','data':{},'timestamp':__import__('time').time()*1000,'sessionId':'debug-session','hypothesisId':'H1'})+'\n'); log_file.close()
+        trace.debug('After load_state - Behaviors.__init__ exit')
 
     def _load_behavior_from_dir(self, item: Path) -> tuple:
         behavior_json_path = item / 'behavior.json'
@@ -230,17 +232,17 @@ class Behaviors:
             return
         workspace_dir = self.bot_paths.workspace_directory
         state_file = workspace_dir / 'behavior_action_state.json'
+        store = WorkspaceStateStore.shared()
         state_data = {}
         if state_file.exists():
             try:
-                state_data = json.loads(state_file.read_text(encoding='utf-8'))
+                state_data = store.read(state_file, {})
             except Exception as e:
                 logger.debug(f'Failed to load state file {state_file}: {e}')
                 raise
         state_data['current_behavior'] = f'{self.bot_name}.{self.current.name}'
         state_data['timestamp'] = datetime.now().isoformat()
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-        state_file.write_text(json.dumps(state_data, indent=2), encoding='utf-8')
+        store.write(state_file, state_data)
 
     def _init_to_first_behavior(self) -> None:
         if self._behaviors:
@@ -270,7 +272,7 @@ class Behaviors:
             self._init_to_first_behavior()
             return
         try:
-            state_data = json.loads(state_file.read_text(encoding='utf-8'))
+            state_data = WorkspaceStateStore.shared().peek(state_file)
             behavior_name = self._extract_behavior_name_from_state(state_data.get('current_behavior', ''))
             if behavior_name:
                 idx = self._find_behavior_index(behavior_name)
@@ -293,5 +295,4 @@ class Behaviors:
         first_action = action_names[0] if action_names else 'clarify'
         self.navigate_to(confirmed_behavior)
         state_data = {'current_behavior': f'{self.bot_name}.{behavior_obj.name}', 'current_action': f'{self.bot_name}.{behavior_obj.name}.{first_action}', 'completed_actions': [], 'timestamp': datetime.now().isoformat()}
-        state_file.parent.mkdir(parents=True, exist_ok=True)
-        state_file.write_text(json.dumps(state_data, indent=2), encoding='utf-8')
\ No newline at end of file
+        WorkspaceStateStore.shared().write(state_file, state_data)
\ No newline at end of file
@@ -68,7 +68,7 @@ class ActionDataCollector:
     
     def _get_scope_description(self, action_name: str) -> str:
         if action_name == 'validate':
-            return "Scope structure:\n{'type': 'story'|'epic'|'increment'|'all'|'files', 'value': <names|priorities|files>, 'exclude': <patterns>}"
+            return "Scope structure:\n{'type': 'story'|'epic'|'increment'|'all'|'files'|'changed', 'value': <names|priorities|files|revision or working-tree>, 'exclude': <patterns>}"
         return "Scope structure:\n{'type': 'story'|'epic'|'increment'|'all', 'value': <names|priorities>}"
     
     def get_action_description(self, action_name: str) -> str:
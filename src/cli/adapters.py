@@ -56,6 +56,11 @@ class JSONAdapter(ChannelAdapter):
     def serialize(self) -> str:
         import json
         return json.dumps(self.to_dict(), indent=2)
+    
+    def to_payload(self) -> Dict:
+        # Plain data with invalid control characters stripped from every string, ready for a single json.dumps
+        from utils import sanitize_for_json
+        return sanitize_for_json(self.to_dict())
 
 class MarkdownAdapter(TextAdapter):
     
@@ -45,12 +45,17 @@ if 'WORKING_AREA' not in os.environ:
     if 'WORKING_AREA' not in os.environ:
         os.environ['WORKING_AREA'] = str(workspace_root)
 
-# Now import src modules - they will use the environment variables we just set
-from bot.bot import Bot
-from bot.workspace import get_workspace_directory, get_bot_directory, get_python_workspace_root
-from cli.cli_session import CLISession
-
 def main():
+    if '--import-profile' in sys.argv[1:]:
+        # Re-run the piped command in a child interpreter under -X importtime; this process stays import-free
+        from cli.import_profile import profile_command
+        sys.exit(profile_command('status' if sys.stdin.isatty() else sys.stdin.read().strip()))
+
+    # Now import src modules - they will use the environment variables we just set
+    from bot.bot import Bot
+    from bot.workspace import get_workspace_directory, get_bot_directory, get_python_workspace_root
+    from cli.cli_session import CLISession
+
     # Use workspace helper functions - don't calculate paths directly
     bot_directory = get_bot_directory()
     workspace_directory = get_workspace_directory()
@@ -89,7 +94,8 @@ def main():
         remaining_input = sys.stdin.read()
         sys.stdin = io.StringIO(first_line + '\n' + remaining_input)
     
-    cli_session = CLISession(bot=bot, workspace_directory=workspace_directory, mode=mode)
+    pretty_json = os.environ.get('CLI_JSON_PRETTY', '') == '1'
+    cli_session = CLISession(bot=bot, workspace_directory=workspace_directory, mode=mode, pretty_json=pretty_json)
     
     suppress_header = json_mode or os.environ.get('SUPPRESS_CLI_HEADER', '') == '1'
     
@@ -9,10 +9,11 @@ from cli.cli_results import CLICommandResponse
 
 class CLISession:
     
-    def __init__(self, bot, workspace_directory: Path, mode: str = None):
+    def __init__(self, bot, workspace_directory: Path, mode: str = None, pretty_json: bool = False):
         self.bot = bot
         self.workspace_directory = Path(workspace_directory)
         self.mode = mode
+        self.pretty_json = pretty_json
     
     def execute_command(self, command: str) -> CLICommandResponse:
         # Extract format mode from the entire command first
@@ -43,6 +44,8 @@ class CLISession:
         handlers = {
             'save': self._handle_save,
             'submit': self._handle_submit,
+            'validation_status': self._handle_validation_status,
+            'validation_cancel': self._handle_validation_cancel,
         }
         if verb.startswith('submitrules:') or verb.startswith('submitrules '):
             return self._handle_submitrules
@@ -52,9 +55,8 @@ class CLISession:
         params = self._parse_save_params(args)
         result = self.bot.save(**params)
         if self.mode == 'json':
-            import json
             return CLICommandResponse(
-                output=json.dumps(result, indent=2),
+                output=self._dump_json(result),
                 status=result.get('status', 'success'),
                 cli_terminated=False
             )
@@ -71,11 +73,49 @@ class CLISession:
         return self._format_submit_response(result, f"{behavior_name} rules submitted to chat!")
     
     
+    def _handle_validation_status(self, verb: str, args: str) -> CLICommandResponse:
+        from actions.validate.validation_job_manager import ValidationJobManager
+        job_manager = ValidationJobManager(self.bot.bot_paths)
+        job_id = args.strip()
+        job = job_manager.get(job_id) if job_id else job_manager.latest()
+        if job is None:
+            return self._format_validation_job_response({'status': 'error', 'message': f"No validation job found{' with id ' + job_id if job_id else ''}"})
+        return self._format_validation_job_response({'status': 'success', 'job': job.to_dict()})
+    
+    def _handle_validation_cancel(self, verb: str, args: str) -> CLICommandResponse:
+        from actions.validate.validation_job_manager import ValidationJobManager
+        job_id = args.strip()
+        if not job_id:
+            return self._format_validation_job_response({'status': 'error', 'message': 'Usage: validation_cancel <job_id>'})
+        job = ValidationJobManager(self.bot.bot_paths).request_cancel(job_id)
+        if job is None:
+            return self._format_validation_job_response({'status': 'error', 'message': f'No validation job found with id {job_id}'})
+        if not job.cancel_requested:
+            return self._format_validation_job_response({'status': 'info', 'message': f'Validation job {job_id} already {job.status}', 'job': job.to_dict()})
+        return self._format_validation_job_response({'status': 'success', 'message': f'Cancellation requested for validation job {job_id}', 'job': job.to_dict()})
+    
+    def _format_validation_job_response(self, result: dict) -> CLICommandResponse:
+        status = 'error' if result['status'] == 'error' else 'success'
+        if self.mode == 'json':
+            return CLICommandResponse(output=self._dump_json(result), status=status, cli_terminated=False)
+        lines = [result['message']] if 'message' in result else []
+        job = result.get('job')
+        if job:
+            lines.append(f"Validation job {job['job_id']} ({job['behavior']}): {job['status']}")
+            lines.append(f"  Started: {job['started_at']}")
+            if job['finished_at']:
+                lines.append(f"  Finished: {job['finished_at']}")
+            if job['cancel_requested'] and job['status'] == 'running':
+                lines.append("  Cancellation requested - stopping after the current scanner")
+            if job['error']:
+                lines.append(f"  Error: {job['error']}")
+            lines.append(f"  Status file: {job['status_file']}")
+        return CLICommandResponse(output='\n'.join(lines), status=status, cli_terminated=False)
+    
     def _format_submit_response(self, result: dict, success_message: str) -> CLICommandResponse:
         if self.mode == 'json':
-            import json
             return CLICommandResponse(
-                output=json.dumps(result, indent=2),
+                output=self._dump_json(result),
                 status=result.get('status', 'success'),
                 cli_terminated=False
             )
@@ -249,8 +289,7 @@ class CLISession:
     def _build_error_response(self, verb: str) -> CLICommandResponse:
         error_message = f"Unknown command '{verb}'"
         if self.mode == 'json':
-            import json
-            output = json.dumps({'status': 'error', 'message': error_message, 'command': verb}, indent=2)
+            output = self._dump_json({'status': 'error', 'message': error_message, 'command': verb})
         else:
             output = f"ERROR: {error_message}"
         return CLICommandResponse(output=output, status='error', cli_terminated=False)
@@ -259,109 +298,43 @@ class CLISession:
         if isinstance(result, CLICommandResponse):
             return result
         
-        # Special handling for status command in JSON mode - wrap bot data consistently
-        from bot.bot import Bot
-        if isinstance(result, Bot) and self.mode == 'json':
-            import json
-            from utils import sanitize_json_string, sanitize_for_json
-            adapter = self._get_adapter_for_domain(result)
-            try:
-                bot_data = json.loads(adapter.serialize())
-            except ValueError as e:
-                if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"[CLISession] JSON parse error in bot data, sanitizing: {str(e)}")
-                    bot_data = json.loads(sanitize_json_string(adapter.serialize()))
-                else:
-                    raise
-            wrapped = {'bot': bot_data}
-            sanitized_wrapped = sanitize_for_json(wrapped)
-            return CLICommandResponse(output=json.dumps(sanitized_wrapped, indent=2, ensure_ascii=True), cli_terminated=cli_terminated)
-        
         adapter = self._get_adapter_for_domain(result)
-        output = adapter.serialize()
-        
-        from instructions.instructions import Instructions
-        if isinstance(result, Instructions) and self.mode == 'json':
-            return self._build_json_instructions_response(output)
+        if self.mode == 'json':
+            return self._build_json_response(result, adapter.to_payload(), is_navigation_command, cli_terminated)
         
+        output = adapter.serialize()
         if is_navigation_command and not cli_terminated:
-            output = self._append_navigation_context(result, output)
+            output = self._append_tty_navigation_context(result, output)
         
         return CLICommandResponse(output=output, cli_terminated=cli_terminated)
     
-    def _build_json_instructions_response(self, output: str) -> CLICommandResponse:
+    def _dump_json(self, data) -> str:
         import json
-        from utils import sanitize_json_string, sanitize_for_json
-        
-        try:
-            instructions_data = json.loads(output) if isinstance(output, str) else output
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in instructions, sanitizing: {str(e)}")
-                instructions_data = json.loads(sanitize_json_string(output)) if isinstance(output, str) else output
-            else:
-                raise
-        
-        status_adapter = self._get_adapter_for_domain(self.bot)
-        try:
-            status_data = json.loads(status_adapter.serialize())
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in status, sanitizing: {str(e)}")
-                status_data = json.loads(sanitize_json_string(status_adapter.serialize()))
-            else:
-                raise
-        
-        unified = {'instructions': instructions_data, 'bot': status_data}
-        sanitized_unified = sanitize_for_json(unified)
-        return CLICommandResponse(output=json.dumps(sanitized_unified, indent=2, ensure_ascii=True), cli_terminated=False)
-    
-    def _append_navigation_context(self, result, output: str) -> str:
-        if self.mode == 'json':
-            return self._append_json_navigation_context(result, output)
-        return self._append_tty_navigation_context(result, output)
+        return json.dumps(data, indent=2 if self.pretty_json else None, ensure_ascii=True)
     
-    def _append_json_navigation_context(self, result, output: str) -> str:
-        import json
+    def _build_json_response(self, result, payload: dict, is_navigation_command: bool, cli_terminated: bool) -> CLICommandResponse:
+        # Adapters hand over sanitized plain data, so the whole response is dumped exactly once
+        from bot.bot import Bot
         from instructions.instructions import Instructions
-        from utils import sanitize_json_string, sanitize_for_json
-        
-        try:
-            result_data = json.loads(output) if isinstance(output, str) else output
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in navigation context, sanitizing: {str(e)}")
-                result_data = json.loads(sanitize_json_string(output)) if isinstance(output, str) else output
-            else:
-                raise
+        if isinstance(result, Bot):
+            # Status command - wrap bot data consistently
+            return CLICommandResponse(output=self._dump_json({'bot': payload}), cli_terminated=cli_terminated)
         
-        unified = dict(result_data) if isinstance(result_data, dict) else {}
-        
-        if self._navigation_succeeded(result) and not isinstance(result, Instructions):
-            self._add_instructions_to_unified(unified)
+        if isinstance(result, Instructions):
+            unified = {'instructions': payload, 'bot': self._bot_payload()}
+            return CLICommandResponse(output=self._dump_json(unified), cli_terminated=False)
         
-        status_adapter = self._get_adapter_for_domain(self.bot)
-        try:
-            unified['bot'] = json.loads(status_adapter.serialize())
-        except ValueError as e:
-            if 'control character' in str(e).lower() or 'Invalid' in str(e):
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.warning(f"[CLISession] JSON parse error in status, sanitizing: {str(e)}")
-                unified['bot'] = json.loads(sanitize_json_string(status_adapter.serialize()))
-            else:
-                raise
+        if is_navigation_command and not cli_terminated:
+            unified = dict(payload) if isinstance(payload, dict) else {}
+            if self._navigation_succeeded(result):
+                self._add_instructions_to_unified(unified)
+            unified['bot'] = self._bot_payload()
+            payload = unified
         
-        sanitized_unified = sanitize_for_json(unified)
-        return json.dumps(sanitized_unified, indent=2, ensure_ascii=True)
+        return CLICommandResponse(output=self._dump_json(payload), cli_terminated=cli_terminated)
+    
+    def _bot_payload(self) -> dict:
+        return self._get_adapter_for_domain(self.bot).to_payload()
     
     def _append_tty_navigation_context(self, result, output: str) -> str:
         from instructions.instructions import Instructions
@@ -381,39 +354,13 @@ class CLISession:
         return result['status'] not in ['error', 'at_start', 'at_end']
     
     def _add_instructions_to_unified(self, unified: dict) -> None:
-        import json
         instructions_result = self.bot.current()
         
         if isinstance(instructions_result, dict) and instructions_result.get('status') == 'error':
             unified['instructions_error'] = instructions_result.get('message', 'Unknown error')
             return
         
-        adapter = self._get_adapter_for_domain(instructions_result)
-        try:
-            serialized = adapter.serialize()
-            unified['instructions'] = json.loads(serialized)
-        except ValueError as e:
-            import logging
-            logger = logging.getLogger(__name__)
-            error_msg = str(e)
-            logger.error(f"[CLISession] JSON parse error in instructions: {error_msg}")
-            # Try to identify the problematic position
-            import re
-            pos_match = re.search(r'column (\d+)', error_msg)
-            if pos_match and serialized:
-                pos = int(pos_match.group(1))
-                start = max(0, pos - 50)
-                end = min(len(serialized), pos + 50)
-                context = serialized[start:end]
-                logger.error(f"[CLISession] JSON context around error position {pos}: ...{repr(context)}...")
-            # Try sanitizing
-            from utils import sanitize_json_string
-            try:
-                unified['instructions'] = json.loads(sanitize_json_string(serialized))
-                logger.warning("[CLISession] Sanitization fixed the JSON parse error")
-            except ValueError:
-                logger.error("[CLISession] Sanitization did not fix the error, returning error object")
-                unified['instructions_error'] = f"Failed to parse instructions JSON: {error_msg}"
+        unified['instructions'] = self._get_adapter_for_domain(instructions_result).to_payload()
     
     def _add_instructions_to_parts(self, parts: list) -> None:
         instructions_result = self.bot.current()
@@ -0,0 +1,121 @@
+"""Startup import accounting for cli_main.
+
+Each piped command starts a fresh interpreter, so everything imported before the command runs is paid on every call.
+The bot core is imported for every verb; the packages in DEFERRED_PACKAGES are only imported by the verbs that need them,
+as listed in COMMAND_MODULES. `python -m cli.cli_main --import-profile` re-runs the piped command (or `status`) in a
+child interpreter under -X importtime and reports what it imported.
+"""
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+IMPORT_PROFILE_FLAG = '--import-profile'
+PROFILE_REPORT_LIMIT = 30
+
+DEFERRED_PACKAGES = ('scanners', 'synchronizers', 'nltk', 'actions.validate.validation_executor')
+
+# Deferred packages each verb is expected to import; any verb not listed should start without them.
+# Verbs are the action part of `behavior.action` commands, or the bare command word.
+COMMAND_MODULES: Dict[str, Tuple[str, ...]] = {
+    'validate': ('scanners', 'nltk', 'actions.validate.validation_executor'),
+    'render': ('synchronizers',),
+}
+
+SRC_ROOT = Path(__file__).resolve().parent.parent
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ImportProfile:
+    command: str
+    wall_seconds: float
+    records: List[ImportRecord]
+    returncode: int
+    stdout: str
+
+    @property
+    def modules(self) -> List[str]:
+        return [record.module for record in self.records]
+
+    @property
+    def import_seconds(self) -> float:
+        return sum(record.cumulative_us for record in self.records if record.depth == 0) / 1_000_000
+
+    def deferred_imports(self) -> List[str]:
+        imported = set(self.modules)
+        return [package for package in DEFERRED_PACKAGES if package in imported]
+
+    def unexpected_imports(self) -> List[str]:
+        expected = COMMAND_MODULES.get(command_verb(self.command), ())
+        return [package for package in self.deferred_imports() if package not in expected]
+
+
+def command_verb(command: str) -> str:
+    verb = command.strip().split(' ', 1)[0] if command.strip() else 'status'
+    return verb.split(':', 1)[0].rsplit('.', 1)[-1].lower()
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            indent = len(name) - len(name.lstrip(' ')) - 1
+            records.append(ImportRecord(name.strip(), int(self_us), int(cumulative_us), indent // 2))
+        except ValueError:
+            continue
+    return records
+
+
+def run_import_profile(command: str, env: Optional[Dict[str, str]] = None) -> ImportProfile:
+    child_env = dict(os.environ if env is None else env)
+    child_env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC_ROOT), child_env.get('PYTHONPATH', '')]))
+    child_env['SUPPRESS_CLI_HEADER'] = '1'
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-m', 'cli.cli_main'],
+        input=command + '\n', capture_output=True, text=True, encoding='utf-8', errors='replace', env=child_env
+    )
+    wall_seconds = time.perf_counter() - started
+    return ImportProfile(command, wall_seconds, parse_importtime(completed.stderr), completed.returncode, completed.stdout)
+
+
+def format_import_profile(profile: ImportProfile, limit: int = PROFILE_REPORT_LIMIT) -> str:
+    lines = [
+        f"Import profile for '{profile.command}': {len(profile.records)} modules, "
+        f"{profile.import_seconds * 1000:.1f} ms importing, {profile.wall_seconds * 1000:.1f} ms wall",
+        '   self [ms] | cumulative [ms] | module'
+    ]
+    for record in sorted(profile.records, key=lambda r: -r.cumulative_us)[:limit]:
+        lines.append(f"{record.self_us / 1000:12.2f} | {record.cumulative_us / 1000:15.2f} | {'  ' * record.depth}{record.module}")
+    if len(profile.records) > limit:
+        lines.append(f'... {len(profile.records) - limit} more modules')
+    deferred = profile.deferred_imports()
+    unexpected = profile.unexpected_imports()
+    if not deferred:
+        lines.append(f"Deferred packages: none imported ({', '.join(DEFERRED_PACKAGES)})")
+    else:
+        labels = [f"{package} ({'unexpected' if package in unexpected else 'expected'})" for package in deferred]
+        lines.append(f"Deferred packages imported: {', '.join(labels)}")
+    return '\n'.join(lines)
+
+
+def profile_command(command: str) -> int:
+    profile = run_import_profile(command or 'status')
+    if profile.stdout:
+        print(profile.stdout, end='' if profile.stdout.endswith('\n') else '\n')
+    print(format_import_profile(profile), file=sys.stderr)
+    return profile.returncode
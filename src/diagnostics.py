@@ -0,0 +1,76 @@
+"""Opt-in diagnostics trace written as JSON lines.
+
+Tracing is off unless AGILE_BOTS_DIAGNOSTICS is set. A value of 1/true/on writes to
+<WORKING_AREA>/.agile_bots/diagnostics.jsonl (the current directory when WORKING_AREA is unset); any other value is
+used as the file path. Records are buffered in memory and flushed every BUFFER_CAPACITY records, on errors and at exit.
+When tracing is off the trace loggers sit above CRITICAL, so a disabled call is a cached level check.
+"""
+import json
+import logging
+import logging.handlers
+import os
+from pathlib import Path
+from typing import Optional
+
+DIAGNOSTICS_ENV = 'AGILE_BOTS_DIAGNOSTICS'
+DIAGNOSTICS_FILE = Path('.agile_bots') / 'diagnostics.jsonl'
+BUFFER_CAPACITY = 200
+TRACE_LOGGER_ROOT = 'diagnostics'
+ENABLED_VALUES = ('1', 'true', 'on', 'yes')
+DISABLED_VALUES = ('', '0', 'false', 'off', 'no')
+
+_configured = False
+
+
+class JsonLinesFormatter(logging.Formatter):
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            'timestamp': record.created * 1000,
+            'location': f'{record.module}.py:{record.lineno}',
+            'logger': record.name[len(TRACE_LOGGER_ROOT) + 1:],
+            'message': record.getMessage(),
+            'data': getattr(record, 'data', {})
+        }, default=str)
+
+
+def diagnostics_path() -> Optional[Path]:
+    setting = os.environ.get(DIAGNOSTICS_ENV, '').strip()
+    if setting.lower() in DISABLED_VALUES:
+        return None
+    if setting.lower() in ENABLED_VALUES:
+        workspace = os.environ.get('WORKING_AREA', '').strip()
+        return (Path(workspace) if workspace else Path.cwd()) / DIAGNOSTICS_FILE
+    return Path(setting)
+
+
+def configure_diagnostics() -> Optional[Path]:
+    """(Re)read AGILE_BOTS_DIAGNOSTICS and set up the trace loggers; returns the trace file, or None when disabled."""
+    global _configured
+    _configured = True
+    root = logging.getLogger(TRACE_LOGGER_ROOT)
+    root.propagate = False
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+    path = diagnostics_path()
+    if path is None:
+        root.setLevel(logging.CRITICAL + 1)
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(path, mode='a', encoding='utf-8', delay=True)
+    file_handler.setFormatter(JsonLinesFormatter())
+    root.addHandler(logging.handlers.MemoryHandler(BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler))
+    root.setLevel(logging.DEBUG)
+    return path
+
+
+def flush_diagnostics() -> None:
+    for handler in logging.getLogger(TRACE_LOGGER_ROOT).handlers:
+        handler.flush()
+
+
+def get_trace_logger(name: str) -> logging.Logger:
+    if not _configured:
+        configure_diagnostics()
+    return logging.getLogger(f'{TRACE_LOGGER_ROOT}.{name}')
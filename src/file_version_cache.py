@@ -0,0 +1,104 @@
+"""Process-wide cache of files parsed into values, keyed by path and file version.
+
+A cached file is served from memory while its mtime, size and inode are unchanged. A file modified within
+RACY_WINDOW_NS of being cached is compared by content as well, because filesystem timestamps are too coarse to tell
+two writes in the same tick apart; when the content is unchanged the cached value is kept and only its stat refreshed.
+"""
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+RACY_WINDOW_NS = 2_000_000_000
+
+
+def is_racy(mtime_ns: int, cached_ns: int) -> bool:
+    """Whether a file with mtime_ns, cached at cached_ns, may have been rewritten since without its mtime changing."""
+    return mtime_ns + RACY_WINDOW_NS > cached_ns
+
+
+@dataclass
+class CachedFile:
+    text: str
+    value: Any
+    mtime_ns: int
+    size: int
+    inode: int
+    cached_ns: int
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size and self.inode == stat.st_ino
+
+    @property
+    def is_racy(self) -> bool:
+        return is_racy(self.mtime_ns, self.cached_ns)
+
+
+class FileVersionCache:
+
+    def __init__(self, parse: Callable[[str], Any], encoding: str = 'utf-8'):
+        self._parse = parse
+        self._encoding = encoding
+        self._files: Dict[str, CachedFile] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def get(self, path: Path) -> Any:
+        """Parsed value of the file at path; raises FileNotFoundError when it does not exist."""
+        entry = self.entry(path)
+        if entry is None:
+            raise FileNotFoundError(path)
+        return entry.value
+
+    def entry(self, path: Path) -> Optional[CachedFile]:
+        """Cached entry for the file at path as it is now, or None when the file does not exist.
+
+        The file is re-read only when its stat changed or its entry is racy, and re-parsed only when its text changed,
+        in which case the entry is replaced. Parse errors propagate and leave nothing cached for path.
+        """
+        key = self._key(path)
+        with self._lock:
+            try:
+                stat = os.stat(key)
+            except FileNotFoundError:
+                self._files.pop(key, None)
+                return None
+            entry = self._files.get(key)
+            if entry is not None and entry.matches(stat) and not entry.is_racy:
+                return entry
+            with open(key, encoding=self._encoding) as handle:
+                text = handle.read()
+            if entry is not None and entry.text == text:
+                entry.mtime_ns, entry.size, entry.inode = stat.st_mtime_ns, stat.st_size, stat.st_ino
+                entry.cached_ns = time.time_ns()
+                return entry
+            self._files.pop(key, None)
+            entry = CachedFile(text, self._parse(text), stat.st_mtime_ns, stat.st_size, stat.st_ino, time.time_ns())
+            self._files[key] = entry
+            return entry
+
+    def cached(self, path: Path) -> Optional[CachedFile]:
+        """Entry held for path without checking the file, or None."""
+        with self._lock:
+            return self._files.get(self._key(path))
+
+    def store(self, path: Path, text: str, value: Any) -> CachedFile:
+        """Cache text and its parsed value for path after the caller has written text to it."""
+        key = self._key(path)
+        with self._lock:
+            stat = os.stat(key)
+            entry = CachedFile(text, value, stat.st_mtime_ns, stat.st_size, stat.st_ino, time.time_ns())
+            self._files[key] = entry
+            return entry
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        with self._lock:
+            if path is None:
+                self._files.clear()
+            else:
+                self._files.pop(self._key(path), None)
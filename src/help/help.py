@@ -34,6 +34,8 @@ class OtherCommands:
             ('path [dir]', 'Show/set working directory'),
             ('scope [filter]', 'Set scope filter (see Scope Command Details)'),
             ('scope all', 'Clear scope filter'),
+            ('validation_status [job_id]', 'Show a background validation job (latest if no id)'),
+            ('validation_cancel <job_id>', 'Cancel a background validation job'),
             ('help', 'Show this help'),
             ('exit', 'Exit CLI'),
         ]
@@ -211,7 +211,7 @@ class HelpAction(Action):
     
     def _get_scope_description(self, action_name: str) -> str:
         if action_name == 'validate':
-            return "Scope structure: {'type': 'story'|'epic'|'increment'|'all'|'files', 'value': <names|priorities|files>, 'exclude': <patterns>}"
+            return "Scope structure: {'type': 'story'|'epic'|'increment'|'all'|'files'|'changed', 'value': <names|priorities|files|revision or working-tree>, 'exclude': <patterns>}"
         return "Scope structure: {'type': 'story'|'epic'|'increment'|'all', 'value': <names|priorities>}"
     
     def _get_parameter_description(self, action_name: str, param_name: str) -> str:
@@ -0,0 +1,81 @@
+"""Compiled instruction and render templates.
+
+Instruction lines and template files carry placeholders such as `{project_area}`, `{render_config.name}` or
+`{{rules}}`. A template is compiled once into its literal segments and placeholder slots, and rendering it joins the
+literals with the slot values in one pass instead of running a str.replace per placeholder over the whole text. Compiled
+templates are cached by text; template files are read through a FileVersionCache, so each file is read once per file version.
+"""
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, List, Mapping, Tuple
+
+from file_version_cache import FileVersionCache
+
+PLACEHOLDER = re.compile(r'\{\{[\w.]+\}\}|\{[\w.]+\}')
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    literals: Tuple[str, ...]
+    slots: Tuple[str, ...]
+
+    @property
+    def placeholders(self) -> Tuple[str, ...]:
+        return self.slots
+
+    def render(self, values: Mapping[str, str]) -> str:
+        """The text with each placeholder replaced by values[placeholder]; placeholders without a value are kept.
+
+        A `{{name}}` slot with no value of its own but a `{name}` value renders as `{value}`, the result replacing
+        `{name}` inside it would give.
+        """
+        if not self.slots:
+            return self.literals[0]
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            parts.append(_fill(slot, values))
+            parts.append(literal)
+        return ''.join(parts)
+
+
+def _fill(slot: str, values: Mapping[str, str]) -> str:
+    value = values.get(slot)
+    if value is not None:
+        return value
+    if slot.startswith('{{'):
+        inner = values.get(slot[1:-1])
+        if inner is not None:
+            return '{' + inner + '}'
+    return slot
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def compile_template(text: str) -> CompiledTemplate:
+    literals = []
+    slots = []
+    position = 0
+    for match in PLACEHOLDER.finditer(text):
+        literals.append(text[position:match.start()])
+        slots.append(match.group(0))
+        position = match.end()
+    literals.append(text[position:])
+    return CompiledTemplate(tuple(literals), tuple(slots))
+
+
+def render_template(text: str, values: Mapping[str, str]) -> str:
+    return compile_template(text).render(values)
+
+
+def render_lines(lines: Iterable[str], values: Mapping[str, str]) -> List[str]:
+    return [compile_template(line).render(values) if isinstance(line, str) else line for line in lines]
+
+
+_template_files = FileVersionCache(lambda text: text)
+
+
+def read_template_text(path: Path) -> str:
+    """Text of a template file, served from memory while the file is unchanged."""
+    return _template_files.get(path)
@@ -1,7 +1,73 @@
-"""Domain Navigator - Executes dot notation commands on domain objects"""
-import re
+"""Domain Navigator - Executes dot notation commands on domain objects
+
+The panel sends the same commands over and over, so the reflection behind them is memoized: parsed commands and
+parameter strings per command string, whether a name on a type can only be an item lookup, and the parameter names of
+each method. Values are still fetched from the live objects on every command. The caches describe classes as they
+were first seen; code that adds attributes to a class afterwards must call clear_navigation_caches.
+"""
 import inspect
-from typing import Any
+import logging
+import re
+import types
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+COMMAND_CACHE_SIZE = 1024
+
+_parameter_names_cache: Dict[Tuple[str, Any], Optional[Tuple[str, ...]]] = {}
+
+
+@lru_cache(maxsize=COMMAND_CACHE_SIZE)
+def _is_item_hop(cls: type, name: str) -> bool:
+    """True when instances of cls can only have attribute name in their own __dict__, so hasattr is otherwise False.
+
+    That holds when no class in the MRO defines name and attribute lookup is not customised. Results are kept for the
+    life of the process, so a name added to cls or one of its bases later is only seen after clear_navigation_caches.
+    """
+    if any(name in vars(klass) for klass in cls.__mro__):
+        return False
+    return not hasattr(cls, '__getattr__') and cls.__getattribute__ is object.__getattribute__
+
+
+def clear_navigation_caches() -> None:
+    """Forget every memoized command, parameter string and reflection result."""
+    _parse_command.cache_clear()
+    _parsed_parameters.cache_clear()
+    _is_item_hop.cache_clear()
+    _parameter_names_cache.clear()
+
+
+def _resolve_attribute(obj: Any, name: str) -> Tuple[bool, Any]:
+    """(True, obj.<name>) when obj has the attribute, else (False, None): hasattr and getattr in one lookup."""
+    if _is_item_hop(type(obj), name):
+        instance_dict = getattr(obj, '__dict__', None)
+        if instance_dict is None or name not in instance_dict:
+            return False, None
+    try:
+        return True, getattr(obj, name)
+    except AttributeError:
+        return False, None
+
+
+def _parameter_names(func: Any) -> Optional[Tuple[str, ...]]:
+    """Names of func's parameters other than self, or None when it has no inspectable signature."""
+    if isinstance(func, types.MethodType):
+        key = ('method', func.__func__)
+    elif isinstance(func, types.FunctionType):
+        key = ('function', func)
+    else:
+        key = None
+    if key is not None and key in _parameter_names_cache:
+        return _parameter_names_cache[key]
+    try:
+        names = tuple(name for name in inspect.signature(func).parameters if name != 'self')
+    except (ValueError, TypeError):
+        names = None
+    if key is not None:
+        _parameter_names_cache[key] = names
+    return names
 
 
 class DomainNavigator:
@@ -17,16 +83,12 @@ class DomainNavigator:
             story_graph.create_epic name:"User Management"
             story_graph."Epic Name".create_sub_epic name:"Auth"
         """
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.info(f"[DomainNavigator] navigate() called with command: '{command}'")
+        logger.info("[DomainNavigator] navigate() called with command: '%s'", command)
         
-        command_part, params_part = self._split_command_and_params(command)
-        logger.info(f"[DomainNavigator] Split command: part='{command_part}', params='{params_part}'")
+        parts, params_part = _parse_command(command)
+        logger.info("[DomainNavigator] Split command: parts=%s, params='%s'", parts, params_part)
         
         current_object = self.bot
-        parts = self._parse_dot_notation(command_part)
-        logger.info(f"[DomainNavigator] Parsed parts: {parts}")
         
         for i, part in enumerate(parts):
             is_last = i == len(parts) - 1
@@ -34,42 +96,36 @@ class DomainNavigator:
             # Strip trailing () from method calls (e.g., 'delete()' -> 'delete')
             if is_last and part.endswith('()'):
                 part = part[:-2]
-                logger.info(f"[DomainNavigator] Stripped () from method name, using: '{part}'")
+                logger.info("[DomainNavigator] Stripped () from method name, using: '%s'", part)
             
-            if hasattr(current_object, part):
-                attr = getattr(current_object, part)
-                
+            found, attr = _resolve_attribute(current_object, part)
+            if found:
                 # Check if this is a callable followed by a value (e.g., rename."New Name" or move_to."Target")
                 if callable(attr) and not is_last and i + 1 < len(parts):
                     next_part = parts[i + 1]
                     # If the next part looks like a value (not a method/property), treat it as a parameter
                     if not hasattr(attr, next_part): 
-                        # Get the first parameter name from the method signature
-                        try:
-                            sig = inspect.signature(attr)
-                            # Get first parameter (excluding 'self')
-                            param_names = [p for p in sig.parameters.keys() if p != 'self']
-                            if param_names:
-                                first_param_name = param_names[0]
-                                # Call the method with the next part as the first parameter
-                                params = {first_param_name: next_part}
-                                # Merge with any other parameters
-                                params.update(self._parse_parameters(params_part))
-                                try:
-                                    result = attr(**params)
-                                    return self._format_result(part, result, params)
-                                except ValueError as e:
-                                    return {'status': 'error', 'message': str(e)}
-                        except (ValueError, TypeError):
-                            pass  # Fall through to normal navigation
+                        # Get the first parameter name from the method signature (excluding 'self')
+                        param_names = _parameter_names(attr)
+                        if param_names:
+                            first_param_name = param_names[0]
+                            # Call the method with the next part as the first parameter
+                            params = {first_param_name: next_part}
+                            # Merge with any other parameters
+                            params.update(_command_parameters(params_part))
+                            try:
+                                result = attr(**params)
+                                return self._format_result(part, result, params)
+                            except ValueError as e:
+                                return {'status': 'error', 'message': str(e)}
+                            except TypeError:
+                                pass  # Fall through to normal navigation
                 
                 if is_last and callable(attr):
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.info(f"[DomainNavigator] Found callable method: '{part}'")
+                    logger.info("[DomainNavigator] Found callable method: '%s'", part)
                     
-                    params = self._parse_parameters(params_part)
-                    logger.info(f"[DomainNavigator] Parsed params: {params}")
+                    params = _command_parameters(params_part)
+                    logger.info("[DomainNavigator] Parsed params: %s", params)
                     
                     # If it's an Action and no params, return its instructions instead of executing
                     if type(attr).__name__ == 'Action' and not params:
@@ -77,18 +133,16 @@ class DomainNavigator:
                         return self._format_object_result(attr)
                     # For other callables or actions with params, execute them
                     try:
-                        logger.info(f"[DomainNavigator] Calling {part} with params: {params}")
+                        logger.info("[DomainNavigator] Calling %s with params: %s", part, params)
                         result = attr(**params)
-                        logger.info(f"[DomainNavigator] Method {part} returned: {type(result)}")
+                        logger.info("[DomainNavigator] Method %s returned: %s", part, type(result))
                         return self._format_result(part, result, params)
                     except ValueError as e:
-                        import traceback
                         error_msg = str(e)
-                        logger.error(f"[DomainNavigator] ValueError calling {part}: {error_msg}")
-                        logger.error(f"[DomainNavigator] Full traceback:\n{traceback.format_exc()}")
+                        logger.error("[DomainNavigator] ValueError calling %s: %s", part, error_msg, exc_info=True)
                         return {'status': 'error', 'message': error_msg}
                     except Exception as e:
-                        logger.error(f"[DomainNavigator] Exception calling {part}: {str(e)}", exc_info=True)
+                        logger.error("[DomainNavigator] Exception calling %s: %s", part, e, exc_info=True)
                         return {'status': 'error', 'message': f'Error calling {part}: {str(e)}'}
                 elif is_last:
                     return self._format_object_result(attr)
@@ -110,7 +164,8 @@ class DomainNavigator:
         
         return current_object
     
-    def _split_command_and_params(self, command: str) -> tuple:
+    @staticmethod
+    def _split_command_and_params(command: str) -> tuple:
         """Split command into dot notation part and parameters part
         
         Example: 
@@ -134,7 +189,8 @@ class DomainNavigator:
         # No parameters found
         return command.strip(), ''
     
-    def _parse_dot_notation(self, path: str) -> list:
+    @staticmethod
+    def _parse_dot_notation(path: str) -> list:
         """Parse dot notation into parts, handling quoted strings
         
         Example:
@@ -160,7 +216,8 @@ class DomainNavigator:
         
         return parts
     
-    def _parse_parameters(self, params_str: str) -> dict:
+    @staticmethod
+    def _parse_parameters(params_str: str) -> dict:
         """Parse parameters from string like: name:"User Management" at_position:1
         Also handles dotted paths like: target:"Epic1"."Child1"
         
@@ -340,3 +397,20 @@ class DomainNavigator:
             return {'status': 'success', 'result': obj}
         
         return {'status': 'success', 'message': f'Retrieved {type(obj).__name__}', 'result_type': type(obj).__name__}
+
+
+@lru_cache(maxsize=COMMAND_CACHE_SIZE)
+def _parse_command(command: str) -> Tuple[Tuple[str, ...], str]:
+    """(dot notation parts, parameters string) of a command."""
+    command_part, params_part = DomainNavigator._split_command_and_params(command)
+    return tuple(DomainNavigator._parse_dot_notation(command_part)), params_part
+
+
+@lru_cache(maxsize=COMMAND_CACHE_SIZE)
+def _parsed_parameters(params_str: str) -> Tuple[Tuple[str, Any], ...]:
+    return tuple(DomainNavigator._parse_parameters(params_str).items())
+
+
+def _command_parameters(params_str: str) -> dict:
+    """A fresh dict of the parameters in params_str; callers may modify it."""
+    return dict(_parsed_parameters(params_str))
@@ -1,7 +1,23 @@
-﻿from .rule import Rule
-from .rule_loader import RuleLoader
-from .rule_filter import RuleFilter
-from .rules import Rules
+﻿import importlib
 
-__all__ = ['Rule', 'RuleLoader', 'RuleFilter', 'Rules']
+# Submodule for each exported name, imported on first access: "import rules.rule_catalog" must not pull in the
+# scanner packages that rules.rules and rules.rule need
+_EXPORTS = {
+    'Rule': '.rule',
+    'RuleLoader': '.rule_loader',
+    'RuleCatalog': '.rule_catalog',
+    'RuleCatalogEntry': '.rule_catalog',
+    'RuleFilter': '.rule_filter',
+    'Rules': '.rules'
+}
 
+__all__ = ['Rule', 'RuleLoader', 'RuleCatalog', 'RuleCatalogEntry', 'RuleFilter', 'Rules']
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,19 +1,17 @@
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from scanners.code.python.code_scanner import CodeScanner
-from scanners.scanner_registry import ScannerRegistry
-from scanners.code.python.test_scanner import TestScanner
-from scanners.resources.scan_context import ScanFilesContext, CrossFileScanContext, FileCollection
 from utils import read_json_file
 from rules.scan_config import ScanConfig
+from rules.rule_catalog import RuleCatalogEntry
 
 class Rule:
 
-    def __init__(self, rule_file_path: Path, behavior_name: str, bot_name: str, rule_content: Optional[Dict[str, Any]]=None):
+    def __init__(self, rule_file_path: Path, behavior_name: str, bot_name: str, rule_content: Optional[Dict[str, Any]]=None, catalog_entry: Optional[RuleCatalogEntry]=None):
         self._rule_file_path = Path(rule_file_path)
         self._behavior_name = behavior_name
         self._bot_name = bot_name
         self._rule_content_param = rule_content
+        self._catalog_entry = catalog_entry if rule_content is None else None
         self._init_rule_content()
         self._init_scanner()
         self._init_violation_tracking()
@@ -25,13 +23,15 @@ class Rule:
             self._rule_file = f'{self._rule_file_path.name}#embedded'
             self._name = rule_content.get('name', 'unknown') or self._rule_file_path.stem
         else:
-            self._rule_content = read_json_file(self._rule_file_path)
+            # With a catalog entry the body (examples, guidance) is only read when something asks for rule_content
+            self._rule_content = read_json_file(self._rule_file_path) if self._catalog_entry is None else None
             self._rule_file = self._rule_file_path.name
             self._name = self._rule_file.replace('.json', '') if self._rule_file else 'unknown'
 
     def _init_scanner(self) -> None:
         self._scanner_load_error: Optional[str] = None
-        scanner_path = self._rule_content.get('scanner')
+        self._target_language: Optional[str] = None
+        scanner_path = self.scanner_path
         if scanner_path:
             self._scanner, self._scanner_load_error = self._load_scanner(scanner_path)
         else:
@@ -44,16 +44,28 @@ class Rule:
         self._scanner_execution_status: Optional[str] = None
 
     def _load_scanner(self, scanner_module_path: str, target_language: str = None) -> tuple[Optional[type], Optional[str]]:
+        from scanners.scanner_registry import ScannerRegistry
         scanner_registry = ScannerRegistry(self._bot_name)
         scanner_class, error = scanner_registry.loads_scanner_class_with_error(scanner_module_path, target_language)
         return (scanner_class, error)
     
     def reload_scanner_for_language(self, target_language: str) -> None:
         """Reload scanner for a specific language."""
-        scanner_path = self._rule_content.get('scanner')
+        scanner_path = self.scanner_path
         if scanner_path:
+            self._target_language = target_language
             self._scanner, self._scanner_load_error = self._load_scanner(scanner_path, target_language)
 
+    def to_worker_args(self) -> Dict[str, Any]:
+        """Picklable arguments for rebuilding this rule inside a scanner worker process."""
+        return {
+            'rule_file_path': str(self._rule_file_path),
+            'behavior_name': self._behavior_name,
+            'bot_name': self._bot_name,
+            'rule_content': self._rule_content_param,
+            'target_language': self._target_language
+        }
+
     @property
     def name(self) -> str:
         return self._name
@@ -78,27 +90,53 @@ class Rule:
 
     @property
     def priority(self) -> int:
+        if self._catalog_entry is not None:
+            return 999 if self._catalog_entry.priority is None else self._catalog_entry.priority
         return self._rule_content.get('priority', 999)
     
     @property
     def description(self) -> str:
+        if self._catalog_entry is not None:
+            return '' if self._catalog_entry.description is None else self._catalog_entry.description
         return self._rule_content.get('description', '')
 
+    @property
+    def do_description(self) -> str:
+        if self._catalog_entry is not None:
+            return self._catalog_entry.do_description
+        return self.rule_content.get('do', {}).get('description', '')
+
+    @property
+    def dont_description(self) -> str:
+        if self._catalog_entry is not None:
+            return self._catalog_entry.dont_description
+        return self.rule_content.get('dont', {}).get('description', '')
+
+    @property
+    def language(self) -> Optional[str]:
+        if self._catalog_entry is not None:
+            return self._catalog_entry.language
+        return self.rule_content.get('language')
+
     @property
     def examples(self) -> List[Dict[str, Any]]:
-        return self._rule_content.get('examples', [])
+        return self.rule_content.get('examples', [])
 
     @property
     def scanner_path(self) -> Optional[str]:
+        if self._catalog_entry is not None:
+            return self._catalog_entry.scanner
         return self._rule_content.get('scanner')
 
     @property
     def rule_content(self) -> Dict[str, Any]:
+        if self._rule_content is None:
+            self._rule_content = read_json_file(self._rule_file_path)
         return self._rule_content
 
     @property
     def instruction(self) -> Optional[str]:
-        return self._rule_content.get('instruction')
+        return self.rule_content.get('instruction')
 
     @property
     def has_scanner(self) -> bool:
@@ -120,6 +158,8 @@ class Rule:
     def requires_two_pass_scan(self) -> bool:
         if not self._scanner:
             return False
+        from scanners.code.python.code_scanner import CodeScanner
+        from scanners.code.python.test_scanner import TestScanner
         return issubclass(self._scanner, TestScanner) or issubclass(self._scanner, CodeScanner)
 
     def scan(self, config: ScanConfig) -> Dict[str, Any]:
@@ -129,7 +169,9 @@ class Rule:
         self._initialize_scan_state()
         try:
             scanner_instance = self._get_scanner_instance()
+            self._notify_scan_phase(config, 'file_by_file')
             self._execute_file_by_file_scan(scanner_instance, config)
+            self._notify_scan_phase(config, 'cross_file')
             self._execute_cross_file_scan(scanner_instance, config)
             return self._build_scan_result()
         except Exception as e:
@@ -137,6 +179,17 @@ class Rule:
             self._scanner_execution_status = f'EXECUTION_FAILED: {str(e)}'
             raise
 
+    def record_worker_scan(self, file_by_file_violations: List[Dict[str, Any]], cross_file_violations: List[Dict[str, Any]], execution_status: str) -> Dict[str, Any]:
+        self._file_by_file_violations = list(file_by_file_violations)
+        self._cross_file_violations = list(cross_file_violations)
+        self._scan_error = None
+        self._scanner_execution_status = execution_status
+        return self._build_scan_result()
+
+    def _notify_scan_phase(self, config: ScanConfig, phase: str) -> None:
+        if config.on_scan_phase:
+            config.on_scan_phase(phase)
+
     def _initialize_scan_state(self):
         self._file_by_file_violations = []
         self._cross_file_violations = []
@@ -151,13 +204,16 @@ class Rule:
         return scanner_instance
 
     def _execute_file_by_file_scan(self, scanner_instance, config: ScanConfig):
+        from scanners.resources.scan_context import ScanFilesContext, FileCollection
         context = ScanFilesContext(
             story_graph=config.story_graph,
             files=FileCollection(
-                test_files=config.test_files or [],
-                code_files=config.code_files or []
+                test_files=config.file_scan_test_files or [],
+                code_files=config.file_scan_code_files or []
             ),
-            on_file_scanned=config.on_file_scanned
+            on_file_scanned=config.on_file_scanned,
+            symbol_index=config.symbol_index,
+            ast_dispatcher=config.ast_dispatcher
         )
         violations_file_by_file = scanner_instance.scan_with_context(context)
         if violations_file_by_file is not None:
@@ -172,6 +228,7 @@ class Rule:
 
     def _execute_cross_file_scan(self, scanner_instance, config: ScanConfig):
         if not config.skip_cross_file and self.requires_two_pass_scan and hasattr(scanner_instance, 'scan_cross_file_with_context'):
+            from scanners.resources.scan_context import CrossFileScanContext, FileCollection
             context = CrossFileScanContext(
                 story_graph=config.story_graph,
                 changed_files=FileCollection(
@@ -183,7 +240,8 @@ class Rule:
                     code_files=config.all_code_files or config.code_files or []
                 ),
                 status_writer=config.status_writer,
-                max_comparisons=config.max_cross_file_comparisons or 20
+                max_comparisons=config.max_cross_file_comparisons or 20,
+                symbol_index=config.symbol_index
             )
             violations_cross_file = scanner_instance.scan_cross_file_with_context(context)
             if violations_cross_file:
@@ -246,7 +304,7 @@ class Rule:
         formatted.append(content)
 
     def _format_inline_examples(self, formatted: list) -> None:
-        examples = self._rule_content.get('examples', [])
+        examples = self.rule_content.get('examples', [])
         for example in examples:
             if 'do' in example:
                 self._format_example_block(example['do'], 'DO', formatted)
@@ -254,7 +312,7 @@ class Rule:
                 self._format_example_block(example['dont'], "DON'T", formatted)
 
     def _format_rule_section(self, section_key: str, header: str, formatted: list) -> None:
-        section = self._rule_content.get(section_key, {})
+        section = self.rule_content.get(section_key, {})
         desc = section.get('description', '')
         guidance = section.get('guidance', [])
         
@@ -275,7 +333,7 @@ class Rule:
         
         self._format_rule_section('dont', "DON'T", formatted)
         
-        if 'examples' in self._rule_content:
+        if 'examples' in self.rule_content:
             self._format_inline_examples(formatted)
         formatted.append('')
         return formatted
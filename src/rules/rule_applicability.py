@@ -0,0 +1,133 @@
+"""Decides which (rule, file) pairs a validation run has to visit before any scanner opens a file.
+
+Scanners describe what they can report on through class attributes (see Scanner): target languages, test or production
+files, AST node kinds or keywords a file must contain, and story graph sections that must be present. The matrix checks
+those against cheap facts about each file - its extension, its path and one byte scan for keywords - and hands each rule
+only the files it could report on. Only scanners that use the base per-file loop are filtered; scanners that walk their
+files some other way, and the cross-file pass, always see every file.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+LANGUAGE_BY_SUFFIX = {
+    '.py': 'python', '.pyi': 'python', '.pyw': 'python',
+    '.js': 'javascript', '.mjs': 'javascript', '.cjs': 'javascript', '.jsx': 'javascript',
+    '.ts': 'typescript', '.tsx': 'typescript'
+}
+
+# Source text that any node of each kind has to contain; node kinds missing here put no constraint on the file
+KEYWORDS_BY_AST_NODE = {
+    'ClassDef': (b'class',), 'FunctionDef': (b'def',), 'AsyncFunctionDef': (b'async',), 'Lambda': (b'lambda',),
+    'Global': (b'global',), 'Nonlocal': (b'nonlocal',), 'Import': (b'import',), 'ImportFrom': (b'import',),
+    'Return': (b'return',), 'Yield': (b'yield',), 'YieldFrom': (b'yield',), 'Await': (b'await',),
+    'Raise': (b'raise',), 'Try': (b'try',), 'TryStar': (b'try',), 'Assert': (b'assert',), 'Delete': (b'del',),
+    'With': (b'with',), 'AsyncWith': (b'with',), 'For': (b'for',), 'AsyncFor': (b'for',), 'While': (b'while',)
+}
+
+
+@dataclass(frozen=True)
+class ScannerApplicability:
+    filters_files: bool
+    languages: FrozenSet[str]
+    roles: FrozenSet[str]
+    keywords: Tuple[bytes, ...]
+    story_graph_sections: Tuple[str, ...]
+
+    @classmethod
+    def for_scanner_class(cls, scanner_class: type) -> 'ScannerApplicability':
+        return _applicability_for(scanner_class)
+
+    @property
+    def is_unrestricted(self) -> bool:
+        return not (self.languages or self.roles or self.keywords)
+
+
+@lru_cache(maxsize=None)
+def _applicability_for(scanner_class: type) -> ScannerApplicability:
+    from scanners.scanner import Scanner
+    from scanners.code.python.code_scanner import CodeScanner
+    from scanners.code.python.composite_visitor import hooked_node_names
+    languages = tuple(getattr(scanner_class, 'target_languages', ()))
+    node_kinds = tuple(getattr(scanner_class, 'required_ast_nodes', ()))
+    keywords = tuple(getattr(scanner_class, 'required_keywords', ()))
+    hook_nodes = tuple(hooked_node_names(scanner_class))
+    if hook_nodes and getattr(scanner_class, 'scan_file_with_context', None) is CodeScanner.scan_file_with_context:
+        # Hook-only scanners report nothing for a file that does not parse as Python or has none of the hooked nodes
+        languages = languages or ('python',)
+        node_kinds = node_kinds or hook_nodes
+    if node_kinds and all(kind in KEYWORDS_BY_AST_NODE for kind in node_kinds):
+        keywords = keywords + tuple(keyword for kind in node_kinds for keyword in KEYWORDS_BY_AST_NODE[kind])
+    scan_with_context = getattr(scanner_class, 'scan_with_context', None)
+    return ScannerApplicability(
+        filters_files=scan_with_context in (Scanner.scan_with_context, CodeScanner.scan_with_context),
+        languages=frozenset(languages),
+        roles=frozenset(getattr(scanner_class, 'file_roles', ())),
+        keywords=tuple(dict.fromkeys(keywords)),
+        story_graph_sections=tuple(getattr(scanner_class, 'required_story_graph_sections', ()))
+    )
+
+
+class FileFacts:
+    """Extension-derived language and, on first request, which of the run's keywords the file contains."""
+
+    def __init__(self, path: Path, keywords: FrozenSet[bytes]):
+        self.path = path
+        self.language = LANGUAGE_BY_SUFFIX.get(path.suffix.lower())
+        self._keywords = keywords
+        self._present: Optional[FrozenSet[bytes]] = None
+
+    def contains_any(self, keywords: Tuple[bytes, ...]) -> bool:
+        if self._present is None:
+            self._present = self._scan_keywords()
+        return not self._present.isdisjoint(keywords)
+
+    def _scan_keywords(self) -> FrozenSet[bytes]:
+        try:
+            content = self.path.read_bytes()
+        except OSError:
+            # Let the scanner decide what an unreadable file means
+            return self._keywords
+        return frozenset(keyword for keyword in self._keywords if keyword in content)
+
+
+class ApplicabilityMatrix:
+    """The (rule x file) work matrix for one validation run, with a count of the pairs it dropped."""
+
+    def __init__(self, rules: List[Any], story_graph: Optional[Dict[str, Any]]):
+        graph = story_graph or {}
+        self._story_graph = graph.get('story_graph', graph) if isinstance(graph, dict) else None
+        self._applicability = {
+            id(rule): ScannerApplicability.for_scanner_class(rule.scanner_class) for rule in rules if rule.scanner_class
+        }
+        self._keywords = frozenset(keyword for applicability in self._applicability.values() for keyword in applicability.keywords)
+        self._facts: Dict[Path, FileFacts] = {}
+        self.skipped_pairs = 0
+
+    def missing_story_graph_sections(self, rule: Any) -> List[str]:
+        applicability = self._applicability.get(id(rule))
+        if applicability is None or not isinstance(self._story_graph, dict):
+            return []
+        return [section for section in applicability.story_graph_sections if not self._story_graph.get(section)]
+
+    def applicable_files(self, rule: Any, files: Dict[str, List[Path]]) -> Tuple[Dict[str, List[Path]], int]:
+        """files narrowed to what rule's scanner can report on, and how many files were dropped."""
+        applicability = self._applicability.get(id(rule))
+        if applicability is None or not applicability.filters_files or applicability.is_unrestricted:
+            return files, 0
+        scanner = rule.scanner if applicability.roles else None
+        applicable = {key: [path for path in paths if self._applies(applicability, scanner, path)] for key, paths in files.items()}
+        skipped = sum(len(paths) for paths in files.values()) - sum(len(paths) for paths in applicable.values())
+        self.skipped_pairs += skipped
+        return applicable, skipped
+
+    def _applies(self, applicability: ScannerApplicability, scanner: Any, path: Path) -> bool:
+        facts = self._facts.get(path)
+        if facts is None:
+            facts = self._facts[path] = FileFacts(path, self._keywords)
+        if applicability.languages and facts.language is not None and facts.language not in applicability.languages:
+            return False
+        if applicability.roles and ('test' if scanner._is_test_file(path) else 'production') not in applicability.roles:
+            return False
+        return not applicability.keywords or facts.contains_any(applicability.keywords)
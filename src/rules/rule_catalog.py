@@ -0,0 +1,126 @@
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from file_version_cache import is_racy
+from utils import read_json_file
+from workspace_state_store import WorkspaceStateStore
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 2
+CATALOG_DIRECTORY = Path('.agile_bots') / 'cache'
+
+
+@dataclass(frozen=True)
+class RuleCatalogEntry:
+    """What digests, listings and filtering need from a rule file, so they never parse the file itself."""
+    path: str
+    mtime_ns: int
+    size: int
+    inode: int
+    cached_ns: int
+    declared_name: Optional[str]
+    priority: Optional[int]
+    scanner: Optional[str]
+    has_scanner_config: bool
+    language: Optional[str]
+    description: Optional[str]
+    do_description: str
+    dont_description: str
+
+    @classmethod
+    def from_file(cls, rule_file: Path, stat: os.stat_result) -> 'RuleCatalogEntry':
+        content = read_json_file(rule_file)
+        return cls(
+            path=str(rule_file),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            inode=stat.st_ino,
+            cached_ns=time.time_ns(),
+            declared_name=content.get('name'),
+            priority=content.get('priority'),
+            scanner=content.get('scanner'),
+            has_scanner_config='scanner' in content or 'scanners' in content,
+            language=content.get('language'),
+            description=content.get('description'),
+            do_description=content.get('do', {}).get('description', ''),
+            dont_description=content.get('dont', {}).get('description', '')
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RuleCatalogEntry':
+        return cls(**{field.name: data[field.name] for field in fields(cls)})
+
+    def matches(self, stat: os.stat_result) -> bool:
+        """Whether the entry still describes the file; entries parsed too soon after the file was modified never do."""
+        return (self.mtime_ns == stat.st_mtime_ns and self.size == stat.st_size and self.inode == stat.st_ino
+                and not is_racy(self.mtime_ns, self.cached_ns))
+
+
+class RuleCatalog:
+    """Rule summaries for one bot directory, kept in <workspace>/.agile_bots/cache and reused while each file's mtime,
+    size and inode are unchanged. Only files that are new or changed since the catalog was written get parsed, along
+    with files modified within the racy window of being parsed, whose mtime cannot tell a later rewrite apart."""
+
+    _catalogs: Dict[Path, 'RuleCatalog'] = {}
+
+    def __init__(self, catalog_file: Optional[Path]):
+        self.catalog_file = catalog_file
+        self._entries: Dict[str, RuleCatalogEntry] = {}
+        if catalog_file is not None:
+            self._entries = self._read(catalog_file)
+
+    @classmethod
+    def for_bot(cls, bot_paths) -> 'RuleCatalog':
+        workspace_directory = getattr(bot_paths, 'workspace_directory', None)
+        bot_directory = getattr(bot_paths, 'bot_directory', None)
+        if workspace_directory is None or bot_directory is None:
+            return cls(None)
+        catalog_file = Path(workspace_directory) / CATALOG_DIRECTORY / f'{Path(bot_directory).name}_rules.json'
+        catalog = cls._catalogs.get(catalog_file)
+        if catalog is None:
+            catalog = cls._catalogs[catalog_file] = cls(catalog_file)
+        return catalog
+
+    @staticmethod
+    def _read(catalog_file: Path) -> Dict[str, RuleCatalogEntry]:
+        try:
+            data = WorkspaceStateStore.shared().peek(catalog_file, {})
+            if data.get('version') != CATALOG_VERSION:
+                return {}
+            return {path: RuleCatalogEntry.from_dict(entry) for path, entry in data.get('rules', {}).items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f'Ignoring unreadable rule catalog {catalog_file}: {e}')
+            return {}
+
+    def entries(self, rule_files: List[Path]) -> List[RuleCatalogEntry]:
+        """Entries for rule_files in the same order, parsing only files the catalog has not seen at their current mtime."""
+        entries = []
+        changed = False
+        for rule_file in rule_files:
+            stat = rule_file.stat()
+            entry = self._entries.get(str(rule_file))
+            if entry is None or not entry.matches(stat):
+                entry = RuleCatalogEntry.from_file(rule_file, stat)
+                self._entries[str(rule_file)] = entry
+                changed = True
+            entries.append(entry)
+        if changed:
+            self._save()
+        return entries
+
+    def entry(self, rule_file: Path) -> RuleCatalogEntry:
+        return self.entries([rule_file])[0]
+
+    def _save(self) -> None:
+        if self.catalog_file is None:
+            return
+        self._entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+        data = {'version': CATALOG_VERSION, 'rules': {path: asdict(entry) for path, entry in self._entries.items()}}
+        try:
+            WorkspaceStateStore.shared().write(self.catalog_file, data)
+        except OSError as e:
+            logger.debug(f'Could not write rule catalog {self.catalog_file}: {e}')
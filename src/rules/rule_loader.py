@@ -1,7 +1,8 @@
 ﻿import logging
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 from rules.rule import Rule
+from rules.rule_catalog import RuleCatalog
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +13,7 @@ class RuleLoader:
         self.behavior_name = behavior_name
         self.bot_paths = bot_paths
         self.behavior = behavior
+        self._catalog = RuleCatalog.for_bot(bot_paths)
 
     def load_bot_rules(self) -> List[Rule]:
         bot_rules_dir = self.bot_paths.bot_directory / 'rules'
@@ -20,11 +22,7 @@ class RuleLoader:
             logger.debug(f'Bot rules directory does not exist: {bot_rules_dir}')
             return bot_rules
         
-        for rule_file in bot_rules_dir.glob('*.json'):
-            if self._is_in_disabled_folder(rule_file):
-                logger.debug(f'Skipping disabled rule: {rule_file.name}')
-                continue
-            bot_rules.append(self._create_rule(rule_file))
+        bot_rules = self._create_rules(self._enabled_rule_files(bot_rules_dir.glob('*.json')))
         
         logger.info(f'Loaded {len(bot_rules)} bot-level rules')
         return sorted(bot_rules, key=lambda r: r.priority)
@@ -32,12 +30,7 @@ class RuleLoader:
     def load_behavior_rules(self) -> List[Rule]:
         behavior_folder = self.bot_paths.bot_directory / 'behaviors' / self.behavior_name
         behavior_rules_dir = behavior_folder / 'rules'
-        behavior_rules = []
-        for rule_file in behavior_rules_dir.glob('*.json'):
-            if self._is_in_disabled_folder(rule_file):
-                logger.debug(f'Skipping disabled rule: {rule_file.name}')
-                continue
-            behavior_rules.append(self._create_rule(rule_file))
+        behavior_rules = self._create_rules(self._enabled_rule_files(behavior_rules_dir.glob('*.json')))
         for subdir_name in ['3_rules', 'rules']:
             subdir = behavior_folder / subdir_name
             if subdir != behavior_rules_dir:
@@ -45,15 +38,25 @@ class RuleLoader:
         logger.info(f'Loaded {len(behavior_rules)} behavior rules for {self.behavior_name}')
         return sorted(behavior_rules, key=lambda r: r.priority)
 
+    def _enabled_rule_files(self, rule_files: Iterable[Path]) -> List[Path]:
+        enabled = []
+        for rule_file in rule_files:
+            if self._is_in_disabled_folder(rule_file):
+                logger.debug(f'Skipping disabled rule: {rule_file.name}')
+                continue
+            enabled.append(rule_file)
+        return enabled
+
+    def _create_rules(self, rule_files: List[Path]) -> List[Rule]:
+        entries = self._catalog.entries(rule_files)
+        return [Rule(rule_file_path=rule_file, behavior_name=self.behavior_name, bot_name=self.bot_name, catalog_entry=entry) for rule_file, entry in zip(rule_files, entries)]
+
     def _create_rule(self, rule_file: Path) -> Rule:
-        return Rule(rule_file_path=rule_file, behavior_name=self.behavior_name, bot_name=self.bot_name)
+        return Rule(rule_file_path=rule_file, behavior_name=self.behavior_name, bot_name=self.bot_name, catalog_entry=self._catalog.entry(rule_file))
 
     def _load_rules_from_subdir(self, subdir: Path, behavior_rules_dir: Path) -> List[Rule]:
         rules = []
-        for rule_file in subdir.rglob('*.json'):
-            if self._is_in_disabled_folder(rule_file):
-                logger.debug(f'Skipping disabled rule: {rule_file.name}')
-                continue
+        for rule_file in self._enabled_rule_files(subdir.rglob('*.json')):
             if behavior_rules_dir.exists() and rule_file.is_relative_to(behavior_rules_dir):
                 continue
             try:
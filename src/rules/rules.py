@@ -1,17 +1,22 @@
 from __future__ import annotations
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Iterator, Dict, Any, TYPE_CHECKING, Callable
+from typing import List, Optional, Iterator, Dict, Any, Set, TYPE_CHECKING, Callable
 from pathlib import Path
 from rules.rule import Rule
 from rules.rule_loader import RuleLoader
 from rules.rule_filter import RuleFilter
+from rules.scanner_metrics import ScannerMetricsRecorder
+from rules.rule_applicability import ApplicabilityMatrix
 from actions.build.story_graph_data import StoryGraphData
 from story_graph.story_graph import StoryGraph
 from actions.validate.validation_scope import ValidationScope
 if TYPE_CHECKING:
+    from rules.scanner_worker import ScanBudget
+    from scanners.code.python.composite_visitor import CompositeVisitor
+    from scanners.code.python.symbol_index import SymbolIndex
     from actions.action_context import ValidateActionContext
 
 @dataclass
@@ -34,6 +39,12 @@ class ValidationContext:
     working_dir: Path
     status_writer: Optional[Any] = None
     max_cross_file_comparisons: int = 20
+    scanner_budget_seconds: Optional[float] = None
+    file_budget_seconds: Optional[float] = None
+    trace_memory: bool = False
+    cancel_check: Optional[Callable[[], bool]] = None
+    discovered_files: Dict[Path, Any] = field(default_factory=dict)
+    git_changed_files: Optional[Set[Path]] = None
 
     @classmethod
     def from_action_context(cls, behavior, context: 'ValidateActionContext', callbacks: Optional[ValidationCallbacks] = None) -> 'ValidationContext':
@@ -45,7 +56,9 @@ class ValidationContext:
         if context.scope:
             story_graph_content = validation_scope.filter_story_graph(story_graph_content)
         
-        files = cls._get_files_for_validation(behavior, context)
+        discovered_files = {}
+        files = cls._get_files_for_validation(behavior, context, discovered_files)
+        git_changed_files = cls._get_git_changed_files(behavior, context, files)
         
         skiprule = context.scope.skiprule if context.scope else []
         exclude = context.scope.exclude if context.scope else []
@@ -61,11 +74,17 @@ class ValidationContext:
             behavior=behavior,
             bot_paths=behavior.bot_paths,
             working_dir=behavior.bot_paths.workspace_directory,
-            max_cross_file_comparisons=context.max_cross_file_comparisons
+            max_cross_file_comparisons=context.max_cross_file_comparisons,
+            scanner_budget_seconds=context.scanner_budget_seconds,
+            file_budget_seconds=context.file_budget_seconds,
+            trace_memory=context.trace_memory,
+            cancel_check=context.cancel_check,
+            discovered_files=discovered_files,
+            git_changed_files=git_changed_files
         )
     
     @classmethod
-    def _get_files_for_validation(cls, behavior, context: 'ValidateActionContext') -> Dict[str, List[Path]]:
+    def _get_files_for_validation(cls, behavior, context: 'ValidateActionContext', discovered_files: Optional[Dict[Path, Any]] = None) -> Dict[str, List[Path]]:
         from actions.validate.file_discovery import FileDiscovery
         from scope import ScopeType
         from actions.validate.validation_type import ValidationType
@@ -106,7 +125,7 @@ class ValidationContext:
             
             return files_dict
         
-        file_discovery = FileDiscovery(behavior.bot_paths, behavior.name, [])
+        file_discovery = FileDiscovery(behavior.bot_paths, behavior.name, [], respect_gitignore=True)
         
         if behavior.name in ('tests', 'test'):
             all_files = {'test': file_discovery.discover_files_from_directory('test')}
@@ -117,6 +136,8 @@ class ValidationContext:
                 'test': file_discovery.discover_files_from_directory('test'),
                 'src': file_discovery.discover_files_from_directory('src')
             }
+        if discovered_files is not None:
+            discovered_files.update(file_discovery.discovered)
         
         if context.scope and context.scope.file_filter:
             filtered_files = {}
@@ -127,7 +148,31 @@ class ValidationContext:
             return filtered_files
         
         return all_files
-    
+
+    @classmethod
+    def _get_git_changed_files(cls, behavior, context: 'ValidateActionContext', files: Dict[str, List[Path]]) -> Optional[Set[Path]]:
+        from scope import ScopeType
+        from actions.validate.git_changes import GitChangeDetector, GitError, RevisionError, DEFAULT_REVISION, reverse_dependencies
+
+        if not context.scope or context.scope.type != ScopeType.CHANGED:
+            return None
+        logger = logging.getLogger(__name__)
+        revision = context.scope.value[0] if context.scope.value else DEFAULT_REVISION
+        workspace_dir = behavior.bot_paths.workspace_directory
+        candidates = [f for file_list in files.values() for f in file_list]
+        try:
+            changed = GitChangeDetector(workspace_dir).changed_files(revision, candidates)
+        except RevisionError as e:
+            # Falling back would quietly validate a different file set than the one asked for
+            raise ValueError(f'Cannot validate changes since {revision}: {e}') from e
+        except (GitError, OSError, ValueError) as e:
+            logger.warning(f'Could not read git changes since {revision} ({e}) - falling back to report timestamps')
+            return None
+        # Direct importers of changed modules are rescanned so cross-file rules still see affected callers
+        importers = reverse_dependencies(changed, candidates, [workspace_dir, workspace_dir / 'src', workspace_dir / 'test'])
+        logger.info(f'Changed since {revision}: {len(changed)} file(s), plus {len(importers)} importer(s)')
+        return changed | importers
+
     @classmethod
     def from_parameters(cls, parameters: Dict[str, Any], behavior, bot_paths, callbacks: Optional[ValidationCallbacks] = None) -> 'ValidationContext':
         from actions.action_context import ValidateActionContext, Scope, ScopeType, FileFilter
@@ -177,7 +222,10 @@ class ValidationContext:
             scope=scope,
             background=parameters.get('background'),
             skip_cross_file=parameters.get('skip_cross_file', False),
-            all_files=all_files
+            all_files=all_files,
+            scanner_budget_seconds=parameters.get('scanner_budget_seconds'),
+            file_budget_seconds=parameters.get('file_budget_seconds'),
+            trace_memory=parameters.get('trace_memory', False)
         )
         
         return cls.from_action_context(behavior, context, callbacks)
@@ -185,6 +233,14 @@ class ValidationContext:
     def should_skip_rule(self, rule_name: str) -> bool:
         return rule_name in self.skiprule
 
+    @property
+    def scan_budget(self) -> ScanBudget:
+        from rules.scanner_worker import ScanBudget
+        return ScanBudget(scanner_seconds=self.scanner_budget_seconds, file_seconds=self.file_budget_seconds)
+
+    def is_cancelled(self) -> bool:
+        return bool(self.cancel_check and self.cancel_check())
+
     def get_filtered_files(self, rules_instance: 'Rules') -> Dict[str, List[Path]]:
         if not self.exclude:
             return self.files
@@ -221,6 +277,10 @@ class ValidationContext:
         if self.all_files:
             return files, files
         
+        if self.git_changed_files is not None:
+            changed_files = {file_type: [f for f in file_list if f in self.git_changed_files] for file_type, file_list in files.items()}
+            return changed_files, files
+        
         last_report_time = self.get_last_report_timestamp()
         
         if last_report_time == 0.0:
@@ -228,11 +288,15 @@ class ValidationContext:
         
         changed_files = {}
         for file_type, file_list in files.items():
-            changed = [f for f in file_list if f.stat().st_mtime > last_report_time]
+            changed = [f for f in file_list if self._file_mtime(f) > last_report_time]
             changed_files[file_type] = changed
         
         return changed_files, files
 
+    def _file_mtime(self, file_path: Path) -> float:
+        discovered = self.discovered_files.get(file_path)
+        return discovered.mtime if discovered is not None else file_path.stat().st_mtime
+
 class Rules:
 
     def __init__(self, behavior=None, bot_config=None, bot_paths=None):
@@ -254,6 +318,10 @@ class Rules:
         self._all_violations: List[Dict[str, Any]] = []
         self._rule_loader = RuleLoader(self.bot_name, self.behavior_name, self.bot_paths, self.behavior)
         self._rule_filter = RuleFilter(self.bot_paths)
+        # Scanner packages are imported when validation runs, not when rules are listed
+        self._symbol_index: Optional[SymbolIndex] = None
+        self._ast_dispatcher: Optional[CompositeVisitor] = None
+        self._applicability: Optional[ApplicabilityMatrix] = None
 
     def _load_rules(self) -> List[Rule]:
         if self._rules is not None:
@@ -325,13 +393,11 @@ class Rules:
             description = rule.description or 'No description'
             lines.append(f"- **{rule.name}**: {description}")
             
-            do_section = rule.rule_content.get('do', {})
-            do_desc = do_section.get('description', '')
+            do_desc = rule.do_description
             if do_desc:
                 lines.append(f"  DO: {do_desc}")
             
-            dont_section = rule.rule_content.get('dont', {})
-            dont_desc = dont_section.get('description', '')
+            dont_desc = rule.dont_description
             if dont_desc:
                 lines.append(f"  DON'T: {dont_desc}")
             
@@ -392,6 +458,25 @@ class Rules:
         self.add_violations(rule.violations)
         return f'  [OK] {rule.rule_file}: Scanner executed successfully ({violations_count} violations)'
 
+    def _record_scanner_metrics(self, rule, rule_result: dict, recorder: ScannerMetricsRecorder, scanner_name: str, logger) -> None:
+        metrics = recorder.finish(violations_found=len(rule.violations))
+        rule_result['scanner_metrics'] = metrics.to_dict()
+        logger.info(f'Scanner metrics: {scanner_name} - {metrics.wall_seconds:.3f}s wall, {metrics.cpu_seconds:.3f}s cpu, {metrics.files_scanned} file(s)')
+        if metrics.over_budget:
+            logger.warning(f'Scanner {scanner_name} (rule: {rule.rule_file}) exceeded its budget: {metrics.wall_seconds:.3f}s > {metrics.budget_seconds}s')
+
+    def _run_scan(self, rule, scan_config, context: ValidationContext, logger) -> tuple:
+        budget = context.scan_budget
+        if not budget.is_limited:
+            return rule.scan(scan_config), []
+        from rules.scanner_worker import ScannerWorker
+        outcome = ScannerWorker(rule, budget, context.is_cancelled).scan(scan_config)
+        execution_status = outcome.describe_status(budget)
+        if execution_status.startswith('PARTIAL'):
+            logger.warning(f'Scanner for rule {rule.rule_file} returned partial results: {execution_status}')
+        scanner_results = rule.record_worker_scan(outcome.file_by_file_violations, outcome.cross_file_violations, execution_status)
+        return scanner_results, outcome.timed_out_files
+
     def _execute_scanner(self, rule, rule_result: dict, context: ValidationContext, scanner_path: str, logger, files: Dict, changed_files: Dict, all_files: Dict) -> str:
         scanner_name = scanner_path.split('.')[-1] if '.' in scanner_path else scanner_path
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -399,6 +484,8 @@ class Rules:
         self._flush_logger_handlers(logger)
         if context.callbacks.on_scanner_start:
             context.callbacks.on_scanner_start(rule.rule_file, scanner_path)
+        recorder = ScannerMetricsRecorder(budget_seconds=context.scanner_budget_seconds, trace_memory=context.trace_memory)
+        recorder.start()
         try:
             max_cross_file = getattr(context, 'max_cross_file_comparisons', 20)
             from rules.scan_config import ScanConfig
@@ -408,13 +495,29 @@ class Rules:
                 changed_files=changed_files,
                 skip_cross_file=context.skip_cross_file,
                 max_cross_file_comparisons=max_cross_file,
-                on_file_scanned=context.callbacks.on_file_scanned,
-                status_writer=context.status_writer
+                on_file_scanned=recorder.wrap_file_callback(context.callbacks.on_file_scanned),
+                status_writer=context.status_writer,
+                symbol_index=self._symbol_index,
+                ast_dispatcher=self._ast_dispatcher
             )
-            scanner_results = rule.scan(scan_config)
+            missing_sections = self._applicability.missing_story_graph_sections(rule) if self._applicability else []
+            skipped_files = 0
+            if missing_sections:
+                logger.info(f'Scanner {scanner_name} not applicable: story graph has no {", ".join(missing_sections)}')
+                scanner_results, timed_out_files = rule.record_worker_scan([], [], f'NOT_APPLICABLE: story graph has no {", ".join(missing_sections)}'), []
+            else:
+                skipped_files = self._apply_applicability(rule, scan_config)
+                scanner_results, timed_out_files = self._run_scan(rule, scan_config, context, logger)
+            self._record_scanner_metrics(rule, rule_result, recorder, scanner_name, logger)
             rule_result['scanner_results'] = self._convert_violations_to_dicts(scanner_results)
-            return self._process_scanner_result(rule, rule_result, scanner_results, scanner_path, scanner_name, logger)
+            status_line = self._process_scanner_result(rule, rule_result, scanner_results, scanner_path, scanner_name, logger)
+            if timed_out_files:
+                rule_result['scanner_status']['timed_out_files'] = timed_out_files
+            if skipped_files:
+                rule_result['scanner_status']['skipped_files'] = skipped_files
+            return status_line
         except Exception as e:
+            self._record_scanner_metrics(rule, rule_result, recorder, scanner_name, logger)
             timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             error_msg = f'Scanner execution failed: {str(e)}'
             logger.error(f'[{timestamp}] Completed scanner: {scanner_name} (rule: {rule.rule_file}) - EXCEPTION: {error_msg}')
@@ -423,6 +526,13 @@ class Rules:
             rule_result['scanner_status'] = {'status': 'EXECUTION_FAILED', 'scanner_path': scanner_path, 'error': error_msg}
             raise
 
+    def _apply_applicability(self, rule, scan_config) -> int:
+        if self._applicability is None:
+            return 0
+        files = {'test': scan_config.test_files, 'src': scan_config.code_files}
+        scan_config.applicable_files, skipped_files = self._applicability.applicable_files(rule, files)
+        return skipped_files
+
     def _process_rule(self, rule, rule_result: dict, context: ValidationContext, logger, files: Dict, changed_files: Dict, all_files: Dict) -> str:
         scanner_path = rule.scanner_path
         if not scanner_path:
@@ -444,9 +554,19 @@ class Rules:
         return ValidationContext(story_graph=story_graph, files=files or {}, callbacks=callbacks or ValidationCallbacks(), skiprule=skiprule or [], exclude=exclude or [], skip_cross_file=True, all_files=False, behavior=self.behavior, bot_paths=getattr(self, 'bot_paths', None), working_dir=Path.cwd())
 
     def _execute_validation(self, context: ValidationContext) -> List[Dict[str, Any]]:
+        from scanners.story_map import StoryMap
+        from scanners.code.python.symbol_index import SymbolIndex
         logger = logging.getLogger(__name__)
         self._log_validation_start(context, logger)
-        processed_rules = self._process_all_rules(context, logger)
+        # Story scanners share one wrapper tree per run; drop it so edits between runs are picked up
+        StoryMap.release_shared()
+        if self._symbol_index is None:
+            self._symbol_index = SymbolIndex()
+        self._symbol_index.invalidate()
+        try:
+            processed_rules = self._process_all_rules(context, logger)
+        finally:
+            StoryMap.release_shared()
         return self._convert_violations_to_dicts(processed_rules)
     
     def _log_validation_start(self, context: ValidationContext, logger) -> None:
@@ -479,25 +599,48 @@ class Rules:
             for rule in rules_list:
                 if rule.scanner_class:
                     rule.reload_scanner_for_language(target_language)
-        for idx, rule in enumerate(rules_list, 1):
-            rule_name = Path(rule.rule_file).stem
-            if context.should_skip_rule(rule_name):
-                logger.info(f'Skipping rule {idx}/{len(rules_list)}: {rule.rule_file} (--skiprule)')
-                scanner_status_summary.append(f'  [SKIP] {rule.rule_file}: Skipped by --skiprule')
-                continue
-            logger.info(f'Processing rule {idx}/{len(rules_list)}: {rule.rule_file}')
-            rule_result = {'rule_file': rule.rule_file, 'rule_content': rule.rule_content, 'scanner_status': {}}
-            try:
-                status_line = self._process_rule(rule, rule_result, context, logger, files, changed_files, all_files)
-                scanner_status_summary.append(status_line)
-            except Exception:
-                scanner_status_summary.append(f'  [ERROR] {rule.rule_file}: Scanner execution failed')
-                raise
-            processed_rules.append(rule_result)
-            if context.callbacks.on_scanner_complete:
-                context.callbacks.on_scanner_complete(rule_result)
+        self._ast_dispatcher = self._build_ast_dispatcher(rules_list, context)
+        self._applicability = ApplicabilityMatrix(rules_list, context.story_graph)
+        try:
+            for idx, rule in enumerate(rules_list, 1):
+                if context.is_cancelled():
+                    logger.info(f'Validation cancelled - {len(rules_list) - idx + 1} rule(s) not run')
+                    scanner_status_summary.append(f'  [CANCELLED] {len(rules_list) - idx + 1} rule(s) not run')
+                    break
+                rule_name = Path(rule.rule_file).stem
+                if context.should_skip_rule(rule_name):
+                    logger.info(f'Skipping rule {idx}/{len(rules_list)}: {rule.rule_file} (--skiprule)')
+                    scanner_status_summary.append(f'  [SKIP] {rule.rule_file}: Skipped by --skiprule')
+                    continue
+                logger.info(f'Processing rule {idx}/{len(rules_list)}: {rule.rule_file}')
+                rule_result = {'rule_file': rule.rule_file, 'rule_content': rule.rule_content, 'scanner_status': {}}
+                try:
+                    status_line = self._process_rule(rule, rule_result, context, logger, files, changed_files, all_files)
+                    scanner_status_summary.append(status_line)
+                except Exception:
+                    scanner_status_summary.append(f'  [ERROR] {rule.rule_file}: Scanner execution failed')
+                    raise
+                finally:
+                    self._ast_dispatcher.release(rule)
+                processed_rules.append(rule_result)
+                if context.callbacks.on_scanner_complete:
+                    context.callbacks.on_scanner_complete(rule_result)
+            if self._applicability.skipped_pairs:
+                scanner_status_summary.append(f'  [PREFILTER] Skipped {self._applicability.skipped_pairs} rule/file pair(s) that no scanner could report on')
+        finally:
+            # Parsed ASTs and prefilter state must not outlive the run, even when a scanner raised
+            self._ast_dispatcher = None
+            self._applicability = None
         self._log_scanner_status_summary(scanner_status_summary, logger)
         return processed_rules
+
+    def _build_ast_dispatcher(self, rules_list: List[Rule], context: ValidationContext) -> CompositeVisitor:
+        from scanners.code.python.composite_visitor import CompositeVisitor, has_ast_hooks
+        # Scanners with on_<NodeType> hooks share one AST walk per file instead of each parsing it again
+        return CompositeVisitor(
+            rule.scanner for rule in rules_list
+            if rule.scanner_class and has_ast_hooks(rule.scanner_class) and not context.should_skip_rule(Path(rule.rule_file).stem)
+        )
     
     def _log_scanner_status_summary(self, scanner_status_summary: List[str], logger) -> None:
         if scanner_status_summary:
@@ -13,6 +13,8 @@ class ScanConfig:
     story_graph: Dict[str, Any]
     files: Optional[Dict[str, List[Path]]] = None
     changed_files: Optional[Dict[str, List[Path]]] = None
+    # Files the file-by-file pass visits after the applicability prefilter; None visits test_files and code_files
+    applicable_files: Optional[Dict[str, List[Path]]] = None
     
     # Scanner behavior configuration
     skip_cross_file: bool = False
@@ -20,7 +22,10 @@ class ScanConfig:
     
     # Callbacks and output
     on_file_scanned: Optional[Callable] = None
+    on_scan_phase: Optional[Callable] = None
     status_writer: Optional[Any] = None
+    symbol_index: Optional[Any] = None
+    ast_dispatcher: Optional[Any] = None
     
     # Derived properties (computed on demand)
     _test_files: Optional[List[Path]] = field(default=None, init=False, repr=False)
@@ -48,6 +53,14 @@ class ScanConfig:
             self._code_files = files_to_scan.get('src', [])
         return self._code_files
     
+    @property
+    def file_scan_test_files(self) -> List[Path]:
+        return self.test_files if self.applicable_files is None else self.applicable_files.get('test', [])
+    
+    @property
+    def file_scan_code_files(self) -> List[Path]:
+        return self.code_files if self.applicable_files is None else self.applicable_files.get('src', [])
+    
     @property
     def all_test_files(self) -> List[Path]:
         if self._all_test_files is None:
@@ -66,10 +79,12 @@ class ScanConfig:
             rule_obj=rule_obj,
             story_graph=self.story_graph,
             files=FileCollection(
-                test_files=self.test_files,
-                code_files=self.code_files
+                test_files=self.file_scan_test_files,
+                code_files=self.file_scan_code_files
             ),
-            on_file_scanned=self.on_file_scanned
+            on_file_scanned=self.on_file_scanned,
+            symbol_index=self.symbol_index,
+            ast_dispatcher=self.ast_dispatcher
         )
     
     def to_cross_file_context(self, rule_obj: Any) -> 'CrossFileScanContext':
@@ -86,5 +101,6 @@ class ScanConfig:
                 code_files=self.all_code_files
             ),
             status_writer=self.status_writer,
-            max_comparisons=self.max_cross_file_comparisons
+            max_comparisons=self.max_cross_file_comparisons,
+            symbol_index=self.symbol_index
         )
@@ -0,0 +1,102 @@
+"""Execution telemetry collected for each scanner run."""
+import heapq
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+
+SLOWEST_FILES_LIMIT = 5
+
+
+@dataclass
+class ScannerMetrics:
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    peak_memory_bytes: Optional[int] = None
+    files_scanned: int = 0
+    violations_found: int = 0
+    slowest_files: List[Dict[str, Any]] = field(default_factory=list)
+    budget_seconds: Optional[float] = None
+
+    @property
+    def over_budget(self) -> bool:
+        return self.budget_seconds is not None and self.wall_seconds > self.budget_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'wall_seconds': round(self.wall_seconds, 4),
+            'cpu_seconds': round(self.cpu_seconds, 4),
+            'peak_memory_bytes': self.peak_memory_bytes,
+            'files_scanned': self.files_scanned,
+            'violations_found': self.violations_found,
+            'slowest_files': self.slowest_files,
+            'budget_seconds': self.budget_seconds,
+            'over_budget': self.over_budget
+        }
+
+
+class ScannerMetricsRecorder:
+    """Times one scanner run; per-file durations are measured between on_file_scanned callbacks."""
+
+    def __init__(self, budget_seconds: Optional[float] = None, trace_memory: bool = False, slowest_files_limit: int = SLOWEST_FILES_LIMIT):
+        self._budget_seconds = budget_seconds
+        self._trace_memory = trace_memory
+        self._slowest_files_limit = slowest_files_limit
+        self._started_tracing = False
+        self._memory_baseline = 0
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self._last_file_mark = 0.0
+        self._files_scanned = 0
+        self._slowest: List[tuple] = []
+
+    def start(self) -> None:
+        if self._trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._memory_baseline = tracemalloc.get_traced_memory()[0]
+        self._cpu_start = time.process_time()
+        self._wall_start = time.perf_counter()
+        self._last_file_mark = self._wall_start
+
+    def wrap_file_callback(self, callback: Optional[Callable]) -> Callable:
+        def on_file_scanned(file_path: Path, violations: List[Any], rule_obj: Any = None) -> None:
+            self._record_file(file_path, time.perf_counter() - self._last_file_mark)
+            if callback:
+                callback(file_path, violations, rule_obj)
+            self._last_file_mark = time.perf_counter()
+        return on_file_scanned
+
+    def _record_file(self, file_path: Path, duration: float) -> None:
+        self._files_scanned += 1
+        entry = (duration, self._files_scanned, str(file_path))
+        if len(self._slowest) < self._slowest_files_limit:
+            heapq.heappush(self._slowest, entry)
+        elif self._slowest_files_limit > 0:
+            heapq.heappushpop(self._slowest, entry)
+
+    def finish(self, violations_found: int = 0) -> ScannerMetrics:
+        wall_seconds = time.perf_counter() - self._wall_start
+        cpu_seconds = time.process_time() - self._cpu_start
+        peak_memory_bytes = None
+        if tracemalloc.is_tracing():
+            peak_memory_bytes = max(tracemalloc.get_traced_memory()[1] - self._memory_baseline, 0)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        slowest_files = [
+            {'file': file_path, 'seconds': round(duration, 4)}
+            for duration, _, file_path in sorted(self._slowest, reverse=True)
+        ]
+        return ScannerMetrics(
+            wall_seconds=wall_seconds,
+            cpu_seconds=cpu_seconds,
+            peak_memory_bytes=peak_memory_bytes,
+            files_scanned=self._files_scanned,
+            violations_found=violations_found,
+            slowest_files=slowest_files,
+            budget_seconds=self._budget_seconds
+        )
@@ -0,0 +1,188 @@
+"""Runs a rule's scanner in a worker process so time budgets and cancellation can be enforced."""
+import logging
+import multiprocessing
+import queue
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable
+
+from rules.scan_config import ScanConfig
+
+logger = logging.getLogger(__name__)
+
+WORKER_POLL_SECONDS = 0.2
+
+
+@dataclass
+class ScanBudget:
+    scanner_seconds: Optional[float] = None
+    file_seconds: Optional[float] = None
+
+    @property
+    def is_limited(self) -> bool:
+        return self.scanner_seconds is not None or self.file_seconds is not None
+
+
+@dataclass
+class WorkerScanOutcome:
+    file_by_file_violations: List[Dict[str, Any]] = field(default_factory=list)
+    cross_file_violations: List[Dict[str, Any]] = field(default_factory=list)
+    timed_out_files: List[str] = field(default_factory=list)
+    stopped_reason: Optional[str] = None
+    error: Optional[str] = None
+    execution_status: Optional[str] = None
+
+    def describe_status(self, budget: ScanBudget) -> str:
+        if self.error:
+            return f'EXECUTION_FAILED: {self.error}'
+        if self.stopped_reason == 'cancelled':
+            return 'PARTIAL: validation cancelled'
+        if self.stopped_reason == 'scanner_budget':
+            return f'PARTIAL: scanner budget of {budget.scanner_seconds}s exceeded'
+        if self.stopped_reason == 'file_budget':
+            return f'PARTIAL: no progress within the {budget.file_seconds}s file budget'
+        if self.timed_out_files:
+            return f'PARTIAL: {len(self.timed_out_files)} file(s) exceeded the {budget.file_seconds}s file budget'
+        return self.execution_status or 'EXECUTION_SUCCESS'
+
+
+def _to_dicts(data: Any) -> Any:
+    if hasattr(data, 'to_dict'):
+        return data.to_dict()
+    if isinstance(data, dict):
+        return {k: _to_dicts(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_to_dicts(item) for item in data]
+    return data
+
+
+def _scan_in_worker(rule_args: Dict[str, Any], scan_kwargs: Dict[str, Any], results) -> None:
+    from rules.rule import Rule
+    try:
+        target_language = rule_args.pop('target_language', None)
+        rule = Rule(**rule_args)
+        if target_language:
+            rule.reload_scanner_for_language(target_language)
+        # Spawn and import time is not billed to the first file; the parent starts its file clock here
+        results.put(('ready', None, None))
+        config = ScanConfig(
+            **scan_kwargs,
+            on_file_scanned=lambda file_path, violations, rule_obj=None: results.put(('file', str(file_path), _to_dicts(violations))),
+            on_scan_phase=lambda phase: results.put(('phase', phase, None))
+        )
+        rule.scan(config)
+        scan_result = {'file_by_file': _to_dicts(rule.file_by_file_violations), 'cross_file': _to_dicts(rule.cross_file_violations)}
+        results.put(('done', scan_result, rule.scanner_execution_status))
+    except Exception as e:
+        results.put(('error', f'{type(e).__name__}: {e}', None))
+
+
+class ScannerWorker:
+    """Scans one rule in a child process, restarting past any file that exceeds the per-file budget."""
+
+    def __init__(self, rule, budget: ScanBudget, is_cancelled: Optional[Callable[[], bool]] = None):
+        self.rule = rule
+        self.budget = budget
+        self._is_cancelled = is_cancelled or (lambda: False)
+        self._mp_context = multiprocessing.get_context('spawn')
+
+    def scan(self, config: ScanConfig) -> WorkerScanOutcome:
+        outcome = WorkerScanOutcome()
+        deadline = time.monotonic() + self.budget.scanner_seconds if self.budget.scanner_seconds is not None else None
+        test_files = list(config.test_files)
+        code_files = list(config.code_files)
+        applicable_files = {'test': list(config.file_scan_test_files), 'src': list(config.file_scan_code_files)}
+        reported: set = set()
+        while True:
+            stuck_file = self._run_segment(config, test_files, code_files, applicable_files, deadline, reported, outcome)
+            if stuck_file is None:
+                return outcome
+            logger.warning(f'Scanner for rule {self.rule.rule_file} exceeded the {self.budget.file_seconds}s file budget on {stuck_file}')
+            outcome.timed_out_files.append(str(stuck_file))
+            skipped = reported | set(outcome.timed_out_files)
+            test_files = [f for f in test_files if str(f) not in skipped]
+            code_files = [f for f in code_files if str(f) not in skipped]
+            applicable_files = {key: [f for f in files if str(f) not in skipped] for key, files in applicable_files.items()}
+
+    def _run_segment(self, config: ScanConfig, test_files: List[Path], code_files: List[Path], applicable_files: Dict[str, List[Path]], deadline: Optional[float], reported: set, outcome: WorkerScanOutcome) -> Optional[Path]:
+        results = self._mp_context.Queue()
+        scan_kwargs = {
+            'story_graph': config.story_graph,
+            'files': {'test': list(config.all_test_files), 'src': list(config.all_code_files)},
+            'changed_files': {'test': test_files, 'src': code_files},
+            'applicable_files': applicable_files,
+            'skip_cross_file': config.skip_cross_file,
+            'max_cross_file_comparisons': config.max_cross_file_comparisons
+        }
+        process = self._mp_context.Process(target=_scan_in_worker, args=(self.rule.to_worker_args(), scan_kwargs, results), daemon=True, name=f'ScannerWorker-{self.rule.name}')
+        process.start()
+        segment_violations: List[Dict[str, Any]] = []
+        phase = 'starting'
+        last_progress = time.monotonic()
+        try:
+            while True:
+                stop_reason = self._check_limits(deadline, phase, last_progress)
+                if stop_reason == 'file_budget':
+                    stuck_file = self._first_unreported(applicable_files['test'] + applicable_files['src'], reported)
+                    if stuck_file is not None:
+                        outcome.file_by_file_violations.extend(segment_violations)
+                        return stuck_file
+                if stop_reason:
+                    outcome.stopped_reason = stop_reason
+                    outcome.file_by_file_violations.extend(segment_violations)
+                    return None
+                try:
+                    kind, payload, extra = results.get(timeout=WORKER_POLL_SECONDS)
+                except queue.Empty:
+                    if not process.is_alive() and results.empty():
+                        outcome.error = f'Scanner worker exited unexpectedly (exit code {process.exitcode})'
+                        outcome.file_by_file_violations.extend(segment_violations)
+                        return None
+                    continue
+                last_progress = time.monotonic()
+                if kind == 'ready':
+                    phase = 'file_by_file'
+                elif kind == 'file':
+                    reported.add(payload)
+                    segment_violations.extend(extra)
+                    if config.on_file_scanned:
+                        config.on_file_scanned(Path(payload), extra, self.rule)
+                elif kind == 'phase':
+                    phase = payload
+                elif kind == 'done':
+                    outcome.file_by_file_violations.extend(payload['file_by_file'])
+                    outcome.cross_file_violations.extend(payload['cross_file'])
+                    outcome.execution_status = extra
+                    return None
+                elif kind == 'error':
+                    outcome.error = payload
+                    outcome.file_by_file_violations.extend(segment_violations)
+                    return None
+        finally:
+            self._stop_process(process)
+            results.close()
+
+    def _check_limits(self, deadline: Optional[float], phase: str, last_progress: float) -> Optional[str]:
+        if self._is_cancelled():
+            return 'cancelled'
+        now = time.monotonic()
+        if deadline is not None and now > deadline:
+            return 'scanner_budget'
+        if self.budget.file_seconds is not None and phase == 'file_by_file' and now - last_progress > self.budget.file_seconds:
+            return 'file_budget'
+        return None
+
+    def _first_unreported(self, files: List[Path], reported: set) -> Optional[Path]:
+        for file_path in files:
+            if str(file_path) not in reported:
+                return file_path
+        return None
+
+    def _stop_process(self, process) -> None:
+        if process.is_alive():
+            process.terminate()
+        process.join(timeout=5)
+        if process.is_alive():
+            process.kill()
+            process.join()
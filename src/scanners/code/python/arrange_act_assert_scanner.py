@@ -13,6 +13,9 @@ from .resources.ast_elements import Functions
 logger = logging.getLogger(__name__)
 
 class ArrangeActAssertScanner(TestScanner):
+
+    target_languages = ('python',)
+    required_keywords = (b'test_',)
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
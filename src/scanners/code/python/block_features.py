@@ -0,0 +1,54 @@
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Tuple
+
+
+def _multiset_ratio_bound(counts1: Counter, length1: int, counts2: Counter, length2: int) -> float:
+    """Upper bound of SequenceMatcher.ratio(): matched characters can never exceed the shared character counts."""
+    total = length1 + length2
+    if total == 0:
+        return 1.0
+    return 2.0 * sum((counts1 & counts2).values()) / total
+
+
+@dataclass
+class BlockFeatures:
+    """Per-block features computed once so block pairs that cannot reach a similarity threshold are skipped cheaply."""
+    statement_types: Tuple[str, ...]
+    statement_type_set: FrozenSet[str]
+    normalized_length: int
+    normalized_counts: Counter
+    preview_text: str
+    preview_counts: Counter
+
+    @classmethod
+    def from_block(cls, block: Dict[str, Any]) -> 'BlockFeatures':
+        statement_types = tuple(type(node).__name__ for node in block.get('ast_nodes') or [])
+        normalized = block['normalized']
+        preview_text = ' '.join(block['preview'].split())
+        return cls(
+            statement_types=statement_types,
+            statement_type_set=frozenset(statement_types),
+            normalized_length=len(normalized),
+            normalized_counts=Counter(normalized),
+            preview_text=preview_text,
+            preview_counts=Counter(preview_text)
+        )
+
+    def ast_similarity_bound(self, other: 'BlockFeatures') -> float:
+        """Upper bound of DuplicationScanner._compare_ast_blocks: statements of different node types score 0."""
+        mine, theirs = self.statement_types, other.statement_types
+        if not mine and not theirs:
+            return 1.0
+        if not mine or not theirs:
+            return 0.0
+        if len(mine) == len(theirs):
+            return sum(1 for type1, type2 in zip(mine, theirs) if type1 == type2) / len(mine)
+        matched = sum(1 for statement_type in mine if statement_type in other.statement_type_set)
+        return matched / len(mine) * min(len(mine), len(theirs)) / max(len(mine), len(theirs))
+
+    def normalized_similarity_bound(self, other: 'BlockFeatures') -> float:
+        return _multiset_ratio_bound(self.normalized_counts, self.normalized_length, other.normalized_counts, other.normalized_length)
+
+    def content_similarity_bound(self, other: 'BlockFeatures') -> float:
+        return _multiset_ratio_bound(self.preview_counts, len(self.preview_text), other.preview_counts, len(other.preview_text))
@@ -14,6 +14,9 @@ logger = logging.getLogger(__name__)
 
 
 class ClearParametersScanner(CodeScanner):
+
+    target_languages = ('python',)
+    file_roles = ('production',)
     
     ACCEPTABLE_PARAMETER_NAMES = {
         'data',
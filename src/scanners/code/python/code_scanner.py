@@ -15,14 +15,24 @@ class CodeScanner(Scanner):
     def __init__(self, rule: 'Rule'):
         super().__init__(rule)
         self.story_graph = None
+        self.symbol_index = None
     
     def scan_with_context(self, context: 'ScanFilesContext') -> List[Dict[str, Any]]:
         self.story_graph = context.story_graph
+        self.symbol_index = context.symbol_index
         return super().scan_with_context(context)
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         self.story_graph = context.story_graph
-        return self._empty_violation_list()
+        from scanners.code.python.composite_visitor import CompositeVisitor, has_ast_hooks, parse_file
+        if not has_ast_hooks(type(self)):
+            return self._empty_violation_list()
+        if context.ast_dispatcher is not None and context.ast_dispatcher.handles(self):
+            return context.ast_dispatcher.violations_for(self, context.file_path)
+        visit = parse_file(context.file_path)
+        if visit is None:
+            return self._empty_violation_list()
+        return CompositeVisitor([self]).walk(visit).violations_for(self)
     
     def _extract_domain_terms(self, story_graph: Dict[str, Any]) -> set:
         domain_terms = self._get_common_domain_terms()
@@ -0,0 +1,175 @@
+"""Single-walk AST dispatch for Python code scanners.
+
+A scanner takes part by defining hooks named after AST node types, e.g. ``on_ClassDef(self, node, visit)``.
+Each hook returns the violations it found for that node. Scanners without hooks keep using their own
+``scan_file_with_context``.
+"""
+import ast
+import logging
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+HOOK_PREFIX = 'on_'
+
+
+@dataclass
+class FileVisit:
+    file_path: Path
+    content: str
+    lines: List[str]
+    tree: ast.AST
+
+
+@lru_cache(maxsize=None)
+def _hook_names(scanner_class: type) -> Tuple[Tuple[type, str], ...]:
+    """(node type, hook name) pairs of a scanner class, looked up once per class."""
+    hook_names = []
+    for attr_name in dir(scanner_class):
+        if not attr_name.startswith(HOOK_PREFIX):
+            continue
+        node_type = getattr(ast, attr_name[len(HOOK_PREFIX):], None)
+        if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+            hook_names.append((node_type, attr_name))
+    return tuple(hook_names)
+
+
+def has_ast_hooks(scanner_class: type) -> bool:
+    return bool(_hook_names(scanner_class))
+
+
+def hooked_node_names(scanner_class: type) -> List[str]:
+    return [node_type.__name__ for node_type, _ in _hook_names(scanner_class)]
+
+
+def ast_hooks(scanner: Any) -> Dict[type, Callable]:
+    return {node_type: getattr(scanner, attr_name) for node_type, attr_name in _hook_names(type(scanner))}
+
+
+def parse_file(file_path: Path) -> Optional[FileVisit]:
+    if not file_path.exists():
+        return None
+    try:
+        content = file_path.read_text(encoding='utf-8')
+        tree = ast.parse(content, filename=str(file_path))
+    except (SyntaxError, UnicodeDecodeError) as e:
+        logger.debug(f'Skipping file {file_path} due to {type(e).__name__}: {e}')
+        return None
+    return FileVisit(file_path=file_path, content=content, lines=content.split('\n'), tree=tree)
+
+
+@dataclass
+class WalkResult:
+    violations: Dict[Any, List[Dict[str, Any]]] = field(default_factory=dict)
+    errors: Dict[Any, Exception] = field(default_factory=dict)
+
+    def violations_for(self, scanner: Any) -> List[Dict[str, Any]]:
+        """The scanner's violations, re-raising the exception its hooks raised during the walk."""
+        error = self.errors.get(scanner)
+        if error is not None:
+            raise error
+        return self.violations.get(scanner, [])
+
+
+@dataclass
+class _FileResults:
+    violations: Dict[int, List[Dict[str, Any]]] = field(default_factory=dict)
+    errors: Dict[int, Exception] = field(default_factory=dict)
+    collected: Set[int] = field(default_factory=set)
+
+
+class CompositeVisitor:
+    """Walks each file once for every registered scanner and hands each rule's violations back on request.
+
+    A file's results are kept until every rule still pending has collected them; release() a rule once its scan is done.
+    """
+
+    def __init__(self, scanners: Iterable[Any]):
+        self._scanners: Dict[int, Any] = {}
+        for scanner in scanners:
+            if has_ast_hooks(type(scanner)):
+                self._scanners[id(scanner.rule)] = scanner
+        self._hooks = self._build_hooks(self._scanners.values())
+        self._results: Dict[Path, _FileResults] = {}
+        self._visited = set()
+
+    @staticmethod
+    def _build_hooks(scanners: Iterable[Any]) -> Dict[type, List[Tuple[Any, Callable]]]:
+        hooks: Dict[type, List[Tuple[Any, Callable]]] = {}
+        for scanner in scanners:
+            for node_type, hook in ast_hooks(scanner).items():
+                hooks.setdefault(node_type, []).append((scanner, hook))
+        return hooks
+
+    @property
+    def scanner_count(self) -> int:
+        return len(self._scanners)
+
+    def handles(self, scanner: Any) -> bool:
+        return id(scanner.rule) in self._scanners
+
+    def violations_for(self, scanner: Any, file_path: Path) -> List[Dict[str, Any]]:
+        rule_key = id(scanner.rule)
+        if file_path not in self._visited:
+            self._visited.add(file_path)
+            self._visit_file(file_path)
+        file_results = self._results.get(file_path)
+        if file_results is None or rule_key in file_results.collected:
+            # Already handed out and released, or the file could not be parsed; walk it again for this scanner alone
+            visit = parse_file(file_path)
+            return CompositeVisitor([scanner]).walk(visit).violations_for(scanner) if visit else []
+        file_results.collected.add(rule_key)
+        error = file_results.errors.get(rule_key)
+        violations = file_results.violations.get(rule_key, [])
+        self._evict_if_collected(file_path)
+        if error is not None:
+            raise error
+        return violations
+
+    def release(self, rule: Any) -> None:
+        """Drop a finished rule's uncollected results and stop walking its hooks."""
+        rule_key = id(rule)
+        if self._scanners.pop(rule_key, None) is None:
+            return
+        self._hooks = self._build_hooks(self._scanners.values())
+        for file_path in list(self._results):
+            file_results = self._results[file_path]
+            file_results.violations.pop(rule_key, None)
+            file_results.errors.pop(rule_key, None)
+            file_results.collected.discard(rule_key)
+            self._evict_if_collected(file_path)
+
+    def _evict_if_collected(self, file_path: Path) -> None:
+        if self._results[file_path].collected >= self._scanners.keys():
+            del self._results[file_path]
+
+    def _visit_file(self, file_path: Path) -> None:
+        visit = parse_file(file_path)
+        if visit is None:
+            return
+        walk_result = self.walk(visit)
+        self._results[file_path] = _FileResults(
+            violations={id(scanner.rule): violations for scanner, violations in walk_result.violations.items()},
+            errors={id(scanner.rule): error for scanner, error in walk_result.errors.items()}
+        )
+
+    def walk(self, visit: FileVisit) -> WalkResult:
+        result = WalkResult()
+        for node in ast.walk(visit.tree):
+            for scanner, hook in self._hooks.get(type(node), ()):
+                if scanner in result.errors:
+                    continue
+                try:
+                    node_violations = hook(node, visit)
+                except Exception as e:
+                    # Only the scanner whose hook raised fails; the others finish the walk
+                    logger.debug(f'{type(scanner).__name__} failed on {visit.file_path}: {type(e).__name__}: {e}')
+                    result.errors[scanner] = e
+                    result.violations.pop(scanner, None)
+                    continue
+                if node_violations:
+                    result.violations.setdefault(scanner, []).extend(node_violations)
+        return result
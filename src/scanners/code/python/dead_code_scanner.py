@@ -1,11 +1,15 @@
 
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 import ast
 import logging
 from scanners.code.python.code_scanner import CodeScanner
+from scanners.code.python.symbol_index import SymbolIndex
 from scanners.violation import Violation
 
+if TYPE_CHECKING:
+    from scanners.resources.scan_context import CrossFileScanContext
+
 logger = logging.getLogger(__name__)
 
 class DeadCodeScanner(CodeScanner):
@@ -28,27 +32,17 @@ class DeadCodeScanner(CodeScanner):
         if not all_files:
             return violations
         
-        definitions = {}
-        usages = set()
+        all_files = [file_path for file_path in all_files if file_path.exists() and file_path.is_file()]
+        symbol_index = self.symbol_index or SymbolIndex()
+        symbol_index.ensure(all_files)
         
-        for file_path in all_files:
-            if not file_path.exists() or not file_path.is_file():
-                continue
-            
-            try:
-                file_defs, file_usages = self._analyze_file(file_path)
-                
-                for name, (line_num, node_type) in file_defs.items():
-                    qualified_name = f"{file_path.stem}.{name}"
-                    definitions[qualified_name] = (file_path, line_num, node_type, name)
-                    if name not in definitions:
-                        definitions[name] = (file_path, line_num, node_type, name)
-                
-                usages.update(file_usages)
-                
-            except Exception as e:
-                logger.debug(f"Error analyzing {file_path}: {e}")
-                continue
+        definitions = {}
+        for file_path, name, line_num, node_type in symbol_index.definitions(all_files):
+            qualified_name = f"{file_path.stem}.{name}"
+            definitions[qualified_name] = (file_path, line_num, node_type, name)
+            if name not in definitions:
+                definitions[name] = (file_path, line_num, node_type, name)
+        usages = symbol_index.references(all_files)
         
         for qualified_name, (file_path, line_num, node_type, simple_name) in definitions.items():
             if '.' in qualified_name and simple_name in usages:
@@ -109,45 +103,7 @@ class DeadCodeScanner(CodeScanner):
         
         return violations
     
-    def _analyze_file(self, file_path: Path) -> Tuple[Dict[str, Tuple[int, str]], Set[str]]:
-        definitions = {}
-        usages = set()
-        
-        try:
-            content = file_path.read_text(encoding='utf-8')
-            tree = ast.parse(content, filename=str(file_path))
-        except (SyntaxError, UnicodeDecodeError) as e:
-            logger.debug(f"Skipping {file_path}: {e}")
-            return definitions, usages
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                definitions[node.name] = (node.lineno, 'function')
-            elif isinstance(node, ast.AsyncFunctionDef):
-                definitions[node.name] = (node.lineno, 'async function')
-            elif isinstance(node, ast.ClassDef):
-                definitions[node.name] = (node.lineno, 'class')
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Name):
-                usages.add(node.id)
-            elif isinstance(node, ast.Attribute):
-                usages.add(node.attr)
-            elif isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    usages.add(node.func.id)
-                elif isinstance(node.func, ast.Attribute):
-                    usages.add(node.func.attr)
-            elif isinstance(node, ast.Import):
-                for alias in node.names:
-                    usages.add(alias.asname if alias.asname else alias.name)
-            elif isinstance(node, ast.ImportFrom):
-                for alias in node.names:
-                    usages.add(alias.asname if alias.asname else alias.name)
-        
-        return definitions, usages
-    
-    def _analyze_private_members(self, tree: ast.AST) -> Tuple[Dict[str, Tuple[int, str]], Set[str]]:
+    def _analyze_private_members(self, tree: ast.AST) -> tuple[Dict[str, tuple[int, str]], set[str]]:
         private_defs = {}
         private_usages = set()
         
@@ -205,6 +161,14 @@ class DeadCodeScanner(CodeScanner):
         
         return False
     
+    def scan_cross_file_with_context(self, context: 'CrossFileScanContext') -> List[Dict[str, Any]]:
+        self.symbol_index = context.symbol_index
+        return self.scan(
+            story_graph=context.story_graph,
+            test_files=context.all_test_files or context.test_files,
+            code_files=context.all_code_files or context.code_files
+        )
+    
     def scan_cross_file(
         self = None,
         test_files: Optional[List[Path]] = None,
@@ -5,7 +5,7 @@ import ast
 from scanners.code.python.code_scanner import CodeScanner
 
 if TYPE_CHECKING:
-    from scanners.resources.scan_context import FileScanContext
+    from scanners.code.python.composite_visitor import FileVisit
 from scanners.violation import Violation
 
 class DelegationScanner(CodeScanner):
@@ -16,23 +16,8 @@ class DelegationScanner(CodeScanner):
     - Methods with 'find by' patterns that aren't in collection classes
     """
     
-    def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
-        file_path = context.file_path
-        
-        violations = []
-        
-        parsed = self._read_and_parse_file(file_path)
-        if not parsed:
-            return violations
-        
-        content, lines, tree = parsed
-        
-        # Check all classes for delegation issues
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                violations.extend(self._check_class_delegation(node, file_path))
-        
-        return violations
+    def on_ClassDef(self, node: ast.ClassDef, visit: 'FileVisit') -> List[Dict[str, Any]]:
+        return self._check_class_delegation(node, visit.file_path)
     
     def _check_class_delegation(self, class_node: ast.ClassDef, file_path: Path) -> List[Dict[str, Any]]:
         violations = []
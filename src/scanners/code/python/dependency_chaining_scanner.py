@@ -5,7 +5,7 @@ import ast
 from scanners.code.python.code_scanner import CodeScanner
 
 if TYPE_CHECKING:
-    from scanners.resources.scan_context import FileScanContext
+    from scanners.code.python.composite_visitor import FileVisit
 from scanners.violation import Violation
 
 class DependencyChainingScanner(CodeScanner):
@@ -16,23 +16,8 @@ class DependencyChainingScanner(CodeScanner):
     - Direct access to sub-collaborators instead of accessing through owning objects
     """
     
-    def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
-        file_path = context.file_path
-        
-        violations = []
-        
-        parsed = self._read_and_parse_file(file_path)
-        if not parsed:
-            return violations
-        
-        content, lines, tree = parsed
-        
-        # Find all classes and check their constructor and method patterns
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                violations.extend(self._check_class_dependency_chaining(node, file_path))
-        
-        return violations
+    def on_ClassDef(self, node: ast.ClassDef, visit: 'FileVisit') -> List[Dict[str, Any]]:
+        return self._check_class_dependency_chaining(node, visit.file_path)
     
     def _check_class_dependency_chaining(self, class_node: ast.ClassDef, file_path: Path) -> List[Dict[str, Any]]:
         violations = []
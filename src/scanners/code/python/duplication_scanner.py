@@ -9,6 +9,7 @@ from scanners.code.python.code_scanner import CodeScanner
 if TYPE_CHECKING:
     from scanners.resources.scan_context import FileScanContext
 from scanners.violation import Violation
+from scanners.code.python.block_features import BlockFeatures
 import hashlib
 from difflib import SequenceMatcher
 import json
@@ -19,6 +20,7 @@ logger = logging.getLogger(__name__)
 FILE_SCAN_TIMEOUT = 60  # seconds
 MAX_FILE_SIZE = 500_000  # bytes (500KB)
 PREVIEW_LENGTH = 200  # characters
+MIN_REPORTABLE_AST_SIMILARITY = 0.60  # lowest AST similarity _determine_max_similarity can accept
 
 def _safe_print(*args, **kwargs):
     try:
@@ -91,7 +93,7 @@ class DuplicationScanner(CodeScanner):
         try:
             serializable_blocks = []
             for block in blocks:
-                serializable_block = {k: v for k, v in block.items() if k not in ('ast_nodes', 'file_path', 'lines')}
+                serializable_block = {k: v for k, v in block.items() if k not in ('ast_nodes', 'file_path', 'lines', 'features')}
                 serializable_blocks.append(serializable_block)
             
             cache_data = {
@@ -393,6 +395,10 @@ class DuplicationScanner(CodeScanner):
                     not (block1['end_line'] < block2['start_line'] or block2['end_line'] < block1['start_line'])):
                     continue
                 
+                if not self._could_be_duplicate(block1, block2, SIMILARITY_THRESHOLD):
+                    continue
+                comparison_count += 1
+                
                 ast_similarity, normalized_similarity, content_similarity = self._calculate_block_similarities(block1, block2)
                 
                 max_similarity = self._determine_max_similarity(ast_similarity, content_similarity, normalized_similarity, SIMILARITY_THRESHOLD)
@@ -574,8 +580,8 @@ class DuplicationScanner(CodeScanner):
             normalized_similarity = 0.0
         
         try:
-            preview1_normalized = ' '.join(block1['preview'].split())
-            preview2_normalized = ' '.join(block2['preview'].split())
+            preview1_normalized = self._block_features(block1).preview_text
+            preview2_normalized = self._block_features(block2).preview_text
             content_similarity = SequenceMatcher(None, preview1_normalized, preview2_normalized).ratio()
         except Exception as e:
             _safe_print(f"Error comparing content blocks: {e}")
@@ -583,6 +589,29 @@ class DuplicationScanner(CodeScanner):
         
         return ast_similarity, normalized_similarity, content_similarity
     
+    def _block_features(self, block: Dict) -> BlockFeatures:
+        features = block.get('features')
+        if features is None:
+            features = block['features'] = BlockFeatures.from_block(block)
+        return features
+    
+    def _could_be_duplicate(self, block1: Dict, block2: Dict, threshold: float) -> bool:
+        """Use feature upper bounds to rule out pairs before the exact AST and sequence comparisons."""
+        features1 = self._block_features(block1)
+        features2 = self._block_features(block2)
+        ast_bound = features1.ast_similarity_bound(features2)
+        if ast_bound < MIN_REPORTABLE_AST_SIMILARITY:
+            return False
+        return ast_bound >= threshold or features1.content_similarity_bound(features2) >= threshold
+    
+    def _could_be_cross_file_duplicate(self, block1: Dict, block2: Dict, threshold: float, content_threshold: float) -> bool:
+        features1 = self._block_features(block1)
+        features2 = self._block_features(block2)
+        if 'ast_nodes' in block1 and 'ast_nodes' in block2 and features1.ast_similarity_bound(features2) >= threshold:
+            return True
+        return (features1.normalized_similarity_bound(features2) >= threshold and
+                features1.content_similarity_bound(features2) >= content_threshold)
+    
     def _determine_max_similarity(self, ast_sim: float, content_sim: float, normalized_sim: float, threshold: float) -> float:
         """Determine the maximum similarity score based on multiple metrics."""
         if ast_sim >= 0.85 and content_sim >= 0.50:
@@ -2146,7 +2175,9 @@ class DuplicationScanner(CodeScanner):
         write_status(f"Extracted {len(changed_blocks)} changed blocks, {len(all_blocks)} reference blocks")
         
         SIMILARITY_THRESHOLD = 0.90
+        CONTENT_SIMILARITY_THRESHOLD = 0.85
         compared_pairs = set()
+        pruned_count = 0
         total_comparisons = len(changed_blocks) * len(all_blocks)
         comparison_count = 0
         last_progress = 0
@@ -2194,6 +2225,10 @@ class DuplicationScanner(CodeScanner):
                     last_report_time = now
                     last_comparison_report = comparison_count
                 
+                if not self._could_be_cross_file_duplicate(block1, block2, SIMILARITY_THRESHOLD, CONTENT_SIMILARITY_THRESHOLD):
+                    pruned_count += 1
+                    continue
+                
                 if 'ast_nodes' in block1 and 'ast_nodes' in block2:
                     ast_similarity = self._compare_ast_blocks(block1['ast_nodes'], block2['ast_nodes'])
                 else:
@@ -2201,11 +2236,11 @@ class DuplicationScanner(CodeScanner):
                 
                 normalized_similarity = SequenceMatcher(None, block1['normalized'], block2['normalized']).ratio()
                 
-                preview1_normalized = ' '.join(block1['preview'].split())
-                preview2_normalized = ' '.join(block2['preview'].split())
+                preview1_normalized = self._block_features(block1).preview_text
+                preview2_normalized = self._block_features(block2).preview_text
                 content_similarity = SequenceMatcher(None, preview1_normalized, preview2_normalized).ratio()
                 
-                if ast_similarity >= SIMILARITY_THRESHOLD or (normalized_similarity >= SIMILARITY_THRESHOLD and content_similarity >= 0.85):
+                if ast_similarity >= SIMILARITY_THRESHOLD or (normalized_similarity >= SIMILARITY_THRESHOLD and content_similarity >= CONTENT_SIMILARITY_THRESHOLD):
                     file1 = block1['file_path']
                     file2 = block2['file_path']
                     func1 = block1['func_name']
@@ -2245,7 +2280,7 @@ class DuplicationScanner(CodeScanner):
                         write_status(f"Found {len(violations)} violations so far...")
                         sys.stdout.flush()
         
-        complete_msg = f"Complete: {comparison_count} comparisons, {len(violations)} violations"
+        complete_msg = f"Complete: {comparison_count} comparisons ({pruned_count} ruled out by block features), {len(violations)} violations"
         _safe_print(f"\n[CROSS-FILE] {complete_msg}")
         write_status(complete_msg)
         write_status("")
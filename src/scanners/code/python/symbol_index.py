@@ -0,0 +1,116 @@
+"""Project-wide index of Python definitions and references shared by cross-file scanners."""
+import ast
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFINITION_KINDS = {ast.FunctionDef: 'function', ast.AsyncFunctionDef: 'async function', ast.ClassDef: 'class'}
+
+
+@dataclass
+class FileSymbols:
+    content_hash: str
+    definitions: Dict[str, Tuple[int, str]] = field(default_factory=dict)
+    spans: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    references: Set[str] = field(default_factory=set)
+    imports: Set[str] = field(default_factory=set)
+    class_members: Dict[str, List[str]] = field(default_factory=dict)
+
+    @classmethod
+    def from_source(cls, content: str, content_hash: str, file_path: Path) -> 'FileSymbols':
+        symbols = cls(content_hash=content_hash)
+        try:
+            tree = ast.parse(content, filename=str(file_path))
+        except (SyntaxError, ValueError) as e:
+            logger.debug(f"Skipping {file_path}: {e}")
+            return symbols
+        for node in ast.walk(tree):
+            kind = DEFINITION_KINDS.get(type(node))
+            if kind:
+                symbols.definitions[node.name] = (node.lineno, kind)
+                symbols.spans[node.name] = (node.lineno, node.end_lineno or node.lineno)
+                if isinstance(node, ast.ClassDef):
+                    symbols.class_members[node.name] = [child.name for child in node.body if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef))]
+            elif isinstance(node, ast.Name):
+                symbols.references.add(node.id)
+            elif isinstance(node, ast.Attribute):
+                symbols.references.add(node.attr)
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                for alias in node.names:
+                    imported_name = alias.asname if alias.asname else alias.name
+                    symbols.references.add(imported_name)
+                    symbols.imports.add(imported_name)
+        return symbols
+
+
+class SymbolIndex:
+    """Definitions, references, imports and class membership per file.
+
+    Files are hashed at most once between invalidate() calls and re-parsed only when their content hash changes.
+    """
+
+    def __init__(self):
+        self._files: Dict[Path, FileSymbols] = {}
+        self._checked: Set[Path] = set()
+
+    def invalidate(self) -> None:
+        self._checked.clear()
+
+    def ensure(self, file_paths: Iterable[Path]) -> int:
+        reparsed = 0
+        for file_path in file_paths:
+            if file_path in self._checked:
+                continue
+            self._checked.add(file_path)
+            if self._update_file(file_path):
+                reparsed += 1
+        return reparsed
+
+    def _update_file(self, file_path: Path) -> bool:
+        try:
+            raw = file_path.read_bytes()
+        except OSError:
+            return self._files.pop(file_path, None) is not None
+        content_hash = hashlib.md5(raw).hexdigest()
+        existing = self._files.get(file_path)
+        if existing is not None and existing.content_hash == content_hash:
+            return False
+        try:
+            content = raw.decode('utf-8')
+        except UnicodeDecodeError as e:
+            logger.debug(f"Skipping {file_path}: {e}")
+            content = ''
+        self._files[file_path] = FileSymbols.from_source(content, content_hash, file_path)
+        return True
+
+    def symbols_for(self, file_path: Path) -> Optional[FileSymbols]:
+        return self._files.get(file_path)
+
+    def definitions(self, file_paths: Optional[Iterable[Path]] = None) -> Iterator[Tuple[Path, str, int, str]]:
+        for file_path in file_paths if file_paths is not None else list(self._files):
+            symbols = self._files.get(file_path)
+            if symbols is None:
+                continue
+            for name, (line_num, kind) in symbols.definitions.items():
+                yield file_path, name, line_num, kind
+
+    def references(self, file_paths: Optional[Iterable[Path]] = None) -> Set[str]:
+        references: Set[str] = set()
+        for file_path in file_paths if file_paths is not None else list(self._files):
+            symbols = self._files.get(file_path)
+            if symbols is not None:
+                references.update(symbols.references)
+        return references
+
+    def class_of(self, file_path: Path, method_name: str) -> Optional[str]:
+        symbols = self._files.get(file_path)
+        if symbols is None:
+            return None
+        for class_name, members in symbols.class_members.items():
+            if method_name in members:
+                return class_name
+        return None
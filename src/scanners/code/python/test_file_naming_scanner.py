@@ -40,7 +40,7 @@ class TestFileNamingScanner(TestScanner):
         return violations
     
     def _extract_sub_epic_names(self, story_graph: Dict[str, Any]) -> List[str]:
-        story_map = StoryMap(story_graph)
+        story_map = StoryMap.shared(story_graph)
         sub_epic_names = []
         for epic in story_map.epics:
             for node in story_map.walk(epic):
@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 
 
 class TestQualityScanner(TestScanner):
+
+    target_languages = ('python',)
+    file_roles = ('test',)
     
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
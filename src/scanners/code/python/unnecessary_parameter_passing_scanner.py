@@ -15,6 +15,10 @@ logger = logging.getLogger(__name__)
 
 class UnnecessaryParameterPassingScanner(CodeScanner):
 
+    target_languages = ('python',)
+    file_roles = ('production',)
+    required_ast_nodes = ('ClassDef',)
+
     def scan_file_with_context(self, context: 'FileScanContext') -> List[Dict[str, Any]]:
         file_path = context.file_path
         story_graph = context.story_graph
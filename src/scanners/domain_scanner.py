@@ -19,7 +19,7 @@ class DomainScanner(Scanner):
         
         violations = []
         story_graph_data = story_graph.get('story_graph', story_graph)
-        story_map = StoryMap(story_graph_data)
+        story_map = StoryMap.shared(story_graph_data)
         
         for epic in story_map.epics():
             epic_violations = self._scan_domain_concepts(
@@ -16,7 +16,7 @@ class ParameterizedTestsScanner(Scanner):
             raise ValueError("self.rule parameter is required for ParameterizedTestsScanner")
         
         violations = []
-        story_map = StoryMap(story_graph)
+        story_map = StoryMap.shared(story_graph)
         
         for epic in story_map.epics():
             for node in story_map.walk(epic):
@@ -32,6 +32,7 @@ class FileCollection:
 @dataclass
 class FileScanContext(ScanContext):
     file_path: Optional[Path] = None
+    ast_dispatcher: Optional[Any] = None
     
     @property
     def exists(self) -> bool:
@@ -58,6 +59,8 @@ class FileScanContext(ScanContext):
 class ScanFilesContext(ScanContext):
     files: FileCollection = field(default_factory=FileCollection)
     on_file_scanned: Optional[Callable] = None
+    symbol_index: Optional[Any] = None
+    ast_dispatcher: Optional[Any] = None
     
     @property
     def test_files(self) -> List[Path]:
@@ -74,6 +77,7 @@ class CrossFileScanContext(ScanContext):
     all_files: FileCollection = field(default_factory=FileCollection)
     status_writer: Optional[Any] = None
     max_comparisons: int = 20
+    symbol_index: Optional[Any] = None
     
     @property
     def test_files(self) -> List[Path]:
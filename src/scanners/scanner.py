@@ -1,6 +1,6 @@
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Union, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -13,6 +13,15 @@ if TYPE_CHECKING:
     from .resources.scan_context import ScanContext, FileScanContext, ScanFilesContext, CrossFileScanContext
 
 class Scanner(ABC):
+
+    # Applicability metadata, read by rules.rule_applicability before any file is opened; empty means unrestricted.
+    # file_roles holds 'test' and/or 'production' as decided by the scanner's own _is_test_file, required_ast_nodes and
+    # required_keywords are any-of, and required_story_graph_sections must all be non-empty for the scanner to report.
+    target_languages: Tuple[str, ...] = ()
+    file_roles: Tuple[str, ...] = ()
+    required_ast_nodes: Tuple[str, ...] = ()
+    required_keywords: Tuple[bytes, ...] = ()
+    required_story_graph_sections: Tuple[str, ...] = ()
     
     def __init__(self, rule: 'Rule'):
         self.rule = rule
@@ -27,7 +36,8 @@ class Scanner(ABC):
             if file_path and file_path.exists() and file_path.is_file():
                 file_context = FileScanContext(
                     story_graph=context.story_graph,
-                    file_path=file_path
+                    file_path=file_path,
+                    ast_dispatcher=getattr(context, 'ast_dispatcher', None)
                 )
                 file_violations = self.scan_file_with_context(file_context)
                 file_violations_list = file_violations if isinstance(file_violations, list) else [file_violations] if file_violations else []
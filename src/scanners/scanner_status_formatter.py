@@ -4,6 +4,7 @@ from actions.validate.validation_stats import ValidationStats
 
 MAX_VIOLATION_DENSITY_FOR_GOOD_STATUS = 200
 MAX_RULES_WITH_ERRORS_FOR_GOOD_STATUS = 5
+MAX_SCANNERS_IN_PERFORMANCE_TABLE = 15
 
 class ScannerStatusFormatter:
 
@@ -23,6 +24,49 @@ class ScannerStatusFormatter:
         lines.extend(self.format_no_scanner_rules_section(categorized['no_scanner']))
         return lines
 
+    def build_scanner_metrics(self, validation_rules: List[Dict[str, Any]]) -> List[str]:
+        timed_rules = [r for r in validation_rules if r.get('scanner_metrics')]
+        if not timed_rules:
+            return []
+        timed_rules = sorted(timed_rules, key=lambda r: -r['scanner_metrics']['wall_seconds'])
+        total_wall = sum(r['scanner_metrics']['wall_seconds'] for r in timed_rules)
+        lines = ['## Scanner Performance', '', f'Total scanner time: **{total_wall:.2f}s** across {len(timed_rules)} scanner(s).', '']
+        skipped_pairs = sum(r.get('scanner_status', {}).get('skipped_files', 0) for r in validation_rules)
+        if skipped_pairs:
+            lines.extend([f'Applicability prefilter skipped **{skipped_pairs}** rule/file pair(s) no scanner could report on.', ''])
+        lines.extend(['| Scanner | Wall (s) | CPU (s) | Peak Memory | Files | Violations |', '|---------|----------|---------|-------------|-------|------------|'])
+        for rule_dict in timed_rules[:MAX_SCANNERS_IN_PERFORMANCE_TABLE]:
+            lines.append(self.format_scanner_metrics_row(rule_dict))
+        if len(timed_rules) > MAX_SCANNERS_IN_PERFORMANCE_TABLE:
+            lines.append(f'*... and {len(timed_rules) - MAX_SCANNERS_IN_PERFORMANCE_TABLE} more scanners*')
+        lines.append('')
+        lines.extend(self.format_slowest_files(timed_rules[:MAX_SCANNERS_IN_PERFORMANCE_TABLE]))
+        return lines
+
+    def format_scanner_metrics_row(self, rule_dict: Dict) -> str:
+        metrics = rule_dict['scanner_metrics']
+        rule_name = Path(rule_dict.get('rule_file', '')).stem or 'unknown'
+        budget_flag = ' 🟥 over budget' if metrics.get('over_budget') else ''
+        peak_memory = metrics.get('peak_memory_bytes')
+        memory_text = f'{peak_memory / (1024 * 1024):.1f} MB' if peak_memory is not None else 'n/a'
+        return f"| {rule_name}{budget_flag} | {metrics['wall_seconds']:.2f} | {metrics['cpu_seconds']:.2f} | {memory_text} | {metrics['files_scanned']} | {metrics['violations_found']} |"
+
+    def format_slowest_files(self, timed_rules: List[Dict]) -> List[str]:
+        lines = []
+        for rule_dict in timed_rules:
+            slowest_files = rule_dict['scanner_metrics'].get('slowest_files', [])
+            if not slowest_files:
+                continue
+            rule_name = Path(rule_dict.get('rule_file', '')).stem or 'unknown'
+            lines.append(f'- **{rule_name}** slowest files:')
+            for entry in slowest_files:
+                lines.append(f"  - `{Path(entry['file']).name}` - {entry['seconds']:.3f}s")
+        if lines:
+            lines.insert(0, '### Slowest Files per Scanner')
+            lines.insert(1, '')
+            lines.append('')
+        return lines
+
     def categorize_scanner_rules(self, validation_rules: List[Dict[str, Any]]) -> Dict:
         executed_rules = []
         load_failed_rules = []
@@ -16,7 +16,7 @@ def _get_story_names_from_scope(story_graph: Dict[str, Any]) -> Set[str]:
     if not scope_config:
         return None
     
-    story_map = StoryMap(story_graph)
+    story_map = StoryMap.shared(story_graph)
     story_names = set()
     
     if 'story_names' in scope_config:
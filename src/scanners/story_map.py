@@ -11,16 +11,39 @@ class StoryNode:
         self.story_group_idx = story_group_idx
         self.story_idx = story_idx
         self._new_node: Optional[NewStoryNode] = None
+        self._children: Optional[List['StoryNode']] = None
+        self._subtree: Optional[List['StoryNode']] = None
+        self._locations: Dict[str, str] = {}
     
     @property
     def children(self) -> List['StoryNode']:
+        if self._children is None:
+            self._children = self._build_children()
+        return self._children
+
+    def _build_children(self) -> List['StoryNode']:
         return []
+
+    def subtree(self) -> List['StoryNode']:
+        """This node followed by all of its descendants, in walk order."""
+        if self._subtree is None:
+            subtree = [self]
+            for child in self.children:
+                subtree.extend(child.subtree())
+            self._subtree = subtree
+        return self._subtree
     
     @property
     def name(self) -> str:
         return self.data.get('name', '')
     
     def map_location(self, field: str = 'name') -> str:
+        location = self._locations.get(field)
+        if location is None:
+            location = self._locations[field] = self._build_map_location(field)
+        return location
+
+    def _build_map_location(self, field: str) -> str:
         if isinstance(self, Epic):
             return f"epics[{self.epic_idx}].{field}"
         elif isinstance(self, SubEpic):
@@ -43,8 +66,7 @@ class StoryNode:
 
 class Epic(StoryNode):
     
-    @property
-    def children(self) -> List[StoryNode]:
+    def _build_children(self) -> List[StoryNode]:
         children = []
         
         sub_epics = self.data.get('sub_epics', [])
@@ -61,21 +83,11 @@ class Epic(StoryNode):
 
     @property
     def all_stories(self) -> List['Story']:
-        stories: List['Story'] = []
-
-        def _collect(node: StoryNode):
-            if isinstance(node, Story):
-                stories.append(node)
-            for child in node.children:
-                _collect(child)
-
-        _collect(self)
-        return stories
+        return [node for node in self.subtree() if isinstance(node, Story)]
 
 class SubEpic(StoryNode):
     
-    @property
-    def children(self) -> List[StoryNode]:
+    def _build_children(self) -> List[StoryNode]:
         children = []
         
         nested_sub_epics = self.data.get('sub_epics', [])
@@ -93,8 +105,7 @@ class SubEpic(StoryNode):
 
 class StoryGroup(StoryNode):
     
-    @property
-    def children(self) -> List[StoryNode]:
+    def _build_children(self) -> List[StoryNode]:
         children = []
         stories = self.data.get('stories', [])
         
@@ -173,6 +184,11 @@ class Scenario(ScenarioBase):
 # ScenarioOutline class removed - use Scenario with optional examples field instead
 
 class Story(StoryNode):
+
+    def __init__(self, data: Dict[str, Any], epic_idx: int, sub_epic_path: Optional[List[int]] = None,
+                 story_group_idx: Optional[int] = None, story_idx: Optional[int] = None):
+        super().__init__(data, epic_idx, sub_epic_path, story_group_idx, story_idx)
+        self._scenarios: Optional[List[Scenario]] = None
     
     @property
     def sizing(self) -> Any:
@@ -196,6 +212,11 @@ class Story(StoryNode):
     
     @property
     def scenarios(self) -> List[Scenario]:
+        if self._scenarios is None:
+            self._scenarios = self._build_scenarios()
+        return self._scenarios
+
+    def _build_scenarios(self) -> List[Scenario]:
         scenarios_data = self.data.get('scenarios', [])
         scenarios = [Scenario(scenario_data, self, scenario_idx) 
                      for scenario_idx, scenario_data in enumerate(scenarios_data)]
@@ -223,9 +244,24 @@ class Story(StoryNode):
         return f"Test{class_name}"
 
 class StoryMap:
+
+    _shared: Optional['StoryMap'] = None
     
     def __init__(self, story_graph: Dict[str, Any]):
         self.story_graph = story_graph
+        self._epics: Optional[List[Epic]] = None
+
+    @classmethod
+    def shared(cls, story_graph: Dict[str, Any]) -> 'StoryMap':
+        """Wrapper tree shared by every scanner that reads the same story graph during a validation run."""
+        shared_map = cls._shared
+        if shared_map is None or shared_map.story_graph is not story_graph:
+            shared_map = cls._shared = cls(story_graph)
+        return shared_map
+
+    @classmethod
+    def release_shared(cls) -> None:
+        cls._shared = None
     
     @classmethod
     def from_bot(cls, bot: Any) -> 'StoryMap':
@@ -252,8 +288,10 @@ class StoryMap:
         return cls(story_graph)
     
     def epics(self) -> List[Epic]:
-        epics_data = self.story_graph.get('epics', [])
-        return [Epic(epic_data, epic_idx) for epic_idx, epic_data in enumerate(epics_data)]
+        if self._epics is None:
+            epics_data = self.story_graph.get('epics', [])
+            self._epics = [Epic(epic_data, epic_idx) for epic_idx, epic_data in enumerate(epics_data)]
+        return self._epics
     
     def find_epic_by_name(self, epic_name: str) -> 'Epic':
         for epic in self.epics():
@@ -262,6 +300,4 @@ class StoryMap:
         return None
     
     def walk(self, node: StoryNode) -> Iterator[StoryNode]:
-        yield node
-        for child in node.children:
-            yield from self.walk(child)
+        return iter(node.subtree())
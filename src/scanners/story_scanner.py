@@ -9,6 +9,8 @@ if TYPE_CHECKING:
     from actions.rules.rule import Rule
 
 class StoryScanner(Scanner):
+
+    required_story_graph_sections = ('epics',)
     
     def __init__(self, rule: 'Rule'):
         super().__init__(rule)
@@ -16,7 +18,7 @@ class StoryScanner(Scanner):
     def scan_with_context(self, context: 'ScanFilesContext') -> List[Dict[str, Any]]:
         violations = []
         story_graph_data = context.story_graph.get('story_graph', context.story_graph)
-        story_map = StoryMap(story_graph_data)
+        story_map = StoryMap.shared(story_graph_data)
         
         for epic in story_map.epics():
             for node in story_map.walk(epic):
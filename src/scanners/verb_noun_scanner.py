@@ -3,29 +3,10 @@ import logging
 from scanners.story_scanner import StoryScanner
 from scanners.story_map import StoryNode, Epic, SubEpic, Story
 from scanners.violation import Violation
-from .vocabulary_helper import VocabularyHelper
-
-import nltk
-from nltk import pos_tag, word_tokenize
-from nltk.corpus import wordnet as wn
+from .vocabulary_helper import VocabularyHelper, load_nltk, wordnet
 
 logger = logging.getLogger(__name__)
 
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab', quiet=True)
-
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger_eng', quiet=True)
-
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    nltk.download('wordnet', quiet=True)
-
 class VerbNounScanner(StoryScanner):
     
     def scan_domain_concept(self, node: Any) -> List[Dict[str, Any]]:
@@ -80,9 +61,9 @@ class VerbNounScanner(StoryScanner):
     
     def _get_tokens_and_tags(self, text: str) -> Tuple[List[str], List[Tuple[str, str]]]:
         try:
-            tokens = word_tokenize(text)
+            tokens = load_nltk().word_tokenize(text)
             tokens = [t for t in tokens if t.isalnum() or any(c.isalnum() for c in t)]
-            tags = pos_tag(tokens)
+            tags = load_nltk().pos_tag(tokens)
             return tokens, tags
         except Exception:
             return [], []
@@ -102,11 +83,11 @@ class VerbNounScanner(StoryScanner):
     def _can_be_verb(self, word: str) -> bool:
         try:
             word_lower = word.lower()
-            synsets = wn.synsets(word_lower, pos=wn.VERB)
+            synsets = wordnet().synsets(word_lower, pos=wordnet().VERB)
             if synsets:
                 return True
             
-            for synset in wn.synsets(word_lower):
+            for synset in wordnet().synsets(word_lower):
                 if 'v' in synset.pos():
                     return True
             
@@ -1,41 +1,46 @@
 
 from typing import List, Set, Optional
-import nltk
-from nltk.corpus import wordnet as wn
-from nltk import pos_tag, word_tokenize
+import sys
+from functools import lru_cache
 
-import socket
-_original_timeout = socket.getdefaulttimeout()
-socket.setdefaulttimeout(2)
+NLTK_DATA = (
+    ('corpora/wordnet', 'wordnet'),
+    ('tokenizers/punkt_tab', 'punkt_tab'),
+    ('taggers/averaged_perceptron_tagger_eng', 'averaged_perceptron_tagger_eng')
+)
+NLTK_DOWNLOAD_TIMEOUT_SECONDS = 2
 
-try:
-    nltk.data.find('corpora/wordnet')
-except LookupError:
-    try:
-        nltk.download('wordnet', quiet=True)
-    except Exception as e:
-        import sys
-        print(f"Warning: Failed to download NLTK wordnet: {e}", file=sys.stderr)
 
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    try:
-        nltk.download('punkt_tab', quiet=True)
-    except Exception as e:
-        import sys
-        print(f"Warning: Failed to download NLTK punkt_tab: {e}", file=sys.stderr)
+@lru_cache(maxsize=None)
+def load_nltk():
+    """Import NLTK and make sure its data is present the first time a scanner needs it.
 
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-except LookupError:
+    Importing NLTK takes several hundred milliseconds and a missing corpus is downloaded, so this is kept out of module
+    import: loading a scanner class to list or filter rules must not pay for it.
+    """
+    import socket
+    import nltk
+    original_timeout = socket.getdefaulttimeout()
+    socket.setdefaulttimeout(NLTK_DOWNLOAD_TIMEOUT_SECONDS)
     try:
-        nltk.download('averaged_perceptron_tagger_eng', quiet=True)
-    except Exception as e:
-        import sys
-        print(f"Warning: Failed to download NLTK averaged_perceptron_tagger_eng: {e}", file=sys.stderr)
+        for resource_path, package in NLTK_DATA:
+            try:
+                nltk.data.find(resource_path)
+            except LookupError:
+                try:
+                    nltk.download(package, quiet=True)
+                except Exception as e:
+                    print(f"Warning: Failed to download NLTK {package}: {e}", file=sys.stderr)
+    finally:
+        socket.setdefaulttimeout(original_timeout)
+    return nltk
+
+
+def wordnet():
+    load_nltk()
+    from nltk.corpus import wordnet as wn
+    return wn
 
-socket.setdefaulttimeout(_original_timeout)
 
 class VocabularyHelper:
     
@@ -47,18 +52,18 @@ class VocabularyHelper:
     def _has_synsets(word: str, pos) -> bool:
         try:
             word_lower = word.lower()
-            synsets = wn.synsets(word_lower, pos=pos)
+            synsets = wordnet().synsets(word_lower, pos=pos)
             return len(synsets) > 0
         except Exception:
             return False
     
     @staticmethod
     def is_verb(word: str) -> bool:
-        return VocabularyHelper._has_synsets(word, wn.VERB)
+        return VocabularyHelper._has_synsets(word, wordnet().VERB)
     
     @staticmethod
     def is_noun(word: str) -> bool:
-        return VocabularyHelper._has_synsets(word, wn.NOUN)
+        return VocabularyHelper._has_synsets(word, wordnet().NOUN)
     
     @staticmethod
     def is_agent_noun(word: str) -> tuple[bool, Optional[str], Optional[str]]:
@@ -107,9 +112,9 @@ class VocabularyHelper:
     @staticmethod
     def get_pos_tags(text: str) -> List[tuple[str, str]]:
         try:
-            tokens = word_tokenize(text)
+            tokens = load_nltk().word_tokenize(text)
             tokens = [t for t in tokens if t.isalnum() or any(c.isalnum() for c in t)]
-            return pos_tag(tokens)
+            return load_nltk().pos_tag(tokens)
         except Exception:
             return []
     
@@ -133,7 +138,7 @@ class VocabularyHelper:
         try:
             word_lower = word.lower()
             
-            synsets = wn.synsets(word_lower)
+            synsets = wordnet().synsets(word_lower)
             
             if not synsets:
                 return False
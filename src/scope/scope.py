@@ -1,11 +1,14 @@
 
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, TYPE_CHECKING
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 import logging
+from workspace_state_store import WorkspaceStateStore
 logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from scope.story_graph_search_index import StoryGraphSearchIndex
 
 class ScopeType(Enum):
     ALL = 'all'
@@ -13,6 +16,7 @@ class ScopeType(Enum):
     STORY = 'story'
     INCREMENT = 'increment'
     FILES = 'files'
+    CHANGED = 'changed'
 
 @dataclass
 class StoryGraphFilter:
@@ -24,106 +28,15 @@ class StoryGraphFilter:
             return True
         return node_name in self.search_terms
     
-    def filter_story_graph(self, story_graph: Dict[str, Any]) -> Dict[str, Any]:
+    def filter_story_graph(self, story_graph: Dict[str, Any], search_index: Optional['StoryGraphSearchIndex'] = None) -> Dict[str, Any]:
         if not self.search_terms and not self.increments:
             return story_graph
         
-        all_filter_names = self.search_terms
-        
-        def name_matches(name: str) -> bool:
-            return any(filter_name.lower() in name.lower() for filter_name in all_filter_names)
-        
-        def filter_sub_epic(sub_epic: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-            sub_epic_name = sub_epic.get('name', '')
-            
-            if name_matches(sub_epic_name):
-                return sub_epic
-            
-            matching_story_groups = []
-            for story_group in sub_epic.get('story_groups', []):
-                matching_stories = []
-                for story in story_group.get('stories', []):
-                    story_name = story.get('name', '')
-                    if name_matches(story_name):
-                        # Story name matches - include full story with all scenarios
-                        matching_stories.append(story)
-                    else:
-                        # Check if any scenario matches
-                        matching_scenarios = []
-                        for scenario in story.get('scenarios', []):
-                            scenario_name = scenario.get('name', '')
-                            if name_matches(scenario_name):
-                                matching_scenarios.append(scenario)
-                        
-                        if matching_scenarios:
-                            # Scenario matched - include story but filter to only matching scenarios
-                            filtered_story = {**story, 'scenarios': matching_scenarios}
-                            matching_stories.append(filtered_story)
-                
-                if matching_stories:
-                    matching_story_groups.append({
-                        **story_group,
-                        'stories': matching_stories
-                    })
-            
-            matching_direct_stories = []
-            for story in sub_epic.get('stories', []):
-                story_name = story.get('name', '')
-                if name_matches(story_name):
-                    # Story name matches - include full story with all scenarios
-                    matching_direct_stories.append(story)
-                else:
-                    # Check if any scenario matches
-                    matching_scenarios = []
-                    for scenario in story.get('scenarios', []):
-                        scenario_name = scenario.get('name', '')
-                        if name_matches(scenario_name):
-                            matching_scenarios.append(scenario)
-                    
-                    if matching_scenarios:
-                        # Scenario matched - include story but filter to only matching scenarios
-                        filtered_story = {**story, 'scenarios': matching_scenarios}
-                        matching_direct_stories.append(filtered_story)
-            
-            filtered_nested_sub_epics = []
-            for nested_sub_epic in sub_epic.get('sub_epics', []):
-                filtered_nested = filter_sub_epic(nested_sub_epic)
-                if filtered_nested:
-                    filtered_nested_sub_epics.append(filtered_nested)
-            
-            if matching_story_groups or matching_direct_stories or filtered_nested_sub_epics:
-                filtered_sub_epic = {**sub_epic}
-                if matching_story_groups:
-                    filtered_sub_epic['story_groups'] = matching_story_groups
-                if matching_direct_stories:
-                    filtered_sub_epic['stories'] = matching_direct_stories
-                if filtered_nested_sub_epics:
-                    filtered_sub_epic['sub_epics'] = filtered_nested_sub_epics
-                return filtered_sub_epic
-            
-            return None
-        
-        filtered_graph = {'epics': []}
-        epics = story_graph.get('epics', [])
-        
-        for epic in epics:
-            epic_name = epic.get('name', '')
-            
-            if name_matches(epic_name):
-                filtered_graph['epics'].append(epic)
-                continue
-            
-            filtered_sub_epics = []
-            for sub_epic in epic.get('sub_epics', []):
-                filtered_sub = filter_sub_epic(sub_epic)
-                if filtered_sub:
-                    filtered_sub_epics.append(filtered_sub)
-            
-            if filtered_sub_epics:
-                filtered_epic = {**epic, 'sub_epics': filtered_sub_epics}
-                filtered_graph['epics'].append(filtered_epic)
-        
-        return filtered_graph
+        from scope.story_graph_search_index import StoryGraphSearchIndex
+        index = search_index or StoryGraphSearchIndex.build(story_graph)
+        # Epics, sub-epics, stories and scenarios whose name contains a term (case-insensitive) are kept;
+        # a matching story keeps all its scenarios, otherwise only the matching scenarios remain
+        return index.filter(story_graph, self.search_terms)
 
 @dataclass
 class FileFilter:
@@ -273,12 +186,12 @@ class Scope:
             return None
         
         try:
-            graph_data = json.loads(story_graph_path.read_text(encoding='utf-8'))
-            
             if self._story_graph_filter:
-                filtered_data = self._story_graph_filter.filter_story_graph(graph_data)
+                from scope.story_graph_search_index import StoryGraphSearchIndex
+                graph_data, search_index = StoryGraphSearchIndex.load(story_graph_path)
+                filtered_data = self._story_graph_filter.filter_story_graph(graph_data, search_index)
             else:
-                filtered_data = graph_data
+                filtered_data = json.loads(story_graph_path.read_text(encoding='utf-8'))
             
             from story_graph.story_graph import StoryGraph
             from bot_path.bot_path import BotPath
@@ -395,8 +308,7 @@ class Scope:
     def save(self):
         scope_file = self.workspace_directory / 'scope.json'
         
-        scope_file.parent.mkdir(parents=True, exist_ok=True)
-        scope_file.write_text(json.dumps(self.to_dict(), indent=2))
+        WorkspaceStateStore.shared().write(scope_file, self.to_dict())
     
     def load(self):
         scope_file = self.workspace_directory / 'scope.json'
@@ -405,7 +317,7 @@ class Scope:
             return
         
         try:
-            scope_data = json.loads(scope_file.read_text())
+            scope_data = WorkspaceStateStore.shared().read(scope_file)
             
             if scope_data:
                 scope_type_str = scope_data.get('type', 'all')
@@ -438,9 +350,7 @@ class Scope:
             return
         
         try:
-            state_data = json.loads(state_file.read_text())
-            if 'scope' in state_data:
-                del state_data['scope']
-                state_file.write_text(json.dumps(state_data, indent=2))
+            with WorkspaceStateStore.shared().transaction(state_file) as state_data:
+                state_data.pop('scope', None)
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f'Failed to clear scope from bot state file: {str(e)}')
@@ -0,0 +1,187 @@
+import bisect
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from file_version_cache import FileVersionCache
+
+TOKEN_PATTERN = re.compile(r'\w+')
+NGRAM_SIZE = 3
+
+# (container key, child kind) for each list the scope filter descends into
+EPIC_CHILDREN = (('sub_epics', 'sub_epic'),)
+SUB_EPIC_CHILDREN = (('story_groups', 'story_group'), ('stories', 'story'), ('sub_epics', 'sub_epic'))
+STORY_GROUP_CHILDREN = (('stories', 'story'),)
+STORY_CHILDREN = (('scenarios', 'scenario'),)
+CHILD_CONTAINERS = {'epic': EPIC_CHILDREN, 'sub_epic': SUB_EPIC_CHILDREN, 'story_group': STORY_GROUP_CHILDREN, 'story': STORY_CHILDREN, 'scenario': ()}
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}
+
+
+class StoryGraphSearchIndex:
+    """Lowercased names, n-gram and token postings and parent links for every node the scope filter can match.
+
+    Node ids are positions in the flat node lists. Each node records the list key and position it came from in its
+    parent, so matches can be turned back into the filtered graph for any dict with the same shape.
+    """
+
+    def __init__(self):
+        self.kinds: List[str] = []
+        self.parents: List[int] = []
+        self.containers: List[str] = []
+        self.positions: List[int] = []
+        self.children: List[List[int]] = []
+        self.name_ids: List[int] = []
+        self.names: List[str] = []
+        self._name_lookup: Dict[str, int] = {}
+        self._name_nodes: List[List[int]] = []
+        self._ngram_postings: Dict[str, Set[int]] = {}
+        self._token_postings: Dict[str, Set[int]] = {}
+        self._sorted_tokens: List[str] = []
+        self.epic_ids: List[int] = []
+
+    @classmethod
+    def build(cls, story_graph: Dict[str, Any]) -> 'StoryGraphSearchIndex':
+        index = cls()
+        for position, epic in enumerate(story_graph.get('epics', [])):
+            index.epic_ids.append(index._add_node(epic, 'epic', -1, 'epics', position))
+        index._sorted_tokens = sorted(index._token_postings)
+        return index
+
+    @classmethod
+    def load(cls, story_graph_path: Path) -> Tuple[Dict[str, Any], 'StoryGraphSearchIndex']:
+        """The graph in story_graph_path and its index, which is rebuilt only when the file changes.
+
+        The graph is parsed from the same text the index was built from, and is a fresh copy the caller may modify.
+        """
+        entry = _indexed_files.entry(story_graph_path)
+        if entry is None:
+            raise FileNotFoundError(story_graph_path)
+        return json.loads(entry.text), entry.value
+
+    def _add_node(self, node: Dict[str, Any], kind: str, parent: int, container: str, position: int) -> int:
+        node_id = len(self.kinds)
+        self.kinds.append(kind)
+        self.parents.append(parent)
+        self.containers.append(container)
+        self.positions.append(position)
+        self.children.append([])
+        self.name_ids.append(self._intern_name(str(node.get('name', '')).lower()) if kind != 'story_group' else -1)
+        if self.name_ids[node_id] >= 0:
+            self._name_nodes[self.name_ids[node_id]].append(node_id)
+        for child_container, child_kind in CHILD_CONTAINERS[kind]:
+            for child_position, child in enumerate(node.get(child_container, [])):
+                self.children[node_id].append(self._add_node(child, child_kind, node_id, child_container, child_position))
+        return node_id
+
+    def _intern_name(self, name: str) -> int:
+        name_id = self._name_lookup.get(name)
+        if name_id is not None:
+            return name_id
+        name_id = len(self.names)
+        self._name_lookup[name] = name_id
+        self.names.append(name)
+        self._name_nodes.append([])
+        for ngram in _ngrams(name):
+            self._ngram_postings.setdefault(ngram, set()).add(name_id)
+        for token in TOKEN_PATTERN.findall(name):
+            self._token_postings.setdefault(token, set()).add(name_id)
+        return name_id
+
+    @property
+    def node_count(self) -> int:
+        return len(self.kinds)
+
+    def _names_containing(self, term: str) -> Iterable[int]:
+        if len(term) < NGRAM_SIZE:
+            return (name_id for name_id, name in enumerate(self.names) if term in name)
+        postings = sorted((self._ngram_postings.get(ngram, set()) for ngram in _ngrams(term)), key=len)
+        candidates = set.intersection(*postings) if postings and postings[0] else set()
+        return (name_id for name_id in candidates if term in self.names[name_id])
+
+    def _names_with_token_prefix(self, prefix: str) -> Set[int]:
+        name_ids = set()
+        start = bisect.bisect_left(self._sorted_tokens, prefix)
+        for token in self._sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            name_ids |= self._token_postings[token]
+        return name_ids
+
+    def search(self, term: str, mode: str = 'substring') -> Set[int]:
+        """Node ids whose name matches term: 'substring' (the scope filter's rule), 'token' or 'prefix' (token prefix)."""
+        term = term.lower()
+        if mode == 'token':
+            name_ids = self._token_postings.get(term, set())
+        elif mode == 'prefix':
+            name_ids = self._names_with_token_prefix(term)
+        else:
+            name_ids = self._names_containing(term)
+        return {node_id for name_id in name_ids for node_id in self._name_nodes[name_id]}
+
+    def matching_nodes(self, search_terms: Iterable[str], mode: str = 'substring') -> Set[int]:
+        matches: Set[int] = set()
+        for term in search_terms:
+            matches |= self.search(term, mode)
+        return matches
+
+    def _with_ancestors(self, node_ids: Set[int]) -> Set[int]:
+        relevant = set()
+        for node_id in node_ids:
+            while node_id >= 0 and node_id not in relevant:
+                relevant.add(node_id)
+                node_id = self.parents[node_id]
+        return relevant
+
+    def filter(self, story_graph: Dict[str, Any], search_terms: Iterable[str], mode: str = 'substring') -> Dict[str, Any]:
+        matches = self.matching_nodes(search_terms, mode)
+        return self.materialize(story_graph, matches)
+
+    def materialize(self, story_graph: Dict[str, Any], matches: Set[int]) -> Dict[str, Any]:
+        """Build the filtered graph from story_graph, visiting only the branches that lead to a match."""
+        relevant = self._with_ancestors(matches)
+        filtered_graph = {'epics': []}
+        epics = story_graph.get('epics', [])
+        for epic_id in self.epic_ids:
+            if epic_id not in relevant:
+                continue
+            epic = epics[self.positions[epic_id]]
+            if epic_id in matches:
+                filtered_graph['epics'].append(epic)
+                continue
+            sub_epics = epic.get('sub_epics', [])
+            filtered_sub_epics = [self._materialize_sub_epic(child_id, sub_epics[self.positions[child_id]], matches, relevant) for child_id in self.children[epic_id] if child_id in relevant]
+            if filtered_sub_epics:
+                filtered_graph['epics'].append({**epic, 'sub_epics': filtered_sub_epics})
+        return filtered_graph
+
+    def _materialize_sub_epic(self, sub_epic_id: int, sub_epic: Dict[str, Any], matches: Set[int], relevant: Set[int]) -> Dict[str, Any]:
+        if sub_epic_id in matches:
+            return sub_epic
+        filtered = {'story_groups': [], 'stories': [], 'sub_epics': []}
+        for child_id in self.children[sub_epic_id]:
+            if child_id not in relevant:
+                continue
+            container = self.containers[child_id]
+            child = sub_epic[container][self.positions[child_id]]
+            if container == 'story_groups':
+                stories = child.get('stories', [])
+                filtered[container].append({**child, 'stories': [self._materialize_story(story_id, stories[self.positions[story_id]], matches) for story_id in self.children[child_id] if story_id in relevant]})
+            elif container == 'stories':
+                filtered[container].append(self._materialize_story(child_id, child, matches))
+            else:
+                filtered[container].append(self._materialize_sub_epic(child_id, child, matches, relevant))
+        # Lists without matches keep the sub-epic's original entries, as the scope filter always has
+        return {**sub_epic, **{container: children for container, children in filtered.items() if children}}
+
+    def _materialize_story(self, story_id: int, story: Dict[str, Any], matches: Set[int]) -> Dict[str, Any]:
+        if story_id in matches:
+            return story
+        scenarios = story.get('scenarios', [])
+        return {**story, 'scenarios': [scenarios[self.positions[scenario_id]] for scenario_id in self.children[story_id] if scenario_id in matches]}
+
+
+_indexed_files = FileVersionCache(lambda text: StoryGraphSearchIndex.build(json.loads(text)))
@@ -4,6 +4,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import json
 import logging
+import sys
 from datetime import datetime
 from story_graph.domain import DomainConcept, StoryUser
 
@@ -137,7 +138,8 @@ class StoryNode(ABC):
     @staticmethod
     def _add_steps_to_node(node: 'StoryNode', step_strings: List[str]) -> None:
         for step_idx, step_text in enumerate(step_strings):
-            step = Step(name=step_text, text=step_text, sequential_order=float(step_idx + 1), _parent=node)
+            step_text = sys.intern(step_text)
+            step = Step(name=step_text, text=step_text, sequential_order=float(step_idx + 1), _parent=node, _bot=node._bot)
             node._children.append(step)
 
     @staticmethod
@@ -1265,6 +1267,19 @@ class Scenario(StoryNode):
             raise ValueError('Scenario requires sequential_order')
         self._children: List['StoryNode'] = []
 
+    @property
+    def _children(self) -> List['StoryNode']:
+        # Steps stay as interned text until something asks for Step nodes
+        if self._pending_steps is not None:
+            step_strings, self._pending_steps = self._pending_steps, None
+            self._add_steps_to_node(self, step_strings)
+        return self._child_nodes
+
+    @_children.setter
+    def _children(self, value: List['StoryNode']) -> None:
+        self._pending_steps: Optional[tuple] = None
+        self._child_nodes = value
+
     @property
     def children(self) -> List['StoryNode']:
         return self._children
@@ -1273,6 +1288,17 @@ class Scenario(StoryNode):
     def steps(self) -> List['Step']:
         return self._filter_children_by_type(Step)
 
+    @property
+    def steps_loaded(self) -> bool:
+        return self._pending_steps is None
+
+    @property
+    def step_texts(self) -> List[str]:
+        """Step text without materializing Step nodes."""
+        if self._pending_steps is not None:
+            return list(self._pending_steps)
+        return [step.text for step in self.steps]
+
     @property
     def examples_columns(self) -> List[str]:
         """Return columns from examples table, or empty list if no examples."""
@@ -1343,7 +1369,9 @@ class Scenario(StoryNode):
     def from_dict(cls, data: Dict[str, Any], index: int=0, parent: Optional[StoryNode]=None, bot: Optional[Any]=None) -> 'Scenario':
         sequential_order = float(data.get('sequential_order', index + 1))
         scenario = cls(name=data.get('name', ''), sequential_order=sequential_order, type=data.get('type', ''), background=data.get('background', []), examples=data.get('examples'), test_method=data.get('test_method'), _parent=parent, _bot=bot)
-        cls._add_steps_to_node(scenario, cls._parse_steps_from_data(data.get('steps', '')))
+        step_strings = cls._parse_steps_from_data(data.get('steps', ''))
+        if step_strings:
+            scenario._pending_steps = tuple(sys.intern(step_text) for step_text in step_strings)
         return scenario
 
 # ScenarioOutline class has been removed - use Scenario with optional examples field instead
@@ -1371,6 +1399,7 @@ class AcceptanceCriteria(StoryNode):
         else:
             text = data.get('description', data.get('text', ''))
             sequential_order = float(data.get('sequential_order', index + 1))
+        text = sys.intern(text)
         return cls(name=text, text=text, sequential_order=sequential_order, _parent=parent, _bot=bot)
 
 @dataclass
@@ -1466,7 +1495,7 @@ class StoryMap:
     def _set_bot_on_all_nodes(self, bot: Any) -> None:
         for epic in self._epics_list:
             epic._bot = bot
-            for node in self.walk(epic):
+            for node in self._walk_loaded(epic):
                 node._bot = bot
 
     @property
@@ -1482,11 +1511,25 @@ class StoryMap:
         for child in node.children:
             yield from self.walk(child)
 
+    def _walk_to_stories(self, node: StoryNode) -> Iterator[StoryNode]:
+        yield node
+        if isinstance(node, Story):
+            return
+        for child in node.children:
+            yield from self._walk_to_stories(child)
+
+    def _walk_loaded(self, node: StoryNode) -> Iterator[StoryNode]:
+        yield node
+        if isinstance(node, Scenario) and not node.steps_loaded:
+            return
+        for child in node.children:
+            yield from self._walk_loaded(child)
+
     @property
     def all_stories(self) -> List['Story']:
         stories = []
         for epic in self._epics_list:
-            for node in self.walk(epic):
+            for node in self._walk_to_stories(epic):
                 if isinstance(node, Story):
                     stories.append(node)
         return stories
@@ -1495,7 +1538,7 @@ class StoryMap:
     def all_scenarios(self) -> List['Scenario']:
         scenarios = []
         for epic in self._epics_list:
-            for node in self.walk(epic):
+            for node in self._walk_to_stories(epic):
                 if isinstance(node, Story):
                     scenarios.extend(node.scenarios)
         return scenarios
@@ -1516,7 +1559,7 @@ class StoryMap:
     def filter_by_story_names(self, story_names: set) -> List['Story']:
         stories = []
         for epic in self._epics_list:
-            for node in self.walk(epic):
+            for node in self._walk_to_stories(epic):
                 if isinstance(node, Story) and node.name in story_names:
                     stories.append(node)
         return stories
@@ -1552,7 +1595,7 @@ class StoryMap:
 
     def find_story_by_name(self, story_name: str) -> Optional['Story']:
         for epic in self._epics_list:
-            for node in self.walk(epic):
+            for node in self._walk_to_stories(epic):
                 if isinstance(node, Story) and node.name == story_name:
                     return node
         return None
@@ -1729,7 +1772,7 @@ class StoryMap:
     
     def _scenario_to_dict(self, scenario: Scenario) -> Dict[str, Any]:
         # Convert Step objects to newline-separated string
-        steps_text = '\n'.join(step.text for step in scenario.steps) if scenario.steps else ''
+        steps_text = '\n'.join(scenario.step_texts)
         result = {
             'name': scenario.name,
             'sequential_order': scenario.sequential_order,
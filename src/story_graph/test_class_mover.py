@@ -2,8 +2,9 @@
 
 import ast
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 def _log(message: str):
@@ -14,6 +15,77 @@ def _log(message: str):
         f.write(f"{datetime.now().isoformat()} {message}\n")
 
 
+@dataclass(frozen=True)
+class ClassMove:
+    """One test class to move from source_file to target_file."""
+    source_file: Path
+    target_file: Path
+    class_name: str
+
+
+@dataclass
+class ClassMoveResult:
+    """Outcome of a batch of class moves: the moves made, the ones refused with why, and the files rewritten."""
+    moved: List[ClassMove] = field(default_factory=list)
+    failed: List[Tuple[ClassMove, str]] = field(default_factory=list)
+    written_files: List[Path] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return bool(self.moved) and not self.failed
+
+
+class _PendingFile:
+    """A test file parsed once, with the class spans moved out of it and the class code moved into it so far."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.content = path.read_text(encoding='utf-8')
+        self.lines = self.content.splitlines(keepends=True)
+        self.spans = self._class_spans(ast.parse(self.content), len(self.lines))
+        self.removed: List[Tuple[int, int]] = []
+        self.added: List[Tuple[str, str]] = []
+
+    @staticmethod
+    def _class_spans(tree: ast.Module, line_count: int) -> Dict[str, Tuple[int, int]]:
+        # A class runs from its first decorator to just before the next top-level class, as in extract_class
+        starts = [(min([node.lineno] + [d.lineno for d in node.decorator_list]) - 1, node.name)
+                  for node in tree.body if isinstance(node, ast.ClassDef)]
+        spans = {}
+        for (start, name), (end, _) in zip(starts, starts[1:] + [(line_count, None)]):
+            spans.setdefault(name, (start, end))
+        return spans
+
+    def take(self, class_name: str) -> Optional[str]:
+        """Code of class_name, marked as moved out; None when the file no longer holds it."""
+        for i, (name, code) in enumerate(self.added):
+            if name == class_name:
+                del self.added[i]
+                return code
+        span = self.spans.get(class_name)
+        if span is None or span in self.removed:
+            return None
+        self.removed.append(span)
+        return ''.join(self.lines[span[0]:span[1]])
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.removed) or bool(self.added)
+
+    def render(self) -> str:
+        lines = list(self.lines)
+        # Bottom-up, so earlier spans keep their line numbers
+        for start, end in sorted(self.removed, reverse=True):
+            del lines[start:end]
+        content = ''.join(lines)
+        for _, class_code in self.added:
+            content = TestClassMover.append_class_code(content, class_code)
+        if self.removed:
+            # Clean up extra blank lines (max 2 consecutive), as remove_class does
+            content = re.sub(r'\n{3,}', '\n\n', content)
+        return content
+
+
 class TestClassMover:
     """Handles extraction and movement of test classes between files."""
     
@@ -135,8 +207,14 @@ class TestClassMover:
             _log(f"[TestClassMover] Target file does not exist: {file_path}")
             return False
             
-        content = file_path.read_text(encoding='utf-8')
-        
+        content = TestClassMover.append_class_code(file_path.read_text(encoding='utf-8'), class_code)
+        file_path.write_text(content, encoding='utf-8')
+        _log(f"[TestClassMover] Successfully added class to {file_path}")
+        return True
+    
+    @staticmethod
+    def append_class_code(content: str, class_code: str) -> str:
+        """content with class_code appended after a blank line, ending in a newline."""
         # Ensure there's proper spacing before the new class
         if content and not content.endswith('\n\n'):
             if content.endswith('\n'):
@@ -150,10 +228,73 @@ class TestClassMover:
         # Ensure file ends with newline
         if not content.endswith('\n'):
             content += '\n'
+        return content
+    
+    @staticmethod
+    def move_classes(moves: List[ClassMove]) -> ClassMoveResult:
+        """Move many test classes, in order, parsing and writing each affected file once.
         
-        file_path.write_text(content, encoding='utf-8')
-        _log(f"[TestClassMover] Successfully added class to {file_path}")
-        return True
+        Each file is parsed when a move first touches it; the moves are applied to line spans in memory, every
+        changed file is parsed once more to check it, and only then is each written. A move whose class or file
+        cannot be found is reported in failed and the others still go ahead. If any rewritten file would not
+        parse, nothing is written and every move is reported as failed.
+        
+        Args:
+            moves: The class moves, applied in list order
+            
+        Returns:
+            ClassMoveResult listing moved and failed moves and the files written
+        """
+        _log(f"[TestClassMover] BATCH MOVE of {len(moves)} test class(es)")
+        result = ClassMoveResult()
+        files: Dict[Path, _PendingFile] = {}
+        unreadable: Dict[Path, str] = {}
+        
+        def pending(path: Path) -> Tuple[Optional[_PendingFile], str]:
+            # Keyed by resolved path, so two spellings of one file share its pending edits
+            path = Path(path).resolve()
+            if path not in files and path not in unreadable:
+                if not path.exists():
+                    unreadable[path] = f"File does not exist: {path}"
+                else:
+                    try:
+                        files[path] = _PendingFile(path)
+                    except SyntaxError as e:
+                        unreadable[path] = f"Syntax error parsing {path}: {e}"
+            return files.get(path), unreadable.get(path, '')
+        
+        for move in moves:
+            source, error = pending(move.source_file)
+            target, target_error = pending(move.target_file)
+            if source is None or target is None:
+                result.failed.append((move, error or target_error))
+            elif source is target:
+                result.failed.append((move, f"Source and target are the same file: {move.source_file}"))
+            else:
+                class_code = source.take(move.class_name)
+                if class_code is None:
+                    result.failed.append((move, f"Class '{move.class_name}' not found in {move.source_file}"))
+                else:
+                    target.added.append((move.class_name, class_code))
+                    result.moved.append(move)
+        
+        rendered = {path: pending_file.render() for path, pending_file in files.items() if pending_file.changed}
+        for path, content in rendered.items():
+            try:
+                ast.parse(content)
+            except SyntaxError as e:
+                _log(f"[TestClassMover] Batch move aborted, {path} would not parse: {e}")
+                result.failed = [(move, f"Batch move aborted, {path} would not parse: {e}") for move in moves]
+                result.moved = []
+                return result
+        for path, content in rendered.items():
+            path.write_text(content, encoding='utf-8')
+            result.written_files.append(path)
+        
+        for move, reason in result.failed:
+            _log(f"[TestClassMover] Failed to move class '{move.class_name}': {reason}")
+        _log(f"[TestClassMover] Batch moved {len(result.moved)} class(es), wrote {len(result.written_files)} file(s)")
+        return result
     
     @staticmethod
     def move_class(source_file: Path, target_file: Path, class_name: str) -> bool:
@@ -173,22 +314,9 @@ class TestClassMover:
         _log(f"[TestClassMover] TO:   {target_file}")
         _log(f"[TestClassMover] ========================================")
         
-        # Extract the class from source
-        class_code = TestClassMover.extract_class(source_file, class_name)
-        if not class_code:
-            _log(f"[TestClassMover] Failed to extract class '{class_name}'")
-            return False
-        
-        # Add to target
-        if not TestClassMover.add_class(target_file, class_code):
-            _log(f"[TestClassMover] Failed to add class to target file")
-            return False
-        
-        # Remove from source
-        if not TestClassMover.remove_class(source_file, class_name):
-            # Rollback: remove from target since we couldn't remove from source
-            _log(f"[TestClassMover] Failed to remove class from source, rolling back")
-            TestClassMover.remove_class(target_file, class_name)
+        result = TestClassMover.move_classes([ClassMove(source_file, target_file, class_name)])
+        if not result.success:
+            _log(f"[TestClassMover] Failed to move class '{class_name}'")
             return False
         
         _log(f"[TestClassMover] Successfully moved class '{class_name}'")
@@ -1,14 +1,15 @@
 """Domain Model Synchronizer package."""
 
 from .domain_model_synchronizer import (
+    DomainModelBuildContext,
     DomainModelDescriptionSynchronizer,
     DomainModelDiagramSynchronizer,
     DomainModelOutlineSynchronizer
 )
 
 __all__ = [
+    'DomainModelBuildContext',
     'DomainModelDescriptionSynchronizer',
     'DomainModelDiagramSynchronizer',
     'DomainModelOutlineSynchronizer'
 ]
-
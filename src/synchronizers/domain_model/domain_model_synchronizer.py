@@ -2,19 +2,26 @@
 Domain Model Synchronizers
 
 Handles rendering of domain model documents from story graph JSON.
-Three separate synchronizers, one per output type.
+Three separate synchronizers, one per output type, sharing one DomainModelBuildContext
+so a render pass reads the story graph and clarification files once.
 """
 
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
 
+from file_version_cache import CachedFile, FileVersionCache
 
-def _load_domain_concepts(input_path: Path) -> Dict[str, Dict]:
-    """Load and deduplicate domain concepts from story graph, tracking module and namespace."""
-    with open(input_path, 'r', encoding='utf-8') as f:
-        story_graph = json.load(f)
-    
+logger = logging.getLogger(__name__)
+
+# Workspace files read besides the story graph, hashed by the render manifest
+DOMAIN_MODEL_RENDER_INPUTS = ('docs/stories/clarification.json', 'input.txt', 'docs/context/input.txt')
+
+
+def _index_domain_concepts(story_graph: Dict[str, Any]) -> Dict[str, Dict]:
+    """Deduplicate domain concepts from story graph, tracking module and namespace."""
     domain_concepts = {}
     for epic in story_graph.get('epics', []):
         epic_name = epic.get('name', '')
@@ -48,14 +55,14 @@ def _load_domain_concepts(input_path: Path) -> Dict[str, Dict]:
     return domain_concepts
 
 
-def _normalize_namespace(namespace: str, class_names: list) -> str:
+def _normalize_namespace(namespace: str, class_names) -> str:
     """
     Normalize namespace/module name to avoid conflicts with class names.
     If namespace/module matches a class name, add underscore prefix.
     
     Args:
         namespace: Original namespace/module name
-        class_names: List of all class names in the domain
+        class_names: All class names in the domain (any container; a set keeps the check O(1))
     
     Returns:
         Normalized namespace/module name
@@ -67,40 +74,6 @@ def _normalize_namespace(namespace: str, class_names: list) -> str:
     return normalized
 
 
-
-
-def _get_solution_info(project_path: Path, kwargs: Dict) -> tuple:
-    """Extract solution name, slug, and purpose from project or kwargs."""
-    solution_name = kwargs.get('solution_name')
-    solution_name_slug = kwargs.get('solution_name_slug')
-    if not solution_name:
-        # Try to extract from project path
-        solution_name = project_path.name.replace('_', ' ').replace('-', ' ').title()
-    if not solution_name_slug:
-        solution_name_slug = solution_name.lower().replace(' ', '-')
-    
-    # Try to get solution purpose from clarification.json
-    solution_purpose = kwargs.get('solution_purpose')
-    if not solution_purpose:
-        clarification_path = project_path / 'docs' / 'stories' / 'clarification.json'
-        if clarification_path.exists():
-            try:
-                with open(clarification_path, 'r', encoding='utf-8') as f:
-                    clarification = json.load(f)
-                    shape_data = clarification.get('shape', {})
-                    key_questions = shape_data.get('key_questions', {})
-                    goals = key_questions.get('goals', '')
-                    if goals:
-                        solution_purpose = goals
-            except Exception:
-                pass
-    
-    if not solution_purpose:
-        solution_purpose = f"Domain model for {solution_name}"
-    
-    return solution_name, solution_name_slug, solution_purpose
-
-
 def _get_source_material(project_path: Path) -> str:
     """Generate source material section."""
     input_file = project_path / 'input.txt'
@@ -114,9 +87,141 @@ def _get_source_material(project_path: Path) -> str:
 **Context:** Shape phase - Domain model extracted from story-graph.json"""
 
 
+def _group_concepts(domain_concepts: Dict[str, Dict], key: str) -> Dict[str, List[Tuple[str, Dict]]]:
+    """(name, concept) pairs per value of concept[key], sorted by name."""
+    grouped = {}
+    for concept_name, concept in domain_concepts.items():
+        grouped.setdefault(concept.get(key, 'Unknown'), []).append((concept_name, concept))
+    return {group: sorted(concepts, key=lambda x: x[0]) for group, concepts in grouped.items()}
+
+
+# Story graph and clarification files, read once per file version
+_input_files = FileVersionCache(lambda text: text)
+
+
+def _read_clarification(path: Path) -> Optional[CachedFile]:
+    try:
+        return _input_files.entry(path)
+    except (OSError, ValueError) as e:
+        logger.debug(f'Could not read {path}: {e}')
+        return None
+
+
+class DomainModelBuildContext:
+    """
+    Story graph and clarification inputs of one project, read once and shared by every domain model synchronizer.
+    
+    Contexts are cached per (input_path, project_path) and reused while neither input file's content changes. Input
+    files are read through a FileVersionCache, so a rewrite within one timestamp tick is still noticed. The story
+    graph is only parsed when an output is rendered.
+    """
+    
+    _contexts: Dict[Tuple[str, str], 'DomainModelBuildContext'] = {}
+    
+    def __init__(self, input_path: Path, project_path: Path):
+        self.input_path = Path(input_path)
+        self.project_path = Path(project_path)
+        self.clarification_path = self.project_path / 'docs' / 'stories' / 'clarification.json'
+        self._story_graph_file = _input_files.entry(self.input_path)
+        if self._story_graph_file is None:
+            raise FileNotFoundError(self.input_path)
+        self._clarification_file = _read_clarification(self.clarification_path)
+        self._concepts: Optional[Dict[str, Dict]] = None
+        self._grouped: Dict[str, Dict[str, List[Tuple[str, Dict]]]] = {}
+    
+    @classmethod
+    def load(cls, input_path: Union[str, Path], project_path: Union[str, Path, None] = None) -> 'DomainModelBuildContext':
+        input_path = Path(input_path)
+        project_path = Path(project_path) if project_path is not None else input_path.parent.parent.parent
+        key = (os.path.abspath(input_path), os.path.abspath(project_path))
+        context = cls._contexts.get(key)
+        if context is None or not context._is_current():
+            context = cls._contexts[key] = cls(input_path, project_path)
+        return context
+    
+    def _is_current(self) -> bool:
+        """Whether both input files still hold the text this context was built from."""
+        return (_input_files.entry(self.input_path) is self._story_graph_file
+                and _read_clarification(self.clarification_path) is self._clarification_file)
+    
+    @property
+    def concepts(self) -> Dict[str, Dict]:
+        """Deduplicated domain concepts by name."""
+        if self._concepts is None:
+            self._concepts = _index_domain_concepts(json.loads(self._story_graph_file.text))
+        return self._concepts
+    
+    @property
+    def concepts_by_module(self) -> Dict[str, List[Tuple[str, Dict]]]:
+        if 'module' not in self._grouped:
+            self._grouped['module'] = _group_concepts(self.concepts, 'module')
+        return self._grouped['module']
+    
+    @property
+    def concepts_by_namespace(self) -> Dict[str, List[Tuple[str, Dict]]]:
+        if 'namespace' not in self._grouped:
+            self._grouped['namespace'] = _group_concepts(self.concepts, 'namespace')
+        return self._grouped['namespace']
+    
+    @property
+    def class_names(self) -> FrozenSet[str]:
+        return frozenset(self.concepts)
+    
+    @property
+    def normalized_modules(self) -> Dict[str, str]:
+        """Module name -> name safe to use beside the class names (see _normalize_namespace)."""
+        if 'normalized_modules' not in self._grouped:
+            class_names = self.class_names
+            self._grouped['normalized_modules'] = {module: _normalize_namespace(module, class_names) for module in self.concepts_by_module}
+        return self._grouped['normalized_modules']
+    
+    def solution_info(self, kwargs: Dict) -> tuple:
+        """Extract solution name, slug, and purpose from project or kwargs."""
+        solution_name = kwargs.get('solution_name')
+        solution_name_slug = kwargs.get('solution_name_slug')
+        if not solution_name:
+            # Try to extract from project path
+            solution_name = self.project_path.name.replace('_', ' ').replace('-', ' ').title()
+        if not solution_name_slug:
+            solution_name_slug = solution_name.lower().replace(' ', '-')
+        
+        # Try to get solution purpose from clarification.json
+        solution_purpose = kwargs.get('solution_purpose')
+        if not solution_purpose and self._clarification_file is not None:
+            try:
+                clarification = json.loads(self._clarification_file.text)
+                shape_data = clarification.get('shape', {})
+                key_questions = shape_data.get('key_questions', {})
+                goals = key_questions.get('goals', '')
+                if goals:
+                    solution_purpose = goals
+            except Exception:
+                pass
+        
+        if not solution_purpose:
+            solution_purpose = f"Domain model for {solution_name}"
+        
+        return solution_name, solution_name_slug, solution_purpose
+    
+    def write_output(self, output_path: Path, content: str) -> Dict[str, Any]:
+        """Write content to output_path and return the synchronizer result."""
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return {
+            'output_path': str(output_path),
+            'summary': {
+                'domain_concepts': len(self.concepts),
+                'file': str(output_path.name)
+            }
+        }
+
+
 class DomainModelDescriptionSynchronizer:
     """Synchronizer for rendering domain model description markdown."""
     
+    render_inputs = DOMAIN_MODEL_RENDER_INPUTS
+    
     def render(self, input_path: Union[str, Path], output_path: Union[str, Path], 
                renderer_command: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -135,47 +240,12 @@ class DomainModelDescriptionSynchronizer:
         Returns:
             Dictionary with output_path and summary
         """
-        input_path = Path(input_path)
-        project_path = kwargs.get('project_path', input_path.parent.parent.parent)
-        project_path = Path(project_path)
-        
-        solution_name, solution_name_slug, solution_purpose = _get_solution_info(project_path, kwargs)
-        domain_concepts = _load_domain_concepts(input_path)
-        
-        # Group concepts by module
-        concepts_by_module = {}
-        for concept_name, concept in domain_concepts.items():
-            module = concept.get('module', 'Unknown')
-            if module not in concepts_by_module:
-                concepts_by_module[module] = []
-            concepts_by_module[module].append((concept_name, concept))
-        
-        # Generate domain descriptions grouped by module
-        module_sections = []
-        for module in sorted(concepts_by_module.keys()):
-            module_lines = [f"### Module: {module}\n"]
-            
-            concepts_in_module = sorted(concepts_by_module[module], key=lambda x: x[0])
-            for concept_name, concept in concepts_in_module:
-                desc_lines = [f"#### {concept_name}\n"]
-                
-                # Build description from responsibilities
-                responsibilities = concept.get('responsibilities', [])
-                if responsibilities:
-                    desc_lines.append("**Key Responsibilities:**")
-                    for resp in responsibilities:
-                        resp_name = resp.get('name', '')
-                        collaborators = resp.get('collaborators', [])
-                        if collaborators:
-                            desc_lines.append(f"- **{resp_name}**: This responsibility involves collaboration with {', '.join(collaborators)}.")
-                        else:
-                            desc_lines.append(f"- **{resp_name}**: {resp_name}")
-                
-                module_lines.append("\n".join(desc_lines))
-            
-            module_sections.append("\n\n".join(module_lines))
-        
-        domain_model_descriptions_text = "\n\n".join(module_sections)
+        context = DomainModelBuildContext.load(input_path, kwargs.get('project_path'))
+        return self.render_from_context(context, output_path, **kwargs)
+    
+    def render_from_context(self, context: DomainModelBuildContext, output_path: Union[str, Path], **kwargs) -> Dict[str, Any]:
+        project_path = context.project_path
+        solution_name, solution_name_slug, solution_purpose = context.solution_info(kwargs)
         source_material = _get_source_material(project_path)
         
         # Determine output path
@@ -184,8 +254,35 @@ class DomainModelDescriptionSynchronizer:
             # If directory or no extension, append filename
             output_path = output_path / f'{solution_name_slug}-domain-model-description.md'
         
-        # Template
-        content = f"""# Domain Model Description: {solution_name}
+        def render_content() -> str:
+            # Generate domain descriptions grouped by module
+            module_sections = []
+            for module, concepts_in_module in sorted(context.concepts_by_module.items()):
+                module_lines = [f"### Module: {module}\n"]
+                
+                for concept_name, concept in concepts_in_module:
+                    desc_lines = [f"#### {concept_name}\n"]
+                    
+                    # Build description from responsibilities
+                    responsibilities = concept.get('responsibilities', [])
+                    if responsibilities:
+                        desc_lines.append("**Key Responsibilities:**")
+                        for resp in responsibilities:
+                            resp_name = resp.get('name', '')
+                            collaborators = resp.get('collaborators', [])
+                            if collaborators:
+                                desc_lines.append(f"- **{resp_name}**: This responsibility involves collaboration with {', '.join(collaborators)}.")
+                            else:
+                                desc_lines.append(f"- **{resp_name}**: {resp_name}")
+                    
+                    module_lines.append("\n".join(desc_lines))
+                
+                module_sections.append("\n\n".join(module_lines))
+            
+            domain_model_descriptions_text = "\n\n".join(module_sections)
+            
+            # Template
+            return f"""# Domain Model Description: {solution_name}
 
 **File Name**: `{solution_name_slug}-domain-model-description.md`
 **Location**: `{project_path.name}/docs/stories/{solution_name_slug}-domain-model-description.md`
@@ -206,22 +303,14 @@ class DomainModelDescriptionSynchronizer:
 {source_material}
 """
         
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        return {
-            'output_path': str(output_path),
-            'summary': {
-                'domain_concepts': len(domain_concepts),
-                'file': str(output_path.name)
-            }
-        }
+        return context.write_output(output_path, render_content())
 
 
 class DomainModelDiagramSynchronizer:
     """Synchronizer for rendering domain model diagram markdown with Mermaid."""
     
+    render_inputs = DOMAIN_MODEL_RENDER_INPUTS
+    
     def render(self, input_path: Union[str, Path], output_path: Union[str, Path], 
                renderer_command: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -240,79 +329,11 @@ class DomainModelDiagramSynchronizer:
         Returns:
             Dictionary with output_path and summary
         """
-        input_path = Path(input_path)
-        project_path = kwargs.get('project_path', input_path.parent.parent.parent)
-        project_path = Path(project_path)
-        
-        solution_name, solution_name_slug, solution_purpose = _get_solution_info(project_path, kwargs)
-        domain_concepts = _load_domain_concepts(input_path)
-        
-        # Group concepts by module
-        concepts_by_module = {}
-        for concept_name, concept in domain_concepts.items():
-            module = concept.get('module', 'Unknown')
-            if module not in concepts_by_module:
-                concepts_by_module[module] = []
-            concepts_by_module[module].append((concept_name, concept))
-        
-        # Get all class names for module normalization
-        all_class_names = list(domain_concepts.keys())
-        
-        # Normalize module names
-        module_mapping = {}  # original_module -> normalized_module
-        
-        for module in concepts_by_module.keys():
-            normalized_module = _normalize_namespace(module, all_class_names)
-            module_mapping[module] = normalized_module
-        
-        # Generate Mermaid diagram grouped by module
-        mermaid_classes = []
-        mermaid_relationships = []
-        seen_relationships = set()
-        
-        # Generate classes grouped by module using namespace blocks
-        for module in sorted(concepts_by_module.keys()):
-            normalized_module = module_mapping[module]
-            concepts_in_module = sorted(concepts_by_module[module], key=lambda x: x[0])
-            
-            # Start module namespace block
-            module_block = [f"    namespace {normalized_module} {{"]
-            
-            for concept_name, concept in concepts_in_module:
-                responsibilities = concept.get('responsibilities', [])
-                resp_methods = []
-                for resp in responsibilities:
-                    resp_name = resp.get('name', '').replace(' ', '_').lower()
-                    resp_methods.append(f"            +{resp_name}()")
-                
-                # Class definition with methods - single closing brace
-                if resp_methods:
-                    class_def = f"        class {concept_name} {{\n" + "\n".join(resp_methods) + "\n        }"
-                else:
-                    class_def = f"        class {concept_name}"
-                module_block.append(class_def)
-            
-            # Close module namespace block
-            module_block.append("    }")
-            mermaid_classes.extend(module_block)
-            mermaid_classes.append("")  # Blank line between modules
-        
-        # Generate relationships using original class names (Mermaid handles module namespace resolution)
-        for concept_name, concept in domain_concepts.items():
-            responsibilities = concept.get('responsibilities', [])
-            
-            for resp in responsibilities:
-                collaborators = resp.get('collaborators', [])
-                for collab in collaborators:
-                    if collab in domain_concepts:
-                        # Use original class names - Mermaid will resolve module namespaces automatically
-                        rel_key = f"{concept_name}->{collab}"
-                        if rel_key not in seen_relationships:
-                            seen_relationships.add(rel_key)
-                            mermaid_relationships.append(f"    {concept_name} --> {collab} : uses")
-        
-        # Generate pure Mermaid syntax (no markdown wrapper)
-        mermaid_content = "classDiagram\n" + "\n".join(mermaid_classes) + "\n    \n    %% Associations\n" + "\n".join(mermaid_relationships)
+        context = DomainModelBuildContext.load(input_path, kwargs.get('project_path'))
+        return self.render_from_context(context, output_path, **kwargs)
+    
+    def render_from_context(self, context: DomainModelBuildContext, output_path: Union[str, Path], **kwargs) -> Dict[str, Any]:
+        _, solution_name_slug, _ = context.solution_info(kwargs)
         
         # Determine output path - use .mmd extension
         output_path = Path(output_path)
@@ -323,17 +344,59 @@ class DomainModelDiagramSynchronizer:
             # If .md extension, change to .mmd
             output_path = output_path.with_suffix('.mmd')
         
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(mermaid_content)
+        def render_content() -> str:
+            domain_concepts = context.concepts
+            module_mapping = context.normalized_modules  # original_module -> normalized_module
+            
+            # Generate Mermaid diagram grouped by module
+            mermaid_classes = []
+            mermaid_relationships = []
+            seen_relationships = set()
+            
+            # Generate classes grouped by module using namespace blocks
+            for module, concepts_in_module in sorted(context.concepts_by_module.items()):
+                normalized_module = module_mapping[module]
+                
+                # Start module namespace block
+                module_block = [f"    namespace {normalized_module} {{"]
+                
+                for concept_name, concept in concepts_in_module:
+                    responsibilities = concept.get('responsibilities', [])
+                    resp_methods = []
+                    for resp in responsibilities:
+                        resp_name = resp.get('name', '').replace(' ', '_').lower()
+                        resp_methods.append(f"            +{resp_name}()")
+                    
+                    # Class definition with methods - single closing brace
+                    if resp_methods:
+                        class_def = f"        class {concept_name} {{\n" + "\n".join(resp_methods) + "\n        }"
+                    else:
+                        class_def = f"        class {concept_name}"
+                    module_block.append(class_def)
+                
+                # Close module namespace block
+                module_block.append("    }")
+                mermaid_classes.extend(module_block)
+                mermaid_classes.append("")  # Blank line between modules
+            
+            # Generate relationships using original class names (Mermaid handles module namespace resolution)
+            for concept_name, concept in domain_concepts.items():
+                responsibilities = concept.get('responsibilities', [])
+                
+                for resp in responsibilities:
+                    collaborators = resp.get('collaborators', [])
+                    for collab in collaborators:
+                        if collab in domain_concepts:
+                            # Use original class names - Mermaid will resolve module namespaces automatically
+                            rel_key = f"{concept_name}->{collab}"
+                            if rel_key not in seen_relationships:
+                                seen_relationships.add(rel_key)
+                                mermaid_relationships.append(f"    {concept_name} --> {collab} : uses")
+            
+            # Generate pure Mermaid syntax (no markdown wrapper)
+            return "classDiagram\n" + "\n".join(mermaid_classes) + "\n    \n    %% Associations\n" + "\n".join(mermaid_relationships)
         
-        return {
-            'output_path': str(output_path),
-            'summary': {
-                'domain_concepts': len(domain_concepts),
-                'file': str(output_path.name)
-            }
-        }
+        return context.write_output(output_path, render_content())
 
 
 class DomainModelOutlineSynchronizer:
@@ -354,53 +417,34 @@ class DomainModelOutlineSynchronizer:
         Returns:
             Dictionary with output_path and summary
         """
-        input_path = Path(input_path)
-        project_path = kwargs.get('project_path', input_path.parent.parent.parent)
-        project_path = Path(project_path)
-        
-        domain_concepts = _load_domain_concepts(input_path)
-        
-        # Group concepts by module
-        concepts_by_module = {}
-        for concept_name, concept in domain_concepts.items():
-            module = concept.get('module', 'Unknown')
-            if module not in concepts_by_module:
-                concepts_by_module[module] = []
-            concepts_by_module[module].append((concept_name, concept))
-        
-        # Generate outline grouped by module
-        outline_lines = []
-        for module in sorted(concepts_by_module.keys()):
-            outline_lines.append(f"## Module: {module}")
-            outline_lines.append("")
-            
-            concepts_in_module = sorted(concepts_by_module[module], key=lambda x: x[0])
-            for concept_name, concept in concepts_in_module:
-                outline_lines.append(concept_name)
-                for resp in concept.get('responsibilities', []):
-                    collaborators = resp.get('collaborators', [])
-                    collab_str = ",".join(collaborators) if collaborators else ""
-                    outline_lines.append(f"    {resp.get('name', '')}: {collab_str}")
-                outline_lines.append("")
-            
-            outline_lines.append("")  # Extra blank line between modules
-        
-        content = "\n".join(outline_lines)
-        
+        context = DomainModelBuildContext.load(input_path, kwargs.get('project_path'))
+        return self.render_from_context(context, output_path, **kwargs)
+    
+    def render_from_context(self, context: DomainModelBuildContext, output_path: Union[str, Path], **kwargs) -> Dict[str, Any]:
         # Determine output path
         output_path = Path(output_path)
         if output_path.is_dir() or not output_path.suffix:
             # If directory or no extension, use domain_outline.md
             output_path = output_path / 'domain_outline.md'
         
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        def render_content() -> str:
+            # Generate outline grouped by module
+            outline_lines = []
+            for module, concepts_in_module in sorted(context.concepts_by_module.items()):
+                outline_lines.append(f"## Module: {module}")
+                outline_lines.append("")
+                
+                for concept_name, concept in concepts_in_module:
+                    outline_lines.append(concept_name)
+                    for resp in concept.get('responsibilities', []):
+                        collaborators = resp.get('collaborators', [])
+                        collab_str = ",".join(collaborators) if collaborators else ""
+                        outline_lines.append(f"    {resp.get('name', '')}: {collab_str}")
+                    outline_lines.append("")
+                
+                outline_lines.append("")  # Extra blank line between modules
+            
+            return "\n".join(outline_lines)
         
-        return {
-            'output_path': str(output_path),
-            'summary': {
-                'domain_concepts': len(domain_concepts),
-                'file': str(output_path.name)
-            }
-        }
+        return context.write_output(output_path, render_content())
+
@@ -0,0 +1,89 @@
+"""
+Story Graph Projection
+
+Index over a story graph's epics that resolves story names to their epic/sub-epic path and
+builds increment-filtered views of the epics without copying them.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+StoryPosition = Tuple[int, int, int, int]  # (epic, sub_epic, story_group, story) indices
+
+
+class StoryGraphProjection:
+    """
+    One pass over the epics records, per story name, the first (epic_name, sub_epic_name) that contains it
+    and, per 'epic|sub_epic|story' key, where that story sits in a story group.
+
+    Projections are shallow: epics, sub-epics and story groups in the result are new dicts with their own
+    'sub_epics', 'story_groups' or 'stories' lists, and every other value (stories and nested sub-epics
+    included) is shared with the source graph. Build one projection per render and copy a shared value
+    before changing it, as the renderer does when it orders nested sub-epics.
+    """
+
+    def __init__(self, epics: List[Dict[str, Any]]):
+        self._epics = epics
+        self._paths: Dict[str, Tuple[str, str]] = {}
+        self._positions: Dict[str, List[StoryPosition]] = {}
+        for epic_idx, epic in enumerate(epics):
+            epic_name = epic.get('name', '')
+            for sub_epic_idx, sub_epic in enumerate(epic.get('sub_epics', [])):
+                sub_epic_name = sub_epic.get('name', '')
+                for group_idx, story_group in enumerate(sub_epic.get('story_groups', [])):
+                    for story_idx, story in enumerate(story_group.get('stories', [])):
+                        story_name = story.get('name', '')
+                        if story_name:
+                            self._paths.setdefault(story_name, (epic_name, sub_epic_name))
+                        key = f"{epic_name}|{sub_epic_name}|{story_name}"
+                        self._positions.setdefault(key, []).append((epic_idx, sub_epic_idx, group_idx, story_idx))
+                for story in sub_epic.get('stories', []):
+                    story_name = story.get('name')
+                    if story_name:
+                        self._paths.setdefault(story_name, (epic_name, sub_epic_name))
+
+    def story_path(self, story_name: str) -> Tuple[Optional[str], Optional[str]]:
+        """(epic_name, sub_epic_name) of the first sub-epic containing story_name, or (None, None)."""
+        return self._paths.get(story_name, (None, None))
+
+    def story_keys(self, increments: Iterable[Dict[str, Any]]) -> Set[str]:
+        """'epic|sub_epic|story' keys of the increments' stories that exist in the epics."""
+        keys = set()
+        for increment in increments:
+            for story in increment.get('stories', []):
+                story_name = story.get('name', '')
+                if story_name:
+                    epic_name, sub_epic_name = self.story_path(story_name)
+                    if epic_name and sub_epic_name:
+                        keys.add(f"{epic_name}|{sub_epic_name}|{story_name}")
+        return keys
+
+    def project(self, story_keys: Set[str], keep_empty: bool = False) -> List[Dict[str, Any]]:
+        """
+        Epics whose story groups hold only the stories in story_keys, in graph order.
+
+        With keep_empty every epic, sub-epic and story group is kept, emptied where needed; otherwise only
+        the ones holding a selected story are, so the work is proportional to the selection.
+        """
+        selected: Dict[int, Dict[int, Dict[int, List[int]]]] = {}
+        for key in story_keys:
+            for epic_idx, sub_epic_idx, group_idx, story_idx in self._positions.get(key, ()):
+                selected.setdefault(epic_idx, {}).setdefault(sub_epic_idx, {}).setdefault(group_idx, []).append(story_idx)
+
+        projected_epics = []
+        for epic_idx in (range(len(self._epics)) if keep_empty else sorted(selected)):
+            epic = self._epics[epic_idx]
+            selected_sub_epics = selected.get(epic_idx, {})
+            sub_epics = epic.get('sub_epics', [])
+            projected_sub_epics = []
+            for sub_epic_idx in (range(len(sub_epics)) if keep_empty else sorted(selected_sub_epics)):
+                sub_epic = sub_epics[sub_epic_idx]
+                selected_groups = selected_sub_epics.get(sub_epic_idx, {})
+                story_groups = sub_epic.get('story_groups', [])
+                projected_groups = []
+                for group_idx in (range(len(story_groups)) if keep_empty else sorted(selected_groups)):
+                    story_group = story_groups[group_idx]
+                    stories = story_group.get('stories', [])
+                    projected_groups.append({**story_group, 'stories': [stories[i] for i in sorted(selected_groups.get(group_idx, ()))]})
+                projected_sub_epics.append({**sub_epic, 'story_groups': projected_groups})
+            projected_epics.append({**epic, 'sub_epics': projected_sub_epics})
+        return projected_epics
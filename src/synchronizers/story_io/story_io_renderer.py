@@ -11,6 +11,9 @@ import xml.etree.ElementTree as ET
 from xml.dom import minidom
 import sys
 
+from .story_io_graph_projection import StoryGraphProjection
+from .story_io_layout_grid import LayoutOccupancyGrid
+
 
 class DrawIORenderer:
     """
@@ -105,30 +108,6 @@ class DrawIORenderer:
             return feature['estimated_stories']
         return 0
     
-    @staticmethod
-    def _find_story_path(story_name: str, epics: List[Dict[str, Any]]) -> tuple:
-        """
-        Find the epic and sub_epic path for a story by name.
-        Returns (epic_name, sub_epic_name) or (None, None) if not found.
-        """
-        def get_sub_epics(epic):
-            return epic.get('sub_epics', [])
-        
-        for epic in epics:
-            epic_name = epic.get('name', '')
-            for sub_epic in get_sub_epics(epic):
-                sub_epic_name = sub_epic.get('name', '')
-                # Check story_groups
-                for story_group in sub_epic.get('story_groups', []):
-                    for story in story_group.get('stories', []):
-                        if story.get('name') == story_name:
-                            return (epic_name, sub_epic_name)
-                # Check direct stories
-                for story in sub_epic.get('stories', []):
-                    if story.get('name') == story_name:
-                        return (epic_name, sub_epic_name)
-        return (None, None)
-    
     @staticmethod
     def _traverse_all_stories(story: Dict[str, Any], collected: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -352,54 +331,11 @@ class DrawIORenderer:
             if matching_increment:
                 # Build set of story keys (epic_name|sub_epic_name|story_name) that belong to the increment
                 # Increments now have flat stories array (no nested epics/sub_epics)
-                stories_in_increment = set()
-                all_epics_for_lookup = story_graph.get("epics", [])
-                for story in matching_increment.get("stories", []):
-                    story_name = story.get("name", "")
-                    if story_name:
-                        # Find epic/sub_epic path for this story
-                        epic_name, sub_epic_name = self._find_story_path(story_name, all_epics_for_lookup)
-                        if epic_name and sub_epic_name:
-                            story_key = f"{epic_name}|{sub_epic_name}|{story_name}"
-                            stories_in_increment.add(story_key)
-                
-                # Filter stories: show ALL epics and sub_epics, but filter stories to only those in increment
-                import copy
-                filtered_epics = []
-                for epic in story_graph.get("epics", []):
-                    epic_name = epic.get("name", "")
-                    filtered_epic = copy.deepcopy(epic)
-                    filtered_epic["sub_epics"] = []
-                    
-                    # Include ALL sub_epics
-                    for sub_epic in epic.get("sub_epics", []):
-                        sub_epic_name = sub_epic.get("name", "")
-                        filtered_sub_epic = copy.deepcopy(sub_epic)
-                        filtered_sub_epic["story_groups"] = []
-                        
-                        # Filter story_groups: only include stories that are in the increment
-                        for story_group in sub_epic.get("story_groups", []):
-                            filtered_stories = []
-                            for story in story_group.get("stories", []):
-                                story_name = story.get("name", "")
-                                story_key = f"{epic_name}|{sub_epic_name}|{story_name}"
-                                if story_key in stories_in_increment:
-                                    filtered_stories.append(story)
-                            
-                            # Include story_group only if it has stories after filtering
-                            if filtered_stories:
-                                filtered_group = copy.deepcopy(story_group)
-                                filtered_group["stories"] = filtered_stories
-                                filtered_sub_epic["story_groups"].append(filtered_group)
-                        
-                        # Include sub_epic only if it has story_groups after filtering
-                        if filtered_sub_epic["story_groups"]:
-                            filtered_epic["sub_epics"].append(filtered_sub_epic)
-                    
-                    # Include epic only if it has sub_epics after filtering
-                    if filtered_epic["sub_epics"]:
-                        filtered_epics.append(filtered_epic)
+                projection = StoryGraphProjection(story_graph.get("epics", []))
+                stories_in_increment = projection.story_keys([matching_increment])
                 
+                # Filter stories to only those in increment, dropping story_groups, sub_epics and epics left empty
+                filtered_epics = projection.project(stories_in_increment)
                 filtered_graph["epics"] = filtered_epics
         
         # Ensure output directory exists
@@ -491,52 +427,12 @@ class DrawIORenderer:
             # CRITICAL: For discovery mode, filter stories to only those in the specified increment(s)
             # Build set of story keys (epic_name|sub_epic_name|story_name) that belong to filtered increments
             # Increments now have flat stories array (no nested epics/sub_epics)
-            stories_in_increments = set()
-            all_epics_for_lookup = filtered_graph.get("epics", [])
-            for increment in filtered_increments:
-                for story in increment.get("stories", []):
-                    story_name = story.get("name", "")
-                    if story_name:
-                        # Find epic/sub_epic path for this story
-                        epic_name, sub_epic_name = self._find_story_path(story_name, all_epics_for_lookup)
-                        if epic_name and sub_epic_name:
-                            story_key = f"{epic_name}|{sub_epic_name}|{story_name}"
-                            stories_in_increments.add(story_key)
-            
-            # Filter stories: show ALL epics and sub_epics, but filter stories to only those in increment(s)
-            import copy
-            filtered_epics = []
-            for epic in story_graph.get("epics", []):
-                epic_name = epic.get("name", "")
-                filtered_epic = copy.deepcopy(epic)
-                filtered_epic["sub_epics"] = []
-                
-                # Include ALL sub_epics
-                for sub_epic in epic.get("sub_epics", []):
-                    sub_epic_name = sub_epic.get("name", "")
-                    filtered_sub_epic = copy.deepcopy(sub_epic)
-                    filtered_sub_epic["story_groups"] = []
-                    
-                    # Filter story_groups: only include stories that are in the increment(s)
-                    for story_group in sub_epic.get("story_groups", []):
-                        filtered_stories = []
-                        for story in story_group.get("stories", []):
-                            story_name = story.get("name", "")
-                            story_key = f"{epic_name}|{sub_epic_name}|{story_name}"
-                            if story_key in stories_in_increments:
-                                filtered_stories.append(story)
-                        
-                        # Include story_group even if empty (to preserve structure)
-                        filtered_group = copy.deepcopy(story_group)
-                        filtered_group["stories"] = filtered_stories
-                        filtered_sub_epic["story_groups"].append(filtered_group)
-                    
-                    # Always include sub_epic (even if it has no stories after filtering)
-                    filtered_epic["sub_epics"].append(filtered_sub_epic)
-                
-                # Always include epic (even if it has no stories after filtering)
-                filtered_epics.append(filtered_epic)
+            projection = StoryGraphProjection(filtered_graph.get("epics", []))
+            stories_in_increments = projection.story_keys(filtered_increments)
             
+            # Filter stories: show ALL epics, sub_epics and story_groups (even if empty, to preserve structure),
+            # but filter stories to only those in increment(s)
+            filtered_epics = projection.project(stories_in_increments, keep_empty=True)
             filtered_graph["epics"] = filtered_epics
         
         # CRITICAL: Auto-generate filename with increment names/numbers
@@ -1143,7 +1039,8 @@ class DrawIORenderer:
                     for idx, nested in enumerate(nested_with_stories):
                         # Create a composite order: parent_order + fractional offset based on relative position
                         # This ensures nested sub-epics appear where parent would be, in correct relative order
-                        nested['_render_order'] = parent_order + (nested.get('sequential_order', 999) / 10000.0)
+                        # Set on a copy: nested sub-epics are shared with the caller's story graph and its projections
+                        nested_with_stories[idx] = {**nested, '_render_order': parent_order + (nested.get('sequential_order', 999) / 10000.0)}
                     features_to_render.extend(nested_with_stories)
                 # Features with no story_groups and no nested sub_epics are skipped
             
@@ -1611,7 +1508,7 @@ class DrawIORenderer:
                     previous_group_start_x = None  # Track start X of previous group (for "or" connector alignment)
                     previous_group_has_users = False  # Track if previous group has users (for spacing with "or" connector)
                     previous_story_users = None
-                    rendered_positions = []  # Track all rendered element positions (x, y, width, height) for collision detection
+                    rendered_positions = LayoutOccupancyGrid()  # Track all rendered element positions (x, y, width, height) for collision detection
                     
                     # Track shown users at feature/column level - each user should only appear once per column
                     feature_shown_users = set()
@@ -1649,12 +1546,8 @@ class DrawIORenderer:
                                             user_x = story_x + user_idx * self.STORY_SPACING_X
                                             
                                             # Check for collision with any rendered element
-                                            for (rx, ry, rw, rh) in rendered_positions:
-                                                if (user_x < rx + rw and user_x + 50 > rx and
-                                                    user_y < ry + rh and user_y + 50 > ry):
-                                                    collision = True
-                                                    break
-                                            if collision:
+                                            if rendered_positions.overlaps(user_x, user_y, 50, 50):
+                                                collision = True
                                                 break
                                     if collision:
                                         break
@@ -1702,15 +1595,9 @@ class DrawIORenderer:
                                             user_x = story_x + user_idx * self.STORY_SPACING_X
                                             user_y = story_y - self.USER_LABEL_OFFSET
                                             
-                                            # Check for collision with any rendered element
-                                            for (rx, ry, rw, rh) in rendered_positions:
-                                                # Check if user box (50x50) overlaps with existing element
-                                                if (user_x < rx + rw and user_x + 50 > rx and
-                                                    user_y < ry + rh and user_y + 50 > ry):
-                                                    collision = True
-                                                    break
-                                            
-                                            if collision:
+                                            # Check if user box (50x50) overlaps with any rendered element
+                                            if rendered_positions.overlaps(user_x, user_y, 50, 50):
+                                                collision = True
                                                 break
                                     
                                     if collision:
@@ -1753,18 +1640,8 @@ class DrawIORenderer:
                                 user_width = self.STORY_WIDTH
                                 user_height = self.STORY_HEIGHT
                                 
-                                # Check for collision with any rendered element
-                                collision_detected = True
-                                test_user_y = initial_user_y
-                                while collision_detected:
-                                    collision_detected = False
-                                    for (rx, ry, rw, rh) in rendered_positions:
-                                        # Check if user box would overlap with existing element
-                                        if (group_start_x < rx + rw and group_start_x + user_width > rx and
-                                            test_user_y < ry + rh and test_user_y + user_height > ry):
-                                            collision_detected = True
-                                            test_user_y += 10
-                                            break
+                                # Move the user box down in 10px steps until it overlaps no rendered element
+                                test_user_y = rendered_positions.first_free_y(group_start_x, initial_user_y, user_width, user_height)
                                 
                                 # Calculate adjustment needed
                                 adjustment = test_user_y - initial_user_y
@@ -1833,17 +1710,8 @@ class DrawIORenderer:
                                     # Check for collision with any rendered element and adjust position if needed
                                     user_width = self.STORY_WIDTH
                                     user_height = self.STORY_HEIGHT
-                                    collision_detected = True
-                                    while collision_detected:
-                                        collision_detected = False
-                                        for (rx, ry, rw, rh) in rendered_positions:
-                                            # Check if user box overlaps with existing element
-                                            if (user_x < rx + rw and user_x + user_width > rx and
-                                                user_y < ry + rh and user_y + user_height > ry):
-                                                collision_detected = True
-                                                # Move user down by 10px to avoid collision
-                                                user_y += 10
-                                                break
+                                    # Move user down by 10px until it overlaps no rendered element
+                                    user_y = rendered_positions.first_free_y(user_x, user_y, user_width, user_height)
                                     
                                     user_label = ET.SubElement(root_elem, 'mxCell',
                                                               id=f'user_e{epic_idx}f{feat_idx}s{story_idx}_{user}',
@@ -1856,7 +1724,7 @@ class DrawIORenderer:
                                     user_geom.set('as', 'geometry')
                                     
                                     # Track user position for collision detection
-                                    rendered_positions.append((user_x, user_y, self.STORY_WIDTH, self.STORY_HEIGHT))
+                                    rendered_positions.insert(user_x, user_y, self.STORY_WIDTH, self.STORY_HEIGHT)
                                     
                                     # Track the bottom of the rightmost/lowest user
                                     if user_bottom_y is None or user_y + user_height > user_bottom_y:
@@ -1882,7 +1750,7 @@ class DrawIORenderer:
                             story_geom.set('as', 'geometry')
                             
                             # Track story position for collision detection
-                            rendered_positions.append((story_x, story_y, self.STORY_WIDTH, self.STORY_HEIGHT))
+                            rendered_positions.insert(story_x, story_y, self.STORY_WIDTH, self.STORY_HEIGHT)
                             
                             # Track first story cell for inserting background rectangles before it
                             if first_story_cell_ref is None:
@@ -2532,7 +2400,7 @@ class DrawIORenderer:
             
             # Build story-to-increment mapping from increments data
             # Increments now have flat stories array (no nested epics/sub_epics)
-            all_epics_for_lookup = story_graph.get('epics', [])
+            projection = StoryGraphProjection(story_graph.get('epics', []))
             for inc_idx, increment in enumerate(story_graph.get('increments', []), 1):
                 # Process flat stories array
                 for story in increment.get('stories', []):
@@ -2540,7 +2408,7 @@ class DrawIORenderer:
                     if not story_name:
                         continue
                     # Find epic/sub_epic path for this story
-                    epic_name, sub_epic_name = self._find_story_path(story_name, all_epics_for_lookup)
+                    epic_name, sub_epic_name = projection.story_path(story_name)
                     if epic_name and sub_epic_name:
                         # Story exists in epics - use full path
                         story_key = f"{epic_name}|{sub_epic_name}|{story_name}"
@@ -3408,7 +3276,8 @@ class DrawIORenderer:
                     for idx, nested in enumerate(nested_with_stories):
                         # Create a composite order: parent_order + fractional offset based on relative position
                         # This ensures nested sub-epics appear where parent would be, in correct relative order
-                        nested['_render_order'] = parent_order + (nested.get('sequential_order', 999) / 10000.0)
+                        # Set on a copy: nested sub-epics are shared with the caller's story graph and its projections
+                        nested_with_stories[idx] = {**nested, '_render_order': parent_order + (nested.get('sequential_order', 999) / 10000.0)}
                     features_to_render.extend(nested_with_stories)
                 # Features with no story_groups and no nested sub_epics are skipped
             
@@ -3876,7 +3745,7 @@ class DrawIORenderer:
                     previous_group_start_x = None  # Track start X of previous group (for "or" connector alignment)
                     previous_group_has_users = False  # Track if previous group has users (for spacing with "or" connector)
                     previous_story_users = None
-                    rendered_positions = []  # Track all rendered element positions (x, y, width, height) for collision detection
+                    rendered_positions = LayoutOccupancyGrid()  # Track all rendered element positions (x, y, width, height) for collision detection
                     
                     # Track shown users at feature/column level - each user should only appear once per column
                     feature_shown_users = set()
@@ -3914,12 +3783,8 @@ class DrawIORenderer:
                                             user_x = story_x + user_idx * self.STORY_SPACING_X
                                             
                                             # Check for collision with any rendered element
-                                            for (rx, ry, rw, rh) in rendered_positions:
-                                                if (user_x < rx + rw and user_x + 50 > rx and
-                                                    user_y < ry + rh and user_y + 50 > ry):
-                                                    collision = True
-                                                    break
-                                            if collision:
+                                            if rendered_positions.overlaps(user_x, user_y, 50, 50):
+                                                collision = True
                                                 break
                                     if collision:
                                         break
@@ -3967,15 +3832,9 @@ class DrawIORenderer:
                                             user_x = story_x + user_idx * self.STORY_SPACING_X
                                             user_y = story_y - self.USER_LABEL_OFFSET
                                             
-                                            # Check for collision with any rendered element
-                                            for (rx, ry, rw, rh) in rendered_positions:
-                                                # Check if user box (50x50) overlaps with existing element
-                                                if (user_x < rx + rw and user_x + 50 > rx and
-                                                    user_y < ry + rh and user_y + 50 > ry):
-                                                    collision = True
-                                                    break
-                                            
-                                            if collision:
+                                            # Check if user box (50x50) overlaps with any rendered element
+                                            if rendered_positions.overlaps(user_x, user_y, 50, 50):
+                                                collision = True
                                                 break
                                     
                                     if collision:
@@ -4018,18 +3877,8 @@ class DrawIORenderer:
                                 user_width = self.STORY_WIDTH
                                 user_height = self.STORY_HEIGHT
                                 
-                                # Check for collision with any rendered element
-                                collision_detected = True
-                                test_user_y = initial_user_y
-                                while collision_detected:
-                                    collision_detected = False
-                                    for (rx, ry, rw, rh) in rendered_positions:
-                                        # Check if user box would overlap with existing element
-                                        if (group_start_x < rx + rw and group_start_x + user_width > rx and
-                                            test_user_y < ry + rh and test_user_y + user_height > ry):
-                                            collision_detected = True
-                                            test_user_y += 10
-                                            break
+                                # Move the user box down in 10px steps until it overlaps no rendered element
+                                test_user_y = rendered_positions.first_free_y(group_start_x, initial_user_y, user_width, user_height)
                                 
                                 # Calculate adjustment needed
                                 adjustment = test_user_y - initial_user_y
@@ -4098,17 +3947,8 @@ class DrawIORenderer:
                                     # Check for collision with any rendered element and adjust position if needed
                                     user_width = self.STORY_WIDTH
                                     user_height = self.STORY_HEIGHT
-                                    collision_detected = True
-                                    while collision_detected:
-                                        collision_detected = False
-                                        for (rx, ry, rw, rh) in rendered_positions:
-                                            # Check if user box overlaps with existing element
-                                            if (user_x < rx + rw and user_x + user_width > rx and
-                                                user_y < ry + rh and user_y + user_height > ry):
-                                                collision_detected = True
-                                                # Move user down by 10px to avoid collision
-                                                user_y += 10
-                                                break
+                                    # Move user down by 10px until it overlaps no rendered element
+                                    user_y = rendered_positions.first_free_y(user_x, user_y, user_width, user_height)
                                     
                                     user_label = ET.SubElement(root_elem, 'mxCell',
                                                               id=f'user_e{epic_idx}f{feat_idx}s{story_idx}_{user}',
@@ -4121,7 +3961,7 @@ class DrawIORenderer:
                                     user_geom.set('as', 'geometry')
                                     
                                     # Track user position for collision detection
-                                    rendered_positions.append((user_x, user_y, self.STORY_WIDTH, self.STORY_HEIGHT))
+                                    rendered_positions.insert(user_x, user_y, self.STORY_WIDTH, self.STORY_HEIGHT)
                                     
                                     # Track the bottom of the rightmost/lowest user
                                     if user_bottom_y is None or user_y + user_height > user_bottom_y:
@@ -4147,7 +3987,7 @@ class DrawIORenderer:
                             story_geom.set('as', 'geometry')
                             
                             # Track story position for collision detection
-                            rendered_positions.append((story_x, story_y, self.STORY_WIDTH, self.STORY_HEIGHT))
+                            rendered_positions.insert(story_x, story_y, self.STORY_WIDTH, self.STORY_HEIGHT)
                             
                             # Track first story cell for inserting background rectangles before it
                             if first_story_cell_ref is None:
@@ -0,0 +1,68 @@
+"""
+Story Test File Index
+
+Parses a pytest file once into its top-level test classes, their methods and line spans, so the story tests
+synchronizer can plan what a story still needs and splice only new code into the existing source. Indexes are
+kept in a FileVersionCache, so a file is re-parsed only when it changes.
+"""
+import ast
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from file_version_cache import FileVersionCache
+
+
+@dataclass(frozen=True)
+class IndexedTestClass:
+    name: str
+    start: int  # 1-based line of the class statement, or of its first decorator
+    end: int  # 1-based last line of the class body
+    methods: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class StoryTestFileIndex:
+    lines: Tuple[str, ...]  # source lines with their line endings
+    classes: Dict[str, IndexedTestClass]
+
+    @classmethod
+    def parse(cls, source: str) -> 'StoryTestFileIndex':
+        """Index of source; raises SyntaxError when it is not valid Python."""
+        classes = {}
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.ClassDef) and node.name not in classes:
+                methods = tuple(child.name for child in node.body if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)))
+                start = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+                classes[node.name] = IndexedTestClass(node.name, start, node.end_lineno, methods)
+        return cls(tuple(source.splitlines(keepends=True)), classes)
+
+    @property
+    def source(self) -> str:
+        return ''.join(self.lines)
+
+    def find_class(self, name: str) -> Optional[IndexedTestClass]:
+        return self.classes.get(name)
+
+    def splice(self, after_class: Dict[str, List[str]], appended: List[str]) -> str:
+        """The source with each block in after_class[name] inserted after that class and appended blocks added at the end.
+
+        Each block is separated from the code before it by one blank line.
+        """
+        lines = list(self.lines)
+        if lines and not lines[-1].endswith('\n'):
+            lines[-1] += '\n'
+        # Bottom-up, so the line numbers of classes still to splice stay valid
+        for name in sorted(after_class, key=lambda class_name: self.classes[class_name].end, reverse=True):
+            end = self.classes[name].end
+            lines[end:end] = [f'\n{block}\n' for block in after_class[name]]
+        lines.extend(f'\n{block}\n' for block in appended)
+        return ''.join(lines)
+
+
+_indexes = FileVersionCache(StoryTestFileIndex.parse)
+
+
+def load_story_test_file_index(path: Path) -> StoryTestFileIndex:
+    """Index of the test file at path, served from memory while the file is unchanged."""
+    return _indexes.get(path)
@@ -3,11 +3,29 @@ Story Tests Synchronizer
 
 Renders pytest test files from story graph JSON.
 Generates test files organized by sub-epic with test classes matching stories.
+Existing test files are indexed once and only the classes and methods of new stories
+and scenarios are spliced into them; files with nothing new are left untouched, and a
+file whose stories and contents are both unchanged since the last sync is not read at all.
 """
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List
+from typing import Dict, Any, Optional, Tuple, Union, List
+import hashlib
 import json
+import logging
+import os
 import re
+import time
+
+from file_version_cache import is_racy
+
+from .story_test_file_index import StoryTestFileIndex, load_story_test_file_index
+
+logger = logging.getLogger(__name__)
+
+# Bump when generated test code changes for the same stories, so files synced by older code are re-planned
+STORY_TESTS_RENDER_VERSION = 1
+SYNC_MANIFEST = Path('.agile_bots') / 'cache' / 'story_tests_outputs.json'
 
 
 def format_test_method_from_scenario(scenario, scenario_name, test_method_name, background_steps=None):
@@ -165,37 +183,10 @@ def create_test_file_content(sub_epic, stories, epic_name):
     # Test classes
     test_classes = []
     for story in stories:
-        story_name = story.get('name', '')
-        test_class = story.get('test_class', f'Test{story_name.replace(" ", "")}')
-        
-        # Get scenarios and scenario outlines
-        scenarios = story.get('scenarios', [])
-        scenario_outlines = story.get('scenario_outlines', [])
-        
-        # Get common background
-        all_scenarios = scenarios + scenario_outlines
-        common_background = get_common_background(all_scenarios)
-        
-        # Class docstring
-        class_docstring = f'class {test_class}:'
-        class_docstring += f'\n    """Story: {story_name} - Tests {story_name.lower()}."""'
-        
-        test_classes.append(class_docstring)
+        test_class_block, methods = format_test_class(story)
+        test_classes.append(test_class_block)
         test_classes.append("")
-        
-        # Add test methods for scenarios
-        for scenario in scenarios:
-            scenario_name = scenario.get('name', '')
-            test_method = scenario.get('test_method', f'test_{scenario_name.lower().replace(" ", "_")}')
-            method_content = format_test_method_from_scenario(scenario, scenario_name, test_method, common_background)
-            test_classes.append(method_content)
-            test_classes.append("")
-        
-        # Add test methods for scenario outlines
-        for scenario_outline in scenario_outlines:
-            scenario_name = scenario_outline.get('name', '')
-            test_method = scenario_outline.get('test_method', f'test_{scenario_name.lower().replace(" ", "_")}')
-            method_content = format_test_method_from_scenario_outline(scenario_outline, scenario_name, test_method, common_background)
+        for _, method_content in methods:
             test_classes.append(method_content)
             test_classes.append("")
     
@@ -208,6 +199,77 @@ def create_test_file_content(sub_epic, stories, epic_name):
     return content
 
 
+def story_test_class_name(story):
+    """Name of the test class for a story."""
+    return story.get('test_class', f'Test{story.get("name", "").replace(" ", "")}')
+
+
+def story_test_method_name(scenario):
+    """Name of the test method for a scenario or scenario outline."""
+    return scenario.get('test_method', f'test_{scenario.get("name", "").lower().replace(" ", "_")}')
+
+
+def format_test_class(story):
+    """Class statement with docstring for a story, and (method name, method source) for each of its scenarios."""
+    story_name = story.get('name', '')
+    scenarios = story.get('scenarios', [])
+    scenario_outlines = story.get('scenario_outlines', [])
+    common_background = get_common_background(scenarios + scenario_outlines)
+    
+    class_block = f'class {story_test_class_name(story)}:\n    """Story: {story_name} - Tests {story_name.lower()}."""'
+    methods = []
+    for scenario in scenarios:
+        method_name = story_test_method_name(scenario)
+        methods.append((method_name, format_test_method_from_scenario(scenario, scenario.get('name', ''), method_name, common_background)))
+    for scenario_outline in scenario_outlines:
+        method_name = story_test_method_name(scenario_outline)
+        methods.append((method_name, format_test_method_from_scenario_outline(scenario_outline, scenario_outline.get('name', ''), method_name, common_background)))
+    return class_block, methods
+
+
+@dataclass
+class StoryTestPlan:
+    """What synchronizing one story does to its test file: add its class, keep it, or update it with new methods."""
+    story_name: str
+    test_class: str
+    action: str
+    new_methods: List[str] = field(default_factory=list)
+    source: str = ''  # class or method source to splice in, blocks separated by blank lines
+
+
+def plan_story_tests(index: Optional[StoryTestFileIndex], stories) -> List[StoryTestPlan]:
+    """Plan for each story against the indexed test file (None when the file does not exist yet)."""
+    plans = []
+    for story in stories:
+        story_name = story.get('name', '')
+        class_name = story_test_class_name(story)
+        class_block, methods = format_test_class(story)
+        indexed_class = index.find_class(class_name) if index else None
+        if indexed_class is None:
+            source = "\n\n".join([class_block] + [content for _, content in methods])
+            plans.append(StoryTestPlan(story_name, class_name, 'add', [name for name, _ in methods], source))
+            continue
+        missing = [(name, content) for name, content in methods if name not in indexed_class.methods]
+        if missing:
+            source = "\n\n".join(content for _, content in missing)
+            plans.append(StoryTestPlan(story_name, class_name, 'update', [name for name, _ in missing], source))
+        else:
+            plans.append(StoryTestPlan(story_name, class_name, 'keep'))
+    return plans
+
+
+def apply_story_test_plans(index: StoryTestFileIndex, plans: List[StoryTestPlan]) -> str:
+    """Source of the indexed file with the plans' new methods spliced into their classes and new classes appended."""
+    after_class = {}
+    appended = []
+    for plan in plans:
+        if plan.action == 'update':
+            after_class.setdefault(plan.test_class, []).append(plan.source)
+        elif plan.action == 'add':
+            appended.append(plan.source)
+    return index.splice(after_class, appended)
+
+
 def extract_stories_from_sub_epic(sub_epic):
     """Extract all stories from a sub-epic."""
     stories = []
@@ -216,8 +278,26 @@ def extract_stories_from_sub_epic(sub_epic):
     return stories
 
 
-def process_sub_epic_for_tests(sub_epic, epic_name, output_dir):
-    """Process a sub-epic and generate test file."""
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _stories_fingerprint(stories) -> str:
+    return hashlib.sha256(repr((STORY_TESTS_RENDER_VERSION, json.dumps(stories, default=str))).encode('utf-8')).hexdigest()
+
+
+def process_sub_epic_for_tests(sub_epic, epic_name, output_dir, synced=None):
+    """Synchronize a sub-epic's test file: create it, splice new classes and methods into it, or leave it untouched.
+    
+    synced maps test file paths to what the last sync recorded for them; a file whose stories and on-disk
+    signature both match its entry is not read, unless it was modified too close to the sync for its mtime to be
+    trusted. Entries are updated in place.
+    Returns (test file path, 'created' | 'updated' | 'unchanged', story plans), or None when there is nothing to sync.
+    """
     # Only process lowest-level sub_epics (those with test_file field)
     if 'test_file' not in sub_epic:
         return None
@@ -231,17 +311,39 @@ def process_sub_epic_for_tests(sub_epic, epic_name, output_dir):
     if not stories:
         return None
     
-    # Generate test file content
-    content = create_test_file_content(sub_epic, stories, epic_name)
+    test_file_path = output_dir / test_file_name
+    synced = synced if synced is not None else {}
+    fingerprint = _stories_fingerprint(stories)
+    entry = synced.get(str(test_file_path))
+    signature = _file_signature(test_file_path)
+    if (entry is not None and signature is not None and entry.get('fingerprint') == fingerprint and entry.get('output') == list(signature)
+            and not is_racy(signature[0], entry.get('synced_ns', 0))):
+        return str(test_file_path), 'unchanged', [StoryTestPlan(story.get('name', ''), story_test_class_name(story), 'keep') for story in stories]
+    
+    if signature is not None:
+        try:
+            index = load_story_test_file_index(test_file_path)
+        except SyntaxError as e:
+            logger.warning(f'Leaving {test_file_path} untouched, it does not parse: {e}')
+            return str(test_file_path), 'unchanged', []
+        plans = plan_story_tests(index, stories)
+        if all(plan.action == 'keep' for plan in plans):
+            synced[str(test_file_path)] = {'fingerprint': fingerprint, 'output': list(signature), 'synced_ns': time.time_ns()}
+            return str(test_file_path), 'unchanged', plans
+        content = apply_story_test_plans(index, plans)
+        status = 'updated'
+    else:
+        plans = plan_story_tests(None, stories)
+        content = create_test_file_content(sub_epic, stories, epic_name)
+        status = 'created'
     
     # Write test file
-    test_file_path = output_dir / test_file_name
     test_file_path.parent.mkdir(parents=True, exist_ok=True)
-    
     with open(test_file_path, 'w', encoding='utf-8') as f:
         f.write(content)
+    synced[str(test_file_path)] = {'fingerprint': fingerprint, 'output': list(_file_signature(test_file_path)), 'synced_ns': time.time_ns()}
     
-    return str(test_file_path)
+    return str(test_file_path), status, plans
 
 
 class StoryTestsSynchronizer:
@@ -269,21 +371,30 @@ class StoryTestsSynchronizer:
         with open(input_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
+        from workspace_state_store import WorkspaceStateStore
+        project_path = Path(kwargs['project_path']) if kwargs.get('project_path') else input_path.parent.parent.parent
+        manifest_path = project_path / SYNC_MANIFEST
+        store = WorkspaceStateStore.shared()
+        try:
+            synced = store.read(manifest_path, {})
+        except ValueError:
+            synced = {}
+        recorded = dict(synced)
+        
         # Process all sub-epics
-        created_files = []
-        updated_files = []
+        files = {'created': [], 'updated': [], 'unchanged': []}
+        plans = []
         
         def process_recursive(epic, epic_name):
             """Recursively process sub-epics."""
             for sub_epic in epic.get('sub_epics', []):
                 # Check if this is a lowest-level sub_epic (has test_file field)
                 if 'test_file' in sub_epic:
-                    result = process_sub_epic_for_tests(sub_epic, epic_name, output_dir)
+                    result = process_sub_epic_for_tests(sub_epic, epic_name, output_dir, synced)
                     if result:
-                        if Path(result).exists():
-                            updated_files.append(result)
-                        else:
-                            created_files.append(result)
+                        test_file, status, file_plans = result
+                        files[status].append(test_file)
+                        plans.extend(file_plans)
                 # Recursively process nested sub-epics
                 if sub_epic.get('sub_epics'):
                     process_recursive(sub_epic, epic_name)
@@ -293,14 +404,24 @@ class StoryTestsSynchronizer:
             epic_name = epic.get('name', '')
             process_recursive(epic, epic_name)
         
+        if synced != recorded:
+            try:
+                with store.transaction(manifest_path) as manifest:
+                    manifest.update(synced)
+            except OSError as e:
+                logger.debug(f'Could not record synced test files in {manifest_path}: {e}')
+        
         return {
             'output_path': str(output_dir),
             'summary': {
-                'total_files': len(created_files) + len(updated_files),
-                'created_files': len(created_files),
-                'updated_files': len(updated_files)
+                'total_files': sum(len(paths) for paths in files.values()),
+                'created_files': len(files['created']),
+                'updated_files': len(files['updated']),
+                'unchanged_files': len(files['unchanged']),
+                'added_test_classes': sum(1 for plan in plans if plan.action == 'add'),
+                'added_test_methods': sum(len(plan.new_methods) for plan in plans)
             },
-            'created_files': created_files,
-            'updated_files': updated_files
+            'created_files': files['created'],
+            'updated_files': files['updated'],
+            'unchanged_files': files['unchanged']
         }
-
@@ -0,0 +1,236 @@
+"""Process-wide cache for the JSON state documents kept in the workspace.
+
+Documents are parsed through a FileVersionCache, so each one is parsed once per file version. Writes go through transactions: nested transactions on the same file
+share one document and the outermost one writes it with a temp file and rename, skipping the write when nothing
+changed. Inside deferred_writes, commits are collected as top-level key changes instead of written, so a worker
+process can hand them to its parent to apply in one place. Journals are append-only JSON lines files for event logs
+that must not be rewritten per event.
+"""
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from file_version_cache import CachedFile, FileVersionCache
+
+logger = logging.getLogger(__name__)
+
+NEW_FILE_MODE = 0o644
+
+
+def _copy_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _copy_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(item) for item in value]
+    return value
+
+
+class WorkspaceStateStore:
+
+    _shared: Optional['WorkspaceStateStore'] = None
+
+    def __init__(self):
+        self._documents = FileVersionCache(json.loads, encoding='utf-8-sig')
+        self._open_transactions: Dict[str, List[Any]] = {}
+        self._deferred: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def shared(cls) -> 'WorkspaceStateStore':
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def exists(self, path: Path) -> bool:
+        key = self._key(path)
+        return key in self._open_transactions or os.path.exists(key)
+
+    def read(self, path: Path, default: Any = None) -> Any:
+        """Copy of the document at path, or default when the file does not exist. Invalid JSON raises JSONDecodeError."""
+        with self._lock:
+            key = self._key(path)
+            if key in self._open_transactions:
+                return _copy_json(self._open_transactions[key][0])
+            document = self._load(key)
+            # Re-parsing the cached text is cheaper than copying the parsed document
+            return default if document is None else json.loads(document.text)
+
+    def peek(self, path: Path, default: Any = None) -> Any:
+        """Like read, but returns the cached document itself; callers must not modify it."""
+        with self._lock:
+            key = self._key(path)
+            if key in self._open_transactions:
+                return self._open_transactions[key][0]
+            document = self._load(key)
+            return default if document is None else document.value
+
+    def write(self, path: Path, data: Any) -> None:
+        with self._lock:
+            key = self._key(path)
+            entry = self._open_transactions.get(key)
+            if entry is None:
+                document = self._load(key) if self._deferred is not None else None
+                self._commit(key, data, json.loads(document.text) if document is not None else None)
+            elif isinstance(entry[0], dict) and isinstance(data, dict):
+                entry[0].clear()
+                entry[0].update(data)
+            else:
+                entry[0] = data
+
+    @contextmanager
+    def transaction(self, path: Path, default: Optional[Callable[[], Any]] = None) -> Iterator[Any]:
+        """Yield the document at path for in-place changes and write it once the outermost transaction on path exits.
+
+        A missing file starts from default() (an empty dict when no default is given). Nothing is written if the block
+        raises or leaves the document as it was on disk.
+        """
+        with self._lock:
+            key = self._key(path)
+            entry = self._open_transactions.get(key)
+            if entry is not None:
+                entry[1] += 1
+            else:
+                document = self._load(key)
+                data = json.loads(document.text) if document is not None else (default() if default else {})
+                baseline = json.loads(document.text) if document is not None and self._deferred is not None else None
+                entry = self._open_transactions[key] = [data, 1, baseline]
+            try:
+                yield entry[0]
+            except BaseException:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._open_transactions[key]
+                raise
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._open_transactions[key]
+                self._commit(key, entry[0], entry[2])
+
+    @contextmanager
+    def deferred_writes(self) -> Iterator[Dict[str, Dict[str, Any]]]:
+        """Collect commits made inside the block instead of writing them; yields the updates for apply_updates.
+
+        Per path, a dict document records the top-level keys it set and removed relative to the document it was
+        read from, so updates collected in different processes from the same file can all be applied.
+        """
+        with self._lock:
+            previous, self._deferred = self._deferred, {}
+            updates = self._deferred
+        try:
+            yield updates
+        finally:
+            with self._lock:
+                self._deferred = previous
+
+    def apply_updates(self, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Write updates collected by deferred_writes, merging key changes into each document as it is now."""
+        for key, update in updates.items():
+            if 'document' in update:
+                self.write(Path(key), update['document'])
+                continue
+            with self.transaction(Path(key)) as document:
+                document.update(update['set'])
+                for name in update['removed']:
+                    document.pop(name, None)
+
+    def _defer(self, key: str, data: Any, baseline: Any) -> None:
+        if not isinstance(data, dict) or not isinstance(baseline, (dict, type(None))):
+            self._deferred[key] = {'document': _copy_json(data)}
+            return
+        baseline = baseline or {}
+        update = self._deferred.setdefault(key, {'set': {}, 'removed': []})
+        if 'document' in update:
+            update['document'] = _copy_json(data)
+            return
+        for name, value in data.items():
+            if name not in baseline or baseline[name] != value:
+                update['set'][name] = _copy_json(value)
+                if name in update['removed']:
+                    update['removed'].remove(name)
+        for name in baseline:
+            if name not in data:
+                update['set'].pop(name, None)
+                if name not in update['removed']:
+                    update['removed'].append(name)
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        self._documents.invalidate(path)
+
+    def _load(self, key: str) -> Optional[CachedFile]:
+        return self._documents.entry(Path(key))
+
+    def _commit(self, key: str, data: Any, baseline: Any = None) -> None:
+        if self._deferred is not None:
+            self._defer(key, data, baseline)
+            return
+        text = json.dumps(data, indent=2)
+        if self._is_on_disk(key, text):
+            return
+        self._write_atomic(Path(key), text)
+        self._documents.store(Path(key), text, json.loads(text))
+
+    def _is_on_disk(self, key: str, text: str) -> bool:
+        cached = self._documents.cached(Path(key))
+        if cached is None or cached.text != text:
+            return False
+        try:
+            return self._load(key) is cached
+        except (OSError, ValueError):
+            return False
+
+    @staticmethod
+    def _write_atomic(path: Path, text: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temp_name = tempfile.mkstemp(prefix=f'.{path.name}.', suffix='.tmp', dir=path.parent)
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as handle:
+                handle.write(text)
+            try:
+                os.chmod(temp_name, path.stat().st_mode & 0o7777)
+            except FileNotFoundError:
+                os.chmod(temp_name, NEW_FILE_MODE)
+            try:
+                os.replace(temp_name, path)
+            except PermissionError:
+                # Windows refuses to replace a file another process has open; fall back to rewriting it in place
+                logger.debug(f'Could not replace {path} atomically, rewriting in place')
+                path.write_text(text, encoding='utf-8')
+        finally:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+
+    def append_journal(self, path: Path, record: Dict[str, Any]) -> None:
+        """Append record as one JSON line; existing lines are never rewritten."""
+        line = (json.dumps(record, default=str) + '\n').encode('utf-8')
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a+b') as handle:
+                if handle.tell() > 0:
+                    handle.seek(-1, os.SEEK_END)
+                    if handle.read(1) != b'\n':
+                        # Start a fresh line after a torn write so it only loses the torn record
+                        line = b'\n' + line
+                handle.write(line)
+
+    def read_journal(self, path: Path) -> List[Dict[str, Any]]:
+        """Records in path in append order; torn or corrupt lines are skipped."""
+        if not path.exists():
+            return []
+        records = []
+        for line_number, line in enumerate(path.read_text(encoding='utf-8', errors='replace').splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.debug(f'Skipping unreadable line {line_number} in {path}')
+        return records
@@ -0,0 +1,27 @@
+"""Benchmark the cold start of the piped `status` command.
+
+Runs `status` in a fresh interpreter five times (or the count given as the first argument), prints the median wall
+time against STATUS_STARTUP_BUDGET_SECONDS and exits non-zero when the median is over budget.
+
+    python test/benchmarks/bench_cli_startup.py [runs]
+"""
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+
+from cli.import_profile import run_import_profile
+
+STATUS_STARTUP_BUDGET_SECONDS = 2.0
+
+
+def main(runs: int) -> int:
+    timings = [run_import_profile('status').wall_seconds for _ in range(runs)]
+    median = sorted(timings)[len(timings) // 2]
+    print(f'status cold start: median {median:.3f}s over {runs} runs (budget {STATUS_STARTUP_BUDGET_SECONDS:.1f}s)')
+    return 0 if median <= STATUS_STARTUP_BUDGET_SECONDS else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
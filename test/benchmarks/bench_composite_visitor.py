@@ -0,0 +1,69 @@
+"""Benchmark the shared AST walk against every code scanner walking on its own.
+
+Runs the hooked Python code scanners over every file under src/ (or the directory given as the first argument),
+once with each scanner parsing and walking each file itself and once through a single CompositeVisitor walk,
+checks both report the same violations and prints their timings.
+
+    python test/benchmarks/bench_composite_visitor.py [source_root]
+"""
+import importlib
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+
+from rules.rule import Rule
+from scanners.code.python.composite_visitor import CompositeVisitor, parse_file
+
+SCANNER_PATHS = (
+    'scanners.code.python.explicit_dependencies_scanner.ExplicitDependenciesScanner',
+    'scanners.code.python.delegation_scanner.DelegationScanner',
+    'scanners.code.python.dependency_chaining_scanner.DependencyChainingScanner',
+)
+
+
+def hooked_scanners():
+    scanners = []
+    for scanner_path in SCANNER_PATHS:
+        module_path, class_name = scanner_path.rsplit('.', 1)
+        rule = Rule(Path(f'{class_name}.json'), 'code', 'story_bot', rule_content={'name': class_name, 'scanner': scanner_path})
+        scanners.append(getattr(importlib.import_module(module_path), class_name)(rule))
+    return scanners
+
+
+def walk_files(dispatcher, file_paths):
+    violations = {}
+    for file_path in file_paths:
+        visit = parse_file(file_path)
+        if visit:
+            result = dispatcher.walk(visit)
+            for scanner, scanner_violations in result.violations.items():
+                violations[(type(scanner).__name__, file_path)] = scanner_violations
+    return violations
+
+
+def main(source_root: Path) -> None:
+    scanners = hooked_scanners()
+    file_paths = sorted(source_root.rglob('*.py'))
+
+    started = time.perf_counter()
+    per_scanner = {}
+    for scanner in scanners:
+        per_scanner.update(walk_files(CompositeVisitor([scanner]), file_paths))
+    per_scanner_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    shared = walk_files(CompositeVisitor(scanners), file_paths)
+    shared_seconds = time.perf_counter() - started
+
+    if shared != per_scanner:
+        raise SystemExit('shared walk and per-scanner walks reported different violations')
+    print(f'{len(file_paths)} files, {len(scanners)} scanners')
+    print(f'per-scanner walks: {per_scanner_seconds:.3f}s')
+    print(f'single walk:       {shared_seconds:.3f}s')
+
+
+if __name__ == '__main__':
+    main(Path(sys.argv[1]) if len(sys.argv) > 1 else REPO_ROOT / 'src')
@@ -0,0 +1,67 @@
+"""Benchmark compiled instruction and render templates against a str.replace per placeholder.
+
+Renders every template file shipped with story_bot and every instruction line of the base actions, once by reading
+each file and replacing each placeholder in turn and once through the compiled templates, checks both give the same
+text and prints the time of one pass of each, averaged over 200 rounds (or the count given as the first argument).
+
+    python test/benchmarks/bench_instruction_templates.py [rounds]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+
+from instructions.instruction_template import read_template_text, render_lines, render_template
+
+VALUES = {'{project_area}': '/workspace', '{bot}': '/bots/story_bot', '{behavior}': 'shape', '{scope}': 'all stories',
+          '{{rules}}': 'rules', '{{scanner_output}}': 'scanner output', '{{render_configs}}': 'configs',
+          '{render_config.name}': 'render_story_map', '{render_config.output}': 'story-map.md'}
+
+
+def template_files():
+    return sorted(path for path in (REPO_ROOT / 'bots' / 'story_bot').rglob('*')
+                  if path.is_file() and 'templates' in path.parts and path.suffix in ('.md', '.txt', '.drawio'))
+
+
+def instruction_lines():
+    lines = []
+    for config_file in sorted((REPO_ROOT / 'base_actions').glob('*/*.json')):
+        instructions = json.loads(config_file.read_text(encoding='utf-8-sig')).get('instructions', [])
+        lines.extend(line for line in instructions if isinstance(line, str))
+    return lines
+
+
+def main(rounds: int) -> None:
+    files = template_files()
+    lines = instruction_lines()
+
+    def chained_replace():
+        rendered = []
+        for text in [path.read_text(encoding='utf-8') for path in files] + lines:
+            for placeholder, value in VALUES.items():
+                text = text.replace(placeholder, value)
+            rendered.append(text)
+        return rendered
+
+    def compiled():
+        return [render_template(read_template_text(path), VALUES) for path in files] + render_lines(lines, VALUES)
+
+    if compiled() != chained_replace():
+        raise SystemExit('compiled templates and chained replace rendered different text')
+    timings = {}
+    for name, render in (('chained replace', chained_replace), ('compiled', compiled)):
+        render()
+        started = time.perf_counter()
+        for _ in range(rounds):
+            render()
+        timings[name] = (time.perf_counter() - started) / rounds
+    total_kb = sum(path.stat().st_size for path in files) // 1024
+    print(f"{len(files)} template files ({total_kb} KB) + {len(lines)} instruction lines: "
+          f"chained replace {timings['chained replace'] * 1000:.2f} ms, compiled {timings['compiled'] * 1000:.2f} ms per pass")
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
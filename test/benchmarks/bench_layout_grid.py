@@ -0,0 +1,72 @@
+"""Benchmark DrawIO user-box placement with the layout occupancy grid against the linear scan.
+
+Places a user above every third story of a 5,000-story map (or the story count given as the first argument), as
+DrawIORenderer does, once with LayoutOccupancyGrid and once with the list-and-scan placement the renderer used
+before it, checks both place every box at the same position and prints their timings.
+
+    python test/benchmarks/bench_layout_grid.py [story_count]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / 'src'))
+
+from synchronizers.story_io.story_io_layout_grid import LayoutOccupancyGrid
+
+
+class LinearOccupancy:
+    """The list-and-scan placement the renderer used before the grid."""
+
+    def __init__(self):
+        self._rects = []
+
+    def __iter__(self):
+        return iter(self._rects)
+
+    def insert(self, x, y, width, height):
+        self._rects.append((x, y, width, height))
+
+    def first_free_y(self, x, y, width, height, step=10):
+        collision_detected = True
+        while collision_detected:
+            collision_detected = False
+            for (rx, ry, rw, rh) in self._rects:
+                if x < rx + rw and x + width > rx and y < ry + rh and y + height > ry:
+                    collision_detected = True
+                    y += step
+                    break
+        return y
+
+
+def place(occupancy_factory, story_count):
+    placed = occupancy_factory()
+    rng = random.Random(0)
+    for story_idx in range(story_count):
+        story_x = (story_idx % 200) * 60
+        story_y = (story_idx // 200) * 170 + rng.choice((0, 0, 20, 55))
+        if story_idx % 3 == 0:
+            user_y = placed.first_free_y(story_x, story_y - 60, 50, 50)
+            placed.insert(story_x, user_y, 50, 50)
+            story_y = max(story_y, user_y + 60)
+        placed.insert(story_x, story_y, 50, 50)
+    return list(placed)
+
+
+def main(story_count: int) -> None:
+    started = time.perf_counter()
+    indexed = place(LayoutOccupancyGrid, story_count)
+    grid_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    linear = place(LinearOccupancy, story_count)
+    linear_seconds = time.perf_counter() - started
+
+    if indexed != linear:
+        raise SystemExit('grid and linear scan placed boxes differently')
+    print(f'{story_count} stories, {len(indexed)} boxes: grid {grid_seconds * 1000:.1f} ms, linear scan {linear_seconds * 1000:.1f} ms')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,27 @@
+"""
+Slow Scanner
+
+Test scanner for exercising scanner worker budgets and cancellation. Reports one violation per file, sleeps on
+files whose name contains 'slow' and never returns on files whose name contains 'hang'. Setting
+SLOW_SCANNER_IMPORT_SECONDS delays importing this module, standing in for a scanner with heavy imports.
+"""
+import os
+import time
+
+from scanners.scanner import Scanner
+
+
+SLOW_FILE_SECONDS = 0.5
+
+time.sleep(float(os.environ.get('SLOW_SCANNER_IMPORT_SECONDS', '0')))
+
+
+class SlowScanner(Scanner):
+
+    def scan_file_with_context(self, context):
+        name = context.file_path.name
+        if 'hang' in name:
+            time.sleep(3600)
+        if 'slow' in name:
+            time.sleep(SLOW_FILE_SECONDS)
+        return [{'rule': self.rule.name, 'violation_message': f'Scanned {name}', 'location': str(context.file_path)}]
@@ -0,0 +1,20 @@
+"""
+State Recording Synchronizer
+
+Test synchronizer for exercising workspace state written from render workers. Writes its input to the output path
+and records the output in the state file named by the state_path argument, through the shared WorkspaceStateStore.
+"""
+from pathlib import Path
+
+from workspace_state_store import WorkspaceStateStore
+
+
+class StateRecordingSynchronizer:
+
+    def render(self, input_path, output_path, state_path, **kwargs):
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(Path(input_path).read_text(encoding='utf-8'), encoding='utf-8')
+        with WorkspaceStateStore.shared().transaction(Path(state_path)) as state:
+            state[str(output_path)] = {'size': output_path.stat().st_size}
+        return {'output_path': str(output_path)}
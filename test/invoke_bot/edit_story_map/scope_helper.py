@@ -36,6 +36,77 @@ class ScopeTestHelper(BaseHelper):
         scoping_param = ScopingParameter(scope)
         return scoping_param.filter_story_graph(story_graph)
     
+    def filter_story_graph_without_index(self, story_graph: dict, search_terms: list) -> dict:
+        """Filter story graph by names the way StoryGraphFilter did before it used StoryGraphSearchIndex."""
+        def name_matches(name: str) -> bool:
+            return any(term.lower() in name.lower() for term in search_terms)
+
+        def filter_stories(stories: list) -> list:
+            matching_stories = []
+            for story in stories:
+                if name_matches(story.get('name', '')):
+                    matching_stories.append(story)
+                    continue
+                matching_scenarios = [scenario for scenario in story.get('scenarios', []) if name_matches(scenario.get('name', ''))]
+                if matching_scenarios:
+                    matching_stories.append({**story, 'scenarios': matching_scenarios})
+            return matching_stories
+
+        def filter_sub_epic(sub_epic: dict):
+            if name_matches(sub_epic.get('name', '')):
+                return sub_epic
+            matching_story_groups = []
+            for story_group in sub_epic.get('story_groups', []):
+                matching_stories = filter_stories(story_group.get('stories', []))
+                if matching_stories:
+                    matching_story_groups.append({**story_group, 'stories': matching_stories})
+            matching_direct_stories = filter_stories(sub_epic.get('stories', []))
+            filtered_nested = [nested for nested in (filter_sub_epic(child) for child in sub_epic.get('sub_epics', [])) if nested]
+            if not (matching_story_groups or matching_direct_stories or filtered_nested):
+                return None
+            filtered_sub_epic = {**sub_epic}
+            if matching_story_groups:
+                filtered_sub_epic['story_groups'] = matching_story_groups
+            if matching_direct_stories:
+                filtered_sub_epic['stories'] = matching_direct_stories
+            if filtered_nested:
+                filtered_sub_epic['sub_epics'] = filtered_nested
+            return filtered_sub_epic
+
+        filtered_graph = {'epics': []}
+        for epic in story_graph.get('epics', []):
+            if name_matches(epic.get('name', '')):
+                filtered_graph['epics'].append(epic)
+                continue
+            filtered_sub_epics = [sub for sub in (filter_sub_epic(sub_epic) for sub_epic in epic.get('sub_epics', [])) if sub]
+            if filtered_sub_epics:
+                filtered_graph['epics'].append({**epic, 'sub_epics': filtered_sub_epics})
+        return filtered_graph
+    
+    def generated_story_graph(self, seed: int, epic_count: int = 6) -> dict:
+        """Story graph with nested sub-epics, story groups, direct stories and scenarios, named from a small mixed-case vocabulary."""
+        import random
+        rng = random.Random(seed)
+        words = ['Place', 'order', 'Cancel', 'ORDER', 'Review', 'cart', 'Pay', 'invoice', 'Ship', 'parcel', 'Track', 'Refund']
+
+        def name(kind: str) -> str:
+            return f"{kind} {' '.join(rng.choice(words) for _ in range(rng.randint(1, 3)))}"
+
+        def story() -> dict:
+            return {'name': name('Story'), 'scenarios': [{'name': name('Scenario'), 'steps': []} for _ in range(rng.randint(0, 3))]}
+
+        def sub_epic(depth: int) -> dict:
+            node = {'name': name('SubEpic')}
+            if rng.random() < 0.7:
+                node['story_groups'] = [{'type': 'and', 'stories': [story() for _ in range(rng.randint(1, 3))]} for _ in range(rng.randint(1, 2))]
+            if rng.random() < 0.4:
+                node['stories'] = [story() for _ in range(rng.randint(1, 2))]
+            if depth < 2 and rng.random() < 0.5:
+                node['sub_epics'] = [sub_epic(depth + 1) for _ in range(rng.randint(1, 2))]
+            return node
+
+        return {'epics': [{'name': name('Epic'), 'sub_epics': [sub_epic(0) for _ in range(rng.randint(1, 3))]} for _ in range(epic_count)]}
+    
     def assert_scope_is_set(self, scope_type: str, scope_value: list):
         """Assert bot scope is set with specified type and value."""
         scope = self.parent.bot.scope()
@@ -16,12 +16,14 @@ Combines domain logic tests with CLI-specific display tests.
 Uses parameterized tests across TTY, Pipe, and JSON channels for CLI tests.
 """
 import re
+import json
 import pytest
 from pathlib import Path
 from helpers.bot_test_helper import BotTestHelper
 from helpers import TTYBotTestHelper, PipeBotTestHelper, JsonBotTestHelper
 from story_graph import StoryMap
 from scanners.story_map import Epic, SubEpic, StoryGroup, Story, Scenario
+from story_graph.nodes import Step
 
 # ============================================================================
 # DOMAIN TESTS - Core Story Graph Navigation
@@ -363,6 +365,114 @@ class TestNavigateStoryGraph:
         # Then: Scenario map location is correct
         helper.story.assert_map_location_matches(scenario)
 
+    @staticmethod
+    def _saved_steps(story_map: StoryMap, workspace: Path, scenario_name: str) -> str:
+        """Helper: Save story_map under workspace and return the saved steps text of scenario_name."""
+        class MockBotPaths:
+            workspace_directory = workspace
+
+        class MockBot:
+            bot_paths = MockBotPaths()
+
+        (workspace / 'docs' / 'stories').mkdir(parents=True, exist_ok=True)
+        story_map._bot = MockBot()
+        story_map.save()
+        saved = json.loads((workspace / 'docs' / 'stories' / 'story-graph.json').read_text(encoding='utf-8'))
+        scenarios = [scenario for epic in saved['epics'] for sub_epic in epic['sub_epics'] for group in sub_epic['story_groups'] for story in group['stories'] for scenario in story['scenarios']]
+        return next(scenario['steps'] for scenario in scenarios if scenario['name'] == scenario_name)
+
+    def test_scenario_steps_are_read_and_saved_without_materializing(self, tmp_path):
+        """
+        SCENARIO: Scenario steps stay as text until Step nodes are needed
+        """
+        # Given: Story map is loaded
+        helper = BotTestHelper(tmp_path)
+        story_map = StoryMap(helper.story.simple_story_graph())
+        scenario = story_map.find_story_by_name('Load Story Graph Into Memory').scenarios[0]
+        # When: Step text is read and the story map is saved
+        step_texts = scenario.step_texts
+        saved_steps = self._saved_steps(story_map, tmp_path, scenario.name)
+        # Then: Step text and saved steps match the graph without creating Step nodes
+        assert step_texts == ["When story graph is loaded", "Then story map is created with epics"]
+        assert saved_steps == "When story graph is loaded\nThen story map is created with epics"
+        assert not scenario.steps_loaded
+
+    def test_scenario_steps_materialize_in_order_on_first_access(self, tmp_path):
+        """
+        SCENARIO: Accessing steps builds Step nodes once
+        """
+        # Given: Story map is loaded
+        helper = BotTestHelper(tmp_path)
+        story_map = StoryMap(helper.story.simple_story_graph())
+        scenario = story_map.find_story_by_name('Load Story Graph Into Memory').scenarios[0]
+        # When: Steps are accessed twice
+        steps = scenario.steps
+        steps_again = scenario.steps
+        # Then: Step nodes are built once, in order, parented to the scenario
+        assert scenario.steps_loaded
+        assert [step.text for step in steps] == ["When story graph is loaded", "Then story map is created with epics"]
+        assert [step.sequential_order for step in steps] == [1.0, 2.0]
+        assert all(step._parent is scenario for step in steps)
+        assert [id(step) for step in steps_again] == [id(step) for step in steps]
+        assert scenario.step_texts == [step.text for step in steps]
+
+    def test_step_added_after_materialization_is_saved(self, tmp_path):
+        """
+        SCENARIO: A step added to a scenario is saved after the loaded steps
+        """
+        # Given: Story map is loaded and its steps have not been materialized
+        helper = BotTestHelper(tmp_path)
+        story_map = StoryMap(helper.story.simple_story_graph())
+        scenario = story_map.find_story_by_name('Load Story Graph Into Memory').scenarios[0]
+        assert not scenario.steps_loaded
+        # When: A step is added through the scenario's children
+        scenario.children.append(Step(name="And epics are sorted", text="And epics are sorted", sequential_order=3.0, _parent=scenario))
+        # Then: The loaded steps come first and the added step is read and saved after them
+        assert scenario.step_texts == ["When story graph is loaded", "Then story map is created with epics", "And epics are sorted"]
+        assert self._saved_steps(story_map, tmp_path, scenario.name) == "When story graph is loaded\nThen story map is created with epics\nAnd epics are sorted"
+
+    def test_shared_scanner_story_map_is_rebuilt_when_story_graph_file_changes(self, tmp_path):
+        """
+        SCENARIO: Shared scanner story map follows edits to the story graph file
+        """
+        # Given: The story graph file is loaded and its shared scanner story map is built
+        from scanners.story_map import StoryMap as ScannerStoryMap
+        helper = BotTestHelper(tmp_path)
+        story_graph_file = helper.story.create_story_graph(helper.story.simple_story_graph())
+        first_map = ScannerStoryMap.shared(json.loads(story_graph_file.read_text(encoding='utf-8')))
+        assert first_map.epics()[0].name == "Build Knowledge"
+        # When: The file is edited and loaded again
+        edited = helper.story.simple_story_graph()
+        edited['epics'][0]['name'] = "Share Knowledge"
+        story_graph_file.write_text(json.dumps(edited), encoding='utf-8')
+        second_map = ScannerStoryMap.shared(json.loads(story_graph_file.read_text(encoding='utf-8')))
+        # Then: Scanners get a new tree that reflects the edit
+        assert second_map is not first_map
+        assert second_map.epics()[0].name == "Share Knowledge"
+        assert ScannerStoryMap.shared(second_map.story_graph) is second_map
+        ScannerStoryMap.release_shared()
+
+    def test_release_shared_scanner_story_map_drops_cached_tree(self, tmp_path):
+        """
+        SCENARIO: Releasing the shared scanner story map drops its cached tree
+        """
+        # Given: A shared scanner story map whose tree is built
+        from scanners.story_map import StoryMap as ScannerStoryMap
+        helper = BotTestHelper(tmp_path)
+        story_graph = helper.story.simple_story_graph()
+        first_map = ScannerStoryMap.shared(story_graph)
+        assert first_map.epics()[0].name == "Build Knowledge"
+        # When: An epic is added to the same story graph dict in place and the shared map is released
+        story_graph['epics'].append({"name": "Share Knowledge", "sequential_order": 2, "sub_epics": [], "story_groups": []})
+        cached_names = [epic.name for epic in ScannerStoryMap.shared(story_graph).epics()]
+        ScannerStoryMap.release_shared()
+        released_map = ScannerStoryMap.shared(story_graph)
+        # Then: The cached tree is reused until released and rebuilt from the edited dict after
+        assert cached_names == ["Build Knowledge"]
+        assert released_map is not first_map
+        assert [epic.name for epic in released_map.epics()] == ["Build Knowledge", "Share Knowledge"]
+        ScannerStoryMap.release_shared()
+
 # ============================================================================
 # DOMAIN TESTS - Core Story Graph Editing Logic
 # ============================================================================
@@ -1037,6 +1147,49 @@ class TestUpdateStoryNodeName:
         
         assert node.name == current_name
 
+    def test_repeated_navigator_commands_reuse_parsed_commands_and_see_renames(self, tmp_path):
+        """
+        SCENARIO: Repeated domain navigator commands reuse their parsed form and still see the current story graph
+        GIVEN: A story graph with an epic
+        WHEN: The panel sends the same commands before and after renaming the epic through the navigator
+        THEN: The repeated commands are served from the command cache and resolve against the renamed epic
+        """
+        from navigation.domain_navigator import DomainNavigator, _parse_command
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph_with_node('Epic', 'root', 'User Management')
+        navigator = DomainNavigator(helper.bot)
+
+        assert navigator.navigate('story_graph."User Management".name') == {'status': 'success', 'result': 'User Management'}
+        hits = _parse_command.cache_info().hits
+        renamed = DomainNavigator(helper.bot).navigate('story_graph."User Management".rename."User Administration"')
+        missing = navigator.navigate('story_graph."User Management".name')
+
+        assert renamed['new_name'] == 'User Administration'
+        assert missing == {'status': 'error', 'message': "Cannot access 'User Management' on StoryMap"}
+        assert navigator.navigate('story_graph."User Administration".name') == {'status': 'success', 'result': 'User Administration'}
+        assert _parse_command.cache_info().hits > hits
+
+    def test_navigator_sees_attributes_added_to_a_class_after_clearing_its_caches(self):
+        """
+        SCENARIO: Attributes added to a class after the navigator looked at it are found once its caches are cleared
+        GIVEN: A class the navigator has seen without a 'label' attribute
+        WHEN: 'label' is added to the class and the navigator caches are cleared
+        THEN: The navigator resolves 'label' on existing instances
+        """
+        from navigation.domain_navigator import _resolve_attribute, clear_navigation_caches
+
+        class Node:
+            pass
+
+        node = Node()
+        assert _resolve_attribute(node, 'label') == (False, None)
+
+        Node.label = 'Billing'
+        clear_navigation_caches()
+
+        assert _resolve_attribute(node, 'label') == (True, 'Billing')
+
+
 class TestMoveStoryNodeToParent:
     """Tests for moving story nodes between parents."""
     # Scenario: Move node to new parent with default position
@@ -1344,6 +1497,73 @@ from helpers.bot_test_helper import BotTestHelper
         assert 'def test_story_map_loads_epics(self, tmp_path):' in target_file_content
         assert 'def test_epic_has_sub_epics(self, tmp_path):' in target_file_content
 
+    def test_batch_move_of_test_classes_writes_each_file_once(self, tmp_path):
+        """
+        SCENARIO: Moving many test classes at once rewrites each test file once
+        GIVEN: Two test files with two test classes each
+        WHEN: Three classes are moved between them in one batch, plus a class that does not exist
+        THEN: Each class ends up in its target file with its methods, each file is written once and the missing class is reported
+        """
+        import ast
+        from story_graph.test_class_mover import TestClassMover, ClassMove
+        scope_file = tmp_path / 'test_manage_story_scope.py'
+        nodes_file = tmp_path / 'test_edit_story_nodes.py'
+        scope_file.write_text('"""Test Manage Story Scope"""\nimport pytest\n\n\nclass TestNavigateStoryGraph:\n    def test_loads_epics(self):\n        pass\n\n\n'
+                              '@pytest.mark.slow\nclass TestFilterScope:\n    def test_filters(self):\n        pass\n', encoding='utf-8')
+        nodes_file.write_text('"""Test Edit Story Nodes"""\nimport pytest\n\n\nclass TestCreateEpic:\n    def test_creates(self):\n        pass\n\n\n'
+                              'class TestDeleteNode:\n    def test_deletes(self):\n        pass\n', encoding='utf-8')
+
+        result = TestClassMover.move_classes([
+            ClassMove(scope_file, nodes_file, 'TestNavigateStoryGraph'),
+            ClassMove(nodes_file, scope_file, 'TestCreateEpic'),
+            ClassMove(scope_file, nodes_file, 'TestFilterScope'),
+            ClassMove(scope_file, nodes_file, 'TestMissing')
+        ])
+
+        def classes(path):
+            return {node.name: [child.name for child in node.body if isinstance(child, ast.FunctionDef)]
+                    for node in ast.parse(path.read_text(encoding='utf-8')).body if isinstance(node, ast.ClassDef)}
+        assert [move.class_name for move in result.moved] == ['TestNavigateStoryGraph', 'TestCreateEpic', 'TestFilterScope']
+        assert [(move.class_name, reason) for move, reason in result.failed] == [('TestMissing', f"Class 'TestMissing' not found in {scope_file}")]
+        assert sorted(result.written_files) == sorted([scope_file.resolve(), nodes_file.resolve()])
+        assert classes(scope_file) == {'TestCreateEpic': ['test_creates']}
+        assert classes(nodes_file) == {'TestDeleteNode': ['test_deletes'], 'TestNavigateStoryGraph': ['test_loads_epics'], 'TestFilterScope': ['test_filters']}
+        assert '@pytest.mark.slow\nclass TestFilterScope:' in nodes_file.read_text(encoding='utf-8')
+
+    def test_batch_move_matches_moving_classes_one_at_a_time(self, tmp_path):
+        """
+        SCENARIO: A batch move leaves the test files as moving each class on its own would
+        GIVEN: Two identical copies of four test files with five test classes each
+        WHEN: The same thirty moves are made one move_class at a time in one copy and as one batch in the other
+        THEN: Every test file has the same bytes in both copies
+        """
+        import random
+        from story_graph.test_class_mover import TestClassMover, ClassMove
+        rng = random.Random(0)
+        owner = {f'TestStory{f}_{c}': f for f in range(4) for c in range(5)}
+        moves = []
+        for _ in range(30):
+            class_name = rng.choice(sorted(owner))
+            target = rng.choice([f for f in range(4) if f != owner[class_name]])
+            moves.append((owner[class_name], target, class_name))
+            owner[class_name] = target
+
+        def class_moves(folder):
+            folder.mkdir()
+            for f in range(4):
+                classes = ''.join(f'class TestStory{f}_{c}:\n    """Story {c}."""\n\n' + ''.join(
+                    f'    def test_scenario_{m}(self, tmp_path):\n        # TODO: Implement test\n        pass\n\n' for m in range(3)) + '\n'
+                    for c in range(5))
+                (folder / f'test_feature_{f}.py').write_text(f'"""Feature {f} Tests"""\nimport pytest\n\n\n{classes}'.rstrip('\n') + '\n', encoding='utf-8')
+            return [ClassMove(folder / f'test_feature_{s}.py', folder / f'test_feature_{t}.py', c) for s, t, c in moves]
+
+        one_by_one = class_moves(tmp_path / 'one_by_one')
+        assert all(TestClassMover.move_class(move.source_file, move.target_file, move.class_name) for move in one_by_one)
+        assert TestClassMover.move_classes(class_moves(tmp_path / 'batch')).success
+
+        for one_by_one_file in sorted((tmp_path / 'one_by_one').iterdir()):
+            assert one_by_one_file.read_bytes() == (tmp_path / 'batch' / one_by_one_file.name).read_bytes(), one_by_one_file.name
+
 class TestCreateEpic:
     """
     Story: Create Epic at Root Level Using CLI
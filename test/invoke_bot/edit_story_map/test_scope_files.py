@@ -195,6 +195,110 @@ class TestFilterScopeByFiles:
         assert Path('test/test_helpers.py') not in filtered_files
         assert Path('test/__pycache__/cached.pyc') not in filtered_files
 
+class TestDiscoverScopeFilesRespectingGitignore:
+    """Tests for FileDiscovery honouring .gitignore files while walking the validation scope."""
+    
+    FILES = [
+        'src/main.py',
+        'src/build/b.py',
+        'src/anchored.py',
+        'src/pkg/anchored.py',
+        'src/generated_api.py',
+        'src/generated_keep.py',
+        'src/local.py',
+        'src/pkg/local.py',
+        'src/tmp.py',
+        'src/pkg/tmp.py/inner.py',
+        '.git/hooks/hook.py',
+    ]
+    
+    KEPT = {
+        'src/main.py',
+        'src/pkg/anchored.py',
+        'src/generated_keep.py',
+        'src/local.py',
+        'src/tmp.py',
+    }
+    
+    @staticmethod
+    def _discovery(workspace: Path, **kwargs):
+        from types import SimpleNamespace
+        from actions.validate.file_discovery import FileDiscovery
+        return FileDiscovery(SimpleNamespace(workspace_directory=workspace), **kwargs)
+    
+    def _workspace(self, tmp_path: Path) -> Path:
+        for relative in self.FILES:
+            file_path = tmp_path / relative
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text('x = 1\n', encoding='utf-8')
+        (tmp_path / '.gitignore').write_text(
+            '# build output anywhere\n'
+            'build/\n'
+            '/src/anchored.py\n'
+            'generated_*.py\n'
+            '!generated_keep.py\n'
+            'tmp.py/\n',
+            encoding='utf-8'
+        )
+        (tmp_path / 'src' / 'pkg' / '.gitignore').write_text('local.py\n', encoding='utf-8')
+        return tmp_path
+    
+    @staticmethod
+    def _relative(files, workspace: Path) -> set:
+        return {discovered.path.relative_to(workspace).as_posix() for discovered in files}
+    
+    def test_discovery_skips_gitignored_files(self, tmp_path):
+        """
+        SCENARIO: Discovery honours workspace and nested .gitignore files
+        GIVEN: A workspace .gitignore with unanchored, anchored, directory-only and negated patterns
+        AND: A nested .gitignore in a package
+        WHEN: src is discovered with respect_gitignore
+        THEN: Only files no pattern ignores are returned
+        """
+        # GIVEN
+        workspace = self._workspace(tmp_path)
+        
+        # WHEN
+        files = self._discovery(workspace, respect_gitignore=True).discover(workspace / 'src')
+        
+        # THEN
+        assert self._relative(files, workspace) == self.KEPT
+    
+    def test_discovery_of_relative_root_applies_workspace_gitignore(self, tmp_path):
+        """
+        SCENARIO: A relative root is discovered from the workspace
+        GIVEN: The gitignored workspace
+        WHEN: Path('src') is discovered with respect_gitignore
+        THEN: The workspace .gitignore applies, so src/build/b.py is skipped
+        """
+        # GIVEN
+        workspace = self._workspace(tmp_path)
+        
+        # WHEN
+        files = self._discovery(workspace, respect_gitignore=True).discover(Path('src'))
+        
+        # THEN
+        assert self._relative(files, workspace) == self.KEPT
+    
+    def test_discovery_ignores_gitignore_unless_asked(self, tmp_path):
+        """
+        SCENARIO: .gitignore is only honoured when discovery asks for it
+        GIVEN: The gitignored workspace
+        WHEN: src is discovered with the default settings and with respect_gitignore=False
+        THEN: Every .py file under src is returned
+        """
+        # GIVEN
+        workspace = self._workspace(tmp_path)
+        every_src_file = {relative for relative in self.FILES if relative.startswith('src/')}
+        
+        # WHEN
+        default_files = self._discovery(workspace).discover(workspace / 'src')
+        unfiltered_files = self._discovery(workspace, respect_gitignore=False).discover(workspace / 'src')
+        
+        # THEN
+        assert self._relative(default_files, workspace) == every_src_file
+        assert self._relative(unfiltered_files, workspace) == every_src_file
+
 # ============================================================================
 # CLI TESTS - Scope Operations via CLI Commands
 # ============================================================================
@@ -115,6 +115,124 @@ class TestFilterScopeByStories:
         helper.scope.assert_story_graph_contains_story(filtered_graph, 'Story A1')
         helper.scope.assert_story_graph_contains_epic(filtered_graph, 'Epic A')
 
+
+class TestFilterScopeWithSearchIndex:
+    """
+    Story: Filter Scope With Search Index
+
+    Domain focus: StoryGraphSearchIndex.filter returns exactly what StoryGraphFilter returned before it used the index
+    """
+
+    def _filter(self, story_graph, search_terms):
+        from scope.scope import StoryGraphFilter
+        return StoryGraphFilter(search_terms=search_terms).filter_story_graph(story_graph)
+
+    def test_filter_matches_filter_without_index_for_random_terms(self, tmp_path):
+        """
+        SCENARIO: Indexed filter matches the filter without an index
+        GIVEN: Generated story graphs with nested sub-epics, story groups, direct stories and scenarios
+        WHEN: They are filtered by random name fragments in random case, alone and in pairs
+        THEN: Each filtered graph equals the one the filter without an index returns, including order
+        """
+        # Given
+        import random
+        helper = BotTestHelper(tmp_path)
+        rng = random.Random(35)
+
+        for seed in range(5):
+            story_graph = helper.scope.generated_story_graph(seed)
+            names = [name for name in json.dumps(story_graph).split('"') if name[:1].isupper() and ' ' in name]
+            for _ in range(40):
+                search_terms = []
+                for _ in range(rng.randint(1, 2)):
+                    name = rng.choice(names)
+                    start = rng.randrange(len(name))
+                    fragment = name[start:start + rng.randint(1, 12)]
+                    search_terms.append(''.join(char.upper() if rng.random() < 0.5 else char.lower() for char in fragment))
+
+                # When
+                filtered_graph = self._filter(story_graph, search_terms)
+
+                # Then
+                assert filtered_graph == helper.scope.filter_story_graph_without_index(story_graph, search_terms), search_terms
+
+    def test_filter_ignores_case_of_terms_and_names(self, tmp_path):
+        """
+        SCENARIO: Filter terms match names regardless of case
+        GIVEN: Story graph with story 'Story A1'
+        WHEN: Filtered by 'sTORY a1'
+        THEN: The story and its epic are kept, as the filter without an index keeps them
+        """
+        # Given
+        helper = BotTestHelper(tmp_path)
+        story_graph = helper.story.story_graph_with_epics_and_increments()
+
+        # When
+        filtered_graph = self._filter(story_graph, ['sTORY a1'])
+
+        # Then
+        helper.scope.assert_story_graph_contains_story(filtered_graph, 'Story A1')
+        helper.scope.assert_story_graph_contains_epic(filtered_graph, 'Epic A')
+        assert filtered_graph == helper.scope.filter_story_graph_without_index(story_graph, ['sTORY a1'])
+
+    def test_matching_story_keeps_all_scenarios(self, tmp_path):
+        """
+        SCENARIO: A story whose name matches keeps all its scenarios
+        GIVEN: A story 'Checkout' with scenarios 'Pay by card' and 'Pay by invoice'
+        AND: A story 'Refund' with scenarios 'Refund to card' and 'Refund by invoice'
+        WHEN: Filtered by 'checkout' and 'INVOICE'
+        THEN: 'Checkout' keeps both scenarios
+        AND: 'Refund' keeps only 'Refund by invoice'
+        """
+        # Given
+        helper = BotTestHelper(tmp_path)
+        story_graph = {'epics': [{'name': 'Shop', 'sub_epics': [{'name': 'Orders', 'story_groups': [{'type': 'and', 'stories': [
+            {'name': 'Checkout', 'scenarios': [{'name': 'Pay by card'}, {'name': 'Pay by invoice'}]},
+            {'name': 'Refund', 'scenarios': [{'name': 'Refund to card'}, {'name': 'Refund by invoice'}]},
+            {'name': 'Browse', 'scenarios': [{'name': 'Search'}]},
+        ]}]}]}]}
+
+        # When
+        filtered_graph = self._filter(story_graph, ['checkout', 'INVOICE'])
+
+        # Then
+        stories = filtered_graph['epics'][0]['sub_epics'][0]['story_groups'][0]['stories']
+        assert [(story['name'], [scenario['name'] for scenario in story['scenarios']]) for story in stories] == [
+            ('Checkout', ['Pay by card', 'Pay by invoice']),
+            ('Refund', ['Refund by invoice']),
+        ]
+        assert filtered_graph == helper.scope.filter_story_graph_without_index(story_graph, ['checkout', 'INVOICE'])
+
+    def test_scope_filter_reads_a_story_graph_rewritten_in_the_same_tick(self, tmp_path):
+        """
+        SCENARIO: Scope filter uses the story graph as it is now, even when its mtime and size did not change
+        GIVEN: A story graph with stories 'Checkout' and 'Cashdesk' filtered once by 'checkout'
+        WHEN: 'Checkout' is renamed to 'Payments' in place and the file's mtime is set back
+        THEN: Filtering by 'payments' keeps the renamed story
+        """
+        # Given
+        from scope.scope import Scope, ScopeType
+        helper = BotTestHelper(tmp_path)
+        workspace = helper.bot.bot_paths.workspace_directory
+        story_graph_path = workspace / 'docs' / 'stories' / 'story-graph.json'
+        story_graph_path.parent.mkdir(parents=True, exist_ok=True)
+        story_graph = {'epics': [{'name': 'Shop', 'sub_epics': [{'name': 'Orders', 'story_groups': [{'type': 'and', 'stories': [
+            {'name': 'Checkout', 'scenarios': []}, {'name': 'Cashdesk', 'scenarios': []}]}]}]}]}
+        story_graph_path.write_text(json.dumps(story_graph), encoding='utf-8')
+        scope = Scope(workspace, helper.bot.bot_paths)
+        scope.filter(ScopeType.STORY, ['checkout'])
+        assert scope.results._content['epics'][0]['sub_epics'][0]['story_groups'][0]['stories'] == [{'name': 'Checkout', 'scenarios': []}]
+        stat = story_graph_path.stat()
+
+        # When
+        story_graph_path.write_text(story_graph_path.read_text(encoding='utf-8').replace('Checkout', 'Payments'), encoding='utf-8')
+        os.utime(story_graph_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        scope = Scope(workspace, helper.bot.bot_paths)
+        scope.filter(ScopeType.STORY, ['payments'])
+
+        # Then
+        assert scope.results._content['epics'][0]['sub_epics'][0]['story_groups'][0]['stories'] == [{'name': 'Payments', 'scenarios': []}]
+
 # ============================================================================
 # CLI TESTS - Scope Operations via CLI Commands
 # ============================================================================
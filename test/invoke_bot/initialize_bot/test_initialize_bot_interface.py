@@ -143,4 +143,57 @@ class TestInitializeCLISession:
         
         # Then - Validate complete CLI response structure
         assert isinstance(cli_response.output, str)
-        helper.bot.assert_status_section_present(cli_response.output)
\ No newline at end of file
+        helper.bot.assert_status_section_present(cli_response.output)
+    
+    def test_json_session_emits_compact_sanitized_json_unless_pretty_requested(self, tmp_path):
+        """
+        SCENARIO: JSON session emits compact, sanitized JSON unless pretty output is requested
+        GIVEN: JSON CLI session
+        WHEN: Status is requested with and without pretty_json
+        THEN: Default output is a single compact JSON line
+              Pretty output parses to the same data
+              Adapter payloads have invalid control characters stripped
+        """
+        # Given
+        from cli.adapter_factory import AdapterFactory
+        helper = JsonBotTestHelper(tmp_path)
+        
+        # When
+        compact = helper.cli_session.execute_command('status').output
+        helper.cli_session.pretty_json = True
+        pretty = helper.cli_session.execute_command('status').output
+        
+        # Then
+        assert '\n' not in compact
+        assert '\n  ' in pretty
+        assert json.loads(compact) == json.loads(pretty)
+        assert json.loads(compact)['bot']['name'] == 'story_bot'
+        assert AdapterFactory.create({'message': 'bad\x07 text'}, 'json').to_payload() == {'message': 'bad text'}
+
+
+class TestStartCLIWithinBudget:
+    """
+    Story: Start CLI Within Budget
+
+    CLI-specific story: Piped commands start a fresh process, so startup imports only what the command needs
+    """
+
+    def test_status_starts_without_deferred_packages(self, tmp_path):
+        """
+        SCENARIO: Status command starts without deferred packages
+        GIVEN: Bot and workspace configured
+        WHEN: 'status' is piped to cli_main under -X importtime
+        THEN: Command succeeds
+              Scanners, synchronizers, NLTK and the validation executor are never imported
+        """
+        # Given
+        from cli.import_profile import run_import_profile
+        PipeBotTestHelper(tmp_path)
+
+        # When
+        profile = run_import_profile('status')
+
+        # Then
+        assert profile.returncode == 0
+        assert 'bot.bot' in profile.modules
+        assert profile.deferred_imports() == []
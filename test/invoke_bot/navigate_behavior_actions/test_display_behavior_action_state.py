@@ -83,6 +83,83 @@ class TestManageBehaviorActionState:
         assert len(completed_actions) == 1
         assert completed_actions[0]['action_state'] == 'story_bot.shape.clarify'
 
+    def test_load_state_writes_no_files_by_default(self, tmp_path, monkeypatch):
+        """Scenario: Loading behavior and action state only reads files unless diagnostics are switched on."""
+        import builtins
+        import io
+        from diagnostics import DIAGNOSTICS_ENV, configure_diagnostics
+        monkeypatch.delenv(DIAGNOSTICS_ENV, raising=False)
+        configure_diagnostics()
+        helper = BotTestHelper(tmp_path)
+        helper.state.set_state('shape', 'strategy')
+
+        writes = []
+        real_open = builtins.open
+        def recording_open(file, mode='r', *args, **kwargs):
+            if any(flag in mode for flag in 'wax+'):
+                writes.append(str(file))
+            return real_open(file, mode, *args, **kwargs)
+        monkeypatch.setattr(builtins, 'open', recording_open)
+        monkeypatch.setattr(io, 'open', recording_open)
+
+        helper.bot.behaviors.load_state()
+        helper.bot.behaviors.current.actions.load_state()
+
+        assert helper.bot.behaviors.current.actions.current_action_name == 'strategy'
+        assert writes == []
+
+    def test_load_state_traces_to_workspace_when_diagnostics_enabled(self, tmp_path, monkeypatch):
+        """Scenario: With diagnostics switched on, state loading is traced as JSON lines under the workspace."""
+        from diagnostics import DIAGNOSTICS_ENV, configure_diagnostics, flush_diagnostics
+        helper = BotTestHelper(tmp_path)
+        helper.state.set_state('shape', 'strategy')
+        trace_file = tmp_path / 'trace.jsonl'
+        monkeypatch.setenv(DIAGNOSTICS_ENV, str(trace_file))
+        configure_diagnostics()
+        try:
+            helper.bot.behaviors.current.actions.load_state()
+            flush_diagnostics()
+        finally:
+            monkeypatch.delenv(DIAGNOSTICS_ENV)
+            configure_diagnostics()
+
+        events = [json.loads(line) for line in trace_file.read_text(encoding='utf-8').splitlines()]
+        assert 'load_state entry' in [event['message'] for event in events]
+        assert any(event['data'].get('final_index') is not None for event in events)
+
+    def test_state_rewritten_outside_the_bot_is_reloaded(self, tmp_path):
+        """Scenario: State cached in memory is replaced when the file is rewritten, even with the same size in the same tick."""
+        helper = BotTestHelper(tmp_path)
+        helper.state.set_state('shape', 'strategy')
+        helper.bot.behaviors.current.actions.load_state()
+        assert helper.bot.behaviors.current.actions.current_action_name == 'strategy'
+
+        state = helper.state.get_state()
+        state['current_action'] = 'story_bot.shape.validate'
+        (helper.workspace / 'behavior_action_state.json').write_text(json.dumps(state), encoding='utf-8')
+        helper.bot.behaviors.current.actions.load_state()
+
+        assert helper.bot.behaviors.current.actions.current_action_name == 'validate'
+
+    def test_activity_journal_records_start_and_completion_when_enabled(self, tmp_path, monkeypatch):
+        """Scenario: With activity tracking switched on, each event is appended as one JSON line in the workspace."""
+        from actions.activity_tracker import ACTIVITY_LOG_ENV, ActionState, ActivityTracker
+        from bot_path.bot_path import BotPath
+        helper = BotTestHelper(tmp_path)
+        tracker = ActivityTracker(BotPath(workspace_path=helper.workspace, bot_directory=helper.bot_directory), 'story_bot')
+        tracker.track_start(ActionState('story_bot', 'shape', 'clarify'))
+        assert not tracker.file.exists()
+
+        monkeypatch.setenv(ACTIVITY_LOG_ENV, '1')
+        tracker.track_start(ActionState('story_bot', 'shape', 'clarify'))
+        tracker.track_completion(ActionState('story_bot', 'shape', 'clarify', outputs={'answers': 2}, duration=5))
+
+        entries = tracker.entries()
+        assert [(entry['action_state'], entry['status']) for entry in entries] == [('story_bot.shape.clarify', 'started'), ('story_bot.shape.clarify', 'completed')]
+        assert entries[1]['outputs'] == {'answers': 2}
+        assert entries[1]['duration'] == 5
+        assert len(tracker.file.read_text(encoding='utf-8').splitlines()) == 2
+
 # Story: Navigate To Behavior Action And Execute (sequential_order: 3)
 
 # ============================================================================
@@ -18,7 +18,8 @@ from actions.action_context import (
     ClarifyActionContext,
     StrategyActionContext,
     ValidateActionContext,
-    ScopeActionContext
+    ScopeActionContext,
+    RenderActionContext
 )
 
 
@@ -96,6 +97,591 @@ class TestRenderOutput:
         base_instructions = '\n'.join(result.get('base_instructions', []))
         assert 'Synchronizers Already Executed' in base_instructions or 'render' in base_instructions.lower()
 
+    def test_domain_model_synchronizers_share_one_load_until_the_story_graph_changes(self, tmp_path):
+        """
+        SCENARIO: Domain model synchronizers share one story graph load until the story graph changes
+        GIVEN: A story graph with domain concepts rendered to description, diagram and outline
+        WHEN: The outputs are rendered again, then after a concept is renamed in place with the file's mtime set back
+        THEN: The second pass reuses the build context; the third loads the renamed concept and renders it everywhere
+        """
+        import os
+        from synchronizers.domain_model import (
+            DomainModelBuildContext, DomainModelDescriptionSynchronizer, DomainModelDiagramSynchronizer, DomainModelOutlineSynchronizer
+        )
+        stories_dir = tmp_path / 'docs' / 'stories'
+        stories_dir.mkdir(parents=True)
+        story_graph_path = stories_dir / 'story-graph.json'
+        concepts = [{'name': 'Invoice', 'responsibilities': [{'name': 'Total amount', 'collaborators': ['Payment']}]},
+                    {'name': 'Payment', 'responsibilities': []}]
+        story_graph_path.write_text(json.dumps({'epics': [{'name': 'Billing', 'domain_concepts': concepts, 'sub_epics': []}]}), encoding='utf-8')
+        synchronizers = [DomainModelDescriptionSynchronizer(), DomainModelDiagramSynchronizer(), DomainModelOutlineSynchronizer()]
+
+        def render_outputs():
+            return [synchronizer.render(story_graph_path, stories_dir / 'domain', project_path=str(tmp_path)) for synchronizer in synchronizers]
+
+        render_outputs()
+        context = DomainModelBuildContext.load(story_graph_path, tmp_path)
+        render_outputs()
+        assert DomainModelBuildContext.load(story_graph_path, tmp_path) is context
+
+        stat = story_graph_path.stat()
+        story_graph_path.write_text(story_graph_path.read_text(encoding='utf-8').replace('Payment', 'Receipt'), encoding='utf-8')
+        os.utime(story_graph_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        results = render_outputs()
+
+        assert DomainModelBuildContext.load(story_graph_path, tmp_path) is not context
+        assert all('Receipt' in Path(result['output_path']).read_text(encoding='utf-8') for result in results)
+        assert 'Invoice --> Receipt : uses' in Path(results[1]['output_path']).read_text(encoding='utf-8')
+
+    def test_render_skips_synchronizers_whose_inputs_and_outputs_are_unchanged(self, tmp_path):
+        """
+        SCENARIO: Render skips synchronizers whose inputs and outputs are unchanged
+        GIVEN: Production story_bot with shape behavior and a story graph that has been rendered once
+        WHEN: Render runs again unchanged, after an output is deleted, after the graph changes, and forced
+        THEN: Only the unchanged run skips; the others rebuild and say why
+        """
+        helper = BotTestHelper(tmp_path)
+        graph_path = helper.story.create_story_graph({'epics': [{'name': 'Billing', 'domain_concepts': [{'name': 'Invoice'}], 'sub_epics': []}]})
+        helper.bot.behaviors.navigate_to('shape')
+        helper.state.set_state('shape', 'render')
+        action_obj = helper.bot.behaviors.current.actions.find_by_name('render')
+        spec = next(spec for spec in action_obj.render_specs if spec.name == 'render_story_map_outline_drawio')
+
+        action_obj.do_execute(RenderActionContext())
+        assert spec.rebuild_reason == 'no previous render recorded'
+
+        result = action_obj.do_execute(RenderActionContext())
+        assert spec.was_skipped and spec.execution_status == 'executed'
+        assert 'Skipped: inputs and outputs unchanged since last render' in '\n'.join(result.get('base_instructions', []))
+
+        Path(spec.execution_result['output_path']).unlink()
+        action_obj.do_execute(RenderActionContext())
+        assert spec.rebuild_reason.startswith('output missing')
+        assert Path(spec.execution_result['output_path']).exists()
+
+        graph_path.write_text(json.dumps({'epics': [{'name': 'Invoicing', 'sub_epics': []}]}), encoding='utf-8')
+        action_obj.do_execute(RenderActionContext())
+        assert spec.rebuild_reason == 'inputs changed: graph'
+
+        action_obj.do_execute(RenderActionContext(force_render=True))
+        assert spec.rebuild_reason == 'forced'
+
+    def test_render_manifest_rebuilds_when_last_render_left_an_output_missing(self, tmp_path):
+        """
+        SCENARIO: An output the last render did not write forces a rebuild
+        GIVEN: A render recorded with one output written and one output missing
+        WHEN: The spec's rebuild reason is checked with unchanged inputs, before and after the missing output appears
+        THEN: Both checks rebuild and name the missing output
+        AND: Once a render writes every output, the spec is current
+        """
+        from actions.render.render_manifest import RenderManifest
+        manifest = RenderManifest(tmp_path)
+        written, missing = tmp_path / 'written.md', tmp_path / 'missing.md'
+        written.write_text('written', encoding='utf-8')
+        inputs = {'graph': 'graph-hash'}
+
+        manifest.record('spec', inputs, [written, missing], {'output_path': str(written)})
+
+        assert manifest.entry('spec')['outputs'][str(missing)] is None
+        assert manifest.rebuild_reason('spec', inputs) == f'output not written by last render: {missing}'
+        missing.write_text('written later', encoding='utf-8')
+        assert manifest.rebuild_reason('spec', inputs) == f'output not written by last render: {missing}'
+        manifest.record('spec', inputs, [written, missing], {'output_path': str(written)})
+        assert manifest.rebuild_reason('spec', inputs) is None
+
+    def test_render_manifest_records_every_file_a_multi_file_synchronizer_writes(self, tmp_path):
+        """
+        SCENARIO: Every file a multi-file synchronizer writes is recorded
+        GIVEN: Production story_bot with shape behavior and a story graph with two stories
+        WHEN: The story files are rendered and one of them is deleted
+        THEN: The manifest records each story file besides the output directory
+        AND: The next render rebuilds, naming the deleted story file
+        """
+        from actions.render.render_manifest import RenderManifest
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': [{'name': 'Billing', 'sequential_order': 1, 'sub_epics': [
+            {'name': 'Invoicing', 'sequential_order': 1, 'story_groups': [{'type': 'and', 'connector': None, 'stories': [
+                {'name': 'Send Invoice', 'sequential_order': 1}, {'name': 'Pay Invoice', 'sequential_order': 2}]}]}]}]})
+        helper.bot.behaviors.navigate_to('shape')
+        helper.state.set_state('shape', 'render')
+        action_obj = helper.bot.behaviors.current.actions.find_by_name('render')
+        spec = next(spec for spec in action_obj.render_specs if spec.name == 'render_story_files')
+
+        action_obj.do_execute(RenderActionContext())
+
+        output_dir = Path(spec.execution_result['output_path'])
+        story_files = [output_dir / file_path for file_path in spec.execution_result['created_files']]
+        assert len(story_files) == 2 and all(story_file.exists() for story_file in story_files)
+        recorded = RenderManifest(helper.bot.bot_paths.workspace_directory).entry(spec.manifest_key)['outputs']
+        assert set(recorded) == {str(output_dir)} | {str(story_file) for story_file in story_files}
+        story_files[0].unlink()
+        action_obj.do_execute(RenderActionContext())
+        assert spec.rebuild_reason == f'output missing: {story_files[0]}'
+        assert story_files[0].exists()
+
+    def test_render_config_loop_expands_from_compiled_template(self, tmp_path):
+        """
+        SCENARIO: Render config loop lines are filled in from compiled templates
+        GIVEN: Production story_bot with shape behavior and a for-each-render-config instruction block
+        WHEN: The render template variables are injected
+        THEN: Each spec gets its own copy of the block with known placeholders filled and unknown ones kept
+        """
+        from actions.render.render_instruction_builder import RenderInstructionBuilder
+        helper = BotTestHelper(tmp_path)
+        helper.bot.behaviors.navigate_to('shape')
+        action_obj = helper.bot.behaviors.current.actions.find_by_name('render')
+        specs = [spec for spec in action_obj.render_specs if isinstance(spec.config_data.get('instructions', ''), str)
+                 and '\n' not in spec.config_data.get('instructions', '')]
+        line = '- {render_config.name}: {render_config.input} -> {render_config.output} ({unknown}, {{render_config.name}})'
+        instructions = ['{{#for_each_render_config}}', line, '{{/for_each_render_config}}']
+
+        RenderInstructionBuilder().inject_render_template_variables(instructions, {}, specs)
+
+        assert instructions == [
+            f"- {spec.name}: {spec.input or 'N/A'} -> {spec.output or 'N/A'} ({{unknown}}, {{{spec.name}}})" for spec in specs
+        ]
+
+    def test_render_config_loop_expands_multi_line_instructions(self, tmp_path):
+        """
+        SCENARIO: Render config loop lines expand a render config's multi-line instructions
+        GIVEN: Production story_bot with shape behavior and a render config whose instructions are a list of lines
+        WHEN: The render template variables are injected
+        THEN: Only the name and the first instruction line are filled in, and a line holding just the instructions
+              placeholder is followed by the remaining instruction lines
+        """
+        from actions.render.render_instruction_builder import RenderInstructionBuilder
+        helper = BotTestHelper(tmp_path)
+        helper.bot.behaviors.navigate_to('shape')
+        action_obj = helper.bot.behaviors.current.actions.find_by_name('render')
+        spec = action_obj.render_specs[0]
+        spec.config_data['instructions'] = ['Plan the story files', 'Write each story file', 'Link them from the map']
+        instructions = ['{{#for_each_render_config}}', '{render_config.name} -> {render_config.output}:',
+                        '{render_config.instructions}', '  first: {render_config.instructions}', '{{/for_each_render_config}}']
+
+        RenderInstructionBuilder().inject_render_template_variables(instructions, {}, [spec])
+
+        assert instructions == [
+            f'{spec.name} -> {{render_config.output}}:',
+            'Plan the story files', 'Write each story file', 'Link them from the map',
+            '  first: Plan the story files'
+        ]
+
+    def test_template_file_rewritten_in_the_same_tick_is_read_again(self, tmp_path):
+        """
+        SCENARIO: A template file rewritten without its mtime or size changing is read again
+        GIVEN: A template file whose text has been read once
+        WHEN: The file is rewritten with text of the same size and its mtime is set back
+        THEN: The new text is returned, because a recently modified file is also compared by content
+        """
+        import os
+        from instructions.instruction_template import read_template_text
+        template_file = tmp_path / 'story-map.md'
+        template_file.write_text('# {epic_name}', encoding='utf-8')
+        assert read_template_text(template_file) == '# {epic_name}'
+        stat = template_file.stat()
+
+        template_file.write_text('# {epic_goal}', encoding='utf-8')
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert read_template_text(template_file) == '# {epic_goal}'
+
+    def test_compiled_templates_match_chained_replace(self):
+        """
+        SCENARIO: Compiled templates render the same text as replacing each placeholder in turn
+        GIVEN: The template files shipped with story_bot and the instruction lines of the base actions
+        WHEN: Each is rendered through its compiled template and by a str.replace per placeholder
+        THEN: Both give the same text
+        """
+        from instructions.instruction_template import read_template_text, render_lines, render_template
+        root = Path(__file__).parent.parent.parent.parent
+        template_files = sorted(path for path in (root / 'bots' / 'story_bot').rglob('*')
+                                if path.is_file() and 'templates' in path.parts and path.suffix in ('.md', '.txt', '.drawio'))
+        instruction_lines = []
+        for config_file in sorted((root / 'base_actions').glob('*/*.json')):
+            instructions = json.loads(config_file.read_text(encoding='utf-8-sig')).get('instructions', [])
+            instruction_lines.extend(line for line in instructions if isinstance(line, str))
+        values = {'{project_area}': '/workspace', '{bot}': '/bots/story_bot', '{behavior}': 'shape', '{scope}': 'all stories',
+                  '{{rules}}': 'rules', '{{scanner_output}}': 'scanner output', '{{render_configs}}': 'configs',
+                  '{render_config.name}': 'render_story_map', '{render_config.output}': 'story-map.md'}
+
+        def chained_replace(text):
+            for placeholder, value in values.items():
+                text = text.replace(placeholder, value)
+            return text
+
+        assert template_files and instruction_lines
+        assert [render_template(read_template_text(path), values) for path in template_files] == \
+               [chained_replace(path.read_text(encoding='utf-8')) for path in template_files]
+        assert render_lines(instruction_lines, values) == [chained_replace(line) for line in instruction_lines]
+
+    def test_render_scheduler_workers_match_in_process_render(self, tmp_path):
+        """
+        SCENARIO: Rendering synchronizers in worker processes gives the same results as rendering in process
+        GIVEN: Production story_bot with shape behavior and a story graph
+        WHEN: The render specs run in process, then across two worker processes
+        THEN: Every spec ends with the same status and writes the same output, reported in spec order
+        """
+        from actions.render.render_manifest import hash_output
+        from actions.render.render_scheduler import RenderScheduler
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': [{'name': 'Billing', 'domain_concepts': [{'name': 'Invoice'}], 'sub_epics': []}]})
+        helper.bot.behaviors.navigate_to('shape')
+        action_obj = helper.bot.behaviors.current.actions.find_by_name('render')
+        specs = [spec for spec in action_obj.render_specs if spec.synchronizer]
+
+        def outcomes():
+            # Synchronizers with their own output cache report the second pass as 'skipped'
+            return [(spec.name, spec.execution_status, {key: value for key, value in spec.execution_result.items() if key != 'skipped'}) for spec in specs]
+
+        RenderScheduler(specs, workers=1).run()
+        in_process = outcomes()
+        outputs = {result['output_path']: hash_output(Path(result['output_path'])) for _, status, result in in_process if status == 'executed'}
+        RenderScheduler(specs, workers=2).run()
+
+        assert outcomes() == in_process
+        assert outputs and all(hash_output(Path(path)) == output_hash for path, output_hash in outputs.items())
+
+    def test_render_workers_sharing_an_output_manifest_keep_every_entry(self, tmp_path):
+        """
+        SCENARIO: Renders in two workers both stay recorded in a shared output manifest
+        GIVEN: An input file and two renders that each record their output in the same state file
+        WHEN: Both render across two worker processes
+        THEN: The state file holds an entry for each output
+        """
+        from actions.render.render_scheduler import run_render_jobs
+        from actions.render.render_spec import RenderJob
+        input_path = tmp_path / 'docs' / 'stories' / 'story-graph.json'
+        input_path.parent.mkdir(parents=True)
+        input_path.write_text(json.dumps({'epics': [{'name': 'Billing', 'sub_epics': []}]}), encoding='utf-8')
+        state_path = tmp_path / 'outputs.json'
+        outputs = [tmp_path / 'docs' / 'description.md', tmp_path / 'docs' / 'outline.md']
+        jobs = [RenderJob('helpers.state_recording_synchronizer.StateRecordingSynchronizer', 'story_bot', str(input_path), str(output_path),
+                          {'state_path': str(state_path)}) for output_path in outputs]
+
+        outcomes = run_render_jobs(jobs, workers=2)
+
+        assert [error for _, error in outcomes] == [None, None]
+        manifest = json.loads(state_path.read_text(encoding='utf-8'))
+        assert set(manifest) == {str(output_path) for output_path in outputs}
+
+    def test_deferred_state_updates_from_the_same_document_all_apply(self, tmp_path):
+        """
+        SCENARIO: State updates collected from the same document in separate stores are all applied
+        GIVEN: A state file with two entries and two stores standing in for two workers
+        WHEN: Each store changes the file inside deferred_writes, one adding an entry and one replacing and removing entries
+        AND: Both collected updates are applied through a third store
+        THEN: The file keeps every change and nothing was written while the updates were deferred
+        """
+        from workspace_state_store import WorkspaceStateStore
+        state_path = tmp_path / 'state.json'
+        state_path.write_text(json.dumps({'kept': 1, 'replaced': 1, 'removed': 1}), encoding='utf-8')
+        first, second = WorkspaceStateStore(), WorkspaceStateStore()
+
+        with first.deferred_writes() as first_updates, second.deferred_writes() as second_updates:
+            with first.transaction(state_path) as state:
+                state['added'] = 2
+            with second.transaction(state_path) as state:
+                state['replaced'] = 2
+                del state['removed']
+            assert json.loads(state_path.read_text(encoding='utf-8')) == {'kept': 1, 'replaced': 1, 'removed': 1}
+        parent = WorkspaceStateStore()
+        parent.apply_updates(first_updates)
+        parent.apply_updates(second_updates)
+
+        assert json.loads(state_path.read_text(encoding='utf-8')) == {'kept': 1, 'replaced': 2, 'added': 2}
+
+    def test_story_tests_sync_splices_new_scenarios_into_existing_test_files(self, tmp_path):
+        """
+        SCENARIO: Story tests sync adds only new tests to existing test files
+        GIVEN: Test files generated for two sub-epics, one of them with an implemented test
+        WHEN: A scenario and a story are added to that sub-epic and the tests are synced again
+        THEN: The new method and class are spliced in, the implemented test is kept and the other file is untouched
+        """
+        import ast
+        from synchronizers.story_tests import StoryTestsSynchronizer
+        stories_dir = tmp_path / 'docs' / 'stories'
+        stories_dir.mkdir(parents=True)
+        story_graph_path = stories_dir / 'story-graph.json'
+        tests_dir = tmp_path / 'test'
+        scenarios = [{'name': 'Pay invoice', 'steps': ['Given an invoice', 'When it is paid', 'Then it is closed']}]
+        sub_epics = [
+            {'name': 'Billing', 'test_file': 'test_billing.py', 'story_groups': [{'stories': [{'name': 'Pay Invoice', 'scenarios': scenarios}]}]},
+            {'name': 'Shipping', 'test_file': 'test_shipping.py', 'story_groups': [{'stories': [{'name': 'Ship Order', 'scenarios': []}]}]}
+        ]
+
+        def sync():
+            story_graph_path.write_text(json.dumps({'epics': [{'name': 'Orders', 'sub_epics': sub_epics}]}), encoding='utf-8')
+            return StoryTestsSynchronizer().render(story_graph_path, tests_dir, project_path=str(tmp_path))
+
+        first = sync()
+        billing = tests_dir / 'test_billing.py'
+        billing.write_text(billing.read_text(encoding='utf-8').replace('# TODO: Implement test\n        pass', 'assert True'), encoding='utf-8')
+        shipping_signature = (tests_dir / 'test_shipping.py').stat().st_mtime_ns
+        scenarios.append({'name': 'Refund invoice', 'steps': ['Given a paid invoice']})
+        sub_epics[0]['story_groups'][0]['stories'].append({'name': 'Send Reminder', 'scenarios': [{'name': 'Remind customer', 'steps': []}]})
+        second = sync()
+
+        assert first['summary']['created_files'] == 2
+        assert second['updated_files'] == [str(billing)] and second['unchanged_files'] == [str(tests_dir / 'test_shipping.py')]
+        assert (second['summary']['added_test_classes'], second['summary']['added_test_methods']) == (1, 2)
+        classes = {node.name: [child.name for child in node.body if isinstance(child, ast.FunctionDef)]
+                   for node in ast.parse(billing.read_text(encoding='utf-8')).body if isinstance(node, ast.ClassDef)}
+        assert classes == {'TestPayInvoice': ['test_pay_invoice', 'test_refund_invoice'], 'TestSendReminder': ['test_remind_customer']}
+        assert 'assert True' in billing.read_text(encoding='utf-8')
+        assert (tests_dir / 'test_shipping.py').stat().st_mtime_ns == shipping_signature
+        assert sync()['summary']['unchanged_files'] == 2
+
+    def test_story_tests_sync_reads_a_test_file_rewritten_in_the_same_tick(self, tmp_path):
+        """
+        SCENARIO: Story tests sync notices a test file rewritten without its mtime or size changing
+        GIVEN: A test file generated for a sub-epic
+        WHEN: A test method is renamed in place to a name of the same length, the file's mtime is set back
+              and the tests are synced again
+        THEN: The file is read again and the missing method is spliced back in next to the renamed one
+        """
+        import ast
+        import os
+        from synchronizers.story_tests import StoryTestsSynchronizer
+        story_graph_path = tmp_path / 'story-graph.json'
+        tests_dir = tmp_path / 'test'
+        scenarios = [{'name': 'Pay invoice', 'steps': ['Given an invoice', 'When it is paid', 'Then it is closed']}]
+        story_graph_path.write_text(json.dumps({'epics': [{'name': 'Orders', 'sub_epics': [
+            {'name': 'Billing', 'test_file': 'test_billing.py', 'story_groups': [{'stories': [{'name': 'Pay Invoice', 'scenarios': scenarios}]}]}]}]}),
+            encoding='utf-8')
+        StoryTestsSynchronizer().render(story_graph_path, tests_dir, project_path=str(tmp_path))
+        billing = tests_dir / 'test_billing.py'
+        stat = billing.stat()
+
+        billing.write_text(billing.read_text(encoding='utf-8').replace('def test_pay_invoice(', 'def test_pay_invoicx('), encoding='utf-8')
+        os.utime(billing, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        result = StoryTestsSynchronizer().render(story_graph_path, tests_dir, project_path=str(tmp_path))
+
+        assert result['updated_files'] == [str(billing)]
+        methods = [child.name for node in ast.parse(billing.read_text(encoding='utf-8')).body if isinstance(node, ast.ClassDef)
+                   for child in node.body if isinstance(child, ast.FunctionDef)]
+        assert methods == ['test_pay_invoicx', 'test_pay_invoice']
+
+
+class LinearOccupancy:
+    """The list-and-scan box placement DrawIORenderer used before LayoutOccupancyGrid."""
+
+    def __init__(self):
+        self.rects = []
+
+    def insert(self, x, y, width, height):
+        self.rects.append((x, y, width, height))
+
+    def query_overlaps(self, x, y, width, height):
+        return [(rx, ry, rw, rh) for (rx, ry, rw, rh) in self.rects if x < rx + rw and x + width > rx and y < ry + rh and y + height > ry]
+
+    def first_free_y(self, x, y, width, height, step=10):
+        collision_detected = True
+        while collision_detected:
+            collision_detected = False
+            for (rx, ry, rw, rh) in self.rects:
+                if x < rx + rw and x + width > rx and y < ry + rh and y + height > ry:
+                    collision_detected = True
+                    y += step
+                    break
+        return y
+
+
+def filter_increment_stories_with_deepcopy(story_graph, increments, keep_empty):
+    """The deep-copying increment filter render_exploration (keep_empty=False) and render_discovery used before StoryGraphProjection."""
+    import copy
+
+    def find_story_path(story_name):
+        for epic in story_graph.get('epics', []):
+            for sub_epic in epic.get('sub_epics', []):
+                for story_group in sub_epic.get('story_groups', []):
+                    if any(story.get('name') == story_name for story in story_group.get('stories', [])):
+                        return epic.get('name', ''), sub_epic.get('name', '')
+                if any(story.get('name') == story_name for story in sub_epic.get('stories', [])):
+                    return epic.get('name', ''), sub_epic.get('name', '')
+        return None, None
+
+    story_keys = set()
+    for increment in increments:
+        for story in increment.get('stories', []):
+            story_name = story.get('name', '')
+            if story_name:
+                epic_name, sub_epic_name = find_story_path(story_name)
+                if epic_name and sub_epic_name:
+                    story_keys.add(f"{epic_name}|{sub_epic_name}|{story_name}")
+
+    filtered_epics = []
+    for epic in story_graph.get('epics', []):
+        filtered_epic = copy.deepcopy(epic)
+        filtered_epic['sub_epics'] = []
+        for sub_epic in epic.get('sub_epics', []):
+            filtered_sub_epic = copy.deepcopy(sub_epic)
+            filtered_sub_epic['story_groups'] = []
+            for story_group in sub_epic.get('story_groups', []):
+                filtered_stories = [story for story in story_group.get('stories', [])
+                                    if f"{epic.get('name', '')}|{sub_epic.get('name', '')}|{story.get('name', '')}" in story_keys]
+                if filtered_stories or keep_empty:
+                    filtered_group = copy.deepcopy(story_group)
+                    filtered_group['stories'] = filtered_stories
+                    filtered_sub_epic['story_groups'].append(filtered_group)
+            if filtered_sub_epic['story_groups'] or keep_empty:
+                filtered_epic['sub_epics'].append(filtered_sub_epic)
+        if filtered_epic['sub_epics'] or keep_empty:
+            filtered_epics.append(filtered_epic)
+    return filtered_epics
+
+
+class TestProjectIncrementViews:
+    """
+    Story: Project Increment Views
+
+    Domain focus: StoryGraphProjection filters epics to increment stories like the deep-copying filter did, without changing the story graph
+    """
+
+    def _random_story_graph(self, rng):
+        story_names = ['Pay', 'Cancel', 'Refund', 'Pack', 'Ship', 'Track']
+
+        def story_group():
+            return {'type': rng.choice(('and', 'or')), 'stories': [{'name': rng.choice(story_names), 'sequential_order': order}
+                                                                   for order in range(rng.randint(0, 4))]}
+
+        def sub_epic(name):
+            node = {'name': name, 'story_groups': [story_group() for _ in range(rng.randint(0, 3))]}
+            if rng.random() < 0.3:
+                node['stories'] = [{'name': rng.choice(story_names)}]
+            if rng.random() < 0.3:
+                node['sub_epics'] = [{'name': f'{name} detail', 'story_groups': [story_group()]}]
+            return node
+
+        epics = [{'name': rng.choice(('Shop', 'Warehouse', 'Billing')), 'links': [{'icon': 'document'}],
+                  'sub_epics': [sub_epic(rng.choice(('Orders', 'Returns', 'Delivery'))) for _ in range(rng.randint(0, 3))]}
+                 for _ in range(rng.randint(1, 4))]
+        increments = [{'name': f'Increment {number}', 'stories': [{'name': rng.choice(story_names + ['Unknown'])} for _ in range(rng.randint(0, 4))]}
+                      for number in range(rng.randint(1, 3))]
+        return {'epics': epics, 'increments': increments}
+
+    @pytest.mark.parametrize('keep_empty', [False, True])
+    def test_projection_matches_deepcopy_filter(self, keep_empty):
+        """
+        SCENARIO: Projected increment views equal the deep-copying filter's views
+        GIVEN: Random story graphs with repeated epic, sub-epic and story names, nested sub-epics and direct stories
+        WHEN: Each increment is projected, dropping empty containers (exploration) or keeping them (discovery)
+        THEN: The projected epics equal the deep-copying filter's epics, in the same order and with the same duplicates
+        AND: The story graph is unchanged
+        """
+        # Given
+        import copy
+        import random
+        from synchronizers.story_io.story_io_graph_projection import StoryGraphProjection
+        rng = random.Random(42)
+
+        for _ in range(300):
+            story_graph = self._random_story_graph(rng)
+            original = copy.deepcopy(story_graph)
+            projection = StoryGraphProjection(story_graph['epics'])
+            for increment in story_graph['increments']:
+                # When
+                projected = projection.project(projection.story_keys([increment]), keep_empty=keep_empty)
+
+                # Then
+                assert projected == filter_increment_stories_with_deepcopy(story_graph, [increment], keep_empty)
+            assert story_graph == original
+
+    def test_projection_shares_only_values_it_does_not_filter(self):
+        """
+        SCENARIO: Projected containers are new while untouched values are shared
+        GIVEN: A story graph with a nested sub-epic and an increment holding one of two stories
+        WHEN: The increment is projected
+        THEN: Epics, sub-epics, story groups and their child lists are new objects
+        AND: Stories, nested sub-epics and other values are the story graph's own objects
+        """
+        # Given
+        from synchronizers.story_io.story_io_graph_projection import StoryGraphProjection
+        nested = {'name': 'Card details', 'story_groups': []}
+        pay = {'name': 'Pay', 'sequential_order': 1}
+        epic = {'name': 'Shop', 'links': [{'icon': 'document'}], 'sub_epics': [
+            {'name': 'Checkout', 'sub_epics': [nested], 'story_groups': [{'type': 'and', 'stories': [pay, {'name': 'Cancel'}]}]}]}
+        projection = StoryGraphProjection([epic])
+
+        # When
+        projected_epic, = projection.project(projection.story_keys([{'stories': [{'name': 'Pay'}]}]))
+
+        # Then
+        projected_sub_epic, = projected_epic['sub_epics']
+        projected_group, = projected_sub_epic['story_groups']
+        assert projected_epic is not epic and projected_epic['sub_epics'] is not epic['sub_epics']
+        assert projected_sub_epic is not epic['sub_epics'][0] and projected_group is not epic['sub_epics'][0]['story_groups'][0]
+        assert projected_group['stories'] == [pay] and projected_group['stories'][0] is pay
+        assert projected_sub_epic['sub_epics'][0] is nested and projected_epic['links'] is epic['links']
+
+    def test_rendering_increment_views_leaves_story_graph_unchanged(self, tmp_path):
+        """
+        SCENARIO: Rendering increment views does not change the story graph
+        GIVEN: A story graph with two sub-epics and an increment holding one story
+        WHEN: The increment is rendered in discovery and exploration mode
+        THEN: Both diagrams are generated
+        AND: The story graph equals a copy taken before rendering
+        """
+        # Given
+        import copy
+        from synchronizers.story_io.story_io_renderer import DrawIORenderer
+        story_graph = {
+            'epics': [{'name': 'Shop', 'sequential_order': 1, 'sub_epics': [
+                {'name': 'Checkout', 'sequential_order': 1, 'story_groups': [
+                    {'type': 'and', 'connector': None, 'stories': [{'name': 'Pay', 'sequential_order': 1}, {'name': 'Cancel', 'sequential_order': 2}]}]},
+                {'name': 'Ship', 'sequential_order': 2, 'story_groups': [
+                    {'type': 'and', 'connector': None, 'stories': [{'name': 'Pack', 'sequential_order': 1}]}]}]}],
+            'increments': [{'name': 'MVP', 'priority': 1, 'stories': [{'name': 'Pay'}]}],
+        }
+        original = copy.deepcopy(story_graph)
+        renderer = DrawIORenderer()
+
+        # When
+        discovery = renderer.render_discovery(story_graph, tmp_path / 'discovery.drawio', increment_names=['MVP'])
+        exploration = renderer.render_exploration(story_graph, tmp_path / 'exploration.drawio', scope='MVP')
+
+        # Then
+        assert discovery['summary']['diagram_generated'] and exploration['summary']['diagram_generated']
+        assert story_graph == original
+
+
+class TestAvoidLayoutCollisions:
+    """
+    Story: Avoid Layout Collisions
+
+    Domain focus: LayoutOccupancyGrid answers overlap and move-down queries exactly as scanning every placed box does
+    """
+
+    @pytest.mark.parametrize('cell_size', [7, 100, 1000])
+    def test_grid_matches_linear_scan_for_random_placements(self, cell_size):
+        """
+        SCENARIO: Grid placement matches scanning every placed box
+        GIVEN: A grid and a linear scan fed the same random boxes, including negative, fractional and zero-sized ones
+        WHEN: Each new box is checked for overlaps and moved down until free before being placed
+        THEN: Both report the same overlaps in the same order and the same free y for every box
+        """
+        # Given
+        import random
+        from synchronizers.story_io.story_io_layout_grid import LayoutOccupancyGrid
+        rng = random.Random(cell_size)
+        grid, linear = LayoutOccupancyGrid(cell_size), LinearOccupancy()
+
+        for _ in range(400):
+            box = (rng.uniform(-300, 1200), rng.uniform(-300, 1200), rng.choice((0, 10, 50, 50, 120.5, 400)), rng.choice((0, 10, 50, 50, 60, 150.25)))
+            step = rng.choice((5, 10, 10, 37.5))
+
+            # When
+            overlaps = grid.query_overlaps(*box)
+            free_y = grid.first_free_y(*box, step=step)
+
+            # Then
+            assert overlaps == linear.query_overlaps(*box)
+            assert grid.overlaps(*box) == bool(overlaps)
+            assert free_y == linear.first_free_y(*box, step=step)
+            grid.insert(box[0], free_y, box[2], box[3])
+            linear.insert(box[0], free_y, box[2], box[3])
+
+        assert list(grid) == linear.rects
+
 
 # ============================================================================
 # STORY: Save Guardrails (Domain Layer)
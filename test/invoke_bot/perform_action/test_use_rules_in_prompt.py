@@ -143,6 +143,54 @@ class TestDisplayRules:
         # THEN: No user message section in instructions
         helper.rules.assert_no_user_message_when_empty(result)
 
+    def test_rules_digest_served_from_catalog_without_parsing_rule_files(self, tmp_path, monkeypatch):
+        """
+        SCENARIO: Rules digest comes from the workspace rule catalog once it is built
+        GIVEN: Rules action has run once for the tests behavior
+        WHEN: Rules action runs again with rule files unchanged
+        THEN: The digest is the same and no rule file is parsed
+        AND: The catalog is cached under the workspace
+        """
+        helper = BotTestHelper(tmp_path)
+        helper.bot.behaviors.navigate_to('tests')
+        behavior = helper.bot.behaviors.current
+        from rules.rules_action import RulesAction
+        from actions.action_context import RulesActionContext
+        first = RulesAction(behavior=behavior, action_config=None).do_execute(RulesActionContext())
+
+        import rules.rule
+        import rules.rule_catalog
+        def fail_read(path):
+            raise AssertionError(f'rule file parsed: {path}')
+        monkeypatch.setattr(rules.rule, 'read_json_file', fail_read)
+        monkeypatch.setattr(rules.rule_catalog, 'read_json_file', fail_read)
+        second = RulesAction(behavior=behavior, action_config=None).do_execute(RulesActionContext())
+
+        assert second == first
+        assert list((helper.workspace / '.agile_bots' / 'cache').glob('*_rules.json'))
+
+    def test_rule_catalog_parses_a_rule_file_rewritten_in_the_same_tick(self, tmp_path):
+        """
+        SCENARIO: Rule catalog parses a rule file again when it was rewritten without its mtime or size changing
+        GIVEN: A rule catalog that has recorded a rule file
+        WHEN: The rule's description is rewritten in place with text of the same length and the file's mtime is set back
+        THEN: A catalog loaded from the same cache file reports the new description
+        """
+        import json
+        import os
+        from rules.rule_catalog import RuleCatalog
+        rule_file = tmp_path / 'rules' / 'use_verbs.json'
+        rule_file.parent.mkdir()
+        rule_file.write_text(json.dumps({'description': 'Name stories with verbs'}), encoding='utf-8')
+        catalog_file = tmp_path / 'cache' / 'story_bot_rules.json'
+        assert RuleCatalog(catalog_file).entry(rule_file).description == 'Name stories with verbs'
+        stat = rule_file.stat()
+
+        rule_file.write_text(json.dumps({'description': 'Name epics after themes'}), encoding='utf-8')
+        os.utime(rule_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert RuleCatalog(catalog_file).entry(rule_file).description == 'Name epics after themes'
+
 
 # ============================================================================
 # STORY: Decide Strategy
@@ -197,6 +197,97 @@ class TestValidateRules:
         rules = result.get('rules', [])
         assert len(rules) > 0, "Code behavior must have validation rules"
 
+    def test_validation_writes_scanner_metrics(self, tmp_path):
+        """
+        SCENARIO: Validation records per-scanner telemetry
+        GIVEN: A Python test file in the workspace
+        AND: Scope filtered to that file
+        AND: Production story_bot with code behavior
+        WHEN: Validate action executes with scope
+        THEN: A validation metrics JSON file is written next to the report
+        AND: Each executed scanner entry carries wall time, cpu time and files scanned
+        """
+        # GIVEN: A Python test file in the workspace
+        helper = BotTestHelper(tmp_path)
+        helper.story.create_story_graph({'epics': []})
+        test_dir = tmp_path / 'workspace' / 'test'
+        test_dir.mkdir(parents=True)
+        (test_dir / 'test_foo.py').write_text('def test_foo():\n    assert True\n')
+
+        # AND: Scope filtered to that file
+        from scope import Scope, ScopeType
+        scope = Scope(workspace_directory=tmp_path)
+        scope.filter(type=ScopeType.FILES, value=['**/test*.py'])
+
+        # AND: Production story_bot with code behavior
+        helper.bot.behaviors.navigate_to('code')
+        behavior = helper.bot.behaviors.current
+
+        # WHEN: Validate action executes with scope
+        from actions.validate.validate_action import ValidateRulesAction
+        action = ValidateRulesAction(behavior=behavior, action_config=None)
+        action.do_execute(ValidateActionContext(scope=scope))
+
+        # THEN: A validation metrics JSON file is written next to the report
+        reports_dir = helper.workspace / behavior.bot_paths.documentation_path / 'reports'
+        metrics_files = list(reports_dir.glob('code-validation-metrics-*.json'))
+        assert len(metrics_files) == 1, f'Expected one metrics file in {reports_dir}'
+        metrics = json.loads(metrics_files[0].read_text(encoding='utf-8'))
+
+        # AND: Each executed scanner entry carries wall time, cpu time and files scanned
+        assert metrics['behavior'] == 'code'
+        executed = [s for s in metrics['scanners'] if s['status'] == 'EXECUTED']
+        assert executed, 'Code behavior must record metrics for its executed scanners'
+        for scanner in executed:
+            assert scanner['wall_seconds'] >= 0
+            assert scanner['cpu_seconds'] >= 0
+            assert 'files_scanned' in scanner
+            assert scanner['over_budget'] is False
+
+    def test_validation_skips_files_a_scanner_cannot_report_on(self, tmp_path):
+        """
+        SCENARIO: Applicability prefilter drops rule/file pairs before scanning
+        GIVEN: A production file using a global statement, a production file without one and a test file
+        AND: Production story_bot with code behavior
+        WHEN: Rules validate those files
+        THEN: The explicit dependencies scanner only scans the file with a global statement
+        AND: The parameter passing scanner skips the test file and the file without classes
+        AND: Each rule reports how many files it skipped
+        """
+        # GIVEN: A production file using a global statement, a production file without one and a test file
+        helper = BotTestHelper(tmp_path)
+        src_dir = tmp_path / 'workspace' / 'src'
+        src_dir.mkdir(parents=True)
+        test_dir = tmp_path / 'workspace' / 'test'
+        test_dir.mkdir(parents=True)
+        uses_global = src_dir / 'settings.py'
+        uses_global.write_text('counter = 0\n\ndef bump():\n    global counter\n    counter += 1\n')
+        plain = src_dir / 'plain.py'
+        plain.write_text('def add(a, b):\n    return a + b\n')
+        test_file = test_dir / 'test_plain.py'
+        test_file.write_text('class TestPlain:\n    def test_add(self):\n        assert True\n')
+
+        # AND: Production story_bot with code behavior
+        behavior = helper.bot.behaviors.find_by_name('code')
+        from rules.rules import Rules, ValidationCallbacks
+        rules = Rules(behavior=behavior, bot_paths=behavior.bot_paths)
+        scanned = {}
+
+        # WHEN: Rules validate those files
+        callbacks = ValidationCallbacks(on_file_scanned=lambda file_path, violations, rule=None: scanned.setdefault(Path(rule.rule_file).stem, []).append(file_path.name))
+        results = rules.validate({'epics': []}, files={'src': [uses_global, plain], 'test': [test_file]}, callbacks=callbacks)
+        status_by_rule = {Path(r['rule_file']).stem: r['scanner_status'] for r in results}
+
+        # THEN: The explicit dependencies scanner only scans the file with a global statement
+        assert scanned['use_explicit_dependencies'] == ['settings.py']
+
+        # AND: The parameter passing scanner skips the test file and the file without classes
+        assert 'avoid_unnecessary_parameter_passing' not in scanned
+
+        # AND: Each rule reports how many files it skipped
+        assert status_by_rule['use_explicit_dependencies']['skipped_files'] == 2
+        assert status_by_rule['avoid_unnecessary_parameter_passing']['skipped_files'] == 3
+
 
 # ============================================================================
 # STORY: Display Rules
@@ -283,4 +374,638 @@ class TestValidateRulesUsingCLI:
 # ============================================================================
 # STORY: Display Rules
 # Maps to: TestDisplayRules in test_perform_action.py
-# ============================================================================
\ No newline at end of file
+# ============================================================================
+
+class TestManageValidationJobsUsingCLI:
+    """
+    Story: Manage Background Validation Jobs Using CLI
+
+    CLI focus: Poll and cancel background validation jobs by job id
+    """
+
+    @pytest.mark.parametrize("helper_class", [
+        TTYBotTestHelper,
+        PipeBotTestHelper,
+        JsonBotTestHelper
+    ])
+    def test_cancel_running_validation_job(self, tmp_path, helper_class):
+        """
+        SCENARIO: User cancels a running background validation job
+        GIVEN: A background validation job is running
+        WHEN: user runs validation_cancel with the job id
+        THEN: Cancellation is requested for that job
+        AND: validation_status reports the job with cancellation requested
+        """
+        # Given
+        helper = helper_class(tmp_path)
+        from actions.validate.validation_job_manager import ValidationJobManager
+        job_manager = ValidationJobManager(helper.domain.bot.bot_paths)
+        job = job_manager.create_job('code', Path('docs/reports/code-validation-status.md'))
+
+        # When
+        cli_response = helper.cli_session.execute_command(f'validation_cancel {job.job_id}')
+
+        # Then
+        assert cli_response.status == 'success'
+        assert job.job_id in cli_response.output
+        assert job_manager.is_cancel_requested(job.job_id)
+
+        # And
+        cli_response = helper.cli_session.execute_command(f'validation_status {job.job_id}')
+        assert cli_response.status == 'success'
+        assert 'running' in cli_response.output
+        assert job_manager.get(job.job_id).cancel_requested
+
+    @pytest.mark.parametrize("helper_class", [
+        TTYBotTestHelper,
+        PipeBotTestHelper,
+        JsonBotTestHelper
+    ])
+    def test_status_of_unknown_validation_job_is_an_error(self, tmp_path, helper_class):
+        """
+        SCENARIO: User asks for the status of a job that does not exist
+        GIVEN: No background validation job has been started
+        WHEN: user runs validation_status with an unknown job id
+        THEN: CLI reports an error naming the job id
+        """
+        # Given
+        helper = helper_class(tmp_path)
+
+        # When
+        cli_response = helper.cli_session.execute_command('validation_status deadbeef')
+
+        # Then
+        assert cli_response.status == 'error'
+        assert 'deadbeef' in cli_response.output
+
+
+class TestBudgetScannerWorker:
+    """
+    Story: Enforce Scanner Budgets In A Worker Process
+
+    Domain focus: ScannerWorker skips files that exceed the per-file budget, honours cancellation and reports partial results
+    """
+
+    def _slow_rule(self):
+        from rules.rule import Rule
+        rule = Rule(Path('slow_rule.json'), 'code', 'story_bot', rule_content={'name': 'slow_rule', 'scanner': 'helpers.slow_scanner.SlowScanner'})
+        rule.reload_scanner_for_language('python')
+        return rule
+
+    def _source_files(self, tmp_path, *names):
+        src_dir = tmp_path / 'src'
+        src_dir.mkdir()
+        files = []
+        for name in names:
+            file_path = src_dir / name
+            file_path.write_text('x = 1\n', encoding='utf-8')
+            files.append(file_path)
+        return files
+
+    def _scan(self, rule, budget, files, is_cancelled=None, on_file_scanned=None):
+        from rules.scanner_worker import ScannerWorker
+        from rules.scan_config import ScanConfig
+        config = ScanConfig(story_graph={}, files={'src': files}, changed_files={'src': files}, skip_cross_file=True, on_file_scanned=on_file_scanned)
+        return ScannerWorker(rule, budget, is_cancelled).scan(config)
+
+    def test_file_over_budget_is_skipped_and_remaining_files_are_scanned(self, tmp_path):
+        """
+        SCENARIO: One file hangs past the per-file budget
+        GIVEN: A scanner that never returns on one of three files
+        WHEN: The rule is scanned in a worker with a file budget
+        THEN: The hanging file is reported as timed out
+        AND: The other files' violations are kept and the status is partial
+        """
+        # Given
+        from rules.scanner_worker import ScanBudget
+        first, hanging, last = self._source_files(tmp_path, 'a.py', 'b_hang.py', 'c.py')
+        budget = ScanBudget(file_seconds=1.0)
+
+        # When
+        outcome = self._scan(self._slow_rule(), budget, [first, hanging, last])
+
+        # Then
+        assert outcome.timed_out_files == [str(hanging)]
+        assert sorted(v['location'] for v in outcome.file_by_file_violations) == [str(first), str(last)]
+        assert outcome.stopped_reason is None
+        assert outcome.describe_status(budget) == 'PARTIAL: 1 file(s) exceeded the 1.0s file budget'
+
+    def test_worker_startup_is_not_billed_to_the_first_file(self, tmp_path, monkeypatch):
+        """
+        SCENARIO: File budget is shorter than the worker's start-up time
+        GIVEN: A scanner whose import takes longer than the file budget
+        WHEN: The rule is scanned in a worker
+        THEN: Every file is scanned and none is reported as timed out
+        """
+        # Given
+        from rules.scanner_worker import ScanBudget
+        files = self._source_files(tmp_path, 'a.py', 'b.py')
+        monkeypatch.setenv('SLOW_SCANNER_IMPORT_SECONDS', '1')
+
+        # When
+        outcome = self._scan(self._slow_rule(), ScanBudget(file_seconds=0.3), files)
+
+        # Then
+        assert outcome.timed_out_files == []
+        assert len(outcome.file_by_file_violations) == 2
+        assert outcome.describe_status(ScanBudget(file_seconds=0.3)) == 'EXECUTION_SUCCESS'
+
+    def test_cancel_during_scan_stops_worker_with_partial_violations(self, tmp_path):
+        """
+        SCENARIO: Validation is cancelled while a scanner is running
+        GIVEN: A scan whose second file never finishes
+        WHEN: Cancellation is requested after the first file is reported
+        THEN: The scan stops as cancelled
+        AND: The first file's violations are kept
+        """
+        # Given
+        from rules.scanner_worker import ScanBudget
+        first, hanging = self._source_files(tmp_path, 'a.py', 'b_hang.py')
+        reported = []
+        budget = ScanBudget(scanner_seconds=60)
+
+        # When
+        outcome = self._scan(self._slow_rule(), budget, [first, hanging], is_cancelled=lambda: bool(reported), on_file_scanned=lambda file_path, violations, rule: reported.append(file_path))
+
+        # Then
+        assert outcome.stopped_reason == 'cancelled'
+        assert reported == [first]
+        assert [v['location'] for v in outcome.file_by_file_violations] == [str(first)]
+        assert outcome.describe_status(budget) == 'PARTIAL: validation cancelled'
+
+    def test_scanner_budget_reports_partial_results(self, tmp_path):
+        """
+        SCENARIO: Scanner exceeds its overall budget
+        GIVEN: A scan whose files each take a while and whose last file never finishes
+        WHEN: The scanner budget runs out
+        THEN: The rule records a partial status with the violations found so far
+        """
+        # Given
+        from rules.scanner_worker import ScanBudget
+        first, hanging = self._source_files(tmp_path, 'a_slow.py', 'b_hang.py')
+        budget = ScanBudget(scanner_seconds=4)
+        rule = self._slow_rule()
+
+        # When
+        outcome = self._scan(rule, budget, [first, hanging])
+        rule.record_worker_scan(outcome.file_by_file_violations, outcome.cross_file_violations, outcome.describe_status(budget))
+
+        # Then
+        assert outcome.stopped_reason == 'scanner_budget'
+        assert rule.scanner_execution_status == 'PARTIAL: scanner budget of 4s exceeded'
+        assert [v['location'] for v in rule.file_by_file_violations] == [str(first)]
+
+
+class TestPrefilterDuplicationBlockPairs:
+    """
+    Story: Prefilter Duplication Block Pairs
+
+    Domain focus: DuplicationScanner rules out block pairs by feature bounds without changing what it reports
+    """
+
+    def test_prefilter_reports_same_violations_as_full_comparison(self, tmp_path, monkeypatch):
+        """
+        SCENARIO: Block feature prefilter does not change duplication violations
+        GIVEN: Two modules with duplicated and unrelated code blocks
+        WHEN: DuplicationScanner scans them with the prefilter on and with it off
+        THEN: Both scans report the same file-by-file and cross-file violations
+        AND: The prefilter skips some exact comparisons
+        """
+        # Given
+        from scanners.code.python.duplication_scanner import DuplicationScanner
+        helper = BotTestHelper(tmp_path)
+        compared = []
+        calculate_block_similarities = DuplicationScanner._calculate_block_similarities
+        monkeypatch.setattr(DuplicationScanner, '_calculate_block_similarities', lambda self, block1, block2: compared.append(1) or calculate_block_similarities(self, block1, block2))
+
+        # When
+        prefiltered = helper.validate.scan_for_duplication(*helper.validate.create_duplication_fixture(tmp_path / 'prefiltered'))
+        prefiltered_comparisons = len(compared)
+        monkeypatch.setattr(DuplicationScanner, '_could_be_duplicate', lambda self, block1, block2, threshold: True)
+        monkeypatch.setattr(DuplicationScanner, '_could_be_cross_file_duplicate', lambda self, block1, block2, threshold, content_threshold: True)
+        unfiltered = helper.validate.scan_for_duplication(*helper.validate.create_duplication_fixture(tmp_path / 'unfiltered'))
+
+        # Then
+        file_violations, cross_file_violations = prefiltered
+        assert file_violations and cross_file_violations
+        normalize = lambda violations: [{**v, 'location': Path(v['location']).name} for v in violations]
+        assert normalize(file_violations) == normalize(unfiltered[0])
+        assert normalize(cross_file_violations) == normalize(unfiltered[1])
+        assert prefiltered_comparisons < len(compared) - prefiltered_comparisons
+
+
+class TestFindDeadCodeWithSymbolIndex:
+    """
+    Story: Find Dead Code With A Shared Symbol Index
+
+    Domain focus: SymbolIndex records definitions and references per file; DeadCodeScanner queries it across modules
+    """
+
+    def _pricing_project(self, tmp_path_factory):
+        # tmp_path would put the test name, and so '/test', in every path; DeadCodeScanner skips test files
+        src_dir = tmp_path_factory.mktemp('pricing') / 'src'
+        src_dir.mkdir()
+        pricing = src_dir / 'pricing.py'
+        pricing.write_text(
+            'def _apply_discount(price, rate):\n'
+            '    return price * (1 - rate)\n'
+            '\n'
+            '\n'
+            'def _legacy_rounding(value):\n'
+            '    return round(value, 1)\n',
+            encoding='utf-8'
+        )
+        checkout = src_dir / 'checkout.py'
+        checkout.write_text(
+            'from pricing import _apply_discount\n'
+            '\n'
+            '\n'
+            'def total(prices, rate):\n'
+            '    return sum(_apply_discount(price, rate) for price in prices)\n',
+            encoding='utf-8'
+        )
+        return pricing, checkout
+
+    def test_symbol_index_records_cross_module_reference(self, tmp_path_factory):
+        """
+        SCENARIO: A function defined in one module is referenced from another
+        GIVEN: pricing.py defines two helpers and checkout.py imports one of them
+        WHEN: Both files are indexed
+        THEN: The index holds both definitions with their lines and the imported helper as a reference
+        AND: An unchanged file is not re-parsed after invalidate()
+        """
+        # Given
+        from scanners.code.python.symbol_index import SymbolIndex
+        pricing, checkout = self._pricing_project(tmp_path_factory)
+        index = SymbolIndex()
+
+        # When
+        parsed = index.ensure([pricing, checkout])
+
+        # Then
+        assert parsed == 2
+        assert sorted((name, line) for _, name, line, _ in index.definitions([pricing])) == [('_apply_discount', 1), ('_legacy_rounding', 5)]
+        assert '_apply_discount' in index.references([checkout])
+        assert '_legacy_rounding' not in index.references([pricing, checkout])
+        index.invalidate()
+        assert index.ensure([pricing, checkout]) == 0
+
+    def test_dead_code_scanner_reports_only_unreferenced_function(self, tmp_path_factory):
+        """
+        SCENARIO: Dead code scan across modules
+        GIVEN: A helper used from another module and a helper used nowhere
+        WHEN: DeadCodeScanner scans the project with a shared symbol index
+        THEN: Only the helper used nowhere is reported
+        AND: After the other module starts using it, the rescan reports nothing
+        """
+        # Given
+        from rules.rule import Rule
+        from scanners.code.python.dead_code_scanner import DeadCodeScanner
+        from scanners.code.python.symbol_index import SymbolIndex
+        pricing, checkout = self._pricing_project(tmp_path_factory)
+        rule = Rule(Path('dead_code.json'), 'code', 'story_bot', rule_content={'name': 'dead_code', 'scanner': 'scanners.code.python.dead_code_scanner.DeadCodeScanner'})
+        scanner = DeadCodeScanner(rule)
+        scanner.symbol_index = SymbolIndex()
+
+        # When
+        violations = scanner.scan_cross_file(code_files=[pricing, checkout])
+
+        # Then
+        assert {(Path(v['location']).name, v['line_number']) for v in violations} == {('pricing.py', 5)}
+        assert all("'_legacy_rounding'" in v['violation_message'] for v in violations)
+        checkout.write_text(checkout.read_text(encoding='utf-8') + '\n\ndef rounded_total(prices, rate):\n    return _legacy_rounding(total(prices, rate))\n', encoding='utf-8')
+        scanner.symbol_index.invalidate()
+        assert scanner.scan_cross_file(code_files=[pricing, checkout]) == []
+
+    def test_cross_file_validation_finds_dead_code_through_shared_index(self, tmp_path, tmp_path_factory):
+        """
+        SCENARIO: Validation with cross-file scans reports dead code from the shared symbol index
+        GIVEN: Production story_bot with code behavior and a helper used nowhere
+        WHEN: Rules validate the project with cross-file scans, running only the legacy unused code rule
+        THEN: The cross-file scan reports the helper used nowhere
+        AND: The rules' shared symbol index holds the project's definitions
+        """
+        # Given
+        helper = BotTestHelper(tmp_path)
+        pricing, checkout = self._pricing_project(tmp_path_factory)
+        behavior = helper.bot.behaviors.find_by_name('code')
+        from rules.rules import Rules, ValidationCallbacks, ValidationContext
+        rules = Rules(behavior=behavior, bot_paths=behavior.bot_paths)
+        other_rules = [Path(rule.rule_file).stem for rule in rules if Path(rule.rule_file).stem != 'detect_legacy_unused_code']
+        context = ValidationContext(story_graph={'epics': []}, files={'src': [pricing, checkout]}, callbacks=ValidationCallbacks(),
+                                    skiprule=other_rules, exclude=[], skip_cross_file=False, all_files=True,
+                                    behavior=behavior, bot_paths=behavior.bot_paths, working_dir=tmp_path)
+
+        # When
+        results = rules.validate(context)
+
+        # Then
+        cross_file = [v for r in results for v in r['scanner_results']['cross_file']['violations']]
+        assert {(Path(v['location']).name, v['line_number']) for v in cross_file} == {('pricing.py', 5)}
+        assert sorted(name for _, name, _, _ in rules._symbol_index.definitions([pricing])) == ['_apply_discount', '_legacy_rounding']
+
+
+class TestShareAstWalkAcrossScanners:
+    """
+    Story: Share One AST Walk Across Code Scanners
+
+    Domain focus: CompositeVisitor walks each file once for every hooked scanner and attributes results and failures per scanner
+    """
+
+    SCANNER_PATHS = (
+        'scanners.code.python.explicit_dependencies_scanner.ExplicitDependenciesScanner',
+        'scanners.code.python.delegation_scanner.DelegationScanner',
+        'scanners.code.python.dependency_chaining_scanner.DependencyChainingScanner',
+    )
+
+    def _hooked_scanners(self):
+        import importlib
+        from rules.rule import Rule
+        scanners = []
+        for scanner_path in self.SCANNER_PATHS:
+            module_path, class_name = scanner_path.rsplit('.', 1)
+            rule = Rule(Path(f'{class_name}.json'), 'code', 'story_bot', rule_content={'name': class_name, 'scanner': scanner_path})
+            scanners.append(getattr(importlib.import_module(module_path), class_name)(rule))
+        return scanners
+
+    def _source_files(self):
+        import scanners.code.python
+        return sorted(Path(scanners.code.python.__file__).parent.glob('*.py'))
+
+    def _own_walk(self, scanner, file_path):
+        from scanners.resources.scan_context import FileScanContext
+        return scanner.scan_file_with_context(FileScanContext(story_graph={}, file_path=file_path))
+
+    def test_shared_walk_matches_each_scanner_walking_alone(self):
+        """
+        SCENARIO: Scanners sharing one walk report what they report walking alone
+        GIVEN: Three hooked code scanners and the code scanner package as source
+        WHEN: Each scanner asks the shared walk for every file, twice
+        THEN: Each answer equals the scanner's own walk of that file
+        """
+        # Given
+        from scanners.code.python.composite_visitor import CompositeVisitor
+        scanners = self._hooked_scanners()
+        dispatcher = CompositeVisitor(scanners)
+        files = self._source_files()
+
+        # When
+        shared = {(id(scanner), file_path): dispatcher.violations_for(scanner, file_path) for scanner in scanners for file_path in files}
+        repeated = {(id(scanner), file_path): dispatcher.violations_for(scanner, file_path) for scanner in scanners for file_path in files}
+
+        # Then
+        own = {(id(scanner), file_path): self._own_walk(scanner, file_path) for scanner in scanners for file_path in files}
+        assert any(own.values())
+        assert shared == own
+        assert repeated == own
+
+    def test_raising_hook_fails_only_its_own_scanner(self):
+        """
+        SCENARIO: One scanner's hook raises during the shared walk
+        GIVEN: A scanner whose FunctionDef hook raises, registered first, and the hooked code scanners
+        AND: A source file the hooked code scanners report violations in
+        WHEN: Every scanner asks the shared walk for the same file
+        THEN: The raising scanner gets its exception
+        AND: The other scanners get the same violations as walking alone
+        """
+        # Given
+        from rules.rule import Rule
+        from scanners.code.python.code_scanner import CodeScanner
+        from scanners.code.python.composite_visitor import CompositeVisitor
+
+        class ExplodingScanner(CodeScanner):
+            def on_FunctionDef(self, node, visit):
+                raise RuntimeError(f'cannot scan {node.name}')
+
+        exploding = ExplodingScanner(Rule(Path('exploding.json'), 'code', 'story_bot', rule_content={'name': 'exploding'}))
+        scanners = self._hooked_scanners()
+        dispatcher = CompositeVisitor([exploding] + scanners)
+        file_path = next(file_path for file_path in self._source_files() if any(self._own_walk(scanner, file_path) for scanner in scanners))
+
+        # When
+        with pytest.raises(RuntimeError, match='cannot scan'):
+            dispatcher.violations_for(exploding, file_path)
+        shared = [dispatcher.violations_for(scanner, file_path) for scanner in scanners]
+
+        # Then
+        assert shared == [self._own_walk(scanner, file_path) for scanner in scanners]
+
+    def test_released_rules_do_not_keep_shared_walk_results(self):
+        """
+        SCENARIO: Rules that never ask for a file do not keep its results alive
+        GIVEN: A shared walk of one file requested by only the first scanner
+        WHEN: The other scanners' rules are released
+        THEN: No results are kept for the file
+        AND: The released scanners are no longer walked
+        """
+        # Given
+        from scanners.code.python.composite_visitor import CompositeVisitor
+        first, *others = self._hooked_scanners()
+        dispatcher = CompositeVisitor([first] + others)
+        file_path = self._source_files()[0]
+        dispatcher.violations_for(first, file_path)
+        assert file_path in dispatcher._results
+
+        # When
+        for scanner in others:
+            dispatcher.release(scanner.rule)
+
+        # Then
+        assert dispatcher._results == {}
+        assert dispatcher.scanner_count == 1
+        assert not any(dispatcher.handles(scanner) for scanner in others)
+
+    def test_scanner_hooks_are_looked_up_once_per_class(self):
+        """
+        SCENARIO: A scanner's AST hooks are found once for its class, not once per file
+        GIVEN: A hooked code scanner and the code scanner package as source
+        WHEN: The scanner walks every file on its own
+        THEN: Its class's hooks were looked up once
+        """
+        # Given
+        from scanners.code.python import composite_visitor
+        scanner = self._hooked_scanners()[0]
+        files = self._source_files()
+        composite_visitor._hook_names.cache_clear()
+
+        # When
+        for file_path in files:
+            self._own_walk(scanner, file_path)
+
+        # Then
+        assert len(files) > 1
+        assert composite_visitor._hook_names.cache_info().misses == 1
+
+    def test_failed_validation_does_not_keep_shared_walk(self, tmp_path, monkeypatch):
+        """
+        SCENARIO: A scanner that raises does not leave the shared walk on the rules
+        GIVEN: Production story_bot with code behavior and a source file
+        AND: The first rule's scan raises
+        WHEN: Rules validate the file
+        THEN: The error is raised to the caller
+        AND: The rules keep neither the shared walk nor the applicability prefilter
+        """
+        # Given
+        helper = BotTestHelper(tmp_path)
+        src_dir = tmp_path / 'workspace' / 'src'
+        src_dir.mkdir(parents=True)
+        source_file = src_dir / 'plain.py'
+        source_file.write_text('def add(a, b):\n    return a + b\n')
+        behavior = helper.bot.behaviors.find_by_name('code')
+        from rules.rules import Rules
+        rules = Rules(behavior=behavior, bot_paths=behavior.bot_paths)
+        seen = []
+
+        def failing_process_rule(self, rule, *args):
+            seen.append((self._ast_dispatcher, self._applicability))
+            raise RuntimeError(f'cannot scan with {rule.rule_file}')
+        monkeypatch.setattr(Rules, '_process_rule', failing_process_rule)
+
+        # When
+        with pytest.raises(RuntimeError, match='cannot scan'):
+            rules.validate({'epics': []}, files={'src': [source_file]})
+
+        # Then
+        assert seen and all(dispatcher is not None and applicability is not None for dispatcher, applicability in seen)
+        assert rules._ast_dispatcher is None
+        assert rules._applicability is None
+
+
+class TestDetectGitChangedFiles:
+    """
+    Story: Validate Only Files Changed Since A Revision
+
+    Domain focus: GitChangeDetector reads refs, loose and packed objects and agrees with git on which source files changed
+    """
+
+    def _git(self, repo, *args):
+        import subprocess
+        return subprocess.run(
+            ['git', '-c', 'user.name=Test', '-c', 'user.email=test@example.com', '-c', 'gc.auto=0', *args],
+            cwd=repo, check=True, capture_output=True, text=True,
+        ).stdout.strip()
+
+    def _git_diff_names(self, repo, *revisions):
+        from actions.validate.git_changes import SOURCE_SUFFIXES
+        return {repo / name for name in self._git(repo, 'diff', '--name-only', *revisions).splitlines() if name.endswith(SOURCE_SUFFIXES)}
+
+    def _source_files(self, repo):
+        return sorted(path for path in (repo / 'src').rglob('*') if path.is_file())
+
+    @pytest.fixture
+    def repo(self, tmp_path_factory):
+        """Three commits, the first two packed and the third loose, plus a staged and an unstaged edit."""
+        repo = tmp_path_factory.mktemp('git_repo')
+        self._git(repo, 'init', '-q')
+        (repo / 'src').mkdir()
+        for name in ('alpha.py', 'beta.py', 'gamma.py', 'delta.py'):
+            (repo / 'src' / name).write_text(f'NAME = {name!r}\n', encoding='utf-8')
+        (repo / 'src' / 'widget.js').write_text('export const widget = 1;\n', encoding='utf-8')
+        (repo / 'README.md').write_text('readme\n', encoding='utf-8')
+        self._git(repo, 'add', '-A')
+        self._git(repo, 'commit', '-q', '-m', 'first')
+        (repo / 'src' / 'alpha.py').write_text('NAME = "alpha, second"\n', encoding='utf-8')
+        (repo / 'src' / 'widget.js').write_text('export const widget = 2;\n', encoding='utf-8')
+        self._git(repo, 'commit', '-q', '-am', 'second')
+        self._git(repo, 'repack', '-a', '-d', '-q')
+        self._git(repo, 'prune-packed')
+        (repo / 'src' / 'beta.py').write_text('NAME = "beta, third"\n', encoding='utf-8')
+        self._git(repo, 'commit', '-q', '-am', 'third')
+        (repo / 'src' / 'gamma.py').write_text('NAME = "gamma, staged"\n', encoding='utf-8')
+        self._git(repo, 'add', 'src/gamma.py')
+        (repo / 'src' / 'delta.py').write_text('NAME = "delta, unstaged"\n', encoding='utf-8')
+        return repo
+
+    def test_changed_files_match_git_diff_for_each_revision(self, repo):
+        """
+        SCENARIO: Changed files since a ref, an ancestor or an abbreviated SHA match git diff
+        GIVEN: A repository whose older commits are packed and whose newest commit is loose
+        AND: A staged and an unstaged edit on top of it
+        WHEN: Changed files are detected since each revision
+        THEN: They equal the source files git diff --name-only reports for that revision
+        """
+        # Given
+        from actions.validate.git_changes import GitChangeDetector
+        first, second = self._git(repo, 'rev-parse', 'HEAD~2'), self._git(repo, 'rev-parse', 'HEAD~1')
+        assert not (repo / '.git' / 'objects' / first[:2] / first[2:]).exists()
+        assert any((repo / '.git' / 'objects' / 'pack').glob('*.idx'))
+        revisions = ['HEAD', 'HEAD~1', 'HEAD^', 'HEAD~2', self._git(repo, 'branch', '--show-current'),
+                     first, first[:7], second[:10], self._git(repo, 'rev-parse', '--short', 'HEAD')]
+        detector = GitChangeDetector(repo)
+
+        for revision in revisions:
+            # When
+            changed = detector.changed_files(revision, self._source_files(repo))
+
+            # Then
+            assert changed == self._git_diff_names(repo, revision), revision
+
+    def test_working_tree_counts_staged_and_unstaged_edits(self, repo):
+        """
+        SCENARIO: Changed files in the working tree include staged edits
+        GIVEN: A staged edit and an unstaged edit on top of HEAD
+        WHEN: Changed files are detected for the working tree
+        THEN: They equal git diff --name-only HEAD, so both edits are included
+        """
+        # Given
+        from actions.validate.git_changes import GitChangeDetector, WORKING_TREE
+
+        # When
+        changed = GitChangeDetector(repo).changed_files(WORKING_TREE, self._source_files(repo))
+
+        # Then
+        assert changed == self._git_diff_names(repo, 'HEAD')
+        assert changed == {repo / 'src' / 'gamma.py', repo / 'src' / 'delta.py'}
+
+    def test_unknown_and_ambiguous_abbreviations_are_rejected(self, repo):
+        """
+        SCENARIO: An abbreviated SHA that names no object or several objects is rejected
+        GIVEN: Two blobs whose ids share their first four hex digits, one loose and one packed
+        WHEN: The four-digit prefix and a prefix that matches nothing are resolved
+        THEN: Both raise a RevisionError naming the problem
+        """
+        # Given
+        from actions.validate.git_changes import GitObjectStore, RevisionError, blob_sha
+        by_prefix = {}
+        contents = (b'blob %d\n' % number for number in range(100000))
+        pair = next(pair for pair in ((by_prefix.setdefault(blob_sha(content)[:4], content), content) for content in contents) if pair[0] != pair[1])
+        (repo / 'blob.txt').write_bytes(pair[0])
+        self._git(repo, 'hash-object', '-w', 'blob.txt')
+        self._git(repo, 'repack', '-d', '-q')
+        (repo / 'blob.txt').write_bytes(pair[1])
+        loose = self._git(repo, 'hash-object', '-w', 'blob.txt')
+        assert (repo / '.git' / 'objects' / loose[:2] / loose[2:]).exists()
+        prefix = blob_sha(pair[0])[:4]
+        unused = next(candidate for candidate in (f'{number:06x}' for number in range(1 << 24)) if not self._git_has_prefix(repo, candidate))
+        store = GitObjectStore(repo / '.git')
+
+        # When / Then
+        with pytest.raises(RevisionError, match='Ambiguous revision'):
+            store.resolve(prefix)
+        with pytest.raises(RevisionError, match='Unknown revision'):
+            store.resolve(unused)
+
+    def _git_has_prefix(self, repo, prefix):
+        import subprocess
+        result = subprocess.run(['git', 'rev-parse', '--verify', '--quiet', prefix], cwd=repo, capture_output=True, text=True)
+        return result.returncode == 0 or 'ambiguous' in result.stderr
+
+    def test_unresolvable_revision_fails_validation_instead_of_falling_back(self, repo):
+        """
+        SCENARIO: Validating changes since a revision that cannot be resolved
+        GIVEN: A changed scope whose revision names no commit
+        WHEN: The files to validate are narrowed to git changes
+        THEN: A ValueError tells the user the revision could not be resolved
+        """
+        # Given
+        from types import SimpleNamespace
+        from rules.rules import ValidationContext
+        from scope import Scope, ScopeType
+        scope = Scope(repo)
+        scope.type = ScopeType.CHANGED
+        scope.value = ['no-such-branch']
+        behavior = SimpleNamespace(bot_paths=SimpleNamespace(workspace_directory=repo))
+
+        # When / Then
+        with pytest.raises(ValueError, match='Cannot validate changes since no-such-branch: Unknown revision'):
+            ValidationContext._get_git_changed_files(behavior, ValidateActionContext(scope=scope), {'src': self._source_files(repo)})
@@ -7,6 +7,66 @@ from pathlib import Path
 from helpers.base_helper import BaseHelper
 
 
+DUPLICATION_FIXTURE_SOURCE = '''
+def rebalance(accounts, limit):
+    while accounts:
+        account = accounts.pop()
+        if account.balance > limit:
+            excess = account.balance - limit
+            account.balance = limit
+            account.reserve += excess
+        elif account.balance < 0:
+            account.flags.append("overdrawn")
+    return limit
+
+
+def merge_scores(scores, weights):
+    for name, score in scores.items():
+        weight = weights.get(name, 1.0)
+        if weight <= 0:
+            raise ValueError(name)
+        adjusted = score * weight
+        weights[name] = adjusted / (1 + adjusted)
+        scores[name] = round(adjusted, 2)
+    return scores
+
+
+def rebalance_savings(savings, cap):
+    while savings:
+        saving = savings.pop()
+        if saving.balance > cap:
+            surplus = saving.balance - cap
+            saving.balance = cap
+            saving.reserve += surplus
+        elif saving.balance < 0:
+            saving.flags.append("overdrawn")
+    return cap
+
+
+def merge_ratings(ratings, factors):
+    for name, rating in ratings.items():
+        factor = factors.get(name, 1.0)
+        if factor <= 0:
+            raise KeyError(name)
+        scaled = rating * factor
+        factors[name] = scaled / (2 + scaled)
+        ratings[name] = round(scaled, 3)
+    return ratings
+
+
+def retry_jobs(queue, attempts):
+    for job in list(queue):
+        try:
+            job.run()
+        except RuntimeError as error:
+            attempts[job.name] = attempts.get(job.name, 0) + 1
+            if attempts[job.name] > 3:
+                queue.remove(job)
+                job.fail(error)
+    return attempts
+'''
+
+
 class ValidateTestHelper(BaseHelper):
     """Helper for validate action, scanners, and rules testing"""
     
@@ -131,6 +191,26 @@ class ValidateTestHelper(BaseHelper):
             files_dict['src'] = code_files
         return files_dict
     
+    def create_duplication_fixture(self, project_dir):
+        """Create a project with two modules sharing near-duplicate code blocks.
+        
+        The pyproject.toml marker keeps DuplicationScanner's block cache inside project_dir.
+        
+        Args:
+            project_dir: Directory to create the project in
+            
+        Returns:
+            Tuple of (changed module Path, list of all module Paths)
+        """
+        src_dir = project_dir / 'src'
+        src_dir.mkdir(parents=True)
+        (project_dir / 'pyproject.toml').write_text('', encoding='utf-8')
+        orders = src_dir / 'orders.py'
+        orders.write_text(DUPLICATION_FIXTURE_SOURCE, encoding='utf-8')
+        refunds = src_dir / 'refunds.py'
+        refunds.write_text(DUPLICATION_FIXTURE_SOURCE.replace('rebalance(', 'balance_accounts(').replace('merge_ratings', 'combine_ratings'), encoding='utf-8')
+        return orders, [orders, refunds]
+    
     # ========================================================================
     # ACTION HELPERS - Execute scanners (deterministic, no conditionals)
     # ========================================================================
@@ -184,6 +264,21 @@ class ValidateTestHelper(BaseHelper):
             violations.extend(file_violations)
         return violations
     
+    def scan_for_duplication(self, changed_file, all_files):
+        """Run DuplicationScanner's file-by-file pass on changed_file and its cross-file pass against all_files.
+        
+        Returns:
+            Tuple of (file-by-file violations, cross-file violations)
+        """
+        from rules.rule import Rule
+        from scanners.code.python.duplication_scanner import DuplicationScanner
+        from scanners.resources.scan_context import FileScanContext
+        rule = Rule(Path('duplication.json'), 'code', 'story_bot', rule_content={'name': 'duplication', 'scanner': 'scanners.code.python.duplication_scanner.DuplicationScanner'})
+        scanner = DuplicationScanner(rule)
+        file_violations = scanner.scan_file_with_context(FileScanContext(story_graph={}, file_path=changed_file))
+        cross_file_violations = scanner.scan_cross_file(code_files=[changed_file], all_code_files=all_files)
+        return file_violations, cross_file_violations
+    
     def _extract_violations_from_results(self, scanner_results):
         """Extract violations list from scanner results dict.
         